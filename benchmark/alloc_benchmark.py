@@ -0,0 +1,100 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from codetiming import Timer
+
+from bip_utils import (
+    Bip32Slip10Secp256k1, Bip39SeedGenerator, Bip44, Bip44Changes, Bip44Coins, P2PKHAddrEncoder, P2WPKHAddrEncoder
+)
+
+
+# Benchmark configuration
+class BenchmarkConf:
+    ITR_NUM: int = 2000
+
+
+# Measure time and transient memory (i.e. peak memory above the memory in use before the call) of the function
+def measure(fct: Callable[[], None],
+            itr_num: int) -> Tuple[float, float]:
+    tracemalloc.start()
+
+    transient_mem = 0
+    for _ in range(itr_num):
+        mem_start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fct()
+        _, mem_peak = tracemalloc.get_traced_memory()
+        transient_mem += mem_peak - mem_start
+
+    tracemalloc.stop()
+
+    # Time is measured separately, since tracing slows down the execution
+    tmr = Timer(logger=None)
+    tmr.start()
+    for _ in range(itr_num):
+        fct()
+    elapsed = tmr.stop()
+
+    return (1e6 * elapsed) / itr_num, transient_mem / itr_num
+
+
+# Main function
+def main() -> None:
+    mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon "\
+               "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon art"
+    seed_bytes = Bip39SeedGenerator(mnemonic).Generate()
+
+    bip32_ctx = Bip32Slip10Secp256k1.FromSeed(seed_bytes)
+    bip32_pub_ctx = Bip32Slip10Secp256k1.FromExtendedKey(bip32_ctx.PublicKey().ToExtended())
+    bip44_ctx = (Bip44.FromSeed(seed_bytes, Bip44Coins.BITCOIN)
+                 .Purpose()
+                 .Coin()
+                 .Account(0)
+                 .Change(Bip44Changes.CHAIN_EXT))
+    pub_key = bip44_ctx.AddressIndex(0).PublicKey().Bip32Key().KeyObject()
+    pub_key_bytes = bytearray(pub_key.RawCompressed().ToBytes())
+
+    tests: List[Tuple[str, Callable[[], None]]] = [
+        ("BIP32 private derivation (hardened)", lambda: bip32_ctx.ChildKey(0x80000000)),
+        ("BIP32 private derivation (normal)", lambda: bip32_ctx.ChildKey(0)),
+        ("BIP32 public derivation", lambda: bip32_pub_ctx.ChildKey(0)),
+        ("BIP32 extended key serialization", lambda: bip32_ctx.ChildKey(0).PrivateKey().ToExtended()),
+        ("P2PKH encoding (key object)", lambda: P2PKHAddrEncoder.EncodeKey(pub_key, net_ver=b"\x00")),
+        ("P2PKH encoding (bytearray key)", lambda: P2PKHAddrEncoder.EncodeKey(pub_key_bytes, net_ver=b"\x00")),
+        ("P2WPKH encoding (key object)", lambda: P2WPKHAddrEncoder.EncodeKey(pub_key, hrp="bc", wit_ver=0)),
+    ]
+
+    print("\nAllocation benchmark started!")
+    print(f"  - Number of iterations for each test: {BenchmarkConf.ITR_NUM}\n")
+    print(f"{'Test':<40}{'Time (us)':>12}{'Transient memory (bytes)':>28}")
+    for name, fct in tests:
+        elapsed_us, transient_mem = measure(fct, BenchmarkConf.ITR_NUM)
+        print(f"{name:<40}{elapsed_us:>12.1f}{transient_mem:>28.1f}")
+    print("\nAllocation benchmark completed.\n")
+
+
+# Execute main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import os
+from typing import Callable, List
+
+from codetiming import Timer
+
+from bip_utils import Base58Alphabets, Base58Decoder, Base58Encoder
+
+
+# Benchmark configuration
+class BenchmarkConf:
+    ADDR_NUM: int = 1000000
+    ALPH_IDX: Base58Alphabets = Base58Alphabets.BITCOIN
+
+
+# Run the specified function and print the elapsed time
+def run_test(name: str,
+             fct: Callable[[], object]) -> None:
+    tmr = Timer(name=name, text="{name} - Elapsed time: {milliseconds:.0f}ms")
+    tmr.start()
+    fct()
+    tmr.stop()
+
+
+# Main function
+def main() -> None:
+    print("\nBase58 benchmark started!")
+    print("Configuration:")
+    print(f"  - Number of addresses: {BenchmarkConf.ADDR_NUM}")
+    print(f"  - Alphabet: {BenchmarkConf.ALPH_IDX}\n")
+
+    # Generate P2PKH-like payloads (net version + 20-byte hash)
+    payloads: List[bytes] = [b"\x00" + os.urandom(20) for _ in range(BenchmarkConf.ADDR_NUM)]
+    addrs = Base58Encoder.CheckEncodeMany(payloads, BenchmarkConf.ALPH_IDX)
+
+    # Single-item APIs
+    run_test("CheckEncode", lambda: [Base58Encoder.CheckEncode(p, BenchmarkConf.ALPH_IDX) for p in payloads])
+    run_test("CheckDecode", lambda: [Base58Decoder.CheckDecode(a, BenchmarkConf.ALPH_IDX) for a in addrs])
+    # Bulk APIs
+    run_test("EncodeMany", lambda: Base58Encoder.EncodeMany(payloads, BenchmarkConf.ALPH_IDX))
+    run_test("CheckEncodeMany", lambda: Base58Encoder.CheckEncodeMany(payloads, BenchmarkConf.ALPH_IDX))
+    run_test("DecodeMany", lambda: Base58Decoder.DecodeMany(addrs, BenchmarkConf.ALPH_IDX))
+    run_test("CheckDecodeMany", lambda: Base58Decoder.CheckDecodeMany(addrs, BenchmarkConf.ALPH_IDX))
+
+    print("\nBase58 benchmark completed.\n")
+
+
+# Execute main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+from typing import Callable, List
+
+from codetiming import Timer
+
+from bip_utils import Bech32Decoder, Bech32Encoder, SegwitBech32Decoder, SegwitBech32Encoder
+
+
+# Benchmark configuration
+class BenchmarkConf:
+    ADDR_NUM: int = 1000000
+    HRP: str = "bc"
+
+
+# Run the specified function and print the elapsed time
+def run_test(name: str,
+             fct: Callable[[], object]) -> None:
+    tmr = Timer(name=name, text="{name} - Elapsed time: {milliseconds:.0f}ms")
+    tmr.start()
+    fct()
+    tmr.stop()
+
+
+# Main function
+def main() -> None:
+    print("\nBech32 benchmark started!")
+    print("Configuration:")
+    print(f"  - Number of addresses: {BenchmarkConf.ADDR_NUM}")
+    print(f"  - HRP: {BenchmarkConf.HRP}\n")
+
+    # Generate P2WPKH-like witness programs (20-byte hash)
+    wit_progs: List[bytes] = [os.urandom(20) for _ in range(BenchmarkConf.ADDR_NUM)]
+    addrs = SegwitBech32Encoder.EncodeMany(BenchmarkConf.HRP, 0, wit_progs)
+    bech32_addrs = Bech32Encoder.EncodeMany(BenchmarkConf.HRP, wit_progs)
+
+    # Single-item APIs
+    run_test("Segwit Encode", lambda: [SegwitBech32Encoder.Encode(BenchmarkConf.HRP, 0, w) for w in wit_progs])
+    run_test("Segwit Decode", lambda: [SegwitBech32Decoder.Decode(BenchmarkConf.HRP, a) for a in addrs])
+    # Bulk APIs
+    run_test("Segwit EncodeMany", lambda: SegwitBech32Encoder.EncodeMany(BenchmarkConf.HRP, 0, wit_progs))
+    run_test("Segwit DecodeMany", lambda: SegwitBech32Decoder.DecodeMany(BenchmarkConf.HRP, addrs))
+    run_test("Segwit IsValidMany", lambda: SegwitBech32Decoder.IsValidMany(BenchmarkConf.HRP, addrs))
+    run_test("Bech32 EncodeMany", lambda: Bech32Encoder.EncodeMany(BenchmarkConf.HRP, wit_progs))
+    run_test("Bech32 DecodeMany", lambda: Bech32Decoder.DecodeMany(BenchmarkConf.HRP, bech32_addrs))
+
+    print("\nBech32 benchmark completed.\n")
+
+
+# Execute main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+from typing import Callable, List
+
+from codetiming import Timer
+
+from bip_utils import (
+    Bip39Languages, Bip39Mnemonic, Bip39MnemonicDecoder, Bip39MnemonicEncoder, Bip39MnemonicGenerator,
+    Bip39MnemonicValidator, Bip39WordsNum
+)
+
+
+# Benchmark configuration
+class BenchmarkConf:
+    MNEMONIC_NUM: int = 1000000
+    WORDS_NUM: Bip39WordsNum = Bip39WordsNum.WORDS_NUM_24
+    LANG: Bip39Languages = Bip39Languages.ENGLISH
+
+
+# Run the specified function and print the elapsed time
+def run_test(name: str,
+             fct: Callable[[], object]) -> None:
+    tmr = Timer(name=name, text="{name} - Elapsed time: {milliseconds:.0f}ms")
+    tmr.start()
+    fct()
+    tmr.stop()
+
+
+# Main function
+def main() -> None:
+    print("\nBIP39 benchmark started!")
+    print("Configuration:")
+    print(f"  - Number of mnemonics: {BenchmarkConf.MNEMONIC_NUM}")
+    print(f"  - Words number: {BenchmarkConf.WORDS_NUM}")
+    print(f"  - Language: {BenchmarkConf.LANG}\n")
+
+    encoder = Bip39MnemonicEncoder(BenchmarkConf.LANG)
+    decoder = Bip39MnemonicDecoder(BenchmarkConf.LANG)
+    validator = Bip39MnemonicValidator(BenchmarkConf.LANG)
+    validator_auto = Bip39MnemonicValidator()
+    generator = Bip39MnemonicGenerator(BenchmarkConf.LANG)
+
+    # Generation
+    run_test("FromWordsNumber", lambda: [generator.FromWordsNumber(BenchmarkConf.WORDS_NUM)
+                                         for _ in range(BenchmarkConf.MNEMONIC_NUM)])
+    run_test("FromWordsNumberMany", lambda: generator.FromWordsNumberMany(BenchmarkConf.WORDS_NUM,
+                                                                          BenchmarkConf.MNEMONIC_NUM))
+
+    # Generate random entropies and the correspondent mnemonics
+    entropy_byte_len = (BenchmarkConf.WORDS_NUM * 11 * 32 // 33) // 8
+    entropies: List[bytes] = [os.urandom(entropy_byte_len) for _ in range(BenchmarkConf.MNEMONIC_NUM)]
+    mnemonics: List[Bip39Mnemonic] = []
+    run_test("Encode", lambda: mnemonics.extend(encoder.Encode(e) for e in entropies))
+    mnemonic_strs = [m.ToStr() for m in mnemonics]
+
+    # Decoding
+    run_test("Decode (object)", lambda: [decoder.Decode(m) for m in mnemonics])
+    run_test("Decode (string)", lambda: [decoder.Decode(m) for m in mnemonic_strs])
+    run_test("DecodeWithChecksum (object)", lambda: [decoder.DecodeWithChecksum(m) for m in mnemonics])
+    # Validation
+    run_test("IsValid (object)", lambda: [validator.IsValid(m) for m in mnemonics])
+    run_test("IsValid (string)", lambda: [validator.IsValid(m) for m in mnemonic_strs])
+    run_test("IsValid (string, automatic language)", lambda: [validator_auto.IsValid(m) for m in mnemonic_strs])
+
+    print("\nBIP39 benchmark completed.\n")
+
+
+# Execute main
+if __name__ == "__main__":
+    main()
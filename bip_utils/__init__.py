@@ -6,34 +6,36 @@ from bip_utils.addr import (
     AdaByronAddrDecoder, AdaByronAddrTypes, AdaByronIcarusAddr, AdaByronIcarusAddrEncoder, AdaByronLegacyAddr,
     AdaByronLegacyAddrEncoder, AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags,
     AdaShelleyRewardAddr, AdaShelleyRewardAddrDecoder, AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr,
-    AdaShelleyStakingAddrDecoder, AdaShelleyStakingAddrEncoder, AlgoAddr, AlgoAddrDecoder, AlgoAddrEncoder, AptosAddr,
-    AptosAddrDecoder, AptosAddrEncoder, AtomAddr, AtomAddrDecoder, AtomAddrEncoder, AvaxPChainAddr,
-    AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddr, AvaxXChainAddrDecoder, AvaxXChainAddrEncoder,
-    BchAddrConverter, BchP2PKHAddr, BchP2PKHAddrDecoder, BchP2PKHAddrEncoder, BchP2SHAddr, BchP2SHAddrDecoder,
-    BchP2SHAddrEncoder, EgldAddr, EgldAddrDecoder, EgldAddrEncoder, EosAddr, EosAddrDecoder, EosAddrEncoder,
-    ErgoNetworkTypes, ErgoP2PKHAddr, ErgoP2PKHAddrDecoder, ErgoP2PKHAddrEncoder, EthAddr, EthAddrDecoder,
-    EthAddrEncoder, FilSecp256k1Addr, FilSecp256k1AddrDecoder, FilSecp256k1AddrEncoder, IcxAddr, IcxAddrDecoder,
-    IcxAddrEncoder, NanoAddr, NanoAddrDecoder, NanoAddrEncoder, NearAddr, NearAddrDecoder, NearAddrEncoder, NeoAddr,
-    NeoAddrDecoder, NeoAddrEncoder, OkexAddr, OkexAddrDecoder, OkexAddrEncoder, OneAddr, OneAddrDecoder, OneAddrEncoder,
-    P2PKHAddr, P2PKHAddrDecoder, P2PKHAddrEncoder, P2PKHPubKeyModes, P2SHAddr, P2SHAddrDecoder, P2SHAddrEncoder,
-    P2TRAddr, P2TRAddrDecoder, P2TRAddrEncoder, P2WPKHAddr, P2WPKHAddrDecoder, P2WPKHAddrEncoder, SolAddr,
-    SolAddrDecoder, SolAddrEncoder, SubstrateEd25519Addr, SubstrateEd25519AddrDecoder, SubstrateEd25519AddrEncoder,
-    SubstrateSr25519Addr, SubstrateSr25519AddrDecoder, SubstrateSr25519AddrEncoder, TrxAddr, TrxAddrDecoder,
-    TrxAddrEncoder, XlmAddr, XlmAddrDecoder, XlmAddrEncoder, XlmAddrTypes, XmrAddr, XmrAddrDecoder, XmrAddrEncoder,
-    XmrIntegratedAddr, XmrIntegratedAddrDecoder, XmrIntegratedAddrEncoder, XrpAddr, XrpAddrDecoder, XrpAddrEncoder,
-    XtzAddr, XtzAddrDecoder, XtzAddrEncoder, XtzAddrPrefixes, ZilAddr, ZilAddrDecoder, ZilAddrEncoder
+    AdaShelleyStakingAddrDecoder, AdaShelleyStakingAddrEncoder, AddrRouter, AddrRouterResult, AlgoAddr, AlgoAddrDecoder,
+    AlgoAddrEncoder, AptosAddr, AptosAddrDecoder, AptosAddrEncoder, AtomAddr, AtomAddrDecoder, AtomAddrEncoder,
+    AvaxPChainAddr, AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddr, AvaxXChainAddrDecoder,
+    AvaxXChainAddrEncoder, BchAddrConverter, BchAddrConverterResult, BchP2PKHAddr, BchP2PKHAddrDecoder,
+    BchP2PKHAddrEncoder, BchP2SHAddr, BchP2SHAddrDecoder, BchP2SHAddrEncoder, EgldAddr, EgldAddrDecoder,
+    EgldAddrEncoder, EosAddr, EosAddrDecoder, EosAddrEncoder, ErgoNetworkTypes, ErgoP2PKHAddr, ErgoP2PKHAddrDecoder,
+    ErgoP2PKHAddrEncoder, EthAddr, EthAddrDecoder, EthAddrEncoder, FilSecp256k1Addr, FilSecp256k1AddrDecoder,
+    FilSecp256k1AddrEncoder, IcxAddr, IcxAddrDecoder, IcxAddrEncoder, MultiAddrEncoder, NanoAddr, NanoAddrDecoder,
+    NanoAddrEncoder, NearAddr, NearAddrDecoder, NearAddrEncoder, NeoAddr, NeoAddrDecoder, NeoAddrEncoder, OkexAddr,
+    OkexAddrDecoder, OkexAddrEncoder, OneAddr, OneAddrDecoder, OneAddrEncoder, P2PKHAddr, P2PKHAddrDecoder,
+    P2PKHAddrEncoder, P2PKHPubKeyModes, P2SHAddr, P2SHAddrDecoder, P2SHAddrEncoder, P2TRAddr, P2TRAddrDecoder,
+    P2TRAddrEncoder, P2WPKHAddr, P2WPKHAddrDecoder, P2WPKHAddrEncoder, SolAddr, SolAddrDecoder, SolAddrEncoder,
+    SubstrateEd25519Addr, SubstrateEd25519AddrDecoder, SubstrateEd25519AddrEncoder, SubstrateSr25519Addr,
+    SubstrateSr25519AddrDecoder, SubstrateSr25519AddrEncoder, TrxAddr, TrxAddrDecoder, TrxAddrEncoder, XlmAddr,
+    XlmAddrDecoder, XlmAddrEncoder, XlmAddrTypes, XmrAddr, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr,
+    XmrIntegratedAddrDecoder, XmrIntegratedAddrEncoder, XrpAddr, XrpAddrDecoder, XrpAddrEncoder, XtzAddr,
+    XtzAddrDecoder, XtzAddrEncoder, XtzAddrPrefixes, ZilAddr, ZilAddrDecoder, ZilAddrEncoder
 )
 
 # Algorand mnemonic
 from bip_utils.algorand.mnemonic import (
-    AlgorandEntropyBitLen, AlgorandEntropyGenerator, AlgorandLanguages, AlgorandMnemonic, AlgorandMnemonicDecoder,
-    AlgorandMnemonicEncoder, AlgorandMnemonicGenerator, AlgorandMnemonicValidator, AlgorandSeedGenerator,
-    AlgorandWordsNum
+    AlgorandEntropyBitLen, AlgorandEntropyGenerator, AlgorandLanguages, AlgorandMnemonic, AlgorandMnemonicBulkValidator,
+    AlgorandMnemonicDecoder, AlgorandMnemonicEncoder, AlgorandMnemonicGenerator, AlgorandMnemonicValidator,
+    AlgorandSeedGenerator, AlgorandWordsNum
 )
 
 # Base58
 from bip_utils.base58 import (
-    Base58Alphabets, Base58ChecksumError, Base58Decoder, Base58Encoder, Base58XmrDecoder, Base58XmrEncoder
+    Base58Alphabets, Base58BulkValidator, Base58ChecksumError, Base58Decoder, Base58Encoder, Base58XmrDecoder,
+    Base58XmrEncoder
 )
 
 # Bech32
@@ -56,8 +58,10 @@ from bip_utils.bip.bip38 import Bip38Decrypter, Bip38EcKeysGenerator, Bip38Encry
 
 # BIP39
 from bip_utils.bip.bip39 import (
-    Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39Mnemonic, Bip39MnemonicDecoder,
-    Bip39MnemonicEncoder, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum
+    Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39Mnemonic, Bip39MnemonicBulkValidator,
+    Bip39MnemonicDecoder, Bip39MnemonicEncoder, Bip39MnemonicGenerator, Bip39MnemonicRecovery,
+    Bip39MnemonicRecoveryProgress, Bip39MnemonicRecoveryResult, Bip39MnemonicSearchSpace, Bip39MnemonicValidator,
+    Bip39SeedGenerator, Bip39WordsNum
 )
 from bip_utils.bip.bip44 import Bip44
 
@@ -75,7 +79,7 @@ from bip_utils.bip.conf.bip86 import Bip86Coins, Bip86Conf, Bip86ConfGetter
 
 # Cardano
 from bip_utils.cardano.bip32 import CardanoByronLegacyBip32, CardanoIcarusBip32
-from bip_utils.cardano.byron import CardanoByronLegacy
+from bip_utils.cardano.byron import CardanoByronLegacy, CardanoByronLegacyScanner, CardanoByronLegacyScanResult
 from bip_utils.cardano.cip1852 import Cip1852
 from bip_utils.cardano.cip1852.conf import Cip1852Coins, Cip1852Conf, Cip1852ConfGetter
 from bip_utils.cardano.mnemonic import CardanoByronLegacySeedGenerator, CardanoIcarusSeedGenerator
@@ -100,13 +104,13 @@ from bip_utils.electrum import ElectrumV1, ElectrumV2Segwit, ElectrumV2Standard
 # Electrum mnemonic
 from bip_utils.electrum.mnemonic_v1 import (
     ElectrumV1EntropyBitLen, ElectrumV1EntropyGenerator, ElectrumV1Languages, ElectrumV1Mnemonic,
-    ElectrumV1MnemonicDecoder, ElectrumV1MnemonicEncoder, ElectrumV1MnemonicGenerator, ElectrumV1MnemonicValidator,
-    ElectrumV1SeedGenerator, ElectrumV1WordsNum
+    ElectrumV1MnemonicBulkValidator, ElectrumV1MnemonicDecoder, ElectrumV1MnemonicEncoder, ElectrumV1MnemonicGenerator,
+    ElectrumV1MnemonicValidator, ElectrumV1SeedGenerator, ElectrumV1WordsNum
 )
 from bip_utils.electrum.mnemonic_v2 import (
     ElectrumV2EntropyBitLen, ElectrumV2EntropyGenerator, ElectrumV2Languages, ElectrumV2Mnemonic,
-    ElectrumV2MnemonicDecoder, ElectrumV2MnemonicEncoder, ElectrumV2MnemonicGenerator, ElectrumV2MnemonicTypes,
-    ElectrumV2MnemonicValidator, ElectrumV2SeedGenerator, ElectrumV2WordsNum
+    ElectrumV2MnemonicBulkValidator, ElectrumV2MnemonicDecoder, ElectrumV2MnemonicEncoder, ElectrumV2MnemonicGenerator,
+    ElectrumV2MnemonicTypes, ElectrumV2MnemonicValidator, ElectrumV2SeedGenerator, ElectrumV2WordsNum
 )
 
 # Monero
@@ -117,9 +121,9 @@ from bip_utils.monero.conf import MoneroCoins, MoneroConf
 
 # Monero mnemonic
 from bip_utils.monero.mnemonic import (
-    MoneroEntropyBitLen, MoneroEntropyGenerator, MoneroLanguages, MoneroMnemonic, MoneroMnemonicDecoder,
-    MoneroMnemonicEncoder, MoneroMnemonicGenerator, MoneroMnemonicNoChecksumEncoder, MoneroMnemonicValidator,
-    MoneroMnemonicWithChecksumEncoder, MoneroSeedGenerator, MoneroWordsNum
+    MoneroEntropyBitLen, MoneroEntropyGenerator, MoneroLanguages, MoneroMnemonic, MoneroMnemonicBulkValidator,
+    MoneroMnemonicDecoder, MoneroMnemonicEncoder, MoneroMnemonicGenerator, MoneroMnemonicNoChecksumEncoder,
+    MoneroMnemonicValidator, MoneroMnemonicWithChecksumEncoder, MoneroSeedGenerator, MoneroWordsNum
 )
 
 # SLIP32
@@ -128,7 +132,7 @@ from bip_utils.slip.slip32 import (
 )
 
 # Solana
-from bip_utils.solana import SplToken
+from bip_utils.solana import SplToken, SplTokenBatch
 
 # SS58
 from bip_utils.ss58 import SS58ChecksumError, SS58Decoder, SS58Encoder
@@ -158,7 +162,10 @@ from bip_utils.utils.crypto import (
     Sha512, Sha512_256, XModemCrc
 )
 from bip_utils.utils.misc import AlgoUtils, BitUtils, BytesUtils, DataBytes, IntegerUtils, StringUtils
-from bip_utils.utils.mnemonic import MnemonicChecksumError
+from bip_utils.utils.mnemonic import (
+    MnemonicBulkValidatorConst, MnemonicChecksumError, MnemonicValidationResults, MnemonicVersionError, SeedCache,
+    SeedCacheConst, SeedCacheMetrics
+)
 
 # WIF
 from bip_utils.wif import WifDecoder, WifEncoder, WifPubKeyModes
@@ -22,7 +22,7 @@
 
 # Imports
 from enum import Enum, auto, unique
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -121,6 +121,58 @@ class P2PKHAddrEncoder(IAddrEncoder):
 
         return Base58Encoder.CheckEncode(net_ver_bytes + Hash160.QuickDigest(pub_key_bytes), base58_alph)
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to P2PKH addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            net_ver (bytes)                          : Net address version
+            base58_alph (Base58Alphabets, optional)  : Base58 alphabet, Bitcoin alphabet by default
+            pub_key_mode (P2PKHPubKeyModes, optional): Public key mode, compressed key by default
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        compressed = kwargs.get("pub_key_mode", P2PKHPubKeyModes.COMPRESSED) == P2PKHPubKeyModes.COMPRESSED
+        return P2PKHAddrEncoder._EncodeKeyHashes(
+            Hash160.DigestMany(
+                [AddrKeyValidator.ValidateAndGetSecp256k1KeyBytes(pub_key, compressed, skip_validation)
+                 for pub_key in pub_keys]
+            ),
+            **kwargs
+        )
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many public key hashes to P2PKH addresses.
+
+        Args:
+            key_hashes (list[bytes]): Hash160 of the public keys (in the public key mode)
+
+        Other Parameters:
+            net_ver (bytes)                        : Net address version
+            base58_alph (Base58Alphabets, optional): Base58 alphabet, Bitcoin alphabet by default
+
+        Returns:
+            list[str]: Address strings
+        """
+        net_ver_bytes = kwargs["net_ver"]
+        base58_alph = kwargs.get("base58_alph", Base58Alphabets.BITCOIN)
+        return Base58Encoder.CheckEncodeMany([net_ver_bytes + key_hash for key_hash in key_hashes], base58_alph)
+
 
 class BchP2PKHAddrDecoder(IAddrDecoder):
     """
@@ -199,6 +251,54 @@ class BchP2PKHAddrEncoder(IAddrEncoder):
                                        net_ver_bytes,
                                        Hash160.QuickDigest(pub_key_obj.RawCompressed().ToBytes()))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Bitcoin Cash P2PKH addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            hrp (str)      : HRP
+            net_ver (bytes): Net address version
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        return BchP2PKHAddrEncoder._EncodeKeyHashes(
+            Hash160.DigestMany(
+                [AddrKeyValidator.ValidateAndGetSecp256k1KeyBytes(pub_key, skip_validation=skip_validation)
+                 for pub_key in pub_keys]
+            ),
+            **kwargs
+        )
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many public key hashes to Bitcoin Cash P2PKH addresses.
+
+        Args:
+            key_hashes (list[bytes]): Hash160 of the compressed public keys
+
+        Other Parameters:
+            hrp (str)      : HRP
+            net_ver (bytes): Net address version
+
+        Returns:
+            list[str]: Address strings
+        """
+        return BchBech32Encoder.EncodeMany(kwargs["hrp"], kwargs["net_ver"], key_hashes)
+
 
 # Deprecated: only for compatibility, Encoder classes shall be used instead
 P2PKHAddr = P2PKHAddrEncoder
@@ -21,7 +21,7 @@
 """Module for P2SH address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
 from bip_utils.addr.iaddr_decoder import IAddrDecoder
@@ -62,6 +62,19 @@ class _P2SHAddrUtils:
         # Address bytes = Hash160(script_signature)
         return Hash160.QuickDigest(script_sig_bytes)
 
+    @staticmethod
+    def AddScriptSigMany(key_hashes: List[bytes]) -> List[bytes]:
+        """
+        Add script signature to many public key hashes and get addresses bytes.
+
+        Args:
+            key_hashes (list[bytes]): Hash160 of the compressed public keys
+
+        Returns:
+            list[bytes]: Addresses bytes
+        """
+        return Hash160.DigestMany([P2SHAddrConst.SCRIPT_BYTES + key_hash for key_hash in key_hashes])
+
 
 class P2SHAddrDecoder(IAddrDecoder):
     """
@@ -122,6 +135,54 @@ class P2SHAddrEncoder(IAddrEncoder):
         pub_key_obj = AddrKeyValidator.ValidateAndGetSecp256k1Key(pub_key)
         return Base58Encoder.CheckEncode(net_ver_bytes + _P2SHAddrUtils.AddScriptSig(pub_key_obj))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to P2SH addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            net_ver (bytes): Net address version
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        return P2SHAddrEncoder._EncodeKeyHashes(
+            Hash160.DigestMany(
+                [AddrKeyValidator.ValidateAndGetSecp256k1KeyBytes(pub_key, skip_validation=skip_validation)
+                 for pub_key in pub_keys]
+            ),
+            **kwargs
+        )
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many public key hashes to P2SH addresses.
+
+        Args:
+            key_hashes (list[bytes]): Hash160 of the compressed public keys
+
+        Other Parameters:
+            net_ver (bytes): Net address version
+
+        Returns:
+            list[str]: Address strings
+        """
+        net_ver_bytes = kwargs["net_ver"]
+        return Base58Encoder.CheckEncodeMany([net_ver_bytes + script_sig_hash
+                                              for script_sig_hash in _P2SHAddrUtils.AddScriptSigMany(key_hashes)])
+
 
 class BchP2SHAddrDecoder(IAddrDecoder):
     """
@@ -185,6 +246,56 @@ class BchP2SHAddrEncoder(IAddrEncoder):
         pub_key_obj = AddrKeyValidator.ValidateAndGetSecp256k1Key(pub_key)
         return BchBech32Encoder.Encode(hrp, net_ver_bytes, _P2SHAddrUtils.AddScriptSig(pub_key_obj))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Bitcoin Cash P2SH addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            hrp (str)      : HRP
+            net_ver (bytes): Net address version
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        return BchP2SHAddrEncoder._EncodeKeyHashes(
+            Hash160.DigestMany(
+                [AddrKeyValidator.ValidateAndGetSecp256k1KeyBytes(pub_key, skip_validation=skip_validation)
+                 for pub_key in pub_keys]
+            ),
+            **kwargs
+        )
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many public key hashes to Bitcoin Cash P2SH addresses.
+
+        Args:
+            key_hashes (list[bytes]): Hash160 of the compressed public keys
+
+        Other Parameters:
+            hrp (str)      : HRP
+            net_ver (bytes): Net address version
+
+        Returns:
+            list[str]: Address strings
+        """
+        return BchBech32Encoder.EncodeMany(kwargs["hrp"],
+                                           kwargs["net_ver"],
+                                           _P2SHAddrUtils.AddScriptSigMany(key_hashes))
+
 
 # Deprecated: only for compatibility, Encoder classes shall be used instead
 P2SHAddr = P2SHAddrEncoder
@@ -27,16 +27,17 @@ References:
 """
 
 # Imports
-from typing import Any, Union
+from functools import lru_cache
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
 from bip_utils.addr.iaddr_decoder import IAddrDecoder
 from bip_utils.addr.iaddr_encoder import IAddrEncoder
 from bip_utils.bech32 import Bech32ChecksumError, SegwitBech32Decoder, SegwitBech32Encoder
-from bip_utils.ecc import IPoint, IPublicKey, Secp256k1, Secp256k1Point, Secp256k1PublicKey
+from bip_utils.ecc import IPoint, IPublicKey, Secp256k1PublicKey, Secp256k1Utils
 from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import BytesUtils, IntegerUtils
+from bip_utils.utils.misc import BytesUtils
 
 
 class P2TRConst:
@@ -83,13 +84,23 @@ class _P2TRUtils:
         Returns:
             bytes: Computed hash
         """
+        return _P2TRUtils.HashTapTweakX(_P2TRUtils.XOnly(pub_key))
 
-        # Use the pre-computed SHA256 of "TapTweak" for speeding up
-        return _P2TRUtils.TaggedHash(
-            P2TRConst.TAP_TWEAK_SHA256,
-            IntegerUtils.ToBytes(pub_key.Point().X(),
-                                 bytes_num=Secp256k1Point.CoordinateLength())
-        )
+    @staticmethod
+    def HashTapTweakX(x_bytes: bytes) -> bytes:
+        """
+        Compute the HashTapTweak of the specified x-only public key.
+        The SHA256 state with the tag prefix already absorbed is copied, instead of hashing it again.
+
+        Args:
+            x_bytes (bytes): X coordinate bytes
+
+        Returns:
+            bytes: Computed hash
+        """
+        sha256 = _P2TRUtils.__TapTweakPrefixHash().Copy()
+        sha256.Update(x_bytes)
+        return sha256.Digest()
 
     @staticmethod
     def LiftX(pub_key: IPublicKey) -> IPoint:
@@ -106,15 +117,12 @@ class _P2TRUtils:
         Raises:
             ValueError: If the point doesn't exist
         """
-        p = P2TRConst.FIELD_SIZE
-        x = pub_key.Point().X()
-        if x >= p:
-            raise ValueError("Unable to compute LiftX point")
-        c = (pow(x, 3, p) + 7) % p
-        y = pow(c, (p + 1) // 4, p)
-        if c != pow(y, 2, p):
-            raise ValueError("Unable to compute LiftX point")
-        return Secp256k1Point.FromCoordinates(x, y if y % 2 == 0 else p - y)
+
+        # Decompressing the key with even y is exactly lift_x, and it's done by the backend
+        try:
+            return Secp256k1PublicKey.FromBytes(b"\x02" + _P2TRUtils.XOnly(pub_key)).Point()
+        except ValueError as ex:
+            raise ValueError("Unable to compute LiftX point") from ex
 
     @staticmethod
     def TweakPublicKey(pub_key: IPublicKey) -> bytes:
@@ -128,10 +136,50 @@ class _P2TRUtils:
         Returns:
             bytes: X coordinate of the tweaked public key
         """
-        h = _P2TRUtils.HashTapTweak(pub_key)
-        out_point = _P2TRUtils.LiftX(pub_key) + (BytesUtils.ToInteger(h) * Secp256k1.Generator())
-        return IntegerUtils.ToBytes(out_point.X(),
-                                    bytes_num=Secp256k1Point.CoordinateLength())
+        return _P2TRUtils.TweakXOnly(_P2TRUtils.XOnly(pub_key))
+
+    @staticmethod
+    def TweakXOnly(x_bytes: bytes) -> bytes:
+        """
+        Tweak a x-only public key as defined by BIP-0086.
+
+        Args:
+            x_bytes (bytes): X coordinate bytes
+
+        Returns:
+            bytes: X coordinate of the tweaked public key
+
+        Raises:
+            ValueError: If the x coordinate is not on the curve or the key cannot be tweaked
+        """
+        return Secp256k1Utils.XOnlyTweakAdd(x_bytes, _P2TRUtils.HashTapTweakX(x_bytes))
+
+    @staticmethod
+    def XOnly(pub_key: IPublicKey) -> bytes:
+        """
+        Get the x-only public key (i.e. the bytes of its x coordinate).
+
+        Args:
+            pub_key (IPublicKey object): Public key
+
+        Returns:
+            bytes: X coordinate bytes
+        """
+        return pub_key.RawCompressed().ToBytes()[1:]
+
+    @staticmethod
+    @lru_cache()
+    def __TapTweakPrefixHash() -> Sha256:
+        """
+        Get the SHA256 state with the "TapTweak" tag prefix (i.e. SHA256(tag) || SHA256(tag)) already absorbed.
+        Being 64-byte long, the prefix fills exactly one SHA256 block. It shall be copied before being updated.
+
+        Returns:
+            Sha256 object: Sha256 object
+        """
+        sha256 = Sha256()
+        sha256.Update(P2TRConst.TAP_TWEAK_SHA256 + P2TRConst.TAP_TWEAK_SHA256)
+        return sha256
 
 
 class P2TRAddrDecoder(IAddrDecoder):
@@ -205,6 +253,53 @@ class P2TRAddrEncoder(IAddrEncoder):
                                           P2TRConst.WITNESS_VER,
                                           _P2TRUtils.TweakPublicKey(pub_key_obj))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to P2TR addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            hrp (str): HRP
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid or cannot be tweaked
+            TypeError: If a public key is not secp256k1
+        """
+        # Only the x coordinate is needed for tweaking, so compressed key bytes are not parsed if validation is skipped
+        # (an x coordinate not on the curve is anyway detected when lifting it)
+        return P2TRAddrEncoder._EncodeTweakedKeys(
+            [_P2TRUtils.TweakXOnly(
+                AddrKeyValidator.ValidateAndGetSecp256k1KeyBytes(pub_key, skip_validation=skip_validation)[1:]
+            ) for pub_key in pub_keys],
+            **kwargs
+        )
+
+    @staticmethod
+    def _EncodeTweakedKeys(tweaked_keys: List[bytes],
+                           **kwargs: Any) -> List[str]:
+        """
+        Encode many tweaked public keys to P2TR addresses.
+
+        Args:
+            tweaked_keys (list[bytes]): X-only tweaked public keys
+
+        Other Parameters:
+            hrp (str): HRP
+
+        Returns:
+            list[str]: Address strings
+        """
+        return SegwitBech32Encoder.EncodeMany(kwargs["hrp"], P2TRConst.WITNESS_VER, tweaked_keys)
+
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
 P2TRAddr = P2TRAddrEncoder
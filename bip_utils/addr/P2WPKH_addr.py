@@ -27,7 +27,7 @@ References:
 """
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
 from bip_utils.addr.iaddr_decoder import IAddrDecoder
@@ -115,6 +115,52 @@ class P2WPKHAddrEncoder(IAddrEncoder):
                                           P2WPKHAddrConst.WITNESS_VER,
                                           Hash160.QuickDigest(pub_key_obj.RawCompressed().ToBytes()))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to P2WPKH addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            hrp (str): HRP
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        return P2WPKHAddrEncoder._EncodeKeyHashes(
+            Hash160.DigestMany(
+                [AddrKeyValidator.ValidateAndGetSecp256k1KeyBytes(pub_key, skip_validation=skip_validation)
+                 for pub_key in pub_keys]
+            ),
+            **kwargs
+        )
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many public key hashes to P2WPKH addresses.
+
+        Args:
+            key_hashes (list[bytes]): Hash160 of the compressed public keys
+
+        Other Parameters:
+            hrp (str): HRP
+
+        Returns:
+            list[str]: Address strings
+        """
+        return SegwitBech32Encoder.EncodeMany(kwargs["hrp"], P2WPKHAddrConst.WITNESS_VER, key_hashes)
+
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
 P2WPKHAddr = P2WPKHAddrEncoder
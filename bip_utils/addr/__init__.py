@@ -1,12 +1,13 @@
 from bip_utils.addr.ada_byron_addr import (
-    AdaByronAddrDecoder, AdaByronAddrTypes, AdaByronIcarusAddr, AdaByronIcarusAddrEncoder, AdaByronLegacyAddr,
-    AdaByronLegacyAddrEncoder
+    AdaByronAddrConst, AdaByronAddrDecoder, AdaByronAddrTypes, AdaByronIcarusAddr, AdaByronIcarusAddrEncoder,
+    AdaByronLegacyAddr, AdaByronLegacyAddrEncoder
 )
 from bip_utils.addr.ada_shelley_addr import (
     AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags, AdaShelleyRewardAddr,
     AdaShelleyRewardAddrDecoder, AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr, AdaShelleyStakingAddrDecoder,
     AdaShelleyStakingAddrEncoder
 )
+from bip_utils.addr.addr_router import AddrRouter, AddrRouterResult
 from bip_utils.addr.algo_addr import AlgoAddr, AlgoAddrDecoder, AlgoAddrEncoder
 from bip_utils.addr.aptos_addr import AptosAddr, AptosAddrDecoder, AptosAddrEncoder
 from bip_utils.addr.atom_addr import AtomAddr, AtomAddrDecoder, AtomAddrEncoder
@@ -14,7 +15,7 @@ from bip_utils.addr.avax_addr import (
     AvaxPChainAddr, AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddr, AvaxXChainAddrDecoder,
     AvaxXChainAddrEncoder
 )
-from bip_utils.addr.bch_addr_converter import BchAddrConverter
+from bip_utils.addr.bch_addr_converter import BchAddrConverter, BchAddrConverterConst, BchAddrConverterResult
 from bip_utils.addr.egld_addr import EgldAddr, EgldAddrDecoder, EgldAddrEncoder
 from bip_utils.addr.eos_addr import EosAddr, EosAddrDecoder, EosAddrEncoder
 from bip_utils.addr.ergo_addr import ErgoNetworkTypes, ErgoP2PKHAddr, ErgoP2PKHAddrDecoder, ErgoP2PKHAddrEncoder
@@ -22,6 +23,7 @@ from bip_utils.addr.eth_addr import EthAddr, EthAddrDecoder, EthAddrEncoder
 from bip_utils.addr.fil_addr import FilSecp256k1Addr, FilSecp256k1AddrDecoder, FilSecp256k1AddrEncoder
 from bip_utils.addr.iaddr_encoder import IAddrEncoder
 from bip_utils.addr.icx_addr import IcxAddr, IcxAddrDecoder, IcxAddrEncoder
+from bip_utils.addr.multi_addr_encoder import MultiAddrEncoder
 from bip_utils.addr.nano_addr import NanoAddr, NanoAddrDecoder, NanoAddrEncoder
 from bip_utils.addr.near_addr import NearAddr, NearAddrDecoder, NearAddrEncoder
 from bip_utils.addr.neo_addr import NeoAddr, NeoAddrDecoder, NeoAddrEncoder
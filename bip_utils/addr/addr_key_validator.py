@@ -134,6 +134,91 @@ class AddrKeyValidator:
         """
         return AddrKeyValidator.__ValidateAndGetGenericKey(pub_key, Sr25519PublicKey)
 
+    @staticmethod
+    def ValidateAndGetSecp256k1KeyBytes(pub_key: Union[bytes, IPublicKey],
+                                        compressed: bool = True,
+                                        skip_validation: bool = False) -> bytes:
+        """
+        Validate and get the raw bytes of a secp256k1 public key.
+        If validation is skipped, public key bytes with the requested format are returned as they are,
+        so it shall be used only for keys that are known to be valid (e.g. derived by the library itself).
+
+        Args:
+            pub_key (bytes or IPublicKey object): Public key bytes or object
+            compressed (bool, optional)         : True for compressed key, false for uncompressed (default: true)
+            skip_validation (bool, optional)    : True for skipping validation of key bytes (default: false)
+
+        Returns:
+            bytes: Public key bytes
+
+        Raises:
+            TypeError: If the public key is not secp256k1
+            ValueError: If the public key is not valid
+        """
+        if skip_validation and isinstance(pub_key, bytes):
+            if compressed and len(pub_key) == Secp256k1PublicKey.CompressedLength():
+                return pub_key
+            if not compressed and len(pub_key) == Secp256k1PublicKey.UncompressedLength():
+                return pub_key
+
+        pub_key_obj = AddrKeyValidator.ValidateAndGetSecp256k1Key(pub_key)
+        return (pub_key_obj.RawCompressed().ToBytes()
+                if compressed
+                else pub_key_obj.RawUncompressed().ToBytes())
+
+    @staticmethod
+    def ValidateAndGetEd25519KeyBytes(pub_key: Union[bytes, IPublicKey],
+                                      skip_validation: bool = False) -> bytes:
+        """
+        Validate and get the raw bytes of a ed25519 public key (i.e. without the 0x00 prefix).
+        If validation is skipped, public key bytes are returned as they are (prefix excluded),
+        so it shall be used only for keys that are known to be valid (e.g. derived by the library itself).
+
+        Args:
+            pub_key (bytes or IPublicKey object): Public key bytes or object
+            skip_validation (bool, optional)    : True for skipping validation of key bytes (default: false)
+
+        Returns:
+            bytes: Public key bytes
+
+        Raises:
+            TypeError: If the public key is not ed25519
+            ValueError: If the public key is not valid
+        """
+        if skip_validation and isinstance(pub_key, bytes):
+            if len(pub_key) == Ed25519PublicKey.CompressedLength() - 1:
+                return pub_key
+            if len(pub_key) == Ed25519PublicKey.CompressedLength() and pub_key[0] == 0:
+                return pub_key[1:]
+
+        return AddrKeyValidator.ValidateAndGetEd25519Key(pub_key).RawCompressed().ToBytes()[1:]
+
+    @staticmethod
+    def ValidateAndGetSr25519KeyBytes(pub_key: Union[bytes, IPublicKey],
+                                      skip_validation: bool = False) -> bytes:
+        """
+        Validate and get the raw bytes of a sr25519 public key.
+        If validation is skipped, public key bytes are returned as they are,
+        so it shall be used only for keys that are known to be valid (e.g. derived by the library itself).
+
+        Args:
+            pub_key (bytes or IPublicKey object): Public key bytes or object
+            skip_validation (bool, optional)    : True for skipping validation of key bytes (default: false)
+
+        Returns:
+            bytes: Public key bytes
+
+        Raises:
+            TypeError: If the public key is not sr25519
+            ValueError: If the public key is not valid
+        """
+        if (skip_validation
+                and isinstance(pub_key, bytes)
+                and len(pub_key) == Sr25519PublicKey.CompressedLength()):
+            return pub_key
+
+        return AddrKeyValidator.ValidateAndGetSr25519Key(pub_key).RawCompressed().ToBytes()
+
     @staticmethod
     def __ValidateAndGetGenericKey(pub_key: Union[bytes, IPublicKey],
                                    pub_key_cls: Type[IPublicKey]) -> IPublicKey:
@@ -151,8 +236,8 @@ class AddrKeyValidator:
             TypeError: If the public key is not of the correct class type
             ValueError: If the public key is not valid
         """
-        if isinstance(pub_key, bytes):
-            pub_key = pub_key_cls.FromBytes(pub_key)
+        if isinstance(pub_key, (bytes, bytearray, memoryview)):
+            pub_key = pub_key_cls.FromBytes(bytes(pub_key))
         elif not isinstance(pub_key, pub_key_cls):
             curve = EllipticCurveGetter.FromType(pub_key_cls.CurveType())
             raise TypeError(f"A {curve.Name()} public key is required"
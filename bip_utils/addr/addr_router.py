@@ -0,0 +1,647 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for classifying and decoding addresses of many coins."""
+
+# Imports
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+
+from bip_utils.addr.ada_byron_addr import AdaByronAddrDecoder, AdaByronIcarusAddrEncoder, AdaByronLegacyAddrEncoder
+from bip_utils.addr.ada_shelley_addr import (
+    AdaShelleyAddrConst, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags,
+    AdaShelleyStakingAddrDecoder, AdaShelleyStakingAddrEncoder
+)
+from bip_utils.addr.algo_addr import AlgoAddrDecoder, AlgoAddrEncoder
+from bip_utils.addr.aptos_addr import AptosAddrDecoder, AptosAddrEncoder
+from bip_utils.addr.atom_addr import AtomAddrDecoder, AtomAddrEncoder
+from bip_utils.addr.avax_addr import (
+    AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddrDecoder, AvaxXChainAddrEncoder
+)
+from bip_utils.addr.egld_addr import EgldAddrDecoder, EgldAddrEncoder
+from bip_utils.addr.eos_addr import EosAddrDecoder, EosAddrEncoder
+from bip_utils.addr.ergo_addr import ErgoP2PKHAddrDecoder, ErgoP2PKHAddrEncoder
+from bip_utils.addr.eth_addr import EthAddrConst, EthAddrDecoder, EthAddrEncoder
+from bip_utils.addr.fil_addr import FilSecp256k1AddrDecoder, FilSecp256k1AddrEncoder
+from bip_utils.addr.iaddr_decoder import IAddrDecoder
+from bip_utils.addr.iaddr_encoder import IAddrEncoder
+from bip_utils.addr.icx_addr import IcxAddrDecoder, IcxAddrEncoder
+from bip_utils.addr.nano_addr import NanoAddrDecoder, NanoAddrEncoder
+from bip_utils.addr.near_addr import NearAddrDecoder, NearAddrEncoder
+from bip_utils.addr.neo_addr import NeoAddrDecoder, NeoAddrEncoder
+from bip_utils.addr.okex_addr import OkexAddrDecoder, OkexAddrEncoder
+from bip_utils.addr.one_addr import OneAddrDecoder, OneAddrEncoder
+from bip_utils.addr.P2PKH_addr import BchP2PKHAddrDecoder, BchP2PKHAddrEncoder, P2PKHAddrDecoder, P2PKHAddrEncoder
+from bip_utils.addr.P2SH_addr import BchP2SHAddrDecoder, BchP2SHAddrEncoder, P2SHAddrDecoder, P2SHAddrEncoder
+from bip_utils.addr.P2TR_addr import P2TRAddrDecoder, P2TRAddrEncoder
+from bip_utils.addr.P2WPKH_addr import P2WPKHAddrDecoder, P2WPKHAddrEncoder
+from bip_utils.addr.sol_addr import SolAddrDecoder, SolAddrEncoder
+from bip_utils.addr.substrate_addr import (
+    SubstrateEd25519AddrDecoder, SubstrateEd25519AddrEncoder, SubstrateSr25519AddrDecoder, SubstrateSr25519AddrEncoder
+)
+from bip_utils.addr.trx_addr import TrxAddrDecoder, TrxAddrEncoder
+from bip_utils.addr.xlm_addr import XlmAddrDecoder, XlmAddrEncoder
+from bip_utils.addr.xmr_addr import XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddrDecoder, XmrIntegratedAddrEncoder
+from bip_utils.addr.xrp_addr import XrpAddrDecoder, XrpAddrEncoder
+from bip_utils.addr.xtz_addr import XtzAddrDecoder, XtzAddrEncoder
+from bip_utils.addr.zil_addr import ZilAddrDecoder, ZilAddrEncoder
+from bip_utils.base58 import Base58Alphabets, Base58Decoder
+from bip_utils.coin_conf import CoinsConf
+from bip_utils.ss58 import SS58Encoder
+from bip_utils.utils.crypto import Hash160
+
+
+class AddrRouterResult(NamedTuple):
+    """Address router result."""
+
+    coins: Tuple[str, ...]
+    payload: Optional[bytes]
+    error: Optional[str]
+
+
+class _AddrRouteIndex(NamedTuple):
+    """
+    Address route index.
+    If base58_alph is None, the prefix is a string prefix of the address, otherwise it's a bytes prefix of the
+    Base58-decoded address. The length (if not None) is the length of the address or of the decoded bytes.
+    """
+
+    prefix: Union[str, bytes]
+    length: Optional[int]
+    base58_alph: Optional[Base58Alphabets] = None
+
+
+class _AddrRoute:
+    """Address route class. It groups the coins sharing the same decoder and parameters."""
+
+    m_coins: List[str]
+    m_decoder_cls: Type[IAddrDecoder]
+    m_params: Dict[str, Any]
+
+    def __init__(self,
+                 decoder_cls: Type[IAddrDecoder],
+                 params: Dict[str, Any]) -> None:
+        """
+        Construct class.
+
+        Args:
+            decoder_cls (IAddrDecoder class): Decoder class
+            params (dict)                   : Decoder parameters
+        """
+        self.m_coins = []
+        self.m_decoder_cls = decoder_cls
+        self.m_params = params
+
+    def Coins(self) -> List[str]:
+        """
+        Get the coin names.
+
+        Returns:
+            list[str]: Coin names
+        """
+        return self.m_coins
+
+    def Decode(self,
+               addr: str) -> bytes:
+        """
+        Decode an address.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            bytes: Decoded bytes
+
+        Raises:
+            ValueError: If the address encoding is not valid
+        """
+        return self.m_decoder_cls.DecodeAddr(addr, **self.m_params)
+
+
+class _AddrRouterTrie:
+    """
+    Prefix trie class.
+    It works with both strings (one node per character) and bytes (one node per byte).
+    """
+
+    m_root: Dict[Any, Any]
+
+    # Key for storing values in nodes, it cannot be a character or a byte
+    VALUES_KEY: Any = None
+
+    def __init__(self) -> None:
+        """Construct class."""
+        self.m_root = {}
+
+    def Insert(self,
+               prefix: Union[str, bytes],
+               value: Any) -> None:
+        """
+        Insert a value for the specified prefix.
+
+        Args:
+            prefix (str or bytes): Prefix
+            value (any)          : Value
+        """
+        node = self.m_root
+        for elem in prefix:
+            node = node.setdefault(elem, {})
+        node.setdefault(self.VALUES_KEY, []).append(value)
+
+    def Match(self,
+              data: Union[str, bytes]) -> List[Any]:
+        """
+        Get the values of all the prefixes of the specified data, starting from the longest one.
+
+        Args:
+            data (str or bytes): Data
+
+        Returns:
+            list: Values
+        """
+        node = self.m_root
+        values = [node.get(self.VALUES_KEY, [])]
+        for elem in data:
+            next_node = node.get(elem)
+            if next_node is None:
+                break
+            node = next_node
+            values.append(node.get(self.VALUES_KEY, []))
+        return [value for node_values in reversed(values) for value in node_values]
+
+
+class _AddrRouteIndexes:
+    """Class container for getting the route index of decoders whose format depends on the parameters."""
+
+    @staticmethod
+    def Base58Check(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a P2PKH/P2SH address.
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        net_ver = params["net_ver"]
+        return _AddrRouteIndex(net_ver,
+                               len(net_ver) + Hash160.DigestSize() + _AddrRouterConst.BASE58_CHECKSUM_BYTE_LEN,
+                               params.get("base58_alph", Base58Alphabets.BITCOIN))
+
+    @staticmethod
+    def BchBech32(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a Bitcoin Cash P2PKH/P2SH address.
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        return _AddrRouteIndex(params["hrp"] + ":", None)
+
+    @staticmethod
+    def Bech32(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a Bech32 address.
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        return _AddrRouteIndex(params["hrp"] + "1", None)
+
+    @staticmethod
+    def P2WPKH(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a P2WPKH address (witness version 0, i.e. "q").
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        return _AddrRouteIndex(params["hrp"] + "1q", None)
+
+    @staticmethod
+    def P2TR(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a P2TR address (witness version 1, i.e. "p").
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        return _AddrRouteIndex(params["hrp"] + "1p", None)
+
+    @staticmethod
+    def AdaShelley(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a Cardano Shelley address.
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        net_tag = params.get("net_tag", AdaShelleyAddrNetworkTags.MAINNET)
+        return _AddrRouteIndex(AdaShelleyAddrConst.NETWORK_TAG_TO_ADDR_HRP[net_tag] + "1", None)
+
+    @staticmethod
+    def AdaShelleyStaking(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a Cardano Shelley staking address.
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        net_tag = params.get("net_tag", AdaShelleyAddrNetworkTags.MAINNET)
+        return _AddrRouteIndex(AdaShelleyAddrConst.NETWORK_TAG_TO_REWARD_ADDR_HRP[net_tag] + "1", None)
+
+    @staticmethod
+    def Neo(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a Neo address.
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        ver = params["ver"]
+        return _AddrRouteIndex(ver,
+                               len(ver) + Hash160.DigestSize() + _AddrRouterConst.BASE58_CHECKSUM_BYTE_LEN,
+                               Base58Alphabets.BITCOIN)
+
+    @staticmethod
+    def Xtz(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a Tezos address.
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        prefix = params["prefix"].value
+        return _AddrRouteIndex(prefix,
+                               len(prefix) + _AddrRouterConst.XTZ_BLAKE_BYTE_LEN
+                               + _AddrRouterConst.BASE58_CHECKSUM_BYTE_LEN,
+                               Base58Alphabets.BITCOIN)
+
+    @staticmethod
+    def Substrate(params: Dict[str, Any]) -> _AddrRouteIndex:
+        """
+        Get the index of a Substrate address.
+
+        Args:
+            params (dict): Decoder parameters
+
+        Returns:
+            _AddrRouteIndex object: Route index
+        """
+        # Get the SS58 format bytes by encoding a dummy public key
+        ss58_bytes = Base58Decoder.Decode(
+            SS58Encoder.Encode(b"\x00" * _AddrRouterConst.SS58_DATA_BYTE_LEN, params["ss58_format"])
+        )
+        ss58_format_len = (len(ss58_bytes) - _AddrRouterConst.SS58_DATA_BYTE_LEN
+                           - _AddrRouterConst.SS58_CHECKSUM_BYTE_LEN)
+        return _AddrRouteIndex(ss58_bytes[:ss58_format_len],
+                               len(ss58_bytes),
+                               Base58Alphabets.BITCOIN)
+
+
+class _AddrRouterConst:
+    """Class container for address router constants."""
+
+    # Base58 checksum length in bytes
+    BASE58_CHECKSUM_BYTE_LEN: int = 4
+    # SS58 data length in bytes
+    SS58_DATA_BYTE_LEN: int = 32
+    # SS58 checksum length in bytes
+    SS58_CHECKSUM_BYTE_LEN: int = 2
+    # Tezos Blake2b digest length in bytes
+    XTZ_BLAKE_BYTE_LEN: int = 20
+
+    # Encoder classes to decoder classes
+    ENCODER_TO_DECODER: Dict[Type[IAddrEncoder], Type[IAddrDecoder]] = {
+        AdaByronIcarusAddrEncoder: AdaByronAddrDecoder,
+        AdaByronLegacyAddrEncoder: AdaByronAddrDecoder,
+        AdaShelleyAddrEncoder: AdaShelleyAddrDecoder,
+        AdaShelleyStakingAddrEncoder: AdaShelleyStakingAddrDecoder,
+        AlgoAddrEncoder: AlgoAddrDecoder,
+        AptosAddrEncoder: AptosAddrDecoder,
+        AtomAddrEncoder: AtomAddrDecoder,
+        AvaxPChainAddrEncoder: AvaxPChainAddrDecoder,
+        AvaxXChainAddrEncoder: AvaxXChainAddrDecoder,
+        BchP2PKHAddrEncoder: BchP2PKHAddrDecoder,
+        BchP2SHAddrEncoder: BchP2SHAddrDecoder,
+        EgldAddrEncoder: EgldAddrDecoder,
+        EosAddrEncoder: EosAddrDecoder,
+        ErgoP2PKHAddrEncoder: ErgoP2PKHAddrDecoder,
+        EthAddrEncoder: EthAddrDecoder,
+        FilSecp256k1AddrEncoder: FilSecp256k1AddrDecoder,
+        IcxAddrEncoder: IcxAddrDecoder,
+        NanoAddrEncoder: NanoAddrDecoder,
+        NearAddrEncoder: NearAddrDecoder,
+        NeoAddrEncoder: NeoAddrDecoder,
+        OkexAddrEncoder: OkexAddrDecoder,
+        OneAddrEncoder: OneAddrDecoder,
+        P2PKHAddrEncoder: P2PKHAddrDecoder,
+        P2SHAddrEncoder: P2SHAddrDecoder,
+        P2TRAddrEncoder: P2TRAddrDecoder,
+        P2WPKHAddrEncoder: P2WPKHAddrDecoder,
+        SolAddrEncoder: SolAddrDecoder,
+        SubstrateEd25519AddrEncoder: SubstrateEd25519AddrDecoder,
+        SubstrateSr25519AddrEncoder: SubstrateSr25519AddrDecoder,
+        TrxAddrEncoder: TrxAddrDecoder,
+        XlmAddrEncoder: XlmAddrDecoder,
+        XmrAddrEncoder: XmrAddrDecoder,
+        XmrIntegratedAddrEncoder: XmrIntegratedAddrDecoder,
+        XrpAddrEncoder: XrpAddrDecoder,
+        XtzAddrEncoder: XtzAddrDecoder,
+        ZilAddrEncoder: ZilAddrDecoder,
+    }
+
+    # Route indexes of decoders whose format does not depend on the parameters
+    FIXED_INDEXES: Dict[Type[IAddrDecoder], _AddrRouteIndex] = {
+        # CBOR array of 2 elements, starting with a tagged (24) item
+        AdaByronAddrDecoder: _AddrRouteIndex(b"\x82\xd8\x18", None, Base58Alphabets.BITCOIN),
+        AlgoAddrDecoder: _AddrRouteIndex("", 58),
+        # Leading zeros can be omitted, so the length is not fixed
+        AptosAddrDecoder: _AddrRouteIndex(CoinsConf.Aptos.ParamByKey("addr_prefix"), None),
+        AvaxPChainAddrDecoder: _AddrRouteIndex(CoinsConf.AvaxPChain.ParamByKey("addr_prefix")
+                                               + CoinsConf.AvaxPChain.ParamByKey("addr_hrp") + "1",
+                                               None),
+        AvaxXChainAddrDecoder: _AddrRouteIndex(CoinsConf.AvaxXChain.ParamByKey("addr_prefix")
+                                               + CoinsConf.AvaxXChain.ParamByKey("addr_hrp") + "1",
+                                               None),
+        EgldAddrDecoder: _AddrRouteIndex(CoinsConf.Elrond.ParamByKey("addr_hrp") + "1", None),
+        EosAddrDecoder: _AddrRouteIndex(CoinsConf.Eos.ParamByKey("addr_prefix"), None),
+        ErgoP2PKHAddrDecoder: _AddrRouteIndex(b"", 38, Base58Alphabets.BITCOIN),
+        EthAddrDecoder: _AddrRouteIndex(CoinsConf.Ethereum.ParamByKey("addr_prefix"),
+                                        len(CoinsConf.Ethereum.ParamByKey("addr_prefix")) + EthAddrConst.ADDR_LEN),
+        FilSecp256k1AddrDecoder: _AddrRouteIndex(CoinsConf.Filecoin.ParamByKey("addr_prefix"), None),
+        IcxAddrDecoder: _AddrRouteIndex(CoinsConf.Icon.ParamByKey("addr_prefix"),
+                                        len(CoinsConf.Icon.ParamByKey("addr_prefix")) + 40),
+        NanoAddrDecoder: _AddrRouteIndex(CoinsConf.Nano.ParamByKey("addr_prefix"), None),
+        NearAddrDecoder: _AddrRouteIndex("", 64),
+        OkexAddrDecoder: _AddrRouteIndex(CoinsConf.OkexChain.ParamByKey("addr_hrp") + "1", None),
+        OneAddrDecoder: _AddrRouteIndex(CoinsConf.HarmonyOne.ParamByKey("addr_hrp") + "1", None),
+        SolAddrDecoder: _AddrRouteIndex(b"", 32, Base58Alphabets.BITCOIN),
+        TrxAddrDecoder: _AddrRouteIndex(CoinsConf.Tron.ParamByKey("addr_prefix"),
+                                        len(CoinsConf.Tron.ParamByKey("addr_prefix")) + (EthAddrConst.ADDR_LEN // 2)
+                                        + BASE58_CHECKSUM_BYTE_LEN,
+                                        Base58Alphabets.BITCOIN),
+        XlmAddrDecoder: _AddrRouteIndex("", 56),
+        XmrAddrDecoder: _AddrRouteIndex("", 95),
+        XmrIntegratedAddrDecoder: _AddrRouteIndex("", 106),
+        XrpAddrDecoder: _AddrRouteIndex(CoinsConf.Ripple.ParamByKey("p2pkh_net_ver"),
+                                        len(CoinsConf.Ripple.ParamByKey("p2pkh_net_ver")) + Hash160.DigestSize()
+                                        + BASE58_CHECKSUM_BYTE_LEN,
+                                        Base58Alphabets.RIPPLE),
+        ZilAddrDecoder: _AddrRouteIndex(CoinsConf.Zilliqa.ParamByKey("addr_hrp") + "1", None),
+    }
+
+    # Route indexes of decoders whose format depends on the parameters
+    PARAMS_INDEXES: Dict[Type[IAddrDecoder], Callable[[Dict[str, Any]], _AddrRouteIndex]] = {
+        AdaShelleyAddrDecoder: _AddrRouteIndexes.AdaShelley,
+        AdaShelleyStakingAddrDecoder: _AddrRouteIndexes.AdaShelleyStaking,
+        AtomAddrDecoder: _AddrRouteIndexes.Bech32,
+        BchP2PKHAddrDecoder: _AddrRouteIndexes.BchBech32,
+        BchP2SHAddrDecoder: _AddrRouteIndexes.BchBech32,
+        NeoAddrDecoder: _AddrRouteIndexes.Neo,
+        P2PKHAddrDecoder: _AddrRouteIndexes.Base58Check,
+        P2SHAddrDecoder: _AddrRouteIndexes.Base58Check,
+        P2TRAddrDecoder: _AddrRouteIndexes.P2TR,
+        P2WPKHAddrDecoder: _AddrRouteIndexes.P2WPKH,
+        SubstrateEd25519AddrDecoder: _AddrRouteIndexes.Substrate,
+        SubstrateSr25519AddrDecoder: _AddrRouteIndexes.Substrate,
+        XtzAddrDecoder: _AddrRouteIndexes.Xtz,
+    }
+
+
+class AddrRouter:
+    """
+    Address router class.
+    It classifies an address (i.e. finds the coins it can belong to) and decodes it in one pass.
+    The routes are indexed in prefix tries: one for the literal prefixes of the address string (e.g. "0x", Bech32
+    HRPs, "bitcoincash:") and one for each Base58 alphabet with the leading bytes of the decoded address
+    (e.g. net versions, SS58 formats). So, only the decoders matching the address prefix and length are called.
+    Decoders without a prefix (e.g. Stellar, Monero) are candidates for any address and only filtered by length.
+    """
+
+    m_routes: Dict[Tuple[Type[IAddrDecoder], Tuple[Tuple[str, Any], ...]], _AddrRoute]
+    m_str_trie: _AddrRouterTrie
+    m_base58_tries: Dict[Base58Alphabets, _AddrRouterTrie]
+
+    @classmethod
+    def FromCoinConfs(cls,
+                      coin_confs: Iterable[Any]) -> AddrRouter:
+        """
+        Construct class from coin configurations.
+
+        Args:
+            coin_confs (iterable): Coin configurations (e.g. BipCoinConf objects), each one shall have the
+                                   CoinNames, AddrClass and AddrParams methods
+
+        Returns:
+            AddrRouter object: AddrRouter object
+
+        Raises:
+            ValueError: If the address class of a configuration is not supported
+        """
+        router = cls()
+        for coin_conf in coin_confs:
+            router.AddCoinConf(coin_conf)
+        return router
+
+    def __init__(self) -> None:
+        """Construct class."""
+        self.m_routes = {}
+        self.m_str_trie = _AddrRouterTrie()
+        self.m_base58_tries = {}
+
+    def AddCoinConf(self,
+                    coin_conf: Any) -> None:
+        """
+        Add a route from a coin configuration.
+
+        Args:
+            coin_conf (any): Coin configuration (e.g. BipCoinConf object), it shall have the CoinNames,
+                             AddrClass and AddrParams methods
+
+        Raises:
+            ValueError: If the address class of the configuration is not supported
+        """
+        decoder_cls = _AddrRouterConst.ENCODER_TO_DECODER.get(coin_conf.AddrClass())
+        if decoder_cls is None:
+            raise ValueError(f"Unsupported address class {coin_conf.AddrClass().__name__}")
+        self.AddRoute(coin_conf.CoinNames().Name(), decoder_cls, coin_conf.AddrParams())
+
+    def AddRoute(self,
+                 coin_name: str,
+                 decoder_cls: Type[IAddrDecoder],
+                 params: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add a route.
+        Coins with the same decoder class and parameters share the same route, so the address is decoded only once.
+
+        Args:
+            coin_name (str)                 : Coin name
+            decoder_cls (IAddrDecoder class): Decoder class
+            params (dict, optional)         : Decoder parameters (default: none)
+        """
+        params = params or {}
+        route_key = (decoder_cls, tuple(sorted(params.items(), key=lambda param: param[0])))
+
+        route = self.m_routes.get(route_key)
+        if route is None:
+            route = _AddrRoute(decoder_cls, params)
+            self.m_routes[route_key] = route
+            self.__IndexRoute(route)
+        if coin_name not in route.Coins():
+            route.Coins().append(coin_name)
+
+    def Decode(self,
+               addr: str) -> AddrRouterResult:
+        """
+        Classify and decode an address.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            AddrRouterResult object: Result, with the names of the coins the address is valid for (starting from the
+                                     most specific ones), the decoded bytes of the first one and no error if valid,
+                                     or no coins, no decoded bytes and the error if not valid
+        """
+        coins: List[str] = []
+        payload = None
+        error = None
+
+        for route in self.__Candidates(addr):
+            try:
+                dec_bytes = route.Decode(addr)
+            except (TypeError, ValueError) as ex:
+                # Keep the error of the most specific route
+                if error is None:
+                    error = str(ex)
+                continue
+            if payload is None:
+                payload = dec_bytes
+            coins.extend(route.Coins())
+
+        if payload is None:
+            return AddrRouterResult((), None, error or "Unknown address format")
+        return AddrRouterResult(tuple(coins), payload, None)
+
+    def DecodeMany(self,
+                   addrs: Iterable[str]) -> Iterator[AddrRouterResult]:
+        """
+        Classify and decode many addresses.
+        Results are generated one by one, so any number of addresses can be processed.
+
+        Args:
+            addrs (iterable[str]): Address strings
+
+        Returns:
+            iterator[AddrRouterResult]: Results, in the same order of the addresses
+        """
+        return (self.Decode(addr) for addr in addrs)
+
+    def __Candidates(self,
+                     addr: str) -> List[_AddrRoute]:
+        """
+        Get the candidate routes of an address, starting from the most specific one.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            list[_AddrRoute]: Candidate routes
+        """
+        candidates = self.__MatchTrie(self.m_str_trie, addr)
+        # Bech32 addresses are allowed to be uppercase
+        if not candidates and addr.isupper():
+            candidates = self.__MatchTrie(self.m_str_trie, addr.lower())
+
+        for base58_alph, base58_trie in self.m_base58_tries.items():
+            try:
+                addr_dec_bytes = Base58Decoder.Decode(addr, base58_alph)
+            except ValueError:
+                continue
+            candidates.extend(self.__MatchTrie(base58_trie, addr_dec_bytes))
+
+        return candidates
+
+    def __IndexRoute(self,
+                     route: _AddrRoute) -> None:
+        """
+        Index a route.
+
+        Args:
+            route (_AddrRoute object): Route
+        """
+        decoder_cls = route.m_decoder_cls
+        if decoder_cls in _AddrRouterConst.PARAMS_INDEXES:
+            route_idx = _AddrRouterConst.PARAMS_INDEXES[decoder_cls](route.m_params)
+        else:
+            # Unknown decoders are always candidates
+            route_idx = _AddrRouterConst.FIXED_INDEXES.get(decoder_cls, _AddrRouteIndex("", None))
+
+        if route_idx.base58_alph is None:
+            trie = self.m_str_trie
+        else:
+            trie = self.m_base58_tries.setdefault(route_idx.base58_alph, _AddrRouterTrie())
+        trie.Insert(route_idx.prefix, (route, route_idx.length))
+
+    @staticmethod
+    def __MatchTrie(trie: _AddrRouterTrie,
+                    data: Union[str, bytes]) -> List[_AddrRoute]:
+        """
+        Get the routes matching the specified data in a trie.
+        Routes with a fixed length are more specific, so they come first.
+
+        Args:
+            trie (_AddrRouterTrie object): Trie
+            data (str or bytes)          : Data
+
+        Returns:
+            list[_AddrRoute]: Routes
+        """
+        data_len = len(data)
+        matches = trie.Match(data)
+        return ([route for route, length in matches if length == data_len]
+                + [route for route, length in matches if length is None])
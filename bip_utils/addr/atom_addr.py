@@ -21,7 +21,7 @@
 """Module for Atom address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -99,6 +99,52 @@ class AtomAddrEncoder(IAddrEncoder):
         return Bech32Encoder.Encode(hrp,
                                     Hash160.QuickDigest(pub_key_obj.RawCompressed().ToBytes()))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Atom addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            hrp (str): HRP
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        return AtomAddrEncoder._EncodeKeyHashes(
+            Hash160.DigestMany(
+                [AddrKeyValidator.ValidateAndGetSecp256k1KeyBytes(pub_key, skip_validation=skip_validation)
+                 for pub_key in pub_keys]
+            ),
+            **kwargs
+        )
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many public key hashes to Atom addresses.
+
+        Args:
+            key_hashes (list[bytes]): Hash160 of the compressed public keys
+
+        Other Parameters:
+            hrp (str): HRP
+
+        Returns:
+            list[str]: Address strings
+        """
+        return Bech32Encoder.EncodeMany(kwargs["hrp"], key_hashes)
+
 
 # Deprecated: only for compatibility,, Encoder class shall be used instead
 AtomAddr = AtomAddrEncoder
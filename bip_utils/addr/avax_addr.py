@@ -21,7 +21,7 @@
 """Module for Avax address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.atom_addr import AtomAddrDecoder, AtomAddrEncoder
@@ -110,6 +110,48 @@ class AvaxPChainAddrEncoder(IAddrEncoder):
         return prefix + AtomAddrEncoder.EncodeKey(pub_key,
                                                   hrp=CoinsConf.AvaxPChain.ParamByKey("addr_hrp"))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Avax P-Chain addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+            **kwargs                        : Not used
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        prefix = CoinsConf.AvaxPChain.ParamByKey("addr_prefix")
+        return [prefix + addr
+                for addr in AtomAddrEncoder.EncodeKeys(pub_keys,
+                                                       skip_validation,
+                                                       hrp=CoinsConf.AvaxPChain.ParamByKey("addr_hrp"))]
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many public key hashes to Avax P-Chain addresses.
+
+        Args:
+            key_hashes (list[bytes]): Hash160 of the compressed public keys
+
+        Returns:
+            list[str]: Address strings
+        """
+        prefix = CoinsConf.AvaxPChain.ParamByKey("addr_prefix")
+        return [prefix + addr
+                for addr in AtomAddrEncoder._EncodeKeyHashes(key_hashes,
+                                                             hrp=CoinsConf.AvaxPChain.ParamByKey("addr_hrp"))]
+
 
 class AvaxXChainAddrDecoder(IAddrDecoder):
     """
@@ -165,6 +207,48 @@ class AvaxXChainAddrEncoder(IAddrEncoder):
         return prefix + AtomAddrEncoder.EncodeKey(pub_key,
                                                   hrp=CoinsConf.AvaxXChain.ParamByKey("addr_hrp"))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Avax X-Chain addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+            **kwargs                        : Not used
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        prefix = CoinsConf.AvaxXChain.ParamByKey("addr_prefix")
+        return [prefix + addr
+                for addr in AtomAddrEncoder.EncodeKeys(pub_keys,
+                                                       skip_validation,
+                                                       hrp=CoinsConf.AvaxXChain.ParamByKey("addr_hrp"))]
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many public key hashes to Avax X-Chain addresses.
+
+        Args:
+            key_hashes (list[bytes]): Hash160 of the compressed public keys
+
+        Returns:
+            list[str]: Address strings
+        """
+        prefix = CoinsConf.AvaxXChain.ParamByKey("addr_prefix")
+        return [prefix + addr
+                for addr in AtomAddrEncoder._EncodeKeyHashes(key_hashes,
+                                                             hrp=CoinsConf.AvaxXChain.ParamByKey("addr_hrp"))]
+
 
 # Deprecated: only for compatibility,, Encoder classes shall be used instead
 AvaxPChainAddr = AvaxPChainAddrEncoder
@@ -21,15 +21,77 @@
 """Module for converting Bitcoin Cash addresses."""
 
 # Imports
-from typing import Optional
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
 
-from bip_utils.bech32 import BchBech32Decoder, BchBech32Encoder
+from bip_utils.base58 import Base58ChecksumError, Base58Decoder, Base58Encoder
+from bip_utils.bech32 import BchBech32Decoder, BchBech32Encoder, Bech32ChecksumError
+from bip_utils.coin_conf import CoinsConf
+
+
+class BchAddrConverterConst:
+    """Class container for Bitcoin Cash address converter constants."""
+
+    # Hash length in bytes for legacy addresses
+    HASH_BYTE_LEN: int = 20
+    # Default net versions of CashAddr addresses
+    P2PKH_STD_NET_VER: bytes = CoinsConf.BitcoinCashMainNet.ParamByKey("p2pkh_std_net_ver")
+    P2SH_STD_NET_VER: bytes = CoinsConf.BitcoinCashMainNet.ParamByKey("p2sh_std_net_ver")
+    # Default net versions of legacy addresses
+    P2PKH_LEGACY_NET_VER: bytes = CoinsConf.BitcoinCashMainNet.ParamByKey("p2pkh_legacy_net_ver")
+    P2SH_LEGACY_NET_VER: bytes = CoinsConf.BitcoinCashMainNet.ParamByKey("p2sh_legacy_net_ver")
+
+
+class BchAddrConverterResult(NamedTuple):
+    """Bitcoin Cash address converter result."""
+
+    address: Optional[str]
+    error: Optional[str]
+
+
+class _BchAddrConverterUtils:
+    """Class container for Bitcoin Cash address converter utility functions."""
+
+    @staticmethod
+    def ConvertMany(addresses: Iterable[str],
+                    conv_fct: Callable[[str], str]) -> List[BchAddrConverterResult]:
+        """
+        Convert many addresses with the specified function, collecting errors instead of raising them.
+
+        Args:
+            addresses (iterable[str]): Addresses
+            conv_fct (Callable)      : Conversion function
+
+        Returns:
+            list[BchAddrConverterResult]: Conversion results, in the same order of addresses
+        """
+        res = []
+        for address in addresses:
+            try:
+                res.append(BchAddrConverterResult(conv_fct(address), None))
+            except (Base58ChecksumError, Bech32ChecksumError, ValueError) as ex:
+                res.append(BchAddrConverterResult(None, str(ex)))
+        return res
+
+    @staticmethod
+    def SetNetVersion(data: List[int],
+                      net_ver: int) -> None:
+        """
+        Set the net version into a base32 data part.
+        The net version byte spans the first 5-bit word and the 3 most significant bits of the second one.
+
+        Args:
+            data (list[int]): Data part in base32
+            net_ver (int)   : Net version
+        """
+        data[0] = net_ver >> 3
+        data[1] = ((net_ver & 0x07) << 2) | (data[1] & 0x03)
 
 
 class BchAddrConverter:
     """
     Bitcoin Cash address converter class.
-    It allows to convert a Bitcoin Cash address by changing its HRP and net version.
+    It allows to convert a Bitcoin Cash address by changing its HRP and net version, and to convert
+    between legacy and CashAddr formats.
     """
 
     @staticmethod
@@ -42,7 +104,7 @@ class BchAddrConverter:
         Args:
             address (str)            : Bitcoin Cash address
             hrp (str)                : New HRP
-            net_ver (bytes, optional): New net version (if None, the old one will be used)
+            net_ver (bytes, optional): New net version (if None or empty, the old one will be used)
 
         Returns:
             str: Converted address string
@@ -52,7 +114,180 @@ class BchAddrConverter:
             ValueError: If the address string is not valid
         """
 
-        # Decode address
-        curr_net_ver, data = BchBech32Decoder.Decode(address[:address.find(":")], address)
+        # Same net version, only the HRP contribution to the checksum shall be updated
+        if not net_ver:
+            return BchBech32Encoder.ReplaceHrp(address, hrp)
+
+        # Decode address without converting it back from base32
+        curr_hrp, data = BchBech32Decoder.DecodeBase32(address)
+        if len(data) < 2:
+            raise ValueError("Invalid address (data part not valid)")
+
+        # The net version can be replaced in place only if its length doesn't change
+        if len(net_ver) != 1:
+            return BchBech32Encoder.Encode(hrp, net_ver, BchBech32Decoder.Decode(curr_hrp, address)[1])
+        _BchAddrConverterUtils.SetNetVersion(data, net_ver[0])
         # Encode again with new HRP and net version
-        return BchBech32Encoder.Encode(hrp, net_ver or curr_net_ver, data)
+        return BchBech32Encoder.EncodeBase32(hrp, data)
+
+    @staticmethod
+    def ConvertMany(addresses: Iterable[str],
+                    hrp: str,
+                    net_ver: Optional[bytes] = None) -> List[BchAddrConverterResult]:
+        """
+        Convert many Bitcoin Cash addresses by changing their HRP and net version.
+        Errors are reported in the results instead of being raised.
+
+        Args:
+            addresses (iterable[str]): Bitcoin Cash addresses
+            hrp (str)                : New HRP
+            net_ver (bytes, optional): New net version (if None or empty, the old one will be used)
+
+        Returns:
+            list[BchAddrConverterResult]: Conversion results, in the same order of addresses
+        """
+        return _BchAddrConverterUtils.ConvertMany(
+            addresses,
+            lambda address: BchAddrConverter.Convert(address, hrp, net_ver)
+        )
+
+    @staticmethod
+    def LegacyToCashAddr(address: str,
+                         hrp: str,
+                         p2pkh_legacy_net_ver: bytes = BchAddrConverterConst.P2PKH_LEGACY_NET_VER,
+                         p2sh_legacy_net_ver: bytes = BchAddrConverterConst.P2SH_LEGACY_NET_VER) -> str:
+        """
+        Convert a Bitcoin Cash legacy address to the CashAddr format.
+
+        Args:
+            address (str)                         : Legacy address
+            hrp (str)                             : HRP
+            p2pkh_legacy_net_ver (bytes, optional): P2PKH legacy net version (default: main net)
+            p2sh_legacy_net_ver (bytes, optional) : P2SH legacy net version (default: main net)
+
+        Returns:
+            str: CashAddr address string
+
+        Raises:
+            Base58ChecksumError: If the address checksum is not valid
+            ValueError: If the address string is not valid
+        """
+        net_ver, addr_hash = BchAddrConverter.__DecodeLegacy(address, p2pkh_legacy_net_ver, p2sh_legacy_net_ver)
+        return BchBech32Encoder.Encode(hrp, net_ver, addr_hash)
+
+    @staticmethod
+    def LegacyToCashAddrMany(addresses: Iterable[str],
+                             hrp: str,
+                             p2pkh_legacy_net_ver: bytes = BchAddrConverterConst.P2PKH_LEGACY_NET_VER,
+                             p2sh_legacy_net_ver: bytes = BchAddrConverterConst.P2SH_LEGACY_NET_VER
+                             ) -> List[BchAddrConverterResult]:
+        """
+        Convert many Bitcoin Cash legacy addresses to the CashAddr format.
+        Errors are reported in the results instead of being raised.
+
+        Args:
+            addresses (iterable[str])             : Legacy addresses
+            hrp (str)                             : HRP
+            p2pkh_legacy_net_ver (bytes, optional): P2PKH legacy net version (default: main net)
+            p2sh_legacy_net_ver (bytes, optional) : P2SH legacy net version (default: main net)
+
+        Returns:
+            list[BchAddrConverterResult]: Conversion results, in the same order of addresses
+        """
+        return _BchAddrConverterUtils.ConvertMany(
+            addresses,
+            lambda address: BchAddrConverter.LegacyToCashAddr(address,
+                                                              hrp,
+                                                              p2pkh_legacy_net_ver,
+                                                              p2sh_legacy_net_ver)
+        )
+
+    @staticmethod
+    def CashAddrToLegacy(address: str,
+                         p2pkh_legacy_net_ver: bytes = BchAddrConverterConst.P2PKH_LEGACY_NET_VER,
+                         p2sh_legacy_net_ver: bytes = BchAddrConverterConst.P2SH_LEGACY_NET_VER) -> str:
+        """
+        Convert a Bitcoin Cash CashAddr address to the legacy format.
+
+        Args:
+            address (str)                         : CashAddr address
+            p2pkh_legacy_net_ver (bytes, optional): P2PKH legacy net version (default: main net)
+            p2sh_legacy_net_ver (bytes, optional) : P2SH legacy net version (default: main net)
+
+        Returns:
+            str: Legacy address string
+
+        Raises:
+            Bech32ChecksumError: If the address checksum is not valid
+            ValueError: If the address string is not valid
+        """
+        net_ver, addr_hash = BchBech32Decoder.Decode(address[:address.rfind(":")].lower(), address)
+
+        # Get legacy net version
+        if net_ver == BchAddrConverterConst.P2PKH_STD_NET_VER:
+            legacy_net_ver = p2pkh_legacy_net_ver
+        elif net_ver == BchAddrConverterConst.P2SH_STD_NET_VER:
+            legacy_net_ver = p2sh_legacy_net_ver
+        else:
+            raise ValueError(f"Invalid net version (expected P2PKH or P2SH, got {net_ver!r})")
+        # Check hash length
+        if len(addr_hash) != BchAddrConverterConst.HASH_BYTE_LEN:
+            raise ValueError(f"Invalid hash length ({len(addr_hash)})")
+
+        return Base58Encoder.CheckEncode(legacy_net_ver + addr_hash)
+
+    @staticmethod
+    def CashAddrToLegacyMany(addresses: Iterable[str],
+                             p2pkh_legacy_net_ver: bytes = BchAddrConverterConst.P2PKH_LEGACY_NET_VER,
+                             p2sh_legacy_net_ver: bytes = BchAddrConverterConst.P2SH_LEGACY_NET_VER
+                             ) -> List[BchAddrConverterResult]:
+        """
+        Convert many Bitcoin Cash CashAddr addresses to the legacy format.
+        Errors are reported in the results instead of being raised.
+
+        Args:
+            addresses (iterable[str])             : CashAddr addresses
+            p2pkh_legacy_net_ver (bytes, optional): P2PKH legacy net version (default: main net)
+            p2sh_legacy_net_ver (bytes, optional) : P2SH legacy net version (default: main net)
+
+        Returns:
+            list[BchAddrConverterResult]: Conversion results, in the same order of addresses
+        """
+        return _BchAddrConverterUtils.ConvertMany(
+            addresses,
+            lambda address: BchAddrConverter.CashAddrToLegacy(address, p2pkh_legacy_net_ver, p2sh_legacy_net_ver)
+        )
+
+    @staticmethod
+    def __DecodeLegacy(address: str,
+                       p2pkh_legacy_net_ver: bytes,
+                       p2sh_legacy_net_ver: bytes) -> Tuple[bytes, bytes]:
+        """
+        Decode a legacy address and get the corresponding CashAddr net version.
+
+        Args:
+            address (str)               : Legacy address
+            p2pkh_legacy_net_ver (bytes): P2PKH legacy net version
+            p2sh_legacy_net_ver (bytes) : P2SH legacy net version
+
+        Returns:
+            tuple[bytes, bytes]: CashAddr net version (index 0) and hash (index 1)
+
+        Raises:
+            Base58ChecksumError: If the address checksum is not valid
+            ValueError: If the address string is not valid
+        """
+        addr_dec_bytes = Base58Decoder.CheckDecode(address)
+
+        # Get CashAddr net version
+        if addr_dec_bytes.startswith(p2pkh_legacy_net_ver):
+            net_ver, addr_hash = BchAddrConverterConst.P2PKH_STD_NET_VER, addr_dec_bytes[len(p2pkh_legacy_net_ver):]
+        elif addr_dec_bytes.startswith(p2sh_legacy_net_ver):
+            net_ver, addr_hash = BchAddrConverterConst.P2SH_STD_NET_VER, addr_dec_bytes[len(p2sh_legacy_net_ver):]
+        else:
+            raise ValueError("Invalid net version (expected P2PKH or P2SH)")
+        # Check hash length
+        if len(addr_hash) != BchAddrConverterConst.HASH_BYTE_LEN:
+            raise ValueError(f"Invalid hash length ({len(addr_hash)})")
+
+        return net_ver, addr_hash
@@ -21,7 +21,7 @@
 """Module for Ethereum address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Optional, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -41,6 +41,13 @@ class EthAddrConst:
     # Address length
     ADDR_LEN: int = 40
 
+    # Case masks for checksum encoding, indexed by a digest byte (0x20 toggles the case of a hex letter)
+    CHKSUM_HIGH_NIBBLE_MASKS: bytes = bytes((0x20 if b & 0x80 else 0x00) for b in range(256))
+    CHKSUM_LOW_NIBBLE_MASKS: bytes = bytes((0x20 if b & 0x08 else 0x00) for b in range(256))
+    # Case masks for checksum encoding, indexed by an address character (only hex letters have a case)
+    CHKSUM_LETTER_MASKS: bytes = bytes((0x20 if ord("a") <= b <= ord("f") else 0x00) for b in range(256))
+    CHKSUM_UPPER_LETTER_MASKS: bytes = bytes((0x20 if ord("A") <= b <= ord("F") else 0x00) for b in range(256))
+
 
 class _EthAddrUtils:
     """Class container for Ethereum address utility functions."""
@@ -56,13 +63,118 @@ class _EthAddrUtils:
         Returns:
             str: Checksum encoded address
         """
+        addr_bytes = addr.lower().encode()
+        return _EthAddrUtils.__ChecksumEncode(addr_bytes, Kekkak256.QuickDigest(addr_bytes))
+
+    @staticmethod
+    def ChecksumEncodeMany(addrs: Iterable[str]) -> List[str]:
+        """
+        Checksum encode many addresses.
+
+        Args:
+            addrs (iterable[str]): Address strings
+
+        Returns:
+            list[str]: Checksum encoded addresses
+        """
+        addrs_bytes = [addr.lower().encode() for addr in addrs]
+        return [_EthAddrUtils.__ChecksumEncode(addr_bytes, addr_digest)
+                for addr_bytes, addr_digest in zip(addrs_bytes, Kekkak256.DigestMany(addrs_bytes))]
+
+    @staticmethod
+    def IsChecksumValid(addr: str) -> bool:
+        """
+        Get if the checksum encoding of the specified address is valid.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        addr_bytes = addr.encode()
+        addr_lower_bytes = addr_bytes.lower()
+        return _EthAddrUtils.__IsChecksumValid(addr_bytes,
+                                               addr_lower_bytes,
+                                               Kekkak256.QuickDigest(addr_lower_bytes))
+
+    @staticmethod
+    def IsChecksumValidMany(addrs: Iterable[str]) -> List[bool]:
+        """
+        Get if the checksum encoding of many addresses is valid.
+
+        Args:
+            addrs (iterable[str]): Address strings
+
+        Returns:
+            list[bool]: True if valid, false otherwise (for each address)
+        """
+        addrs_bytes = [addr.encode() for addr in addrs]
+        addrs_lower_bytes = [addr_bytes.lower() for addr_bytes in addrs_bytes]
+        return [_EthAddrUtils.__IsChecksumValid(addr_bytes, addr_lower_bytes, addr_digest)
+                for addr_bytes, addr_lower_bytes, addr_digest in zip(addrs_bytes,
+                                                                     addrs_lower_bytes,
+                                                                     Kekkak256.DigestMany(addrs_lower_bytes))]
+
+    @staticmethod
+    def __ChecksumEncode(addr_lower_bytes: bytes,
+                         addr_digest: bytes) -> str:
+        """
+        Checksum encode an address from its digest.
+
+        Args:
+            addr_lower_bytes (bytes): Lowercase address bytes
+            addr_digest (bytes)     : Digest of the lowercase address
+
+        Returns:
+            str: Checksum encoded address
+        """
+        # Flipping the case bit of a lowercase letter makes it uppercase
+        case_mask = _EthAddrUtils.__ChecksumCaseMask(addr_lower_bytes, addr_digest)
+        return (int.from_bytes(addr_lower_bytes, "big") ^ case_mask).to_bytes(len(addr_lower_bytes), "big").decode()
+
+    @staticmethod
+    def __IsChecksumValid(addr_bytes: bytes,
+                          addr_lower_bytes: bytes,
+                          addr_digest: bytes) -> bool:
+        """
+        Get if the checksum encoding of an address is valid from its digest.
+
+        Args:
+            addr_bytes (bytes)      : Address bytes
+            addr_lower_bytes (bytes): Lowercase address bytes
+            addr_digest (bytes)     : Digest of the lowercase address
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        # The uppercase letters of the address shall be exactly the ones required by the digest
+        upper_mask = int.from_bytes(addr_bytes.translate(EthAddrConst.CHKSUM_UPPER_LETTER_MASKS), "big")
+        return upper_mask == _EthAddrUtils.__ChecksumCaseMask(addr_lower_bytes, addr_digest)
+
+    @staticmethod
+    def __ChecksumCaseMask(addr_lower_bytes: bytes,
+                           addr_digest: bytes) -> int:
+        """
+        Get the checksum case mask of an address, i.e. the case bit set for each letter to be uppercased.
+        A character shall be uppercased if the respective nibble of the digest is greater or equal to 8.
+        The nibbles are read directly from the digest bytes (high nibbles for even characters, low ones for odd).
 
-        # Compute address digest
-        addr_hex_digest = BytesUtils.ToHexString(Kekkak256.QuickDigest(addr.lower()))
-        # Encode it
-        enc_addr = [c.upper() if (int(addr_hex_digest[i], 16) >= 8) else c.lower() for i, c in enumerate(addr)]
+        Args:
+            addr_lower_bytes (bytes): Lowercase address bytes
+            addr_digest (bytes)     : Digest of the lowercase address
+
+        Returns:
+            int: Case mask
+        """
+        addr_len = len(addr_lower_bytes)
 
-        return "".join(enc_addr)
+        case_mask = bytearray(addr_len)
+        case_mask[0::2] = addr_digest[:(addr_len + 1) // 2].translate(EthAddrConst.CHKSUM_HIGH_NIBBLE_MASKS)
+        case_mask[1::2] = addr_digest[:addr_len // 2].translate(EthAddrConst.CHKSUM_LOW_NIBBLE_MASKS)
+        # Only letters have a case
+        return (int.from_bytes(case_mask, "big")
+                & int.from_bytes(addr_lower_bytes.translate(EthAddrConst.CHKSUM_LETTER_MASKS), "big"))
 
 
 class EthAddrDecoder(IAddrDecoder):
@@ -97,11 +209,55 @@ class EthAddrDecoder(IAddrDecoder):
         # Validate length
         AddrDecUtils.ValidateLength(addr_no_prefix, EthAddrConst.ADDR_LEN)
         # Check checksum encoding
-        if not skip_chksum_enc and addr_no_prefix != _EthAddrUtils.ChecksumEncode(addr_no_prefix):
+        if not skip_chksum_enc and not _EthAddrUtils.IsChecksumValid(addr_no_prefix):
             raise ValueError("Invalid checksum encoding")
 
         return BytesUtils.FromHexString(addr_no_prefix)
 
+    @staticmethod
+    def IsValidMany(addrs: Iterable[str],
+                    **kwargs: Any) -> List[bool]:
+        """
+        Get if many Ethereum addresses are valid.
+        The checksum encoding of all the addresses is verified at once.
+
+        Args:
+            addrs (iterable[str]): Address strings
+
+        Other Parameters:
+            skip_chksum_enc (bool, optional): True to skip checksum encoding verification, false otherwise (default)
+
+        Returns:
+            list[bool]: True if valid, false otherwise (for each address)
+        """
+        skip_chksum_enc = kwargs.get("skip_chksum_enc", False)
+
+        addrs_no_prefix = [EthAddrDecoder.__ValidateAndRemovePrefix(addr) for addr in addrs]
+        if skip_chksum_enc:
+            return [addr is not None for addr in addrs_no_prefix]
+
+        # Verify the checksum encoding only for the addresses with a valid format
+        chksum_valid = iter(_EthAddrUtils.IsChecksumValidMany([addr for addr in addrs_no_prefix if addr is not None]))
+        return [addr is not None and next(chksum_valid) for addr in addrs_no_prefix]
+
+    @staticmethod
+    def __ValidateAndRemovePrefix(addr: str) -> Optional[str]:
+        """
+        Validate the format of an address (without checksum encoding) and remove its prefix.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            str: Address string without prefix
+            None: If the address format is not valid
+        """
+        try:
+            EthAddrDecoder.DecodeAddr(addr, skip_chksum_enc=True)
+        except ValueError:
+            return None
+        return addr[len(CoinsConf.Ethereum.ParamByKey("addr_prefix")):]
+
 
 class EthAddrEncoder(IAddrEncoder):
     """
@@ -139,6 +295,81 @@ class EthAddrEncoder(IAddrEncoder):
                                                                if not skip_chksum_enc
                                                                else addr)
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Ethereum addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            skip_chksum_enc (bool, optional): True to skip checksum encoding, false otherwise (default)
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        # First byte of the uncompressed key (i.e. 0x04) is not needed
+        kekkak_digests = Kekkak256.DigestMany(
+            [AddrKeyValidator.ValidateAndGetSecp256k1KeyBytes(pub_key, False, skip_validation)[1:]
+             for pub_key in pub_keys]
+        )
+        return EthAddrEncoder._EncodeKeyHashes(
+            [kekkak_digest[EthAddrConst.START_BYTE // 2:] for kekkak_digest in kekkak_digests],
+            **kwargs
+        )
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many public key hashes to Ethereum addresses.
+
+        Args:
+            key_hashes (list[bytes]): Last 20 bytes of the Kekkak256 of the public keys
+
+        Other Parameters:
+            skip_chksum_enc (bool, optional): True to skip checksum encoding, false otherwise (default)
+
+        Returns:
+            list[str]: Address strings
+        """
+        skip_chksum_enc = kwargs.get("skip_chksum_enc", False)
+        addr_prefix = CoinsConf.Ethereum.ParamByKey("addr_prefix")
+
+        addrs = [BytesUtils.ToHexString(key_hash) for key_hash in key_hashes]
+        if not skip_chksum_enc:
+            addrs = _EthAddrUtils.ChecksumEncodeMany(addrs)
+        return [addr_prefix + addr for addr in addrs]
+
+    @staticmethod
+    def ChecksumEncodeMany(addrs: Iterable[str]) -> List[str]:
+        """
+        Checksum encode many Ethereum addresses (e.g. lowercase ones).
+        The current checksum encoding of the addresses is not verified.
+
+        Args:
+            addrs (iterable[str]): Address strings
+
+        Returns:
+            list[str]: Checksum encoded address strings
+
+        Raises:
+            ValueError: If an address encoding is not valid
+        """
+        addr_prefix = CoinsConf.Ethereum.ParamByKey("addr_prefix")
+
+        addrs_no_prefix = [BytesUtils.ToHexString(EthAddrDecoder.DecodeAddr(addr, skip_chksum_enc=True))
+                           for addr in addrs]
+        return [addr_prefix + addr for addr in _EthAddrUtils.ChecksumEncodeMany(addrs_no_prefix)]
+
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
 EthAddr = EthAddrEncoder
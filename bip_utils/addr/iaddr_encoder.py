@@ -22,7 +22,7 @@
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.ecc import IPublicKey
 
@@ -48,3 +48,29 @@ class IAddrEncoder(ABC):
             ValueError: If the public key is not valid
             TypeError: If the public key is not of the correct type (it depends on the address type)
         """
+
+    @classmethod
+    def EncodeKeys(cls,
+                   pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to addresses with the same parameters.
+        The generic implementation encodes each key with EncodeKey, the address types used for large
+        address pools override it with a faster one.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes, if supported
+                                              by the address type (default: false). It shall be used only for
+                                              keys that are known to be valid (e.g. derived by the library itself).
+            **kwargs                        : Arbitrary arguments depending on the address type
+
+        Returns:
+            list[str]: Address strings
+
+        Raised:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not of the correct type (it depends on the address type)
+        """
+        return [cls.EncodeKey(pub_key, **kwargs) for pub_key in pub_keys]
@@ -0,0 +1,338 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for encoding a public key to many address types at once."""
+
+# Imports
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type, Union
+
+from bip_utils.addr.addr_key_validator import AddrKeyValidator
+from bip_utils.addr.atom_addr import AtomAddrEncoder
+from bip_utils.addr.avax_addr import AvaxPChainAddrEncoder, AvaxXChainAddrEncoder
+from bip_utils.addr.eth_addr import EthAddrConst, EthAddrEncoder
+from bip_utils.addr.iaddr_encoder import IAddrEncoder
+from bip_utils.addr.okex_addr import OkexAddrEncoder
+from bip_utils.addr.one_addr import OneAddrEncoder
+from bip_utils.addr.P2PKH_addr import BchP2PKHAddrEncoder, P2PKHAddrEncoder, P2PKHPubKeyModes
+from bip_utils.addr.P2SH_addr import BchP2SHAddrEncoder, P2SHAddrEncoder
+from bip_utils.addr.P2TR_addr import P2TRAddrEncoder, _P2TRUtils
+from bip_utils.addr.P2WPKH_addr import P2WPKHAddrEncoder
+from bip_utils.addr.substrate_addr import SubstrateEd25519AddrEncoder, SubstrateSr25519AddrEncoder
+from bip_utils.addr.trx_addr import TrxAddrEncoder
+from bip_utils.ecc import IPublicKey
+from bip_utils.utils.crypto import Hash160, Kekkak256
+
+
+class _MultiAddrKeyData:
+    """
+    Public key data class.
+    It computes the intermediate values of a public key (e.g. key bytes and hashes) only once, when required
+    by an address encoder, and keeps them for the following encoders.
+    """
+
+    m_pub_key: Union[bytes, IPublicKey]
+    m_cache: Dict[str, Any]
+
+    def __init__(self,
+                 pub_key: Union[bytes, IPublicKey]) -> None:
+        """
+        Construct class.
+
+        Args:
+            pub_key (bytes or IPublicKey): Public key bytes or object
+        """
+        self.m_pub_key = pub_key
+        self.m_cache = {}
+
+    def PublicKey(self) -> Union[bytes, IPublicKey]:
+        """
+        Get the public key as passed to the constructor.
+
+        Returns:
+            bytes or IPublicKey: Public key bytes or object
+        """
+        return self.m_pub_key
+
+    def Secp256k1Key(self) -> IPublicKey:
+        """
+        Get the validated secp256k1 public key.
+
+        Returns:
+            IPublicKey object: IPublicKey object
+
+        Raises:
+            TypeError: If the public key is not secp256k1
+            ValueError: If the public key is not valid
+        """
+        return self.__Get("secp256k1_key",
+                          lambda: AddrKeyValidator.ValidateAndGetSecp256k1Key(self.m_pub_key))
+
+    def Ed25519Key(self) -> IPublicKey:
+        """
+        Get the validated ed25519 public key.
+
+        Returns:
+            IPublicKey object: IPublicKey object
+
+        Raises:
+            TypeError: If the public key is not ed25519
+            ValueError: If the public key is not valid
+        """
+        return self.__Get("ed25519_key",
+                          lambda: AddrKeyValidator.ValidateAndGetEd25519Key(self.m_pub_key))
+
+    def Sr25519Key(self) -> IPublicKey:
+        """
+        Get the validated sr25519 public key.
+
+        Returns:
+            IPublicKey object: IPublicKey object
+
+        Raises:
+            TypeError: If the public key is not sr25519
+            ValueError: If the public key is not valid
+        """
+        return self.__Get("sr25519_key",
+                          lambda: AddrKeyValidator.ValidateAndGetSr25519Key(self.m_pub_key))
+
+    def Hash160(self,
+                pub_key_mode: P2PKHPubKeyModes = P2PKHPubKeyModes.COMPRESSED) -> bytes:
+        """
+        Get the Hash160 of the secp256k1 public key.
+
+        Args:
+            pub_key_mode (P2PKHPubKeyModes, optional): Public key mode, compressed key by default
+
+        Returns:
+            bytes: Hash160 of the public key
+        """
+        if pub_key_mode == P2PKHPubKeyModes.COMPRESSED:
+            return self.__Get("hash160_compr",
+                              lambda: Hash160.QuickDigest(self.Secp256k1Key().RawCompressed().ToBytes()))
+        return self.__Get("hash160_uncompr",
+                          lambda: Hash160.QuickDigest(self.Secp256k1Key().RawUncompressed().ToBytes()))
+
+    def P2TRTweakedKey(self) -> bytes:
+        """
+        Get the x-only tweaked secp256k1 public key used by P2TR.
+
+        Returns:
+            bytes: Tweaked public key
+
+        Raises:
+            ValueError: If the public key cannot be tweaked
+        """
+        return self.__Get("p2tr_tweaked_key",
+                          lambda: _P2TRUtils.TweakPublicKey(self.Secp256k1Key()))
+
+    def EthAddrBytes(self) -> bytes:
+        """
+        Get the Ethereum address bytes of the secp256k1 public key (i.e. last bytes of the Keccak256 digest).
+
+        Returns:
+            bytes: Ethereum address bytes
+        """
+        # First byte of the uncompressed key (i.e. 0x04) is not needed
+        return self.__Get("eth_addr", lambda: Kekkak256.QuickDigest(
+            self.Secp256k1Key().RawUncompressed().ToBytes()[1:]
+        )[EthAddrConst.START_BYTE // 2:])
+
+    def __Get(self,
+              name: str,
+              compute_fct: Callable[[], Any]) -> Any:
+        """
+        Get a value from the cache, computing it if not present.
+
+        Args:
+            name (str)            : Value name
+            compute_fct (function): Function for computing the value
+
+        Returns:
+            Any: Value
+        """
+        if name not in self.m_cache:
+            self.m_cache[name] = compute_fct()
+        return self.m_cache[name]
+
+
+class _MultiAddrSharedEncoders:
+    """
+    Class container for shared encoders.
+    Each function encodes the public key with the respective encoder class, starting from the intermediate values
+    already computed in the public key data (i.e. by calling the private encoding methods of the class).
+    """
+
+    @staticmethod
+    def Hash160(encoder_cls: Any,
+                key_data: _MultiAddrKeyData,
+                **kwargs: Any) -> str:
+        """
+        Encode using the Hash160 of the public key.
+
+        Args:
+            encoder_cls (IAddrEncoder class)   : Encoder class
+            key_data (_MultiAddrKeyData object): Public key data
+            **kwargs                           : Encoder parameters
+
+        Returns:
+            str: Address string
+        """
+        key_hash = key_data.Hash160(kwargs.get("pub_key_mode", P2PKHPubKeyModes.COMPRESSED))
+        return encoder_cls._EncodeKeyHashes([key_hash], **kwargs)[0]
+
+    @staticmethod
+    def P2TR(encoder_cls: Any,
+             key_data: _MultiAddrKeyData,
+             **kwargs: Any) -> str:
+        """
+        Encode using the P2TR tweaked public key.
+
+        Args:
+            encoder_cls (IAddrEncoder class)   : Encoder class
+            key_data (_MultiAddrKeyData object): Public key data
+            **kwargs                           : Encoder parameters
+
+        Returns:
+            str: Address string
+        """
+        return encoder_cls._EncodeTweakedKeys([key_data.P2TRTweakedKey()], **kwargs)[0]
+
+    @staticmethod
+    def EthAddr(encoder_cls: Any,
+                key_data: _MultiAddrKeyData,
+                **kwargs: Any) -> str:
+        """
+        Encode using the Ethereum address bytes of the public key.
+
+        Args:
+            encoder_cls (IAddrEncoder class)   : Encoder class
+            key_data (_MultiAddrKeyData object): Public key data
+            **kwargs                           : Encoder parameters
+
+        Returns:
+            str: Address string
+        """
+        return encoder_cls._EncodeKeyHashes([key_data.EthAddrBytes()], **kwargs)[0]
+
+    @staticmethod
+    def Ed25519Key(encoder_cls: Any,
+                   key_data: _MultiAddrKeyData,
+                   **kwargs: Any) -> str:
+        """
+        Encode using the validated ed25519 public key.
+
+        Args:
+            encoder_cls (IAddrEncoder class)   : Encoder class
+            key_data (_MultiAddrKeyData object): Public key data
+            **kwargs                           : Encoder parameters
+
+        Returns:
+            str: Address string
+        """
+        return encoder_cls.EncodeKey(key_data.Ed25519Key(), **kwargs)
+
+    @staticmethod
+    def Sr25519Key(encoder_cls: Any,
+                   key_data: _MultiAddrKeyData,
+                   **kwargs: Any) -> str:
+        """
+        Encode using the validated sr25519 public key.
+
+        Args:
+            encoder_cls (IAddrEncoder class)   : Encoder class
+            key_data (_MultiAddrKeyData object): Public key data
+            **kwargs                           : Encoder parameters
+
+        Returns:
+            str: Address string
+        """
+        return encoder_cls.EncodeKey(key_data.Sr25519Key(), **kwargs)
+
+
+class MultiAddrEncoder:
+    """
+    Multi-address encoder class.
+    It allows encoding the same public key to many address types at once (e.g. P2PKH, P2SH, P2WPKH and P2TR
+    for Bitcoin, or many SS58 formats and HRPs).
+    The public key is validated only once and the intermediate values shared between the address types
+    (i.e. key bytes, Hash160, Keccak256 and tweaked key) are computed only once, then encoded directly
+    by the encoders supporting them.
+    Other encoders are called as they are, so any IAddrEncoder class can be used.
+    """
+
+    SHARED_ENCODERS: Dict[Type[IAddrEncoder], Callable[..., str]] = {
+        AtomAddrEncoder: _MultiAddrSharedEncoders.Hash160,
+        AvaxPChainAddrEncoder: _MultiAddrSharedEncoders.Hash160,
+        AvaxXChainAddrEncoder: _MultiAddrSharedEncoders.Hash160,
+        BchP2PKHAddrEncoder: _MultiAddrSharedEncoders.Hash160,
+        BchP2SHAddrEncoder: _MultiAddrSharedEncoders.Hash160,
+        EthAddrEncoder: _MultiAddrSharedEncoders.EthAddr,
+        OkexAddrEncoder: _MultiAddrSharedEncoders.EthAddr,
+        OneAddrEncoder: _MultiAddrSharedEncoders.EthAddr,
+        P2PKHAddrEncoder: _MultiAddrSharedEncoders.Hash160,
+        P2SHAddrEncoder: _MultiAddrSharedEncoders.Hash160,
+        P2TRAddrEncoder: _MultiAddrSharedEncoders.P2TR,
+        P2WPKHAddrEncoder: _MultiAddrSharedEncoders.Hash160,
+        SubstrateEd25519AddrEncoder: _MultiAddrSharedEncoders.Ed25519Key,
+        SubstrateSr25519AddrEncoder: _MultiAddrSharedEncoders.Sr25519Key,
+        TrxAddrEncoder: _MultiAddrSharedEncoders.EthAddr,
+    }
+
+    @staticmethod
+    def EncodeKey(pub_key: Union[bytes, IPublicKey],
+                  encoders: Iterable[Tuple[Type[IAddrEncoder], Dict[str, Any]]]) -> List[str]:
+        """
+        Encode a public key to many addresses.
+
+        Args:
+            pub_key (bytes or IPublicKey): Public key bytes or object
+            encoders (iterable[tuple])   : Encoder class (index 0) and its parameters (index 1) for each address,
+                                           parameters are the same of the encoder EncodeKey method
+
+        Returns:
+            list[str]: Address strings, in the same order of the encoders
+
+        Raises:
+            ValueError: If the public key is not valid
+            TypeError: If the public key is not of the correct type for an encoder
+        """
+        key_data = _MultiAddrKeyData(pub_key)
+        return [MultiAddrEncoder.__EncodeKey(key_data, encoder_cls, params)
+                for encoder_cls, params in encoders]
+
+    @staticmethod
+    def __EncodeKey(key_data: _MultiAddrKeyData,
+                    encoder_cls: Type[IAddrEncoder],
+                    params: Dict[str, Any]) -> str:
+        """
+        Encode a public key to an address, using the shared values if supported by the encoder.
+
+        Args:
+            key_data (_MultiAddrKeyData object): Public key data
+            encoder_cls (IAddrEncoder class)   : Encoder class
+            params (dict)                      : Encoder parameters
+
+        Returns:
+            str: Address string
+        """
+        shared_encoder_fct = MultiAddrEncoder.SHARED_ENCODERS.get(encoder_cls)
+        if shared_encoder_fct is None:
+            return encoder_cls.EncodeKey(key_data.PublicKey(), **params)
+        return shared_encoder_fct(encoder_cls, key_data, **params)
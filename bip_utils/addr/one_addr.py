@@ -21,7 +21,7 @@
 """Module for Harmony One address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.eth_addr import EthAddrDecoder, EthAddrEncoder
 from bip_utils.addr.iaddr_decoder import IAddrDecoder
@@ -96,6 +96,43 @@ class OneAddrEncoder(IAddrEncoder):
         return Bech32Encoder.Encode(CoinsConf.HarmonyOne.ParamByKey("addr_hrp"),
                                     BytesUtils.FromHexString(eth_addr))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Harmony One addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+            **kwargs                        : Not used
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        # Get addresses in Ethereum format (checksum encoding is not needed)
+        eth_addrs = EthAddrEncoder.EncodeKeys(pub_keys, skip_validation, skip_chksum_enc=True)
+        return OneAddrEncoder._EncodeKeyHashes([BytesUtils.FromHexString(eth_addr[2:]) for eth_addr in eth_addrs])
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many Ethereum address bytes to Harmony One addresses.
+
+        Args:
+            key_hashes (list[bytes]): Ethereum addresses (20 bytes each)
+
+        Returns:
+            list[str]: Address strings
+        """
+        return Bech32Encoder.EncodeMany(CoinsConf.HarmonyOne.ParamByKey("addr_hrp"), key_hashes)
+
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
 OneAddr = OneAddrEncoder
@@ -21,7 +21,7 @@
 """Module for Solana address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -91,6 +91,29 @@ class SolAddrEncoder(IAddrEncoder):
         pub_key_obj = AddrKeyValidator.ValidateAndGetEd25519Key(pub_key)
         return Base58Encoder.Encode(pub_key_obj.RawCompressed().ToBytes()[1:])
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Solana addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+            **kwargs                        : Not used
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not ed25519
+        """
+        return Base58Encoder.EncodeMany(
+            [AddrKeyValidator.ValidateAndGetEd25519KeyBytes(pub_key, skip_validation) for pub_key in pub_keys]
+        )
+
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
 SolAddr = SolAddrEncoder
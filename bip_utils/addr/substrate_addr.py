@@ -21,7 +21,7 @@
 """Module for Substrate address encoding/decoding."""
 
 # Imports
-from typing import Any, Type, Union
+from typing import Any, Iterable, List, Type, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -123,6 +123,32 @@ class SubstrateEd25519AddrEncoder(IAddrEncoder):
         pub_key_obj = AddrKeyValidator.ValidateAndGetEd25519Key(pub_key)
         return SS58Encoder.Encode(pub_key_obj.RawCompressed().ToBytes()[1:], ss58_format)
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Substrate addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            ss58_format (int): SS58 format
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not ed25519
+        """
+        return SS58Encoder.EncodeMany(
+            [AddrKeyValidator.ValidateAndGetEd25519KeyBytes(pub_key, skip_validation) for pub_key in pub_keys],
+            kwargs["ss58_format"]
+        )
+
 
 class SubstrateSr25519AddrDecoder(IAddrDecoder):
     """
@@ -180,6 +206,32 @@ class SubstrateSr25519AddrEncoder(IAddrEncoder):
         pub_key_obj = AddrKeyValidator.ValidateAndGetSr25519Key(pub_key)
         return SS58Encoder.Encode(pub_key_obj.RawCompressed().ToBytes(), ss58_format)
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Substrate addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+
+        Other Parameters:
+            ss58_format (int): SS58 format
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not sr25519
+        """
+        return SS58Encoder.EncodeMany(
+            [AddrKeyValidator.ValidateAndGetSr25519KeyBytes(pub_key, skip_validation) for pub_key in pub_keys],
+            kwargs["ss58_format"]
+        )
+
 
 # Deprecated: only for compatibility, Encoder classes shall be used instead
 SubstrateEd25519Addr = SubstrateEd25519AddrEncoder
@@ -21,7 +21,7 @@
 """Module for Tron address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.eth_addr import EthAddrConst, EthAddrDecoder, EthAddrEncoder
@@ -104,6 +104,44 @@ class TrxAddrEncoder(IAddrEncoder):
         # Add prefix and encode
         return Base58Encoder.CheckEncode(CoinsConf.Tron.ParamByKey("addr_prefix") + BytesUtils.FromHexString(eth_addr))
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Tron addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+            **kwargs                        : Not used
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        # Get addresses in Ethereum format (checksum encoding is not needed)
+        eth_addrs = EthAddrEncoder.EncodeKeys(pub_keys, skip_validation, skip_chksum_enc=True)
+        return TrxAddrEncoder._EncodeKeyHashes([BytesUtils.FromHexString(eth_addr[2:]) for eth_addr in eth_addrs])
+
+    @staticmethod
+    def _EncodeKeyHashes(key_hashes: List[bytes],
+                         **kwargs: Any) -> List[str]:
+        """
+        Encode many Ethereum address bytes to Tron addresses.
+
+        Args:
+            key_hashes (list[bytes]): Ethereum addresses (20 bytes each)
+
+        Returns:
+            list[str]: Address strings
+        """
+        addr_prefix = CoinsConf.Tron.ParamByKey("addr_prefix")
+        return Base58Encoder.CheckEncodeMany([addr_prefix + key_hash for key_hash in key_hashes])
+
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
 TrxAddr = TrxAddrEncoder
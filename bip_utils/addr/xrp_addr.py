@@ -21,7 +21,7 @@
 """Module for Ripple address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.iaddr_decoder import IAddrDecoder
 from bip_utils.addr.iaddr_encoder import IAddrEncoder
@@ -89,6 +89,30 @@ class XrpAddrEncoder(IAddrEncoder):
                                           net_ver=CoinsConf.Ripple.ParamByKey("p2pkh_net_ver"),
                                           base58_alph=Base58Alphabets.RIPPLE)
 
+    @staticmethod
+    def EncodeKeys(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                   skip_validation: bool = False,
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Ripple addresses.
+
+        Args:
+            pub_keys (iterable)             : Public keys (each element shall be bytes or IPublicKey)
+            skip_validation (bool, optional): True for skipping validation of keys passed as bytes (default: false)
+            **kwargs                        : Not used
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If a public key is not valid
+            TypeError: If a public key is not secp256k1
+        """
+        return P2PKHAddrEncoder.EncodeKeys(pub_keys,
+                                           skip_validation,
+                                           net_ver=CoinsConf.Ripple.ParamByKey("p2pkh_net_ver"),
+                                           base58_alph=Base58Alphabets.RIPPLE)
+
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
 XrpAddr = XrpAddrEncoder
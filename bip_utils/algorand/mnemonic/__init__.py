@@ -3,5 +3,7 @@ from bip_utils.algorand.mnemonic.algorand_mnemonic import AlgorandLanguages, Alg
 from bip_utils.algorand.mnemonic.algorand_mnemonic_decoder import AlgorandMnemonicDecoder
 from bip_utils.algorand.mnemonic.algorand_mnemonic_encoder import AlgorandMnemonicEncoder
 from bip_utils.algorand.mnemonic.algorand_mnemonic_generator import AlgorandMnemonicGenerator
-from bip_utils.algorand.mnemonic.algorand_mnemonic_validator import AlgorandMnemonicValidator
+from bip_utils.algorand.mnemonic.algorand_mnemonic_validator import (
+    AlgorandMnemonicBulkValidator, AlgorandMnemonicValidator
+)
 from bip_utils.algorand.mnemonic.algorand_seed_generator import AlgorandSeedGenerator
@@ -25,6 +25,7 @@ from enum import IntEnum, unique
 from typing import List
 
 from bip_utils.bip.bip39 import Bip39Languages, Bip39Mnemonic
+from bip_utils.bip.bip39.bip39_mnemonic import Bip39MnemonicConst
 from bip_utils.utils.mnemonic import MnemonicLanguages
 
 
@@ -53,6 +54,9 @@ class AlgorandMnemonicConst:
     # Checksum length in bytes
     CHECKSUM_BYTE_LEN: int = 2
 
+    # Word length in bit
+    WORD_BIT_LEN: int = Bip39MnemonicConst.WORD_BIT_LEN
+
 
 class AlgorandMnemonic(Bip39Mnemonic):
     """Algorand mnemonic class."""
@@ -24,12 +24,12 @@ Reference: https://github.com/algorand/py-algorand-sdk
 """
 
 # Imports
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Union
 
+from bip_utils.algorand.mnemonic.algorand_entropy_generator import AlgorandEntropyBitLen
 from bip_utils.algorand.mnemonic.algorand_mnemonic import AlgorandLanguages, AlgorandMnemonic, AlgorandMnemonicConst
 from bip_utils.algorand.mnemonic.algorand_mnemonic_utils import AlgorandMnemonicUtils
 from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListFinder, Bip39WordsListGetter
-from bip_utils.utils.misc import BytesUtils
 from bip_utils.utils.mnemonic import Mnemonic, MnemonicChecksumError, MnemonicDecoderBase, MnemonicWordsList
 
 
@@ -86,19 +86,33 @@ class AlgorandMnemonicDecoder(MnemonicDecoderBase):
         words_list, _ = self._FindLanguage(mnemonic_obj)
 
         # Get words indexes
-        word_indexes = [words_list.GetWordIdx(w) for w in words]
-        # Get back entropy as list
-        entropy_list = AlgorandMnemonicUtils.ConvertBits(word_indexes[:-1], 11, 8)
-        # Cannot be None if the number of words is valid (checked at the beginning)
-        assert entropy_list is not None
-        # Get back entropy bytes
-        entropy_bytes = BytesUtils.FromList(entropy_list)[:-1]
+        word_indexes = words_list.GetWordsIdx(words)
+        # Get back entropy bytes from the bit stream, the padding bits of the last word are discarded
+        entropy_bytes = AlgorandMnemonicUtils.WordIndexesToBytes(word_indexes[:-1],
+                                                                 AlgorandEntropyBitLen.BIT_LEN_256 // 8)
 
         # Validate checksum
         self.__ValidateChecksum(entropy_bytes, word_indexes[-1], words_list)
 
         return entropy_bytes
 
+    def DecodeMany(self,
+                   mnemonics: Iterable[Union[str, Mnemonic]]) -> List[bytes]:
+        """
+        Decode many mnemonic phrases to bytes (no checksum).
+
+        Args:
+            mnemonics (iterable): Mnemonics (each element shall be str or Mnemonic object)
+
+        Returns:
+            list[bytes]: Decoded bytes
+
+        Raises:
+            MnemonicChecksumError: If checksum is not valid
+            ValueError: If mnemonic is not valid
+        """
+        return [self.Decode(mnemonic) for mnemonic in mnemonics]
+
     @staticmethod
     def __ValidateChecksum(entropy_bytes: bytes,
                            chksum_word_idx_exp: int,
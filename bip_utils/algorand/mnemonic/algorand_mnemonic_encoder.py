@@ -24,12 +24,13 @@ Reference: https://github.com/algorand/py-algorand-sdk
 """
 
 # Imports
-from typing import List
+from typing import List, Sequence
 
 from bip_utils.algorand.mnemonic.algorand_entropy_generator import AlgorandEntropyGenerator
-from bip_utils.algorand.mnemonic.algorand_mnemonic import AlgorandLanguages, AlgorandMnemonic
+from bip_utils.algorand.mnemonic.algorand_mnemonic import AlgorandLanguages, AlgorandMnemonic, AlgorandMnemonicConst
 from bip_utils.algorand.mnemonic.algorand_mnemonic_utils import AlgorandMnemonicUtils
 from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
+from bip_utils.utils.crypto import Sha512_256
 from bip_utils.utils.mnemonic import Mnemonic, MnemonicEncoderBase
 
 
@@ -70,29 +71,37 @@ class AlgorandMnemonicEncoder(MnemonicEncoderBase):
             ValueError: If bytes length is not valid
         """
 
-        # Check entropy length
-        entropy_byte_len = len(entropy_bytes)
-        if not AlgorandEntropyGenerator.IsValidEntropyByteLen(entropy_byte_len):
-            raise ValueError(f"Entropy byte length ({entropy_byte_len}) is not valid")
-
-        # Compute checksum word
-        chksum_word_idx = AlgorandMnemonicUtils.ComputeChecksumWordIndex(entropy_bytes)
-        # Convert entropy bytes to a list of word indexes
-        word_indexes = AlgorandMnemonicUtils.ConvertBits(entropy_bytes, 8, 11)
-        # Cannot be None by converting bytes from 8-bit to 11-bit
-        assert word_indexes is not None
-        # Get mnemonic
-        return AlgorandMnemonic.FromList(self.__IndexesToWords(word_indexes + [chksum_word_idx]))
-
-    def __IndexesToWords(self,
-                         indexes: List[int]) -> List[str]:
+        return self.EncodeMany([entropy_bytes])[0]
+
+    def EncodeMany(self,
+                   entropies: Sequence[bytes]) -> List[Mnemonic]:
         """
-        Get a list of words from a list of indexes.
+        Encode many bytes to mnemonic phrases.
+        Checksums are computed in a single batch.
 
         Args:
-            indexes (list[int]): List of indexes
+            entropies (sequence[bytes]): Entropy bytes
 
         Returns:
-            list[str]: List of words
+            list[Mnemonic]: Encoded mnemonics
+
+        Raises:
+            ValueError: If bytes length is not valid
         """
-        return [self.m_words_list.GetWordAtIdx(idx) for idx in indexes]
+
+        # Check entropy length
+        for entropy_bytes in entropies:
+            entropy_byte_len = len(entropy_bytes)
+            if not AlgorandEntropyGenerator.IsValidEntropyByteLen(entropy_byte_len):
+                raise ValueError(f"Entropy byte length ({entropy_byte_len}) is not valid")
+
+        mnemonics: List[Mnemonic] = []
+        for entropy_bytes, digest in zip(entropies, Sha512_256.DigestMany(entropies)):
+            # Convert entropy bytes to a list of word indexes and append the checksum word
+            word_indexes = AlgorandMnemonicUtils.BytesToWordIndexes(entropy_bytes)
+            word_indexes.append(
+                AlgorandMnemonicUtils.ChecksumToWordIndex(digest[:AlgorandMnemonicConst.CHECKSUM_BYTE_LEN])
+            )
+            # Words of the list are already normalized
+            mnemonics.append(AlgorandMnemonic(self.m_words_list.GetWordsAtIdx(word_indexes)))
+        return mnemonics
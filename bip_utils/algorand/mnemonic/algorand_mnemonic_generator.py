@@ -21,7 +21,7 @@
 """Module for Algorand mnemonic generation."""
 
 # Imports
-from typing import Dict, Union
+from typing import Dict, Iterable, List, Union
 
 from bip_utils.algorand.mnemonic.algorand_entropy_generator import AlgorandEntropyBitLen, AlgorandEntropyGenerator
 from bip_utils.algorand.mnemonic.algorand_mnemonic import AlgorandLanguages, AlgorandMnemonicConst, AlgorandWordsNum
@@ -77,16 +77,8 @@ class AlgorandMnemonicGenerator:
             ValueError: If words number is not valid
         """
 
-        # Check words number
-        if words_num not in AlgorandMnemonicConst.MNEMONIC_WORD_NUM:
-            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
-
-        # Convert int to enum if necessary
-        if isinstance(words_num, int):
-            words_num = AlgorandWordsNum(words_num)
-
         # Get entropy length in bit from words number
-        entropy_bit_len = AlgorandMnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
         # Generate entropy
         entropy_bytes = AlgorandEntropyGenerator(entropy_bit_len).Generate()
 
@@ -107,3 +99,61 @@ class AlgorandMnemonicGenerator:
             ValueError: If entropy byte length is not valid
         """
         return self.m_mnemonic_encoder.Encode(entropy_bytes)
+
+    def FromWordsNumberMany(self,
+                            words_num: Union[int, AlgorandWordsNum],
+                            count: int) -> List[Mnemonic]:
+        """
+        Generate many mnemonics with the specified words number from random entropy.
+        Entropy is read in a single chunk for all the mnemonics.
+
+        Args:
+            words_num (int or AlgorandWordsNum): Number of words (25)
+            count (int)                        : Number of mnemonics
+
+        Returns:
+            list[Mnemonic]: Generated mnemonics
+
+        Raises:
+            ValueError: If words number or count is not valid
+        """
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
+        return self.FromEntropyMany(AlgorandEntropyGenerator(entropy_bit_len).GenerateMany(count))
+
+    def FromEntropyMany(self,
+                        entropies: Iterable[bytes]) -> List[Mnemonic]:
+        """
+        Generate many mnemonics from the specified entropy bytes.
+
+        Args:
+            entropies (iterable[bytes]): Entropy bytes
+
+        Returns:
+            list[Mnemonic]: Generated mnemonics
+
+        Raises:
+            ValueError: If entropy byte length is not valid
+        """
+        return self.m_mnemonic_encoder.EncodeMany(list(entropies))
+
+    @staticmethod
+    def __EntropyBitLenFromWordsNum(words_num: Union[int, AlgorandWordsNum]) -> int:
+        """
+        Get entropy length from words number.
+
+        Args:
+            words_num (int or AlgorandWordsNum): Words number
+
+        Returns:
+            int: Correspondent entropy length
+
+        Raises:
+            ValueError: If words number is not valid
+        """
+        if words_num not in AlgorandMnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
+
+        # Convert int to enum if necessary
+        if isinstance(words_num, int):
+            words_num = AlgorandWordsNum(words_num)
+        return AlgorandMnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
@@ -25,6 +25,7 @@ from typing import List, Optional, Union
 
 from bip_utils.algorand.mnemonic.algorand_mnemonic import AlgorandMnemonicConst
 from bip_utils.utils.crypto import Sha512_256
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
 class AlgorandMnemonicUtils:
@@ -55,13 +56,64 @@ class AlgorandMnemonicUtils:
             str: Computed checksum word index
         """
 
-        # Compute checksum and convert it to 11-bit
-        chksum = AlgorandMnemonicUtils.ComputeChecksum(data_bytes)
-        chksum_11bit = AlgorandMnemonicUtils.ConvertBits(chksum, 8, 11)
-        # Cannot be None by converting bytes from 8-bit to 11-bit
-        assert chksum_11bit is not None
+        return AlgorandMnemonicUtils.ChecksumToWordIndex(AlgorandMnemonicUtils.ComputeChecksum(data_bytes))
 
-        return chksum_11bit[0]
+    @staticmethod
+    def ChecksumToWordIndex(chksum: bytes) -> int:
+        """
+        Get the checksum word index from a checksum, i.e. its first 11-bit group.
+
+        Args:
+            chksum (bytes): Checksum
+
+        Returns:
+            int: Checksum word index
+        """
+        return (BytesUtils.ToInteger(chksum, endianness="little")
+                & ((1 << AlgorandMnemonicConst.WORD_BIT_LEN) - 1))
+
+    @staticmethod
+    def BytesToWordIndexes(data_bytes: bytes) -> List[int]:
+        """
+        Convert bytes to word indexes.
+        Bytes are read as a single little endian bit stream, from which 11-bit groups are extracted by shift and mask.
+        The last group is padded with zeros if the number of bits is not a multiple of 11.
+
+        Args:
+            data_bytes (bytes): Data bytes
+
+        Returns:
+            list[int]: Word indexes
+        """
+        word_bit_len = AlgorandMnemonicConst.WORD_BIT_LEN
+        word_mask = (1 << word_bit_len) - 1
+        data_int = BytesUtils.ToInteger(data_bytes, endianness="little")
+
+        return [(data_int >> shift) & word_mask
+                for shift in range(0, len(data_bytes) * 8, word_bit_len)]
+
+    @staticmethod
+    def WordIndexesToBytes(word_indexes: List[int],
+                           bytes_num: int) -> bytes:
+        """
+        Convert word indexes to bytes.
+        Word indexes are joined in a single little endian bit stream, exceeding bits are discarded.
+
+        Args:
+            word_indexes (list[int]): Word indexes
+            bytes_num (int)         : Number of bytes
+
+        Returns:
+            bytes: Data bytes
+        """
+        word_bit_len = AlgorandMnemonicConst.WORD_BIT_LEN
+        data_int = 0
+        for word_idx in reversed(word_indexes):
+            data_int = (data_int << word_bit_len) | word_idx
+
+        return IntegerUtils.ToBytes(data_int & ((1 << (bytes_num * 8)) - 1),
+                                    bytes_num=bytes_num,
+                                    endianness="little")
 
     @staticmethod
     def ConvertBits(data: Union[bytes, List[int]],
@@ -23,9 +23,9 @@
 # Imports
 from typing import Optional
 
-from bip_utils.algorand.mnemonic.algorand_mnemonic import AlgorandLanguages
+from bip_utils.algorand.mnemonic.algorand_mnemonic import AlgorandLanguages, AlgorandMnemonic, AlgorandMnemonicConst
 from bip_utils.algorand.mnemonic.algorand_mnemonic_decoder import AlgorandMnemonicDecoder
-from bip_utils.utils.mnemonic import MnemonicValidator
+from bip_utils.utils.mnemonic import MnemonicBulkValidator, MnemonicValidator
 
 
 class AlgorandMnemonicValidator(MnemonicValidator):
@@ -47,3 +47,23 @@ class AlgorandMnemonicValidator(MnemonicValidator):
             lang (AlgorandLanguages, optional): Language, None for automatic detection
         """
         super().__init__(AlgorandMnemonicDecoder(lang))
+
+
+class AlgorandMnemonicBulkValidator(MnemonicBulkValidator):
+    """
+    Algorand bulk mnemonic validator class.
+    It validates a stream of mnemonic phrases.
+    """
+
+    def __init__(self,
+                 lang: Optional[AlgorandLanguages] = AlgorandLanguages.ENGLISH) -> None:
+        """
+        Construct class.
+
+        Args:
+            lang (AlgorandLanguages, optional): Language, None for automatic detection
+
+        Raises:
+            TypeError: If the language is not a AlgorandLanguages enum
+        """
+        super().__init__(AlgorandMnemonicValidator, (lang,), AlgorandMnemonic, AlgorandMnemonicConst.MNEMONIC_WORD_NUM)
@@ -1,3 +1,4 @@
 from bip_utils.base58.base58 import Base58Alphabets, Base58Decoder, Base58Encoder
+from bip_utils.base58.base58_bulk import Base58BulkValidator
 from bip_utils.base58.base58_ex import Base58ChecksumError
 from bip_utils.base58.base58_xmr import Base58XmrDecoder, Base58XmrEncoder
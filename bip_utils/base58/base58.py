@@ -22,7 +22,7 @@
 
 # Imports
 from enum import Enum, auto, unique
-from typing import Dict
+from typing import Dict, Iterable, List
 
 from bip_utils.base58.base58_ex import Base58ChecksumError
 from bip_utils.utils.crypto import DoubleSha256
@@ -49,6 +49,11 @@ class Base58Const:
         Base58Alphabets.BITCOIN: "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz",
         Base58Alphabets.RIPPLE: "rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz",
     }
+    # Alphabets lookup tables (character to digit)
+    ALPHABETS_DIGITS: Dict[Base58Alphabets, Dict[str, int]] = {
+        alph_idx: {c: i for i, c in enumerate(alphabet)}
+        for alph_idx, alphabet in ALPHABETS.items()
+    }
 
 
 class Base58Utils:
@@ -67,6 +72,34 @@ class Base58Utils:
         """
         return DoubleSha256.QuickDigest(data_bytes)[:Base58Const.CHECKSUM_BYTE_LEN]
 
+    @staticmethod
+    def ComputeChecksums(data_bytes: Iterable[bytes]) -> List[bytes]:
+        """
+        Compute Base58 checksum of many data.
+
+        Args:
+            data_bytes (iterable[bytes]): Data bytes
+
+        Returns:
+            list[bytes]: Computed checksums
+        """
+        return [digest[:Base58Const.CHECKSUM_BYTE_LEN]
+                for digest in DoubleSha256.DigestMany(data_bytes)]
+
+    @staticmethod
+    def ValidateAlphabet(alph_idx: Base58Alphabets) -> None:
+        """
+        Validate alphabet index.
+
+        Args:
+            alph_idx (Base58Alphabets): Alphabet index
+
+        Raises:
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+        """
+        if not isinstance(alph_idx, Base58Alphabets):
+            raise TypeError("Alphabet index is not an enumerative of Base58Alphabets")
+
 
 class Base58Encoder:
     """Base58 encoder class. It provides methods for encoding and checksum encoding to Base58 format."""
@@ -87,26 +120,29 @@ class Base58Encoder:
         Raises:
             TypeError: If alphabet index is not a Base58Alphabets enumerative
         """
-        if not isinstance(alph_idx, Base58Alphabets):
-            raise TypeError("Alphabet index is not an enumerative of Base58Alphabets")
+        Base58Utils.ValidateAlphabet(alph_idx)
+        return Base58Encoder.__Encode(data_bytes, Base58Const.ALPHABETS[alph_idx])
 
-        enc = ""
+    @staticmethod
+    def EncodeMany(data_bytes: Iterable[bytes],
+                   alph_idx: Base58Alphabets = Base58Alphabets.BITCOIN) -> List[str]:
+        """
+        Encode many bytes into Base58 strings.
 
-        # Get alphabet
-        alphabet = Base58Const.ALPHABETS[alph_idx]
+        Args:
+            data_bytes (iterable[bytes])        : Data bytes
+            alph_idx (Base58Alphabets, optional): Alphabet index, Bitcoin by default
 
-        # Convert bytes to integer
-        val = BytesUtils.ToInteger(data_bytes)
+        Returns:
+            list[str]: Encoded strings
 
-        # Algorithm implementation
-        while val > 0:
-            val, mod = divmod(val, Base58Const.RADIX)
-            enc = alphabet[mod] + enc
+        Raises:
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+        """
+        Base58Utils.ValidateAlphabet(alph_idx)
 
-        # Get number of leading zeros
-        n = len(data_bytes) - len(data_bytes.lstrip(b"\x00"))
-        # Add padding
-        return (alphabet[0] * n) + enc
+        alphabet = Base58Const.ALPHABETS[alph_idx]
+        return [Base58Encoder.__Encode(data, alphabet) for data in data_bytes]
 
     @staticmethod
     def CheckEncode(data_bytes: bytes,
@@ -128,6 +164,57 @@ class Base58Encoder:
         # Append checksum and encode all together
         return Base58Encoder.Encode(data_bytes + Base58Utils.ComputeChecksum(data_bytes), alph_idx)
 
+    @staticmethod
+    def CheckEncodeMany(data_bytes: Iterable[bytes],
+                        alph_idx: Base58Alphabets = Base58Alphabets.BITCOIN) -> List[str]:
+        """
+        Encode many bytes into Base58 strings with checksum.
+
+        Args:
+            data_bytes (iterable[bytes])        : Data bytes
+            alph_idx (Base58Alphabets, optional): Alphabet index, Bitcoin by default
+
+        Returns:
+            list[str]: Encoded strings with checksum
+
+        Raises:
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+        """
+        Base58Utils.ValidateAlphabet(alph_idx)
+
+        data_bytes = list(data_bytes)
+        alphabet = Base58Const.ALPHABETS[alph_idx]
+        return [Base58Encoder.__Encode(data + checksum, alphabet)
+                for data, checksum in zip(data_bytes, Base58Utils.ComputeChecksums(data_bytes))]
+
+    @staticmethod
+    def __Encode(data_bytes: bytes,
+                 alphabet: str) -> str:
+        """
+        Encode bytes into a Base58 string with the specified alphabet.
+
+        Args:
+            data_bytes (bytes): Data bytes
+            alphabet (str)    : Alphabet
+
+        Returns:
+            str: Encoded string
+        """
+        radix = Base58Const.RADIX
+
+        # Convert bytes to integer and compute digits from the least significant one
+        val = int.from_bytes(data_bytes, byteorder="big")
+        enc = []
+        while val > 0:
+            val, mod = divmod(val, radix)
+            enc.append(alphabet[mod])
+        enc.reverse()
+
+        # Get number of leading zeros
+        n = len(data_bytes) - len(data_bytes.lstrip(b"\x00"))
+        # Add padding
+        return (alphabet[0] * n) + "".join(enc)
+
 
 class Base58Decoder:
     """Base58 decoder class. It provides methods for decoding and checksum decoding Base58 format."""
@@ -146,28 +233,36 @@ class Base58Decoder:
             bytes: Decoded bytes
 
         Raises:
+            ValueError: If the string is not a valid Base58 format
             TypeError: If alphabet index is not a Base58Alphabets enumerative
         """
-        if not isinstance(alph_idx, Base58Alphabets):
-            raise TypeError("Alphabet index is not an enumerative of Base58Alphabets")
+        Base58Utils.ValidateAlphabet(alph_idx)
+        return Base58Decoder.__Decode(data_str,
+                                      Base58Const.ALPHABETS[alph_idx][0],
+                                      Base58Const.ALPHABETS_DIGITS[alph_idx])
 
-        # Get alphabet
-        alphabet = Base58Const.ALPHABETS[alph_idx]
+    @staticmethod
+    def DecodeMany(data_str: Iterable[str],
+                   alph_idx: Base58Alphabets = Base58Alphabets.BITCOIN) -> List[bytes]:
+        """
+        Decode many bytes from Base58 strings.
 
-        # Convert string to integer
-        val = 0
-        for i, c in enumerate(data_str[::-1]):
-            val += alphabet.index(c) * (Base58Const.RADIX ** i)
+        Args:
+            data_str (iterable[str])            : Data strings
+            alph_idx (Base58Alphabets, optional): Alphabet index, Bitcoin by default
 
-        dec = bytearray()
-        while val > 0:
-            val, mod = divmod(val, 2**8)
-            dec.append(mod)
+        Returns:
+            list[bytes]: Decoded bytes
 
-        # Get padding length
-        pad_len = len(data_str) - len(data_str.lstrip(alphabet[0]))
-        # Add padding
-        return (b"\x00" * pad_len) + bytes(dec[::-1])
+        Raises:
+            ValueError: If one of the strings is not a valid Base58 format
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+        """
+        Base58Utils.ValidateAlphabet(alph_idx)
+
+        zero_char = Base58Const.ALPHABETS[alph_idx][0]
+        digits = Base58Const.ALPHABETS_DIGITS[alph_idx]
+        return [Base58Decoder.__Decode(data, zero_char, digits) for data in data_str]
 
     @staticmethod
     def CheckDecode(data_str: str,
@@ -194,14 +289,91 @@ class Base58Decoder:
         data_bytes = dec_bytes[:-Base58Const.CHECKSUM_BYTE_LEN]
         checksum_bytes = dec_bytes[-Base58Const.CHECKSUM_BYTE_LEN:]
 
-        # Compute checksum
-        checksum_bytes_got = Base58Utils.ComputeChecksum(data_bytes)
-
         # Verify checksum
+        Base58Decoder.__VerifyChecksum(checksum_bytes, Base58Utils.ComputeChecksum(data_bytes))
+
+        return data_bytes
+
+    @staticmethod
+    def CheckDecodeMany(data_str: Iterable[str],
+                        alph_idx: Base58Alphabets = Base58Alphabets.BITCOIN) -> List[bytes]:
+        """
+        Decode many bytes from Base58 strings with checksum.
+        All strings are decoded first, then checksums are computed all together.
+
+        Args:
+            data_str (iterable[str])            : Data strings
+            alph_idx (Base58Alphabets, optional): Alphabet index, Bitcoin by default
+
+        Returns:
+            list[bytes]: Decoded bytes (checksum removed)
+
+        Raises:
+            ValueError: If one of the strings is not a valid Base58 format
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+            Base58ChecksumError: If one of the checksums is not valid
+        """
+        checksum_len = Base58Const.CHECKSUM_BYTE_LEN
+
+        # Decode strings
+        dec_bytes = Base58Decoder.DecodeMany(data_str, alph_idx)
+        # Get data bytes
+        data_bytes = [dec[:-checksum_len] for dec in dec_bytes]
+
+        # Verify checksums
+        for dec, checksum_bytes_got in zip(dec_bytes, Base58Utils.ComputeChecksums(data_bytes)):
+            Base58Decoder.__VerifyChecksum(dec[-checksum_len:], checksum_bytes_got)
+
+        return data_bytes
+
+    @staticmethod
+    def __Decode(data_str: str,
+                 zero_char: str,
+                 digits: Dict[str, int]) -> bytes:
+        """
+        Decode bytes from a Base58 string with the specified alphabet.
+
+        Args:
+            data_str (str)        : Data string
+            zero_char (str)       : Alphabet character representing zero
+            digits (dict[str, int]): Alphabet lookup table (character to digit)
+
+        Returns:
+            bytes: Decoded bytes
+
+        Raises:
+            ValueError: If the string is not a valid Base58 format
+        """
+        radix = Base58Const.RADIX
+
+        # Convert string to integer
+        val = 0
+        try:
+            for c in data_str:
+                val = val * radix + digits[c]
+        except KeyError as ex:
+            raise ValueError(f"Invalid Base58 character {ex.args[0]!r}") from ex
+
+        # Get padding length
+        pad_len = len(data_str) - len(data_str.lstrip(zero_char))
+        # Add padding
+        return (b"\x00" * pad_len) + val.to_bytes((val.bit_length() + 7) // 8, byteorder="big")
+
+    @staticmethod
+    def __VerifyChecksum(checksum_bytes: bytes,
+                         checksum_bytes_got: bytes) -> None:
+        """
+        Verify checksum.
+
+        Args:
+            checksum_bytes (bytes)    : Checksum bytes
+            checksum_bytes_got (bytes): Computed checksum bytes
+
+        Raises:
+            Base58ChecksumError: If checksum is not valid
+        """
         if checksum_bytes != checksum_bytes_got:
             raise Base58ChecksumError(
                 f"Invalid checksum (expected {BytesUtils.ToHexString(checksum_bytes_got)}, "
                 f"got {BytesUtils.ToHexString(checksum_bytes)})"
             )
-
-        return data_bytes
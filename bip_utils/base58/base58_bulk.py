@@ -0,0 +1,296 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for bulk Base58 decoding with checksum validation.
+If NumPy is installed, strings are decoded in a vectorized way, otherwise a pure-Python implementation is used.
+"""
+
+# Imports
+from typing import Any, List, Sequence, Tuple
+
+from bip_utils.base58.base58 import Base58Alphabets, Base58Const, Base58Decoder, Base58Utils
+from bip_utils.base58.base58_ex import Base58ChecksumError
+
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE: bool = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class Base58BulkValidatorConst:
+    """Class container for Base58 bulk validator constants."""
+
+    # Limb size in bits for the vectorized radix conversion
+    LIMB_BIT_LEN: int = 32
+    # Limb size in bytes
+    LIMB_BYTE_LEN: int = LIMB_BIT_LEN // 8
+    # Value for invalid characters in lookup tables
+    INVALID_DIGIT: int = 0xFF
+
+
+class Base58BulkValidator:
+    """
+    Base58 bulk validator class.
+    It decodes many Base58 strings of the same length (e.g. P2PKH/P2SH addresses, WIF keys) and validates their
+    checksum, reporting invalid strings in a mask instead of raising exceptions.
+    """
+
+    @staticmethod
+    def IsNumpyAvailable() -> bool:
+        """
+        Get if NumPy is available for vectorized decoding.
+
+        Returns:
+            bool: True if available, false otherwise
+        """
+        return NUMPY_AVAILABLE
+
+    @staticmethod
+    def CheckDecode(data_str: Any,
+                    payload_len: int,
+                    alph_idx: Base58Alphabets = Base58Alphabets.BITCOIN,
+                    use_numpy: bool = True) -> Tuple[Any, Any]:
+        """
+        Decode many Base58 strings with checksum.
+        Strings shall have the same length and shall decode to payload_len bytes plus the checksum.
+        Strings that are not valid Base58, that decode to a different length or whose checksum is not valid are
+        reported as invalid in the mask. The checksum is computed only for strings that were successfully decoded.
+
+        Args:
+            data_str (numpy.ndarray or sequence[str]): Data strings (str or bytes NumPy array, or sequence of str)
+            payload_len (int)                        : Payload length in bytes (checksum excluded)
+            alph_idx (Base58Alphabets, optional)     : Alphabet index, Bitcoin by default
+            use_numpy (bool, optional)               : True for using NumPy if available (default: true)
+
+        Returns:
+            tuple: Decoded payloads (index 0) and valid mask (index 1).
+                   With NumPy, a uint8 array of shape (n, payload_len) and a bool array of shape (n,),
+                   where rows of invalid strings are zeroed.
+                   Without NumPy, a list of bytes (empty for invalid strings) and a list of bool.
+
+        Raises:
+            TypeError: If alphabet index is not a Base58Alphabets enumerative
+            ValueError: If the payload length is not valid
+        """
+        Base58Utils.ValidateAlphabet(alph_idx)
+        if payload_len <= 0:
+            raise ValueError(f"Invalid payload length ({payload_len})")
+
+        if use_numpy and NUMPY_AVAILABLE:
+            return _Base58BulkValidatorNumpy.CheckDecode(data_str, payload_len, alph_idx)
+        return _Base58BulkValidatorPython.CheckDecode(data_str, payload_len, alph_idx)
+
+
+class _Base58BulkValidatorPython:
+    """Base58 bulk validator class (pure-Python implementation)."""
+
+    @staticmethod
+    def CheckDecode(data_str: Sequence[str],
+                    payload_len: int,
+                    alph_idx: Base58Alphabets) -> Tuple[List[bytes], List[bool]]:
+        """
+        Decode many Base58 strings with checksum.
+
+        Args:
+            data_str (sequence[str])  : Data strings
+            payload_len (int)         : Payload length in bytes (checksum excluded)
+            alph_idx (Base58Alphabets): Alphabet index
+
+        Returns:
+            tuple[list[bytes], list[bool]]: Decoded payloads (index 0) and valid mask (index 1)
+        """
+        payloads = []
+        valid_mask = []
+        for data in data_str:
+            if isinstance(data, bytes):
+                data = data.decode("ascii", errors="replace")
+            else:
+                data = str(data)
+            try:
+                dec_bytes = Base58Decoder.CheckDecode(data, alph_idx)
+            except (ValueError, Base58ChecksumError):
+                dec_bytes = b""
+            is_valid = len(dec_bytes) == payload_len
+            payloads.append(dec_bytes if is_valid else b"")
+            valid_mask.append(is_valid)
+        return payloads, valid_mask
+
+
+class _Base58BulkValidatorNumpy:
+    """Base58 bulk validator class (NumPy implementation)."""
+
+    @staticmethod
+    def CheckDecode(data_str: Any,
+                    payload_len: int,
+                    alph_idx: Base58Alphabets) -> Tuple[Any, Any]:
+        """
+        Decode many Base58 strings with checksum.
+
+        Args:
+            data_str (numpy.ndarray or sequence[str]): Data strings
+            payload_len (int)                        : Payload length in bytes (checksum excluded)
+            alph_idx (Base58Alphabets)               : Alphabet index
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: Decoded payloads (index 0) and valid mask (index 1)
+        """
+        dec_len = payload_len + Base58Const.CHECKSUM_BYTE_LEN
+        data_str = np.asarray(data_str).reshape(-1)
+        # An empty sequence has no string type (i.e. it is converted to a float array)
+        if data_str.size == 0:
+            return np.zeros((0, payload_len), dtype=np.uint8), np.zeros(0, dtype=bool)
+
+        # Map characters to digits
+        digits, valid_mask, is_short = _Base58BulkValidatorNumpy.__CharsToDigits(data_str, alph_idx)
+        # Convert digits to bytes
+        dec_bytes, is_dec_valid = _Base58BulkValidatorNumpy.__DigitsToBytes(digits, dec_len)
+        valid_mask &= is_dec_valid
+
+        # The number of leading zero characters shall be equal to the number of leading zero bytes
+        str_zeros = _Base58BulkValidatorNumpy.__LeadingZerosCount(digits != 0)
+        bytes_zeros = _Base58BulkValidatorNumpy.__LeadingZerosCount(dec_bytes != 0)
+        valid_mask &= str_zeros == bytes_zeros
+
+        # Verify checksum only for rows that were decoded
+        valid_idx = np.flatnonzero(valid_mask)
+        if valid_idx.size > 0:
+            payloads_valid = dec_bytes[valid_idx, :payload_len]
+            checksums_exp = dec_bytes[valid_idx, payload_len:]
+            payloads_buf = payloads_valid.tobytes()
+            checksums_got = np.frombuffer(
+                b"".join(Base58Utils.ComputeChecksums(payloads_buf[i:i + payload_len]
+                                                      for i in range(0, len(payloads_buf), payload_len))),
+                dtype=np.uint8
+            ).reshape(-1, Base58Const.CHECKSUM_BYTE_LEN)
+            valid_mask[valid_idx] = np.all(checksums_exp == checksums_got, axis=1)
+
+        payloads = dec_bytes[:, :payload_len]
+        payloads[~valid_mask] = 0
+
+        # Strings shorter than the array item size (i.e. padded with null characters) are decoded one by one
+        short_idx = np.flatnonzero(is_short)
+        if short_idx.size > 0:
+            short_payloads, short_valid_mask = _Base58BulkValidatorPython.CheckDecode(
+                [data_str[i] for i in short_idx], payload_len, alph_idx
+            )
+            for i, payload, is_valid in zip(short_idx, short_payloads, short_valid_mask):
+                valid_mask[i] = is_valid
+                if is_valid:
+                    payloads[i] = np.frombuffer(payload, dtype=np.uint8)
+
+        return payloads, valid_mask
+
+    @staticmethod
+    def __CharsToDigits(data_str: Any,
+                        alph_idx: Base58Alphabets) -> Tuple[Any, Any, Any]:
+        """
+        Map characters to Base58 digits.
+
+        Args:
+            data_str (numpy.ndarray)  : Data strings
+            alph_idx (Base58Alphabets): Alphabet index
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Digits of shape (n, str_len) (index 0), valid mask
+                                                                (index 1) and mask of strings shorter than str_len
+                                                                (index 2)
+
+        Raises:
+            TypeError: If the array is not of strings or bytes
+        """
+        if data_str.dtype.kind == "U":
+            char_size = 4
+            chars = data_str.view(np.uint32)
+        elif data_str.dtype.kind == "S":
+            char_size = 1
+            chars = data_str.view(np.uint8)
+        else:
+            raise TypeError(f"Invalid array type ({data_str.dtype})")
+
+        str_num = data_str.size
+        str_len = data_str.dtype.itemsize // char_size
+        chars = chars.reshape(str_num, str_len)
+
+        # Build lookup table, non-ASCII characters are mapped to an invalid digit
+        lut = np.full(256, Base58BulkValidatorConst.INVALID_DIGIT, dtype=np.uint8)
+        for c, digit in Base58Const.ALPHABETS_DIGITS[alph_idx].items():
+            lut[ord(c)] = digit
+
+        is_ascii = chars < 0x80
+        digits = lut[np.where(is_ascii, chars, 0)]
+        is_digit = is_ascii & (digits != Base58BulkValidatorConst.INVALID_DIGIT)
+
+        return np.where(is_digit, digits, 0), np.all(is_digit, axis=1), np.any(chars == 0, axis=1)
+
+    @staticmethod
+    def __DigitsToBytes(digits: Any,
+                        dec_len: int) -> Tuple[Any, Any]:
+        """
+        Convert Base58 digits to fixed-length big-endian bytes, using 32-bit limbs.
+
+        Args:
+            digits (numpy.ndarray): Digits of shape (n, str_len)
+            dec_len (int)         : Decoded length in bytes
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: Bytes of shape (n, dec_len) (index 0) and valid mask (index 1),
+                                                 false for values not fitting in dec_len bytes
+        """
+        limb_bit_len = Base58BulkValidatorConst.LIMB_BIT_LEN
+        limb_byte_len = Base58BulkValidatorConst.LIMB_BYTE_LEN
+        limb_mask = (1 << limb_bit_len) - 1
+
+        str_num = digits.shape[0]
+        limbs_num = (dec_len + limb_byte_len - 1) // limb_byte_len
+        # Limbs are stored from the least significant one in 64-bit integers, so that multiplications do not overflow
+        limbs = np.zeros((limbs_num, str_num), dtype=np.uint64)
+        overflow = np.zeros(str_num, dtype=bool)
+
+        radix = np.uint64(Base58Const.RADIX)
+        for col in digits.T.astype(np.uint64):
+            carry = col
+            for i in range(limbs_num):
+                acc = limbs[i] * radix + carry
+                limbs[i] = acc & np.uint64(limb_mask)
+                carry = acc >> np.uint64(limb_bit_len)
+            overflow |= carry != 0
+
+        # Convert limbs to big-endian bytes and remove the exceeding leading ones
+        dec_bytes = limbs[::-1].T.astype(">u4", order="C").view(np.uint8).reshape(str_num, limbs_num * limb_byte_len)
+        exceeding_len = limbs_num * limb_byte_len - dec_len
+        overflow |= np.any(dec_bytes[:, :exceeding_len] != 0, axis=1)
+
+        return np.ascontiguousarray(dec_bytes[:, exceeding_len:]), ~overflow
+
+    @staticmethod
+    def __LeadingZerosCount(is_non_zero: Any) -> Any:
+        """
+        Count the leading zeros of each row.
+
+        Args:
+            is_non_zero (numpy.ndarray): Bool array of shape (n, m), true for non-zero elements
+
+        Returns:
+            numpy.ndarray: Leading zeros count of shape (n,)
+        """
+        return np.where(np.any(is_non_zero, axis=1), np.argmax(is_non_zero, axis=1), is_non_zero.shape[1])
@@ -21,9 +21,9 @@
 """Module for base58-monero decoding/encoding."""
 
 # Imports
-from typing import List
+from typing import Dict, Iterable, List, Tuple
 
-from bip_utils.base58.base58 import Base58Alphabets, Base58Const, Base58Decoder, Base58Encoder
+from bip_utils.base58.base58 import Base58Alphabets, Base58Const
 
 
 class Base58XmrConst:
@@ -31,6 +31,8 @@ class Base58XmrConst:
 
     # Alphabet
     ALPHABET: str = Base58Const.ALPHABETS[Base58Alphabets.BITCOIN]
+    # Alphabet lookup table (character to digit)
+    ALPHABET_DIGITS: Dict[str, int] = Base58Const.ALPHABETS_DIGITS[Base58Alphabets.BITCOIN]
 
     # Block decoded maximum length in bytes
     BLOCK_DEC_MAX_BYTE_LEN: int = 8
@@ -39,6 +41,15 @@ class Base58XmrConst:
     BLOCK_ENC_MAX_BYTE_LEN: int = 11
     # Block encoded lengths in bytes
     BLOCK_ENC_BYTE_LENS: List[int] = [0, 2, 3, 5, 6, 7, 9, 10, 11]
+    # Block decoded lengths in bytes, indexed by encoded length
+    BLOCK_DEC_BYTE_LENS: Dict[int, int] = {
+        enc_len: dec_len for dec_len, enc_len in enumerate(BLOCK_ENC_BYTE_LENS)
+    }
+    # Radix powers for each block encoded length, from the most significant digit
+    BLOCK_ENC_POWERS: Dict[int, Tuple[int, ...]] = {
+        enc_len: tuple(Base58Const.RADIX ** i for i in range(enc_len - 1, -1, -1))
+        for enc_len in BLOCK_ENC_BYTE_LENS
+    }
 
 
 class Base58XmrEncoder:
@@ -58,42 +69,46 @@ class Base58XmrEncoder:
         Returns:
             str: Encoded string
         """
-        enc = ""
-
-        # Get lengths
-        data_len = len(data_bytes)
         block_dec_len = Base58XmrConst.BLOCK_DEC_MAX_BYTE_LEN
 
-        # Compute total block count and last block length
-        tot_block_cnt, last_block_enc_len = divmod(data_len, block_dec_len)
+        # Encode each block (the last one can be shorter) to its fixed length
+        return "".join([
+            Base58XmrEncoder.__EncodeBlock(data_bytes[i:i + block_dec_len])
+            for i in range(0, len(data_bytes), block_dec_len)
+        ])
 
-        # Encode each single block and pad
-        for i in range(tot_block_cnt):
-            block_enc = Base58Encoder.Encode(data_bytes[i * block_dec_len:(i + 1) * block_dec_len])
-            enc += Base58XmrEncoder.__Pad(block_enc, Base58XmrConst.BLOCK_ENC_MAX_BYTE_LEN)
+    @staticmethod
+    def EncodeMany(data_bytes: Iterable[bytes]) -> List[str]:
+        """
+        Encode many bytes into Base58 strings with Monero variation.
 
-        # Encode last block and pad
-        if last_block_enc_len > 0:
-            block_enc = Base58Encoder.Encode(
-                data_bytes[tot_block_cnt * block_dec_len:(tot_block_cnt * block_dec_len) + last_block_enc_len])
-            enc += Base58XmrEncoder.__Pad(block_enc, Base58XmrConst.BLOCK_ENC_BYTE_LENS[last_block_enc_len])
+        Args:
+            data_bytes (iterable[bytes]): Data bytes
 
-        return enc
+        Returns:
+            list[str]: Encoded strings
+        """
+        return [Base58XmrEncoder.Encode(d) for d in data_bytes]
 
     @staticmethod
-    def __Pad(enc_str: str,
-              pad_len: int) -> str:
+    def __EncodeBlock(block_bytes: bytes) -> str:
         """
-        Pad the encoded string to the specified length.
+        Encode a block to its fixed encoded length, padding with the zero character.
 
         Args:
-            enc_str (str): Encoded string
-            pad_len (int): Pad length
+            block_bytes (bytes): Block bytes
 
         Returns:
-            str: Padded string
+            str: Encoded block
         """
-        return enc_str.rjust(pad_len, Base58XmrConst.ALPHABET[0])
+        alphabet = Base58XmrConst.ALPHABET
+        radix = Base58Const.RADIX
+
+        block_val = int.from_bytes(block_bytes, "big")
+        return "".join([
+            alphabet[(block_val // power) % radix]
+            for power in Base58XmrConst.BLOCK_ENC_POWERS[Base58XmrConst.BLOCK_ENC_BYTE_LENS[len(block_bytes)]]
+        ])
 
 
 class Base58XmrDecoder:
@@ -112,44 +127,63 @@ class Base58XmrDecoder:
 
         Returns:
             bytes: Decoded bytes
-        """
-        dec = b""
 
-        # Get lengths
-        data_len = len(data_str)
-        block_dec_len = Base58XmrConst.BLOCK_DEC_MAX_BYTE_LEN
+        Raises:
+            ValueError: If the string is not a valid Base58 Monero string
+        """
         block_enc_len = Base58XmrConst.BLOCK_ENC_MAX_BYTE_LEN
 
-        # Compute block count and last block length
-        tot_block_cnt, last_block_enc_len = divmod(data_len, block_enc_len)
+        # Check last block length
+        if (len(data_str) % block_enc_len) not in Base58XmrConst.BLOCK_DEC_BYTE_LENS:
+            raise ValueError(f"Invalid string length ({len(data_str)})")
+
+        # Decode each block (the last one can be shorter) to its fixed decoded length
+        return b"".join([
+            Base58XmrDecoder.__DecodeBlock(data_str[i:i + block_enc_len])
+            for i in range(0, len(data_str), block_enc_len)
+        ])
 
-        # Get last block decoded length
-        last_block_dec_len = Base58XmrConst.BLOCK_ENC_BYTE_LENS.index(last_block_enc_len)
+    @staticmethod
+    def DecodeMany(data_str: Iterable[str]) -> List[bytes]:
+        """
+        Decode many bytes from Base58 strings with Monero variation.
 
-        # Decode each single block and unpad
-        for i in range(tot_block_cnt):
-            block_dec = Base58Decoder.Decode(data_str[(i * block_enc_len):((i + 1) * block_enc_len)])
-            dec += Base58XmrDecoder.__UnPad(block_dec, block_dec_len)
+        Args:
+            data_str (iterable[str]): Data strings
 
-        # Decode last block and unpad
-        if last_block_enc_len > 0:
-            block_dec = Base58Decoder.Decode(
-                data_str[(tot_block_cnt * block_enc_len):((tot_block_cnt * block_enc_len) + last_block_enc_len)])
-            dec += Base58XmrDecoder.__UnPad(block_dec, last_block_dec_len)
+        Returns:
+            list[bytes]: Decoded bytes
 
-        return dec
+        Raises:
+            ValueError: If a string is not a valid Base58 Monero string
+        """
+        return [Base58XmrDecoder.Decode(d) for d in data_str]
 
     @staticmethod
-    def __UnPad(dec_bytes: bytes,
-                unpad_len: int) -> bytes:
+    def __DecodeBlock(block_str: str) -> bytes:
         """
-        Unpad the decoded string to the specified length.
+        Decode a block to its fixed decoded length.
 
         Args:
-            dec_bytes (bytes): Decoded bytes
-            unpad_len (int): Unpad length
+            block_str (str): Block string
 
         Returns:
-            bytes: Unpadded string
+            bytes: Decoded block
+
+        Raises:
+            ValueError: If the block is not valid
         """
-        return dec_bytes[len(dec_bytes) - unpad_len:len(dec_bytes)]
+        digits = Base58XmrConst.ALPHABET_DIGITS
+        radix = Base58Const.RADIX
+
+        block_val = 0
+        try:
+            for c in block_str:
+                block_val = block_val * radix + digits[c]
+        except KeyError as ex:
+            raise ValueError(f"Invalid Base58 character {ex.args[0]!r}") from ex
+
+        block_dec_len = Base58XmrConst.BLOCK_DEC_BYTE_LENS[len(block_str)]
+        if block_val >> (block_dec_len * 8):
+            raise ValueError(f"Invalid block value (overflow): {block_str}")
+        return block_val.to_bytes(block_dec_len, "big")
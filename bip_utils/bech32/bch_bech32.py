@@ -24,9 +24,10 @@ Reference: https://github.com/bitcoincashorg/bitcoincash.org/blob/master/spec/ca
 """
 
 # Imports
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
-from bip_utils.bech32.bech32_base import Bech32BaseUtils, Bech32DecoderBase, Bech32EncoderBase
+from bip_utils.bech32.bech32_base import Bech32BaseConst, Bech32BaseUtils, Bech32DecoderBase, Bech32EncoderBase
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
@@ -37,41 +38,73 @@ class BchBech32Const:
     SEPARATOR: str = ":"
     # Checksum length
     CHECKSUM_STR_LEN: int = 8
+    # Generator polynomial table, indexed by the 5 most significant bits of the checksum state
+    GENERATOR_TABLE: Tuple[int, ...] = (
+        0x0000000000, 0x98f2bc8e61, 0x79b76d99e2, 0xe145d11783,
+        0xf33e5fb3c4, 0x6bcce33da5, 0x8a89322a26, 0x127b8ea447,
+        0xae2eabe2a8, 0x36dc176cc9, 0xd799c67b4a, 0x4f6b7af52b,
+        0x5d10f4516c, 0xc5e248df0d, 0x24a799c88e, 0xbc552546ef,
+        0x1e4f43e470, 0x86bdff6a11, 0x67f82e7d92, 0xff0a92f3f3,
+        0xed711c57b4, 0x7583a0d9d5, 0x94c671ce56, 0x0c34cd4037,
+        0xb061e806d8, 0x28935488b9, 0xc9d6859f3a, 0x512439115b,
+        0x435fb7b51c, 0xdbad0b3b7d, 0x3ae8da2cfe, 0xa21a66a29f,
+    )
 
 
 class BchBech32Utils:
     """Class container for Bitcoin Cash utility functions."""
 
     @staticmethod
-    def PolyMod(values: List[int]) -> int:
+    def PolyMod(values: Iterable[int],
+                chk: int = 1) -> int:
         """
         Computes the polynomial modulus.
 
         Args:
-            values (list[int]): List of polynomial coefficients
+            values (iterable[int]): List of polynomial coefficients
+            chk (int, optional)   : Initial checksum state (1 by default)
 
         Returns:
             int: Computed modulus
         """
+        return BchBech32Utils.__PolyModState(values, chk) ^ 1
 
-        # Generator polynomial
-        generator = [
-            (0x01, 0x98f2bc8e61),
-            (0x02, 0x79b76d99e2),
-            (0x04, 0xf33e5fb3c4),
-            (0x08, 0xae2eabe2a8),
-            (0x10, 0x1e4f43e470)
-        ]
-        # Compute modulus
-        chk = 1
-        for value in values:
-            top = chk >> 35
-            chk = ((chk & 0x07ffffffff) << 5) ^ value
-            for i in generator:
-                if top & i[0] != 0:
-                    chk ^= i[1]
+    @staticmethod
+    @lru_cache()
+    def HrpPolyMod(hrp: str) -> int:
+        """
+        Compute the checksum state after absorbing the expanded HRP.
+        The result is cached, since the same HRP is usually used for many addresses.
+
+        Args:
+            hrp (str): HRP
 
-        return chk ^ 1
+        Returns:
+            int: Checksum state
+        """
+        return BchBech32Utils.__PolyModState(BchBech32Utils.HrpExpand(hrp), 1)
+
+    @staticmethod
+    @lru_cache()
+    def HrpChecksumDelta(hrp_from: str,
+                         hrp_to: str,
+                         data_len: int) -> int:
+        """
+        Compute the value to be XORed to a checksum for replacing its HRP, leaving the data part unchanged.
+        Since the checksum is linear, the difference only depends on the two HRPs and on the data part length.
+
+        Args:
+            hrp_from (str): Current HRP
+            hrp_to (str)  : New HRP
+            data_len (int): Data part length (without checksum)
+
+        Returns:
+            int: Checksum difference
+        """
+        return BchBech32Utils.__PolyModState(
+            [0] * (data_len + BchBech32Const.CHECKSUM_STR_LEN),
+            BchBech32Utils.HrpPolyMod(hrp_from) ^ BchBech32Utils.HrpPolyMod(hrp_to)
+        )
 
     @staticmethod
     def HrpExpand(hrp: str) -> List[int]:
@@ -100,8 +133,8 @@ class BchBech32Utils:
         Returns:
             list[int]: Computed checksum
         """
-        values = BchBech32Utils.HrpExpand(hrp) + data
-        polymod = BchBech32Utils.PolyMod(values + [0, 0, 0, 0, 0, 0, 0, 0])
+        chk = BchBech32Utils.__PolyModState(data, BchBech32Utils.HrpPolyMod(hrp))
+        polymod = BchBech32Utils.PolyMod([0] * BchBech32Const.CHECKSUM_STR_LEN, chk)
         return [(polymod >> 5 * (7 - i)) & 0x1f for i in range(BchBech32Const.CHECKSUM_STR_LEN)]
 
     @staticmethod
@@ -117,7 +150,26 @@ class BchBech32Utils:
         Returns:
             bool: True if valid, false otherwise
         """
-        return BchBech32Utils.PolyMod(BchBech32Utils.HrpExpand(hrp) + data) == 0
+        return BchBech32Utils.PolyMod(data, BchBech32Utils.HrpPolyMod(hrp)) == 0
+
+    @staticmethod
+    def __PolyModState(values: Iterable[int],
+                       chk: int) -> int:
+        """
+        Compute the polynomial modulus state, i.e. without the final XOR.
+
+        Args:
+            values (iterable[int]): List of polynomial coefficients
+            chk (int)             : Initial checksum state
+
+        Returns:
+            int: Checksum state
+        """
+        generator_table = BchBech32Const.GENERATOR_TABLE
+
+        for value in values:
+            chk = ((chk & 0x07ffffffff) << 5) ^ value ^ generator_table[chk >> 35]
+        return chk
 
 
 class BchBech32Encoder(Bech32EncoderBase):
@@ -149,6 +201,81 @@ class BchBech32Encoder(Bech32EncoderBase):
                                  Bech32BaseUtils.ConvertToBase32(net_ver + data),
                                  BchBech32Const.SEPARATOR)
 
+    @classmethod
+    def EncodeMany(cls,
+                   hrp: str,
+                   net_ver: bytes,
+                   data: Iterable[bytes]) -> List[str]:
+        """
+        Encode many data to Bitcoin Cash Bech32 with the same HRP and net version.
+
+        Args:
+            hrp (str)             : HRP
+            net_ver (bytes)       : Net version
+            data (iterable[bytes]): Data
+
+        Returns:
+            list[str]: Encoded addresses
+
+        Raises:
+            ValueError: If the data is not valid
+        """
+        return [cls.Encode(hrp, net_ver, d) for d in data]
+
+    @classmethod
+    def EncodeBase32(cls,
+                     hrp: str,
+                     data: List[int]) -> str:
+        """
+        Encode to Bitcoin Cash Bech32 from data already converted to base32.
+        It allows to skip the bits conversion when the data part comes from a decoded address.
+
+        Args:
+            hrp (str)       : HRP
+            data (list[int]): Data part in base32 (i.e. net version and data, without checksum)
+
+        Returns:
+            str: Encoded address
+        """
+        return cls._EncodeBech32(hrp, list(data), BchBech32Const.SEPARATOR)
+
+    @staticmethod
+    def ReplaceHrp(addr: str,
+                   hrp: str) -> str:
+        """
+        Replace the HRP of a Bitcoin Cash Bech32 address, leaving its data part unchanged.
+        After validating the address, the checksum is updated with the HRP difference only, without
+        computing it again on the whole data part.
+
+        Args:
+            addr (str): Address
+            hrp (str) : New HRP
+
+        Returns:
+            str: Address with the new HRP
+
+        Raises:
+            ValueError: If the bech32 string is not valid
+            Bech32ChecksumError: If the checksum is not valid
+        """
+        checksum_len = BchBech32Const.CHECKSUM_STR_LEN
+        charset = Bech32BaseConst.CHARSET
+
+        # Decode address to validate it
+        hrp_got, data = BchBech32Decoder.DecodeBase32(addr)
+        addr = addr.lower()
+
+        # Update checksum
+        checksum = 0
+        for c in addr[-checksum_len:]:
+            checksum = (checksum << 5) | Bech32BaseConst.CHARSET_DIGITS[c]
+        checksum ^= BchBech32Utils.HrpChecksumDelta(hrp_got, hrp, len(data))
+
+        return (hrp
+                + BchBech32Const.SEPARATOR
+                + addr[len(hrp_got) + 1:-checksum_len]
+                + "".join([charset[(checksum >> 5 * (checksum_len - 1 - i)) & 0x1f] for i in range(checksum_len)]))
+
     @staticmethod
     def _ComputeChecksum(hrp: str,
                          data: List[int]) -> List[int]:
@@ -204,6 +331,53 @@ class BchBech32Decoder(Bech32DecoderBase):
 
         return IntegerUtils.ToBytes(conv_data[0]), BytesUtils.FromList(conv_data[1:])
 
+    @classmethod
+    def DecodeMany(cls,
+                   hrp: str,
+                   addrs: Iterable[str]) -> List[Tuple[bytes, bytes]]:
+        """
+        Decode many addresses from Bitcoin Cash Bech32 with the same HRP.
+
+        Args:
+            hrp (str)            : Human readable part
+            addrs (iterable[str]): Addresses
+
+        Returns:
+            list[tuple[bytes, bytes]]: Net version (index 0) and data (index 1) of each address
+
+        Raises:
+            ValueError: If a bech32 string is not valid
+            Bech32ChecksumError: If a checksum is not valid
+        """
+        return [cls.Decode(hrp, addr) for addr in addrs]
+
+    @classmethod
+    def DecodeBase32(cls,
+                     addr: str) -> Tuple[str, List[int]]:
+        """
+        Decode from Bitcoin Cash Bech32 without converting the data part back from base32.
+        The HRP is not checked, but returned together with the data part.
+        The data part is anyway checked to be convertible back from base32 (i.e. its padding bits shall be zero).
+
+        Args:
+            addr (str): Address
+
+        Returns:
+            tuple[str, list[int]]: HRP (index 0) and data part in base32 without checksum (index 1)
+
+        Raises:
+            ValueError: If the bech32 string is not valid
+            Bech32ChecksumError: If the checksum is not valid
+        """
+        hrp_got, data = cls._DecodeBech32(addr,
+                                          BchBech32Const.SEPARATOR,
+                                          BchBech32Const.CHECKSUM_STR_LEN)
+
+        # Check padding
+        Bech32BaseUtils.ConvertFromBase32(data)
+
+        return hrp_got, data
+
     @staticmethod
     def _VerifyChecksum(hrp: str,
                         data: List[int]) -> bool:
@@ -29,7 +29,8 @@ References:
 
 # Imports
 from enum import Enum, auto, unique
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
 
 from bip_utils.bech32.bech32_base import Bech32BaseUtils, Bech32DecoderBase, Bech32EncoderBase
 from bip_utils.utils.misc import BytesUtils
@@ -55,35 +56,57 @@ class Bech32Const:
         Bech32Encodings.BECH32: 1,
         Bech32Encodings.BECH32M: 0x2bc830a3,
     }
+    # Generator polynomial table, indexed by the 5 most significant bits of the checksum state
+    GENERATOR_TABLE: Tuple[int, ...] = (
+        0x00000000, 0x3b6a57b2, 0x26508e6d, 0x1d3ad9df,
+        0x1ea119fa, 0x25cb4e48, 0x38f19797, 0x039bc025,
+        0x3d4233dd, 0x0628646f, 0x1b12bdb0, 0x2078ea02,
+        0x23e32a27, 0x18897d95, 0x05b3a44a, 0x3ed9f3f8,
+        0x2a1462b3, 0x117e3501, 0x0c44ecde, 0x372ebb6c,
+        0x34b57b49, 0x0fdf2cfb, 0x12e5f524, 0x298fa296,
+        0x1756516e, 0x2c3c06dc, 0x3106df03, 0x0a6c88b1,
+        0x09f74894, 0x329d1f26, 0x2fa7c6f9, 0x14cd914b,
+    )
 
 
 class Bech32Utils:
     """Class container for Bech32 utility functions."""
 
     @staticmethod
-    def PolyMod(values: List[int]) -> int:
+    def PolyMod(values: Iterable[int],
+                chk: int = 1) -> int:
         """
         Computes the polynomial modulus.
 
         Args:
-            values (list[int]): List of polynomial coefficients
+            values (iterable[int]): List of polynomial coefficients
+            chk (int, optional)   : Initial checksum state (1 by default)
 
         Returns:
             int: Computed modulus
         """
-
-        # Generator polynomial
-        generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+        generator_table = Bech32Const.GENERATOR_TABLE
 
         # Compute modulus
-        chk = 1
         for value in values:
-            top = chk >> 25
-            chk = (chk & 0x1ffffff) << 5 ^ value
-            for i in range(5):
-                chk ^= generator[i] if ((top >> i) & 1) else 0
+            chk = ((chk & 0x1ffffff) << 5) ^ value ^ generator_table[chk >> 25]
         return chk
 
+    @staticmethod
+    @lru_cache()
+    def HrpPolyMod(hrp: str) -> int:
+        """
+        Compute the checksum state after absorbing the expanded HRP.
+        The result is cached, since the same HRP is usually used for many addresses.
+
+        Args:
+            hrp (str): HRP
+
+        Returns:
+            int: Checksum state
+        """
+        return Bech32Utils.PolyMod(Bech32Utils.HrpExpand(hrp))
+
     @staticmethod
     def HrpExpand(hrp: str) -> List[int]:
         """
@@ -113,8 +136,9 @@ class Bech32Utils:
         Returns:
             list[int]: Computed checksum
         """
-        values = Bech32Utils.HrpExpand(hrp) + data
-        polymod = Bech32Utils.PolyMod(values + [0, 0, 0, 0, 0, 0]) ^ Bech32Const.ENCODING_CHECKSUM_CONST[encoding]
+        chk = Bech32Utils.PolyMod(data, Bech32Utils.HrpPolyMod(hrp))
+        chk = Bech32Utils.PolyMod([0] * Bech32Const.CHECKSUM_STR_LEN, chk)
+        polymod = chk ^ Bech32Const.ENCODING_CHECKSUM_CONST[encoding]
         return [(polymod >> 5 * (5 - i)) & 0x1f for i in range(Bech32Const.CHECKSUM_STR_LEN)]
 
     @staticmethod
@@ -132,7 +156,7 @@ class Bech32Utils:
         Returns:
             bool: True if valid, false otherwise
         """
-        polymod = Bech32Utils.PolyMod(Bech32Utils.HrpExpand(hrp) + data)
+        polymod = Bech32Utils.PolyMod(data, Bech32Utils.HrpPolyMod(hrp))
         return polymod == Bech32Const.ENCODING_CHECKSUM_CONST[encoding]
 
 
@@ -163,6 +187,25 @@ class Bech32Encoder(Bech32EncoderBase):
                                  Bech32BaseUtils.ConvertToBase32(data),
                                  Bech32Const.SEPARATOR)
 
+    @classmethod
+    def EncodeMany(cls,
+                   hrp: str,
+                   data: Iterable[bytes]) -> List[str]:
+        """
+        Encode many data to Bech32 with the same HRP.
+
+        Args:
+            hrp (str)             : HRP
+            data (iterable[bytes]): Data
+
+        Returns:
+            list[str]: Encoded addresses
+
+        Raises:
+            ValueError: If the data is not valid
+        """
+        return [cls.Encode(hrp, d) for d in data]
+
     @staticmethod
     def _ComputeChecksum(hrp: str,
                          data: List[int]) -> List[int]:
@@ -219,6 +262,26 @@ class Bech32Decoder(Bech32DecoderBase):
             Bech32BaseUtils.ConvertFromBase32(data)
         )
 
+    @classmethod
+    def DecodeMany(cls,
+                   hrp: str,
+                   addrs: Iterable[str]) -> List[bytes]:
+        """
+        Decode many addresses from Bech32 with the same HRP.
+
+        Args:
+            hrp (str)            : Human readable part
+            addrs (iterable[str]): Addresses
+
+        Returns:
+            list[bytes]: Decoded addresses
+
+        Raises:
+            ValueError: If a bech32 string is not valid
+            Bech32ChecksumError: If a checksum is not valid
+        """
+        return [cls.Decode(hrp, addr) for addr in addrs]
+
     @staticmethod
     def _VerifyChecksum(hrp: str,
                         data: List[int]) -> bool:
@@ -22,7 +22,7 @@
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from bip_utils.bech32.bech32_ex import Bech32ChecksumError
 from bip_utils.utils.misc import AlgoUtils
@@ -33,6 +33,13 @@ class Bech32BaseConst:
 
     # Character set
     CHARSET: str = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+    # Character set digits
+    CHARSET_DIGITS: Dict[str, int] = {c: i for i, c in enumerate(CHARSET)}
+    # Translation table from 5-bit values to the digits used by int() for base 32 (invalid values are mapped to "!")
+    BASE32_INT_DIGITS_TABLE: bytes = bytes.maketrans(
+        bytes(range(32)) + bytes(range(32, 256)),
+        b"0123456789abcdefghijklmnopqrstuv" + b"!" * (256 - 32)
+    )
 
 
 class Bech32BaseUtils:
@@ -102,31 +109,63 @@ class Bech32BaseUtils:
         Returns:
             list[int]: List of converted values, None in case of errors
         """
+
+        # Convert the whole data to an integer, so that bits can be regrouped with shifts only
+        val = Bech32BaseUtils.__ToInteger(data, from_bits)
+        if val is None:
+            return None
+
+        bit_len = len(data) * from_bits
+        if pad:
+            # Pad the value with zeros to reach to_bits
+            out_len = (bit_len + to_bits - 1) // to_bits
+            val <<= (out_len * to_bits) - bit_len
+        else:
+            # Padding shall be shorter than from_bits and made of zeros
+            out_len, pad_bit_len = divmod(bit_len, to_bits)
+            if pad_bit_len >= from_bits or (val & ((1 << pad_bit_len) - 1)):
+                return None
+            val >>= pad_bit_len
+
+        if to_bits == 8:
+            return list(val.to_bytes(out_len, "big"))
+
         max_out_val = (1 << to_bits) - 1
-        max_acc = (1 << (from_bits + to_bits - 1)) - 1
+        return [(val >> shift) & max_out_val for shift in range((out_len - 1) * to_bits, -1, -to_bits)]
+
+    @staticmethod
+    def __ToInteger(data: Union[bytes, List[int]],
+                    from_bits: int) -> Optional[int]:
+        """
+        Convert data to an integer, where every value is a group of from_bits bits (big endian).
 
-        acc = 0
-        bits = 0
-        ret = []
+        Args:
+            data (list[int] or bytes): Data to be converted
+            from_bits (int)          : Number of bits of each value
+
+        Returns:
+            int: Integer value, None if a value is less than zero or greater than 2^from_bits
+        """
+        if len(data) == 0:
+            return 0
+
+        # Fast paths for bytes and base32, using C-level conversions
+        if from_bits in (5, 8):
+            try:
+                data_bytes = data if isinstance(data, bytes) else bytes(data)
+                return (int.from_bytes(data_bytes, "big")
+                        if from_bits == 8
+                        else int(data_bytes.translate(Bech32BaseConst.BASE32_INT_DIGITS_TABLE), 32))
+            except (TypeError, ValueError):
+                return None
 
+        val = 0
         for value in data:
             # Value shall not be less than zero or greater than 2^from_bits
             if value < 0 or (value >> from_bits):
                 return None
-            # Continue accumulating until greater than to_bits
-            acc = ((acc << from_bits) | value) & max_acc
-            bits += from_bits
-            while bits >= to_bits:
-                bits -= to_bits
-                ret.append((acc >> bits) & max_out_val)
-        if pad:
-            if bits:
-                # Pad the value with zeros to reach to_bits
-                ret.append((acc << (to_bits - bits)) & max_out_val)
-        elif bits >= from_bits or ((acc << (to_bits - bits)) & max_out_val):
-            return None
-
-        return ret
+            val = (val << from_bits) | value
+        return val
 
 
 class Bech32EncoderBase(ABC):
@@ -217,19 +256,65 @@ class Bech32DecoderBase(ABC):
         if len(hrp) == 0 or any(ord(x) < 33 or ord(x) > 126 for x in hrp):
             raise ValueError(f"Invalid bech32 format (HRP not valid: {hrp})")
 
-        # Get data and check it
+        # Get data and convert it back from alphabet
         data_part = bech_str[sep_pos + 1:]
-        if (len(data_part) < (checksum_len + 1)
-                or not all(x in Bech32BaseConst.CHARSET for x in data_part)):
+        if len(data_part) < (checksum_len + 1):
             raise ValueError("Invalid bech32 format (data part not valid)")
+        try:
+            int_data = [Bech32BaseConst.CHARSET_DIGITS[x] for x in data_part]
+        except KeyError as ex:
+            raise ValueError("Invalid bech32 format (data part not valid)") from ex
 
-        # Convert back from alphabet and verify checksum
-        int_data = [Bech32BaseConst.CHARSET.find(x) for x in data_part]
+        # Verify checksum
         if not cls._VerifyChecksum(hrp, int_data):
             raise Bech32ChecksumError("Invalid bech32 checksum")
 
         return hrp, int_data[:-checksum_len]
 
+    @classmethod
+    def IsValidMany(cls,
+                    hrp: str,
+                    addrs: Iterable[str]) -> List[bool]:
+        """
+        Get if many Bech32 strings are valid.
+
+        Args:
+            hrp (str)            : Human readable part
+            addrs (iterable[str]): Addresses
+
+        Returns:
+            list[bool]: True if the address at the same index is valid, false otherwise
+        """
+        res = []
+        for addr in addrs:
+            try:
+                cls.Decode(hrp, addr)
+            except (Bech32ChecksumError, ValueError):
+                res.append(False)
+            else:
+                res.append(True)
+        return res
+
+    @classmethod
+    @abstractmethod
+    def Decode(cls,
+               hrp: str,
+               addr: str) -> Any:
+        """
+        Decode from Bech32.
+
+        Args:
+            hrp (str) : Human readable part
+            addr (str): Address
+
+        Returns:
+            Any: Decoded data
+
+        Raises:
+            ValueError: If the bech32 string is not valid
+            Bech32ChecksumError: If the checksum is not valid
+        """
+
     @staticmethod
     @abstractmethod
     def _VerifyChecksum(hrp: str,
@@ -27,7 +27,7 @@ References:
 """
 
 # Imports
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from bip_utils.bech32.bech32 import Bech32Const, Bech32Encodings, Bech32Utils
 from bip_utils.bech32.bech32_base import Bech32BaseUtils, Bech32DecoderBase, Bech32EncoderBase
@@ -82,6 +82,27 @@ class SegwitBech32Encoder(Bech32EncoderBase):
                                  [wit_ver] + Bech32BaseUtils.ConvertToBase32(wit_prog),
                                  SegwitBech32Const.SEPARATOR)
 
+    @classmethod
+    def EncodeMany(cls,
+                   hrp: str,
+                   wit_ver: int,
+                   wit_progs: Iterable[bytes]) -> List[str]:
+        """
+        Encode many witness programs to Segwit Bech32 with the same HRP and witness version.
+
+        Args:
+            hrp (str)                  : HRP
+            wit_ver (int)              : Witness version
+            wit_progs (iterable[bytes]): Witness programs
+
+        Returns:
+            list[str]: Encoded addresses
+
+        Raises:
+            ValueError: If the data is not valid
+        """
+        return [cls.Encode(hrp, wit_ver, wit_prog) for wit_prog in wit_progs]
+
     @staticmethod
     def _ComputeChecksum(hrp: str,
                          data: List[int]) -> List[int]:
@@ -153,6 +174,26 @@ class SegwitBech32Decoder(Bech32DecoderBase):
 
         return wit_ver, BytesUtils.FromList(conv_data)
 
+    @classmethod
+    def DecodeMany(cls,
+                   hrp: str,
+                   addrs: Iterable[str]) -> List[Tuple[int, bytes]]:
+        """
+        Decode many addresses from Segwit Bech32 with the same HRP.
+
+        Args:
+            hrp (str)            : Human readable part
+            addrs (iterable[str]): Addresses
+
+        Returns:
+            list[tuple[int, bytes]]: Witness version (index 0) and witness program (index 1) of each address
+
+        Raises:
+            Bech32ChecksumError: If a checksum is not valid
+            ValueError: If a bech32 string is not valid
+        """
+        return [cls.Decode(hrp, addr) for addr in addrs]
+
     @staticmethod
     def _VerifyChecksum(hrp: str,
                         data: List[int]) -> bool:
@@ -64,11 +64,11 @@ class _Bip32KeySerializer:
         """
 
         # Serialize key
-        ser_key = (
-            key_net_ver_bytes
-            + bytes(key_data.Depth()) + bytes(key_data.ParentFingerPrint()) + bytes(key_data.Index())
-            + bytes(key_data.ChainCode()) + key_bytes
-        )
+        ser_key = b"".join((
+            key_net_ver_bytes,
+            bytes(key_data.Depth()), bytes(key_data.ParentFingerPrint()), bytes(key_data.Index()),
+            bytes(key_data.ChainCode()), key_bytes
+        ))
         # Encode it
         return Base58Encoder.CheckEncode(ser_key)
 
@@ -264,7 +264,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         Returns:
             bytes: Key identifier bytes
         """
-        return Hash160.QuickDigest(self.m_pub_key.RawCompressed().ToBytes())
+        return Hash160.QuickDigest(self.RawCompressed().ToBytes())
 
     @lru_cache()
     def ToExtended(self) -> str:
@@ -76,19 +76,19 @@ class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
         index_bytes = cls._SerializeIndex(index)
         chain_code_bytes = priv_key.ChainCode().ToBytes()
         priv_key_bytes = priv_key.Raw().ToBytes()
-        pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
 
         # Compute Z and chain code
         if index.IsHardened():
             z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                             b"\x00" + priv_key_bytes + index_bytes)
+                                             b"".join((b"\x00", priv_key_bytes, index_bytes)))
             chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                            b"\x01" + priv_key_bytes + index_bytes)[1]
+                                                            b"".join((b"\x01", priv_key_bytes, index_bytes)))[1]
         else:
+            pub_key_bytes = pub_key.RawCompressed().ToBytes()[1:]
             z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                             b"\x02" + pub_key_bytes + index_bytes)
+                                             b"".join((b"\x02", pub_key_bytes, index_bytes)))
             chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                            b"\x03" + pub_key_bytes + index_bytes)[1]
+                                                            b"".join((b"\x03", pub_key_bytes, index_bytes)))[1]
 
         # Compute the left and right part of the new private key
         hmac_half_len = HmacSha512.DigestSize() // 2
@@ -125,9 +125,9 @@ class Bip32KholawEd25519KeyDerivatorBase(IBip32KeyDerivator, ABC):
 
         # Compute Z and chain code
         z_bytes = HmacSha512.QuickDigest(chain_code_bytes,
-                                         b"\x02" + pub_key_bytes + index_bytes)
+                                         b"".join((b"\x02", pub_key_bytes, index_bytes)))
         chain_code_bytes = HmacSha512.QuickDigestHalves(chain_code_bytes,
-                                                        b"\x03" + pub_key_bytes + index_bytes)[1]
+                                                        b"".join((b"\x03", pub_key_bytes, index_bytes)))[1]
 
         # Compute the new public key point
         hmac_half_len = HmacSha512.DigestSize() // 2
@@ -84,9 +84,9 @@ class Bip32Slip10EcdsaDerivator(IBip32KeyDerivator):
 
         # Data for HMAC
         if index.IsHardened():
-            data_bytes = (Bip32Slip10DerivatorConst.PRIV_KEY_PREFIX
-                          + priv_key_bytes
-                          + index.ToBytes())
+            data_bytes = b"".join((Bip32Slip10DerivatorConst.PRIV_KEY_PREFIX,
+                                   priv_key_bytes,
+                                   index.ToBytes()))
         else:
             data_bytes = pub_key.RawCompressed().ToBytes() + index.ToBytes()
 
@@ -170,9 +170,9 @@ class Bip32Slip10Ed25519Derivator(IBip32KeyDerivator):
         """
 
         # Data for HMAC
-        data_bytes = (Bip32Slip10DerivatorConst.PRIV_KEY_PREFIX
-                      + priv_key.Raw().ToBytes()
-                      + index.ToBytes())
+        data_bytes = b"".join((Bip32Slip10DerivatorConst.PRIV_KEY_PREFIX,
+                               priv_key.Raw().ToBytes(),
+                               index.ToBytes()))
         # Compute HMAC halves
         return HmacSha512.QuickDigestHalves(priv_key.ChainCode().ToBytes(),
                                             data_bytes)
@@ -24,12 +24,12 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 """
 
 # Imports
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
 from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListFinder, Bip39WordsListGetter
 from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import BytesUtils, IntegerUtils
+from bip_utils.utils.misc import IntegerUtils
 from bip_utils.utils.mnemonic import Mnemonic, MnemonicChecksumError, MnemonicDecoderBase, MnemonicWordsList
 
 
@@ -68,9 +68,10 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
             MnemonicChecksumError: If checksum is not valid
             ValueError: If mnemonic is not valid
         """
-        mnemonic_bin_str = self.__DecodeAndVerifyBinaryStr(mnemonic)
+        mnemonic_int, mnemonic_bit_len = self.__DecodeAndVerifyInteger(mnemonic)
+        checksum_len = self.__GetChecksumLen(mnemonic_bit_len)
 
-        return self.__EntropyBytesFromBinaryStr(mnemonic_bin_str)
+        return self.__EntropyBytesFromInteger(mnemonic_int, mnemonic_bit_len, checksum_len)
 
     def DecodeWithChecksum(self,
                            mnemonic: Union[str, Mnemonic]) -> bytes:
@@ -87,26 +88,21 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
             MnemonicChecksumError: If checksum is not valid
             ValueError: If mnemonic is not valid
         """
-        mnemonic_bin_str = self.__DecodeAndVerifyBinaryStr(mnemonic)
+        mnemonic_int, mnemonic_bit_len = self.__DecodeAndVerifyInteger(mnemonic)
 
-        # Compute pad bit length
-        mnemonic_bit_len = len(mnemonic_bin_str)
-        pad_bit_len = (mnemonic_bit_len
-                       if mnemonic_bit_len % 8 == 0
-                       else mnemonic_bit_len + (8 - mnemonic_bit_len % 8))
+        # Checksum bits are kept in the least significant bits, so the value is zero-padded on the left
+        return IntegerUtils.ToBytes(mnemonic_int, (mnemonic_bit_len + 7) // 8)
 
-        return BytesUtils.FromBinaryStr(mnemonic_bin_str, pad_bit_len // 4)
-
-    def __DecodeAndVerifyBinaryStr(self,
-                                   mnemonic: Union[str, Mnemonic]) -> str:
+    def __DecodeAndVerifyInteger(self,
+                                 mnemonic: Union[str, Mnemonic]) -> Tuple[int, int]:
         """
-        Decode a mnemonic phrase to its mnemonic binary string by verifying the checksum.
+        Decode a mnemonic phrase to its integer representation by verifying the checksum.
 
         Args:
             mnemonic (str or Mnemonic object): Mnemonic
 
         Returns:
-            str: Mnemonic binary string
+            tuple[int, int]: Mnemonic integer (index 0) and its length in bits (index 1)
 
         Raises:
             MnemonicChecksumError: If checksum is not valid
@@ -121,94 +117,92 @@ class Bip39MnemonicDecoder(MnemonicDecoderBase):
         # Detect language if it was not specified at construction
         words_list, _ = self._FindLanguage(mnemonic_obj)
 
-        # Get back mnemonic binary string
-        mnemonic_bin_str = self.__MnemonicToBinaryStr(mnemonic_obj, words_list)
+        # Get back mnemonic integer
+        mnemonic_int = self.__MnemonicToInteger(mnemonic_obj, words_list)
+        mnemonic_bit_len = mnemonic_obj.WordsCount() * Bip39MnemonicConst.WORD_BIT_LEN
 
         # Verify checksum
-        checksum_bin_str = mnemonic_bin_str[-self.__GetChecksumLen(mnemonic_bin_str):]
-        checksum_bin_str_got = self.__ComputeChecksumBinaryStr(mnemonic_bin_str)
-
-        if checksum_bin_str != checksum_bin_str_got:
+        checksum_len = self.__GetChecksumLen(mnemonic_bit_len)
+        checksum = mnemonic_int & ((1 << checksum_len) - 1)
+        checksum_got = self.__ComputeChecksum(
+            self.__EntropyBytesFromInteger(mnemonic_int, mnemonic_bit_len, checksum_len),
+            checksum_len
+        )
+
+        if checksum != checksum_got:
             raise MnemonicChecksumError(
-                f"Invalid checksum (expected {checksum_bin_str}, got {checksum_bin_str_got})"
+                f"Invalid checksum (expected {checksum:0{checksum_len}b}, got {checksum_got:0{checksum_len}b})"
             )
 
-        return mnemonic_bin_str
+        return mnemonic_int, mnemonic_bit_len
 
-    def __ComputeChecksumBinaryStr(self,
-                                   mnemonic_bin_str: str) -> str:
+    @staticmethod
+    def __ComputeChecksum(entropy_bytes: bytes,
+                          checksum_len: int) -> int:
         """
-        Compute checksum from mnemonic binary string.
+        Compute checksum from entropy bytes.
 
         Args:
-            mnemonic_bin_str (str): Mnemonic binary string
+            entropy_bytes (bytes): Entropy bytes
+            checksum_len (int)   : Checksum length in bits
 
         Returns:
-           str: Computed checksum binary string
+           int: Computed checksum
         """
 
-        # Get entropy bytes
-        entropy_bytes = self.__EntropyBytesFromBinaryStr(mnemonic_bin_str)
-        # Convert entropy hash to binary string
-        entropy_hash_bin_str = BytesUtils.ToBinaryStr(Sha256.QuickDigest(entropy_bytes),
-                                                      Sha256.DigestSize() * 8)
-
-        # Return checksum
-        return entropy_hash_bin_str[:self.__GetChecksumLen(mnemonic_bin_str)]
+        # The checksum is at most 8-bit long, so only the first byte of the hash is needed
+        return Sha256.QuickDigest(entropy_bytes)[0] >> (8 - checksum_len)
 
-    def __EntropyBytesFromBinaryStr(self,
-                                    mnemonic_bin_str: str) -> bytes:
+    @staticmethod
+    def __EntropyBytesFromInteger(mnemonic_int: int,
+                                  mnemonic_bit_len: int,
+                                  checksum_len: int) -> bytes:
         """
-        Get entropy bytes from mnemonic binary string.
+        Get entropy bytes from mnemonic integer.
 
         Args:
-            mnemonic_bin_str (str): Mnemonic binary string
+            mnemonic_int (int)    : Mnemonic integer
+            mnemonic_bit_len (int): Mnemonic length in bits
+            checksum_len (int)    : Checksum length in bits
 
         Returns:
            bytes: Entropy bytes
         """
-
-        # Get checksum length
-        checksum_len = self.__GetChecksumLen(mnemonic_bin_str)
-        # Get back entropy binary string
-        entropy_bin_str = mnemonic_bin_str[:-checksum_len]
-
-        # Get entropy bytes from binary string
-        return BytesUtils.FromBinaryStr(entropy_bin_str, checksum_len * 8)
+        return IntegerUtils.ToBytes(mnemonic_int >> checksum_len, (mnemonic_bit_len - checksum_len) // 8)
 
     @staticmethod
-    def __MnemonicToBinaryStr(mnemonic: Mnemonic,
-                              words_list: MnemonicWordsList) -> str:
+    def __MnemonicToInteger(mnemonic: Mnemonic,
+                            words_list: MnemonicWordsList) -> int:
         """
-        Get mnemonic binary string from mnemonic phrase.
+        Get mnemonic integer from mnemonic phrase.
+        Each word index is appended as the next 11 least significant bits.
 
         Args:
             mnemonic (Mnemonic object)           : Mnemonic object
             words_list (MnemonicWordsList object): Words list object
 
         Returns:
-           str: Mnemonic binary string
+           int: Mnemonic integer
 
         Raises:
             ValueError: If the one of the mnemonic word is not valid
         """
+        word_bit_len = Bip39MnemonicConst.WORD_BIT_LEN
 
-        # Convert each word to its index in binary format
-        mnemonic_bin_str = map(lambda word: IntegerUtils.ToBinaryStr(words_list.GetWordIdx(word),
-                                                                     Bip39MnemonicConst.WORD_BIT_LEN),
-                               mnemonic.ToList())
-
-        return "".join(mnemonic_bin_str)
+        mnemonic_int = 0
+        for word in mnemonic.ToList():
+            mnemonic_int = (mnemonic_int << word_bit_len) | words_list.GetWordIdx(word)
+        return mnemonic_int
 
     @staticmethod
-    def __GetChecksumLen(mnemonic_bin_str: str) -> int:
+    def __GetChecksumLen(mnemonic_bit_len: int) -> int:
         """
-        Get checksum length from mnemonic binary string.
+        Get checksum length from mnemonic length in bits.
 
         Args:
-            mnemonic_bin_str (str): Mnemonic binary string
+            mnemonic_bit_len (int): Mnemonic length in bits
 
         Returns:
-           int: Checksum length
+           int: Checksum length in bits
         """
-        return len(mnemonic_bin_str) // 33
+        return mnemonic_bit_len // 33
@@ -21,7 +21,7 @@
 """Module for BIP39 mnemonic generation."""
 
 # Imports
-from typing import Union
+from typing import Iterable, List, Union
 
 from bip_utils.bip.bip39.bip39_entropy_generator import Bip39EntropyGenerator
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39MnemonicConst, Bip39WordsNum
@@ -66,10 +66,6 @@ class Bip39MnemonicGenerator:
             ValueError: If words number is not valid
         """
 
-        # Check words number
-        if words_num not in Bip39MnemonicConst.MNEMONIC_WORD_NUM:
-            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
-
         # Get entropy length in bit from words number
         entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
         # Generate entropy
@@ -93,6 +89,42 @@ class Bip39MnemonicGenerator:
         """
         return self.m_mnemonic_encoder.Encode(entropy_bytes)
 
+    def FromWordsNumberMany(self,
+                            words_num: Union[int, Bip39WordsNum],
+                            count: int) -> List[Mnemonic]:
+        """
+        Generate many mnemonics with the specified words number from random entropy.
+        Entropy is read in a single chunk for all the mnemonics.
+
+        Args:
+            words_num (int or Bip39WordsNum): Number of words (12, 15, 18, 21, 24)
+            count (int)                     : Number of mnemonics
+
+        Returns:
+            list[Mnemonic]: Generated mnemonics
+
+        Raises:
+            ValueError: If words number or count is not valid
+        """
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
+        return self.FromEntropyMany(Bip39EntropyGenerator(entropy_bit_len).GenerateMany(count))
+
+    def FromEntropyMany(self,
+                        entropies: Iterable[bytes]) -> List[Mnemonic]:
+        """
+        Generate many mnemonics from the specified entropy bytes.
+
+        Args:
+            entropies (iterable[bytes]): Entropy bytes (accepted lengths in bits: 128, 160, 192, 224, 256)
+
+        Returns:
+            list[Mnemonic]: Generated mnemonics
+
+        Raises:
+            ValueError: If entropy byte length is not valid
+        """
+        return [self.m_mnemonic_encoder.Encode(entropy_bytes) for entropy_bytes in entropies]
+
     @staticmethod
     def __EntropyBitLenFromWordsNum(words_num: int) -> int:
         """
@@ -103,5 +135,10 @@ class Bip39MnemonicGenerator:
 
         Returns:
             int: Correspondent entropy length
+
+        Raises:
+            ValueError: If words number is not valid
         """
+        if words_num not in Bip39MnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
         return (words_num * Bip39MnemonicConst.WORD_BIT_LEN) - (words_num // 3)
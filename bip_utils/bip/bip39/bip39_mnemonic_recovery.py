@@ -0,0 +1,643 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for BIP39 mnemonic recovery.
+It allows recovering a mnemonic with missing, unknown, misspelled or swapped words, by matching the candidates
+against a known address or extended public key.
+"""
+
+# Imports
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import (
+    Callable, Deque, FrozenSet, Generator, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+)
+
+from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
+from bip_utils.bip.bip39.bip39_seed_generator import Bip39SeedGenerator
+from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes
+from bip_utils.bip.conf.common import BipCoins
+from bip_utils.utils.crypto import Sha256
+from bip_utils.utils.misc import IntegerUtils
+from bip_utils.utils.mnemonic import MnemonicWordsList
+
+
+class Bip39MnemonicRecoveryConst:
+    """Class container for BIP39 mnemonic recovery constants."""
+
+    # Placeholder for unknown words
+    UNKNOWN_WORD: str = "?"
+    # Default maximum edit distance for misspelled words
+    DEFAULT_MAX_EDIT_DIST: int = 1
+    # Minimum prefix length for matching misspelled words (BIP39 words are unique in their first 4 letters)
+    MIN_PREFIX_LEN: int = 4
+
+    # Default number of addresses to be derived for each candidate
+    DEFAULT_ADDR_NUM: int = 20
+    # Default number of candidates for each chunk submitted to the executor
+    DEFAULT_CHUNK_SIZE: int = 1024
+    # Maximum number of chunks waiting to be processed by the executor
+    MAX_PENDING_CHUNKS: int = 64
+    # Seed for checking the coin type before searching (same length of a BIP39 seed)
+    COIN_CHECK_SEED: bytes = b"\x00" * 64
+
+
+class Bip39MnemonicRecoveryResult(NamedTuple):
+    """BIP39 mnemonic recovery result class."""
+
+    cand_index: int
+    mnemonic: Bip39Mnemonic
+    address: Optional[str]
+    address_index: Optional[int]
+
+
+class Bip39MnemonicRecoveryProgress(NamedTuple):
+    """
+    BIP39 mnemonic recovery progress class.
+    All the candidates before next_index have been checked, so the search can be resumed from it.
+    """
+
+    next_index: int
+    total: int
+    valid_num: int
+
+
+class Bip39MnemonicSearchSpace:
+    """
+    BIP39 mnemonic search space class.
+    It contains all the candidate mnemonics of a damaged mnemonic, as a list of variants (the mnemonic itself,
+    the mnemonic with two swapped words, the mnemonic with a missing word inserted at each position) where each
+    position has a list of candidate words.
+    Candidates are numbered in a fixed order, so that the enumeration can be resumed from any index, and the checksum
+    is verified with integer operations only.
+    """
+
+    m_lang: Bip39Languages
+    m_variants: List[List[List[int]]]
+    m_variants_len: List[int]
+
+    @classmethod
+    def FromMnemonic(cls,
+                     mnemonic: Union[str, List[str]],
+                     lang: Bip39Languages = Bip39Languages.ENGLISH,
+                     max_edit_dist: int = Bip39MnemonicRecoveryConst.DEFAULT_MAX_EDIT_DIST,
+                     swap_words: bool = False) -> Bip39MnemonicSearchSpace:
+        """
+        Create the search space of a damaged mnemonic.
+        Words equal to "?" are unknown and replaced by all the words of the list. Words not in the words list are
+        considered misspelled and replaced by the words within the maximum edit distance or starting with the same
+        prefix. If the mnemonic has one word less than a valid words number, the missing word is searched at every
+        position.
+
+        Args:
+            mnemonic (str or list[str])    : Damaged mnemonic
+            lang (Bip39Languages, optional): Language (default: English)
+            max_edit_dist (int, optional)  : Maximum edit distance for misspelled words (default: 1)
+            swap_words (bool, optional)    : True for also trying every pair of swapped words (default: false)
+
+        Returns:
+            Bip39MnemonicSearchSpace object: Bip39MnemonicSearchSpace object
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If the words number is not valid or a misspelled word has no candidates
+        """
+        words = (mnemonic.split() if isinstance(mnemonic, str) else mnemonic)
+        words = [word if word == Bip39MnemonicRecoveryConst.UNKNOWN_WORD else Bip39Mnemonic.FromList([word]).ToStr()
+                 for word in words]
+        words_list = Bip39WordsListGetter.Instance().GetByLanguage(lang)
+
+        # Get candidates of each position
+        all_words = list(range(words_list.Length()))
+        cand_words = [all_words
+                      if word == Bip39MnemonicRecoveryConst.UNKNOWN_WORD
+                      else _Bip39MnemonicRecoveryUtils.WordCandidates(word, words_list, max_edit_dist)
+                      for word in words]
+        for word, cands in zip(words, cand_words):
+            if not cands:
+                raise ValueError(f"No candidates found for word {word}")
+
+        # Get variants
+        if len(words) in Bip39MnemonicConst.MNEMONIC_WORD_NUM:
+            variants = [cand_words]
+            if swap_words:
+                variants += [cand_words[:i] + [cand_words[j]]
+                             + cand_words[i + 1:j]
+                             + [cand_words[i]] + cand_words[j + 1:]
+                             for i in range(len(words))
+                             for j in range(i + 1, len(words))
+                             if cand_words[i] != cand_words[j]]
+        elif len(words) + 1 in Bip39MnemonicConst.MNEMONIC_WORD_NUM:
+            # Inserting a word before the same word is equal to inserting it after, so it's skipped
+            variants = [cand_words[:i]
+                        + [[word_idx for word_idx in all_words
+                            if i == len(words) or len(cand_words[i]) != 1 or word_idx != cand_words[i][0]]]
+                        + cand_words[i:]
+                        for i in range(len(words) + 1)]
+        else:
+            raise ValueError(f"Mnemonic words count is not valid ({len(words)})")
+
+        return cls(lang, variants)
+
+    def __init__(self,
+                 lang: Bip39Languages,
+                 variants: List[List[List[int]]]) -> None:
+        """
+        Construct class.
+
+        Args:
+            lang (Bip39Languages)            : Language
+            variants (list[list[list[int]]]): Candidate word indexes of each position, for each variant
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If the variants are not valid
+        """
+        if not variants or any(len(variant) not in Bip39MnemonicConst.MNEMONIC_WORD_NUM for variant in variants):
+            raise ValueError("Invalid search space variants")
+
+        # Words list is not kept, so that the class is cheap to be pickled
+        Bip39WordsListGetter.Instance().GetByLanguage(lang)
+
+        self.m_lang = lang
+        self.m_variants = variants
+        self.m_variants_len = []
+        for variant in variants:
+            variant_len = 1
+            for cands in variant:
+                variant_len *= len(cands)
+            self.m_variants_len.append(variant_len)
+
+    def Language(self) -> Bip39Languages:
+        """
+        Get the language.
+
+        Returns:
+            Bip39Languages: Language
+        """
+        return self.m_lang
+
+    def Length(self) -> int:
+        """
+        Get the number of candidates, before checksum filtering.
+
+        Returns:
+            int: Number of candidates
+        """
+        return sum(self.m_variants_len)
+
+    def ValidCandidates(self,
+                        start_idx: int = 0,
+                        end_idx: Optional[int] = None) -> Iterator[Tuple[int, Bip39Mnemonic]]:
+        """
+        Get the candidates with a valid checksum, in the specified index range.
+
+        Args:
+            start_idx (int, optional): Start index (default: 0)
+            end_idx (int, optional)  : End index, excluded (default: None, i.e. up to the end)
+
+        Returns:
+            Iterator[tuple[int, Bip39Mnemonic]]: Candidate index (index 0) and mnemonic (index 1)
+        """
+        end_idx = self.Length() if end_idx is None else min(end_idx, self.Length())
+        words_list = Bip39WordsListGetter.Instance().GetByLanguage(self.m_lang)
+
+        var_offset = 0
+        for variant, variant_len in zip(self.m_variants, self.m_variants_len):
+            var_start = max(start_idx - var_offset, 0)
+            var_end = min(end_idx - var_offset, variant_len)
+            if var_start < var_end:
+                for cand_idx, mnemonic_int in self.__ValidCandidatesInVariant(variant, var_start, var_end):
+                    yield var_offset + cand_idx, self.__IntegerToMnemonic(words_list, mnemonic_int, len(variant))
+            var_offset += variant_len
+
+    def __ValidCandidatesInVariant(self,
+                                   variant: List[List[int]],
+                                   start_idx: int,
+                                   end_idx: int) -> Iterator[Tuple[int, int]]:
+        """
+        Get the candidates with a valid checksum of a variant, in the specified index range.
+        The last position changes faster, so the integer of the other positions is computed only once for all the
+        candidates of the last position.
+
+        Args:
+            variant (list[list[int]]): Candidate word indexes of each position
+            start_idx (int)          : Start index in the variant
+            end_idx (int)            : End index in the variant, excluded
+
+        Returns:
+            Iterator[tuple[int, int]]: Candidate index in the variant (index 0) and mnemonic integer (index 1)
+        """
+        word_bit_len = Bip39MnemonicConst.WORD_BIT_LEN
+        mnemonic_bit_len = len(variant) * word_bit_len
+        checksum_len = mnemonic_bit_len // 33
+        checksum_mask = (1 << checksum_len) - 1
+        entropy_byte_len = (mnemonic_bit_len - checksum_len) // 8
+        last_cands = variant[-1]
+
+        # Get the candidate digits of the start index, the last position is the least significant one
+        digits = [0] * len(variant)
+        rem = start_idx
+        for i in range(len(variant) - 1, -1, -1):
+            rem, digits[i] = divmod(rem, len(variant[i]))
+
+        cand_idx = start_idx
+        while cand_idx < end_idx:
+            prefix_int = 0
+            for i in range(len(variant) - 1):
+                prefix_int = (prefix_int << word_bit_len) | variant[i][digits[i]]
+            prefix_int <<= word_bit_len
+
+            last_start = digits[-1]
+            last_end = min(len(last_cands), last_start + end_idx - cand_idx)
+            for j in range(last_start, last_end):
+                mnemonic_int = prefix_int | last_cands[j]
+                entropy_bytes = IntegerUtils.ToBytes(mnemonic_int >> checksum_len, entropy_byte_len)
+                if Sha256.QuickDigest(entropy_bytes)[0] >> (8 - checksum_len) == mnemonic_int & checksum_mask:
+                    yield cand_idx + j - last_start, mnemonic_int
+            cand_idx += last_end - last_start
+
+            # Increment the other digits
+            digits[-1] = 0
+            for i in range(len(variant) - 2, -1, -1):
+                digits[i] += 1
+                if digits[i] < len(variant[i]):
+                    break
+                digits[i] = 0
+
+    @staticmethod
+    def __IntegerToMnemonic(words_list: MnemonicWordsList,
+                            mnemonic_int: int,
+                            words_num: int) -> Bip39Mnemonic:
+        """
+        Get the mnemonic from its integer.
+
+        Args:
+            words_list (MnemonicWordsList object): Words list
+            mnemonic_int (int)                   : Mnemonic integer
+            words_num (int)                      : Words number
+
+        Returns:
+            Bip39Mnemonic object: Bip39Mnemonic object
+        """
+        word_bit_len = Bip39MnemonicConst.WORD_BIT_LEN
+        word_mask = (1 << word_bit_len) - 1
+        return Bip39Mnemonic(
+            [words_list.GetWordAtIdx((mnemonic_int >> shift) & word_mask)
+             for shift in range((words_num - 1) * word_bit_len, -1, -word_bit_len)]
+        )
+
+
+class _Bip39MnemonicRecoveryMatcher:
+    """
+    BIP39 mnemonic recovery matcher class.
+    It derives the keys of a candidate mnemonic and matches them against the targets.
+    It only contains picklable members, so that it can be submitted to a process pool.
+    """
+
+    m_bip_cls: Type[Bip44Base]
+    m_coin_type: BipCoins
+    m_target_addrs: FrozenSet[str]
+    m_target_xpub: Optional[str]
+    m_passphrase: str
+    m_account_idx: int
+    m_addr_num: int
+
+    def __init__(self,
+                 bip_cls: Type[Bip44Base],
+                 coin_type: BipCoins,
+                 target_addrs: FrozenSet[str],
+                 target_xpub: Optional[str],
+                 passphrase: str,
+                 account_idx: int,
+                 addr_num: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            bip_cls (Bip44Base class)  : BIP class (e.g. Bip44, Bip49, Bip84, Bip86)
+            coin_type (BipCoins)       : Coin type
+            target_addrs (frozenset)   : Target addresses
+            target_xpub (str)          : Target account extended public key (None if not used)
+            passphrase (str)           : Passphrase
+            account_idx (int)          : Account index
+            addr_num (int)             : Number of addresses to be derived
+        """
+        self.m_bip_cls = bip_cls
+        self.m_coin_type = coin_type
+        self.m_target_addrs = target_addrs
+        self.m_target_xpub = target_xpub
+        self.m_passphrase = passphrase
+        self.m_account_idx = account_idx
+        self.m_addr_num = addr_num
+
+    def Match(self,
+              cand_idx: int,
+              mnemonic: Bip39Mnemonic,
+              lang: Bip39Languages) -> Optional[Bip39MnemonicRecoveryResult]:
+        """
+        Match a candidate mnemonic.
+
+        Args:
+            cand_idx (int)                : Candidate index
+            mnemonic (Bip39Mnemonic object): Candidate mnemonic
+            lang (Bip39Languages)         : Language
+
+        Returns:
+            Bip39MnemonicRecoveryResult object: Result (None if the mnemonic doesn't match)
+        """
+        seed_bytes = Bip39SeedGenerator(mnemonic, lang).Generate(self.m_passphrase)
+        bip_acc = self.m_bip_cls.FromSeed(seed_bytes, self.m_coin_type).Purpose().Coin().Account(self.m_account_idx)
+
+        if self.m_target_xpub is not None and bip_acc.PublicKey().ToExtended() == self.m_target_xpub:
+            return Bip39MnemonicRecoveryResult(cand_idx, mnemonic, None, None)
+
+        if self.m_target_addrs:
+            bip_chg = bip_acc.Change(Bip44Changes.CHAIN_EXT)
+            for addr_idx in range(self.m_addr_num):
+                addr = bip_chg.AddressIndex(addr_idx).PublicKey().ToAddress()
+                if addr in self.m_target_addrs:
+                    return Bip39MnemonicRecoveryResult(cand_idx, mnemonic, addr, addr_idx)
+        return None
+
+
+class _Bip39MnemonicRecoveryUtils:
+    """Class container for BIP39 mnemonic recovery utility functions."""
+
+    @staticmethod
+    def SearchRange(search_space: Bip39MnemonicSearchSpace,
+                    matcher: _Bip39MnemonicRecoveryMatcher,
+                    start_idx: int,
+                    end_idx: int) -> Tuple[List[Bip39MnemonicRecoveryResult], int]:
+        """
+        Search a range of candidates.
+        It is not name-mangled, so that it can be pickled and submitted to a process pool.
+
+        Args:
+            search_space (Bip39MnemonicSearchSpace object): Search space
+            matcher (_Bip39MnemonicRecoveryMatcher object): Matcher
+            start_idx (int)                               : Start index
+            end_idx (int)                                 : End index, excluded
+
+        Returns:
+            tuple[list[Bip39MnemonicRecoveryResult], int]: Matching candidates (index 0) and number of candidates
+                                                            with a valid checksum (index 1)
+        """
+        res = []
+        valid_num = 0
+        for cand_idx, mnemonic in search_space.ValidCandidates(start_idx, end_idx):
+            valid_num += 1
+            match = matcher.Match(cand_idx, mnemonic, search_space.Language())
+            if match is not None:
+                res.append(match)
+        return res, valid_num
+
+    @staticmethod
+    def WordCandidates(word: str,
+                       words_list: MnemonicWordsList,
+                       max_edit_dist: int) -> List[int]:
+        """
+        Get the candidate word indexes of a word.
+        A word in the words list is the only candidate of itself, otherwise the candidates are the words starting with
+        it, the words with the same first 4 letters and the words within the maximum edit distance.
+
+        Args:
+            word (str)                           : Word
+            words_list (MnemonicWordsList object): Words list
+            max_edit_dist (int)                  : Maximum edit distance
+
+        Returns:
+            list[int]: Candidate word indexes
+        """
+        try:
+            return [words_list.GetWordIdx(word)]
+        except ValueError:
+            pass
+
+        prefix_len = Bip39MnemonicRecoveryConst.MIN_PREFIX_LEN
+        cands = []
+        for word_idx in range(words_list.Length()):
+            list_word = words_list.GetWordAtIdx(word_idx)
+            if (list_word.startswith(word)
+                    or (len(word) >= prefix_len and list_word[:prefix_len] == word[:prefix_len])
+                    or _Bip39MnemonicRecoveryUtils.EditDistance(word, list_word, max_edit_dist) <= max_edit_dist):
+                cands.append(word_idx)
+        return cands
+
+    @staticmethod
+    def EditDistance(word1: str,
+                     word2: str,
+                     max_dist: int) -> int:
+        """
+        Compute the edit distance (Levenshtein distance) between two words.
+        The computation stops as soon as the distance is known to exceed the maximum one.
+
+        Args:
+            word1 (str)   : First word
+            word2 (str)   : Second word
+            max_dist (int): Maximum distance
+
+        Returns:
+            int: Edit distance (max_dist + 1 if greater than max_dist)
+        """
+        if abs(len(word1) - len(word2)) > max_dist:
+            return max_dist + 1
+
+        prev_row = list(range(len(word2) + 1))
+        for i, c1 in enumerate(word1, 1):
+            curr_row = [i]
+            for j, c2 in enumerate(word2, 1):
+                curr_row.append(min(prev_row[j] + 1,
+                                    curr_row[j - 1] + 1,
+                                    prev_row[j - 1] + (c1 != c2)))
+            if min(curr_row) > max_dist:
+                return max_dist + 1
+            prev_row = curr_row
+        return min(prev_row[-1], max_dist + 1)
+
+
+class Bip39MnemonicRecovery:
+    """
+    BIP39 mnemonic recovery class.
+    It searches the candidates of a search space whose keys match a target address or account extended public key.
+    Candidates are first filtered by checksum, which is cheap and discards most of them, then the seed and the keys
+    are derived only for the remaining ones.
+    """
+
+    m_search_space: Bip39MnemonicSearchSpace
+    m_matcher: _Bip39MnemonicRecoveryMatcher
+
+    def __init__(self,
+                 search_space: Bip39MnemonicSearchSpace,
+                 bip_cls: Type[Bip44Base],
+                 coin_type: BipCoins,
+                 target_addrs: Optional[Iterable[str]] = None,
+                 target_xpub: Optional[str] = None,
+                 passphrase: str = "",
+                 account_idx: int = 0,
+                 addr_num: int = Bip39MnemonicRecoveryConst.DEFAULT_ADDR_NUM) -> None:
+        """
+        Construct class.
+
+        Args:
+            search_space (Bip39MnemonicSearchSpace object): Search space
+            bip_cls (Bip44Base class)                     : BIP class (e.g. Bip44, Bip49, Bip84, Bip86)
+            coin_type (BipCoins)                          : Coin type, shall be compatible with the BIP class
+            target_addrs (iterable[str], optional)        : Target addresses of the external chain (default: None)
+            target_xpub (str, optional)                   : Target account extended public key (default: None)
+            passphrase (str, optional)                    : Passphrase (default: empty)
+            account_idx (int, optional)                   : Account index (default: 0)
+            addr_num (int, optional)                      : Number of addresses to be derived for each candidate
+                                                            (default: 20)
+
+        Raises:
+            TypeError: If the coin type is not compatible with the BIP class
+            ValueError: If no target is specified or the number of addresses is not valid
+        """
+        target_addrs = frozenset(target_addrs or [])
+        if not target_addrs and target_xpub is None:
+            raise ValueError("At least a target address or extended public key shall be specified")
+        if target_addrs and addr_num <= 0:
+            raise ValueError(f"Invalid addresses number ({addr_num})")
+        # The coin type is checked by the BIP class only when constructing from a seed, so do it now instead of
+        # failing on the first candidate
+        bip_cls.FromSeed(Bip39MnemonicRecoveryConst.COIN_CHECK_SEED, coin_type)
+
+        self.m_search_space = search_space
+        self.m_matcher = _Bip39MnemonicRecoveryMatcher(bip_cls,
+                                                       coin_type,
+                                                       target_addrs,
+                                                       target_xpub,
+                                                       passphrase,
+                                                       account_idx,
+                                                       addr_num)
+
+    def SearchSpace(self) -> Bip39MnemonicSearchSpace:
+        """
+        Get the search space.
+
+        Returns:
+            Bip39MnemonicSearchSpace object: Bip39MnemonicSearchSpace object
+        """
+        return self.m_search_space
+
+    def Search(self,
+               start_idx: int = 0,
+               executor: Optional[Executor] = None,
+               chunk_size: int = Bip39MnemonicRecoveryConst.DEFAULT_CHUNK_SIZE,
+               progress_fct: Optional[Callable[[Bip39MnemonicRecoveryProgress], None]] = None
+               ) -> Iterator[Bip39MnemonicRecoveryResult]:
+        """
+        Search the candidates and yield the ones matching the targets.
+        Candidates are processed in chunks of consecutive indexes, in order. After each chunk, the progress function
+        is called with the index the search can be resumed from.
+
+        Args:
+            start_idx (int, optional)      : Index of the first candidate, for resuming a search (default: 0)
+            executor (Executor, optional)  : Executor for searching chunks of candidates concurrently (default: None)
+                                             A process pool is advised, since the search is CPU-bound
+            chunk_size (int, optional)     : Number of candidates for each chunk (default: 1024)
+            progress_fct (Callable, optional): Function called with the progress after each chunk (default: None)
+
+        Returns:
+            Iterator[Bip39MnemonicRecoveryResult]: Matching candidates, in index order
+
+        Raises:
+            ValueError: If the start index or chunk size is not valid
+        """
+        total = self.m_search_space.Length()
+        if start_idx < 0 or start_idx > total:
+            raise ValueError(f"Invalid start index ({start_idx})")
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+        return self.__Search(start_idx, executor, chunk_size, progress_fct)
+
+    def __Search(self,
+                 start_idx: int,
+                 executor: Optional[Executor],
+                 chunk_size: int,
+                 progress_fct: Optional[Callable[[Bip39MnemonicRecoveryProgress], None]]
+                 ) -> Iterator[Bip39MnemonicRecoveryResult]:
+        """
+        Search the candidates and yield the ones matching the targets.
+
+        Args:
+            start_idx (int)                  : Index of the first candidate
+            executor (Executor, optional)    : Executor for searching chunks of candidates concurrently
+            chunk_size (int)                 : Number of candidates for each chunk
+            progress_fct (Callable, optional): Function called with the progress after each chunk
+
+        Returns:
+            Iterator[Bip39MnemonicRecoveryResult]: Matching candidates, in index order
+        """
+        total = self.m_search_space.Length()
+        valid_num = 0
+        pending: Deque[Tuple[int, Union[Future, Tuple[List[Bip39MnemonicRecoveryResult], int]]]] = deque()
+        for chunk_start in range(start_idx, total, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, total)
+            if executor is None:
+                pending.append((chunk_end, _Bip39MnemonicRecoveryUtils.SearchRange(self.m_search_space,
+                                                                                   self.m_matcher,
+                                                                                   chunk_start,
+                                                                                   chunk_end)))
+            else:
+                pending.append((chunk_end, executor.submit(_Bip39MnemonicRecoveryUtils.SearchRange,
+                                                           self.m_search_space,
+                                                           self.m_matcher,
+                                                           chunk_start,
+                                                           chunk_end)))
+
+            # Keep a limited number of chunks in flight
+            if executor is None or len(pending) >= Bip39MnemonicRecoveryConst.MAX_PENDING_CHUNKS:
+                valid_num = yield from self.__ProcessChunk(pending.popleft(), total, valid_num, progress_fct)
+        while pending:
+            valid_num = yield from self.__ProcessChunk(pending.popleft(), total, valid_num, progress_fct)
+
+    @staticmethod
+    def __ProcessChunk(chunk: Tuple[int, Union[Future, Tuple[List[Bip39MnemonicRecoveryResult], int]]],
+                       total: int,
+                       valid_num: int,
+                       progress_fct: Optional[Callable[[Bip39MnemonicRecoveryProgress], None]]
+                       ) -> Generator[Bip39MnemonicRecoveryResult, None, int]:
+        """
+        Process the result of a chunk.
+
+        Args:
+            chunk (tuple)                    : Chunk end index (index 0) and result or future (index 1)
+            total (int)                      : Total number of candidates
+            valid_num (int)                  : Number of candidates with a valid checksum so far
+            progress_fct (Callable, optional): Progress function
+
+        Returns:
+            Generator[Bip39MnemonicRecoveryResult, None, int]: Matching candidates of the chunk, returns the updated
+                                                               number of candidates with a valid checksum
+        """
+        chunk_end, chunk_res = chunk
+        res, chunk_valid_num = chunk_res.result() if isinstance(chunk_res, Future) else chunk_res
+        valid_num += chunk_valid_num
+
+        yield from res
+        if progress_fct is not None:
+            progress_fct(Bip39MnemonicRecoveryProgress(chunk_end, total, valid_num))
+        return valid_num
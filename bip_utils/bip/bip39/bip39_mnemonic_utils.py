@@ -22,6 +22,7 @@
 
 # Imports
 import os
+from functools import lru_cache
 from typing import Tuple
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39MnemonicConst
@@ -60,6 +61,7 @@ class Bip39WordsListGetter(MnemonicWordsListGetterBase):
                                    Bip39MnemonicConst.WORDS_LIST_NUM)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def __GetLanguageFile(lang: MnemonicLanguages) -> str:
         """
         Get the specified language file name.
@@ -23,9 +23,9 @@
 # Imports
 from typing import Optional
 
-from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages
+from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
 from bip_utils.bip.bip39.bip39_mnemonic_decoder import Bip39MnemonicDecoder
-from bip_utils.utils.mnemonic import MnemonicValidator
+from bip_utils.utils.mnemonic import MnemonicBulkValidator, MnemonicValidator
 
 
 class Bip39MnemonicValidator(MnemonicValidator):
@@ -43,3 +43,23 @@ class Bip39MnemonicValidator(MnemonicValidator):
             lang (Bip39Languages, optional): Language, None for automatic detection
         """
         super().__init__(Bip39MnemonicDecoder(lang))
+
+
+class Bip39MnemonicBulkValidator(MnemonicBulkValidator):
+    """
+    BIP39 bulk mnemonic validator class.
+    It validates a stream of mnemonic phrases.
+    """
+
+    def __init__(self,
+                 lang: Optional[Bip39Languages] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            lang (Bip39Languages, optional): Language, None for automatic detection
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+        """
+        super().__init__(Bip39MnemonicValidator, (lang,), Bip39Mnemonic, Bip39MnemonicConst.MNEMONIC_WORD_NUM)
@@ -24,14 +24,15 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 """
 
 # Imports
-from typing import Optional, Union
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional, Union
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic
 from bip_utils.bip.bip39.bip39_mnemonic_validator import Bip39MnemonicValidator
 from bip_utils.bip.bip39.ibip39_seed_generator import IBip39SeedGenerator
 from bip_utils.utils.crypto import Pbkdf2HmacSha512
 from bip_utils.utils.misc import StringUtils
-from bip_utils.utils.mnemonic import Mnemonic
+from bip_utils.utils.mnemonic import Mnemonic, SeedCache
 
 
 class Bip39SeedGeneratorConst:
@@ -41,6 +42,8 @@ class Bip39SeedGeneratorConst:
     SEED_SALT_MOD: str = "mnemonic"
     # PBKDF2 round for seed generation
     SEED_PBKDF2_ROUNDS: int = 2048
+    # Domain for seed cache
+    SEED_CACHE_DOMAIN: str = "bip39"
 
 
 class Bip39SeedGenerator(IBip39SeedGenerator):
@@ -50,16 +53,19 @@ class Bip39SeedGenerator(IBip39SeedGenerator):
     """
 
     m_mnemonic: Mnemonic
+    m_seed_cache: Optional[SeedCache]
 
     def __init__(self,
                  mnemonic: Union[str, Mnemonic],
-                 lang: Optional[Bip39Languages] = None) -> None:
+                 lang: Optional[Bip39Languages] = None,
+                 seed_cache: Optional[SeedCache] = None) -> None:
         """
         Construct class.
 
         Args:
             mnemonic (str or Mnemonic object): Mnemonic
             lang (Bip39Languages, optional)  : Language, None for automatic detection
+            seed_cache (SeedCache, optional) : Seed cache, None for not caching seeds (default: None)
 
         Raises:
             ValueError: If the mnemonic is not valid
@@ -72,6 +78,7 @@ class Bip39SeedGenerator(IBip39SeedGenerator):
         self.m_mnemonic = (Bip39Mnemonic.FromString(mnemonic)
                            if isinstance(mnemonic, str)
                            else mnemonic)
+        self.m_seed_cache = seed_cache
 
     def Generate(self,
                  passphrase: str = "") -> bytes:
@@ -84,7 +91,62 @@ class Bip39SeedGenerator(IBip39SeedGenerator):
         Returns:
             bytes: Generated seed
         """
-        salt = StringUtils.NormalizeNfkd(Bip39SeedGeneratorConst.SEED_SALT_MOD + passphrase)
-        return Pbkdf2HmacSha512.DeriveKey(self.m_mnemonic.ToStr(),
-                                          salt,
-                                          Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+        mnemonic_str = self.m_mnemonic.ToStr()
+        salt = self.__Salt(passphrase)
+
+        def generate_fct() -> bytes:
+            return Pbkdf2HmacSha512.DeriveKey(mnemonic_str, salt, Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+
+        if self.m_seed_cache is None:
+            return generate_fct()
+        return self.m_seed_cache.GetOrGenerate((Bip39SeedGeneratorConst.SEED_CACHE_DOMAIN, mnemonic_str, salt),
+                                               generate_fct)
+
+    @staticmethod
+    def GenerateMany(mnemonics: Iterable[Union[str, Mnemonic]],
+                     passphrase: str = "",
+                     lang: Optional[Bip39Languages] = None,
+                     executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Generate the seeds of many mnemonics using the specified passphrase.
+        All the mnemonics are validated before generating any seed.
+
+        Args:
+            mnemonics (iterable)           : Mnemonics (each element shall be str or Mnemonic object)
+            passphrase (str, optional)     : Passphrase, empty if not specified
+            lang (Bip39Languages, optional): Language, None for automatic detection
+            executor (Executor, optional)  : Executor for generating seeds concurrently (default: None)
+                                             A thread pool is advised, since hashlib releases the GIL while deriving
+
+        Returns:
+            list[bytes]: Generated seeds, in the same order of mnemonics
+
+        Raises:
+            MnemonicChecksumError: If the checksum of a mnemonic is not valid
+            ValueError: If a mnemonic is not valid
+        """
+        validator = Bip39MnemonicValidator(lang)
+
+        mnemonic_strs = []
+        for mnemonic in mnemonics:
+            mnemonic_obj = Bip39Mnemonic.FromString(mnemonic) if isinstance(mnemonic, str) else mnemonic
+            validator.Validate(mnemonic_obj)
+            mnemonic_strs.append(mnemonic_obj.ToStr())
+
+        return Pbkdf2HmacSha512.DeriveKeyMany(mnemonic_strs,
+                                              Bip39SeedGenerator.__Salt(passphrase),
+                                              Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS,
+                                              executor=executor)
+
+    @staticmethod
+    def __Salt(passphrase: str) -> str:
+        """
+        Get the salt from the passphrase.
+
+        Args:
+            passphrase (str): Passphrase
+
+        Returns:
+            str: Salt
+        """
+        return StringUtils.NormalizeNfkd(Bip39SeedGeneratorConst.SEED_SALT_MOD + passphrase)
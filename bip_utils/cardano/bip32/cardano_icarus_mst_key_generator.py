@@ -27,13 +27,14 @@ References:
 """
 
 # Imports
-from typing import Tuple
+from typing import Optional, Tuple
 
 from bip_utils.bip.bip32 import IBip32MstKeyGenerator
 from bip_utils.bip.bip32.slip10.bip32_slip10_mst_key_generator import Bip32Slip10MstKeyGeneratorConst
 from bip_utils.ecc import Ed25519KholawPrivateKey
 from bip_utils.utils.crypto import Pbkdf2HmacSha512
 from bip_utils.utils.misc import BitUtils
+from bip_utils.utils.mnemonic import SeedCache
 
 
 class CardanoIcarusMasterKeyGeneratorConst:
@@ -45,14 +46,30 @@ class CardanoIcarusMasterKeyGeneratorConst:
     PBKDF2_ROUNDS: int = 4096
     # PBKDF2 output length in bytes
     PBKDF2_OUT_BYTE_LEN: int = 96
+    # Domain for seed cache
+    SEED_CACHE_DOMAIN: str = "cardano_icarus"
 
 
 class CardanoIcarusMstKeyGenerator(IBip32MstKeyGenerator):
     """
     Cardano Icarus master key generator class.
     It allows master keys generation in according to Cardano Icarus.
+    Since master keys are generated by class methods, the seed cache is set for the whole class (disabled by default).
     """
 
+    __seed_cache: Optional[SeedCache] = None
+
+    @classmethod
+    def SetSeedCache(cls,
+                     seed_cache: Optional[SeedCache]) -> None:
+        """
+        Set the cache for the PBKDF2 output of master key generation.
+
+        Args:
+            seed_cache (SeedCache): Seed cache, None for disabling it
+        """
+        cls.__seed_cache = seed_cache
+
     @classmethod
     def GenerateFromSeed(cls,
                          seed_bytes: bytes) -> Tuple[bytes, bytes]:
@@ -72,10 +89,17 @@ class CardanoIcarusMstKeyGenerator(IBip32MstKeyGenerator):
         if len(seed_bytes) < Bip32Slip10MstKeyGeneratorConst.SEED_MIN_BYTE_LEN:
             raise ValueError(f"Invalid seed length ({len(seed_bytes)})")
 
-        key_bytes = Pbkdf2HmacSha512.DeriveKey(CardanoIcarusMasterKeyGeneratorConst.PBKDF2_PASSWORD,
-                                               seed_bytes,
-                                               CardanoIcarusMasterKeyGeneratorConst.PBKDF2_ROUNDS,
-                                               CardanoIcarusMasterKeyGeneratorConst.PBKDF2_OUT_BYTE_LEN)
+        def generate_fct() -> bytes:
+            return Pbkdf2HmacSha512.DeriveKey(CardanoIcarusMasterKeyGeneratorConst.PBKDF2_PASSWORD,
+                                              seed_bytes,
+                                              CardanoIcarusMasterKeyGeneratorConst.PBKDF2_ROUNDS,
+                                              CardanoIcarusMasterKeyGeneratorConst.PBKDF2_OUT_BYTE_LEN)
+
+        seed_cache = cls.__seed_cache
+        key_bytes = (generate_fct()
+                     if seed_cache is None
+                     else seed_cache.GetOrGenerate((CardanoIcarusMasterKeyGeneratorConst.SEED_CACHE_DOMAIN, seed_bytes),
+                                                   generate_fct))
         key_bytes = cls.__TweakMasterKeyBits(key_bytes)
 
         return key_bytes[:Ed25519KholawPrivateKey.Length()], key_bytes[Ed25519KholawPrivateKey.Length():]
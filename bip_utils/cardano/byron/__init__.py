@@ -1 +1,4 @@
 from bip_utils.cardano.byron.cardano_byron_legacy import CardanoByronLegacy
+from bip_utils.cardano.byron.cardano_byron_legacy_scanner import (
+    CardanoByronLegacyScanner, CardanoByronLegacyScannerConst, CardanoByronLegacyScanResult
+)
@@ -0,0 +1,392 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for scanning Cardano Byron legacy addresses.
+It allows finding which addresses belong to a Cardano Byron legacy wallet, by decrypting their HD paths.
+"""
+
+# Imports
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, Future
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from bip_utils.addr import AdaByronAddrConst
+from bip_utils.base58 import Base58Decoder
+from bip_utils.bip.bip32 import Bip32Path
+from bip_utils.cardano.byron.cardano_byron_legacy import CardanoByronLegacy
+from bip_utils.utils.crypto import Blake2b224, ChaCha20Poly1305, ChaCha20Poly1305Decrypter, Crc32
+from bip_utils.utils.misc import CborIndefiniteLenArrayDecoder
+
+
+class CardanoByronLegacyScannerConst:
+    """Class container for Cardano Byron legacy scanner constants."""
+
+    # Default number of addresses for each chunk submitted to the executor
+    DEFAULT_CHUNK_SIZE: int = 1000
+    # Maximum number of chunks waiting to be processed by the executor
+    MAX_PENDING_CHUNKS: int = 64
+
+    # CBOR major types
+    CBOR_MAJOR_UINT: int = 0
+    CBOR_MAJOR_BYTES: int = 2
+    CBOR_MAJOR_ARRAY: int = 4
+    CBOR_MAJOR_MAP: int = 5
+    CBOR_MAJOR_TAG: int = 6
+    # Key of the encrypted HD path in the address attributes
+    HD_PATH_ATTR_KEY: int = 1
+
+
+class CardanoByronLegacyScanResult(NamedTuple):
+    """Cardano Byron legacy scan result class."""
+
+    address: str
+    hd_path: Bip32Path
+
+
+class _CardanoByronLegacyAddrParser:
+    """
+    Cardano Byron legacy address parser class.
+    It gets the encrypted HD path of an address by reading only the needed CBOR items, without a generic decoder.
+    Only definite-length items are accepted, like the ones generated by Cardano Byron addresses.
+    """
+
+    @staticmethod
+    def GetHdPathEnc(addr: str) -> Optional[bytes]:
+        """
+        Get the encrypted HD path of the specified address.
+        The address type is not checked.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            bytes: Encrypted HD path bytes (None if the address doesn't contain it)
+
+        Raises:
+            ValueError: If the address encoding is not valid
+        """
+        try:
+            return _CardanoByronLegacyAddrParser.__GetHdPathEnc(Base58Decoder.Decode(addr))
+        except IndexError as ex:
+            raise ValueError("Invalid CBOR encoding") from ex
+
+    @staticmethod
+    def __GetHdPathEnc(addr_bytes: bytes) -> Optional[bytes]:
+        """
+        Get the encrypted HD path of the specified address bytes.
+
+        Args:
+            addr_bytes (bytes): Address bytes
+
+        Returns:
+            bytes: Encrypted HD path bytes (None if the address doesn't contain it)
+
+        Raises:
+            ValueError: If the address encoding is not valid
+            IndexError: If the address bytes are truncated
+        """
+
+        # Address: [tag(payload), CRC32]
+        pos = _CardanoByronLegacyAddrParser.__ReadExpected(addr_bytes, 0,
+                                                           CardanoByronLegacyScannerConst.CBOR_MAJOR_ARRAY, 2)
+        pos = _CardanoByronLegacyAddrParser.__ReadExpected(addr_bytes, pos,
+                                                           CardanoByronLegacyScannerConst.CBOR_MAJOR_TAG,
+                                                           AdaByronAddrConst.PAYLOAD_TAG)
+        payload_bytes, pos = _CardanoByronLegacyAddrParser.__ReadBytes(addr_bytes, pos)
+        crc32, pos = _CardanoByronLegacyAddrParser.__ReadHeader(addr_bytes, pos,
+                                                                CardanoByronLegacyScannerConst.CBOR_MAJOR_UINT)
+        if pos != len(addr_bytes):
+            raise ValueError("Invalid address encoding")
+        if Crc32.QuickIntDigest(payload_bytes) != crc32:
+            raise ValueError("Invalid CRC")
+
+        # Payload: [root hash, attributes, type]
+        pos = _CardanoByronLegacyAddrParser.__ReadExpected(payload_bytes, 0,
+                                                           CardanoByronLegacyScannerConst.CBOR_MAJOR_ARRAY, 3)
+        root_hash_bytes, pos = _CardanoByronLegacyAddrParser.__ReadBytes(payload_bytes, pos)
+        if len(root_hash_bytes) != Blake2b224.DigestSize():
+            raise ValueError("Invalid address root hash")
+
+        hd_path_enc_bytes = None
+        attrs_num, pos = _CardanoByronLegacyAddrParser.__ReadHeader(payload_bytes, pos,
+                                                                    CardanoByronLegacyScannerConst.CBOR_MAJOR_MAP)
+        for _ in range(attrs_num):
+            attr_key, pos = _CardanoByronLegacyAddrParser.__ReadHeader(payload_bytes, pos,
+                                                                       CardanoByronLegacyScannerConst.CBOR_MAJOR_UINT)
+            attr_bytes, pos = _CardanoByronLegacyAddrParser.__ReadBytes(payload_bytes, pos)
+            # The attribute value is itself a CBOR-encoded byte string
+            if attr_key == CardanoByronLegacyScannerConst.HD_PATH_ATTR_KEY:
+                hd_path_enc_bytes, attr_pos = _CardanoByronLegacyAddrParser.__ReadBytes(attr_bytes, 0)
+                if attr_pos != len(attr_bytes):
+                    raise ValueError("Invalid address attributes")
+
+        _, pos = _CardanoByronLegacyAddrParser.__ReadHeader(payload_bytes, pos,
+                                                            CardanoByronLegacyScannerConst.CBOR_MAJOR_UINT)
+        if pos != len(payload_bytes):
+            raise ValueError("Invalid address payload")
+
+        return hd_path_enc_bytes
+
+    @staticmethod
+    def __ReadExpected(data: bytes,
+                       pos: int,
+                       major_type: int,
+                       value: int) -> int:
+        """
+        Read a CBOR item header and check its value.
+
+        Args:
+            data (bytes)    : Data
+            pos (int)       : Header position
+            major_type (int): Expected major type
+            value (int)     : Expected value
+
+        Returns:
+            int: Position after the header
+
+        Raises:
+            ValueError: If the header is not the expected one
+            IndexError: If the data is truncated
+        """
+        value_got, pos = _CardanoByronLegacyAddrParser.__ReadHeader(data, pos, major_type)
+        if value_got != value:
+            raise ValueError(f"Invalid CBOR value (expected: {value}, got: {value_got})")
+        return pos
+
+    @staticmethod
+    def __ReadBytes(data: bytes,
+                    pos: int) -> Tuple[bytes, int]:
+        """
+        Read a CBOR byte string.
+
+        Args:
+            data (bytes): Data
+            pos (int)   : Item position
+
+        Returns:
+            tuple[bytes, int]: Byte string (index 0) and position of the next item (index 1)
+
+        Raises:
+            ValueError: If the item is not a definite-length byte string
+            IndexError: If the data is truncated
+        """
+        length, pos = _CardanoByronLegacyAddrParser.__ReadHeader(data, pos,
+                                                                 CardanoByronLegacyScannerConst.CBOR_MAJOR_BYTES)
+        if pos + length > len(data):
+            raise IndexError("Truncated CBOR byte string")
+        return data[pos:pos + length], pos + length
+
+    @staticmethod
+    def __ReadHeader(data: bytes,
+                     pos: int,
+                     major_type: int) -> Tuple[int, int]:
+        """
+        Read a CBOR item header.
+
+        Args:
+            data (bytes)    : Data
+            pos (int)       : Header position
+            major_type (int): Expected major type
+
+        Returns:
+            tuple[int, int]: Header value (index 0) and position after the header (index 1)
+
+        Raises:
+            ValueError: If the major type is not the expected one or the length is indefinite
+            IndexError: If the data is truncated
+        """
+        initial_byte = data[pos]
+        if initial_byte >> 5 != major_type:
+            raise ValueError("Invalid CBOR major type")
+
+        info = initial_byte & 0x1f
+        if info < 24:
+            return info, pos + 1
+        if info > 27:
+            raise ValueError("Invalid CBOR additional information")
+
+        val_len = 1 << (info - 24)
+        if pos + 1 + val_len > len(data):
+            raise IndexError("Truncated CBOR header")
+        return int.from_bytes(data[pos + 1:pos + 1 + val_len], "big"), pos + 1 + val_len
+
+
+class _CardanoByronLegacyScannerUtils:
+    """Class container for Cardano Byron legacy scanner utility functions."""
+
+    @staticmethod
+    def ScanChunk(hd_path_key_bytes: bytes,
+                  addrs: List[str]) -> List[CardanoByronLegacyScanResult]:
+        """
+        Scan a chunk of addresses.
+        It is not name-mangled, so that it can be pickled and submitted to a process pool.
+
+        Args:
+            hd_path_key_bytes (bytes): HD path key bytes
+            addrs (list[str])        : Addresses
+
+        Returns:
+            list[CardanoByronLegacyScanResult]: Matching addresses, in the same order of the input
+        """
+        scanner = CardanoByronLegacyScanner(hd_path_key_bytes)
+        return [res for res in map(scanner.ScanAddress, addrs) if res is not None]
+
+
+class CardanoByronLegacyScanner:
+    """
+    Cardano Byron legacy scanner class.
+    It finds the addresses belonging to a Cardano Byron legacy wallet, by trying to decrypt their HD paths.
+    The HD path key is derived only once (the nonce is the same for all addresses), so each address only costs
+    a base58 decoding, a minimal CBOR parsing and a ChaCha20-Poly1305 decryption.
+    """
+
+    m_hd_path_key_bytes: bytes
+    m_decrypter: ChaCha20Poly1305Decrypter
+
+    @classmethod
+    def FromWallet(cls,
+                   byron_legacy: CardanoByronLegacy) -> CardanoByronLegacyScanner:
+        """
+        Construct class from a Cardano Byron legacy wallet.
+
+        Args:
+            byron_legacy (CardanoByronLegacy object): CardanoByronLegacy object
+
+        Returns:
+            CardanoByronLegacyScanner object: CardanoByronLegacyScanner object
+        """
+        return cls(byron_legacy.HdPathKey())
+
+    def __init__(self,
+                 hd_path_key_bytes: bytes) -> None:
+        """
+        Construct class.
+
+        Args:
+            hd_path_key_bytes (bytes): HD path key bytes, shall be 32-byte long
+
+        Raises:
+            ValueError: If the HD path key is not valid
+        """
+        if len(hd_path_key_bytes) != ChaCha20Poly1305.KeySize():
+            raise ValueError("HD path key shall be 32-byte long")
+        self.m_hd_path_key_bytes = hd_path_key_bytes
+        self.m_decrypter = ChaCha20Poly1305Decrypter(hd_path_key_bytes,
+                                                     AdaByronAddrConst.CHACHA20_POLY1305_NONCE)
+
+    def HdPathKey(self) -> bytes:
+        """
+        Get the key used for HD path decryption.
+
+        Returns:
+            bytes: Key bytes
+        """
+        return self.m_hd_path_key_bytes
+
+    def ScanAddress(self,
+                    addr: str) -> Optional[CardanoByronLegacyScanResult]:
+        """
+        Scan a single address.
+        Addresses that are not valid or don't contain an HD path are considered not belonging to the wallet.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            CardanoByronLegacyScanResult object: Scan result (None if the address doesn't belong to the wallet)
+        """
+        try:
+            hd_path_enc_bytes = _CardanoByronLegacyAddrParser.GetHdPathEnc(addr)
+            if hd_path_enc_bytes is None or len(hd_path_enc_bytes) < ChaCha20Poly1305.TagSize():
+                return None
+
+            plain_text_bytes = self.m_decrypter.Decrypt(
+                AdaByronAddrConst.CHACHA20_POLY1305_ASSOC_DATA,
+                hd_path_enc_bytes[:-ChaCha20Poly1305.TagSize()],
+                hd_path_enc_bytes[-ChaCha20Poly1305.TagSize():]
+            )
+            return CardanoByronLegacyScanResult(
+                addr,
+                Bip32Path(CborIndefiniteLenArrayDecoder.Decode(plain_text_bytes), True)
+            )
+        except ValueError:
+            return None
+
+    def Scan(self,
+             addrs: Iterable[str],
+             executor: Optional[Executor] = None,
+             chunk_size: int = CardanoByronLegacyScannerConst.DEFAULT_CHUNK_SIZE
+             ) -> Iterator[CardanoByronLegacyScanResult]:
+        """
+        Scan the specified addresses and yield the ones belonging to the wallet.
+        Addresses are consumed lazily, so the iterable can be a stream (e.g. lines of a chain snapshot file).
+
+        Args:
+            addrs (iterable[str])        : Addresses
+            executor (Executor, optional): Executor for scanning chunks of addresses concurrently (default: None)
+                                           A process pool is advised, since the scanning is CPU-bound
+            chunk_size (int, optional)   : Number of addresses for each chunk submitted to the executor
+                                           (default: 1000)
+
+        Returns:
+            Iterator[CardanoByronLegacyScanResult]: Scan results of matching addresses, in the same order of the input
+
+        Raises:
+            ValueError: If the chunk size is not valid
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+
+        if executor is None:
+            return (res for res in map(self.ScanAddress, addrs) if res is not None)
+        return self.__ScanConcurrent(addrs, executor, chunk_size)
+
+    def __ScanConcurrent(self,
+                         addrs: Iterable[str],
+                         executor: Executor,
+                         chunk_size: int) -> Iterator[CardanoByronLegacyScanResult]:
+        """
+        Scan the specified addresses concurrently and yield the ones belonging to the wallet.
+
+        Args:
+            addrs (iterable[str]): Addresses
+            executor (Executor)  : Executor
+            chunk_size (int)     : Number of addresses for each chunk submitted to the executor
+
+        Returns:
+            Iterator[CardanoByronLegacyScanResult]: Scan results of matching addresses, in the same order of the input
+        """
+
+        # Keep a limited number of chunks in flight, so that the input is not entirely loaded in memory
+        addrs_it = iter(addrs)
+        pending: Deque[Future] = deque()
+        while True:
+            chunk = list(islice(addrs_it, chunk_size))
+            if not chunk:
+                break
+            pending.append(executor.submit(_CardanoByronLegacyScannerUtils.ScanChunk, self.m_hd_path_key_bytes, chunk))
+            if len(pending) >= CardanoByronLegacyScannerConst.MAX_PENDING_CHUNKS:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
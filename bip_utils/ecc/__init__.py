@@ -35,6 +35,7 @@ from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
 
 # secp256k1
 from bip_utils.ecc.secp256k1.secp256k1 import Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey
+from bip_utils.ecc.secp256k1.secp256k1_utils import Secp256k1Utils
 
 # sr25519
 from bip_utils.ecc.sr25519.sr25519 import Sr25519
@@ -55,6 +55,23 @@ class Ed25519Utils:
         """
         return ed25519_lib.int_encode(int_val)
 
+    @staticmethod
+    def PointIsOnCurve(point_bytes: bytes) -> bool:
+        """
+        Get if the specified encoded point lies on the ed25519 curve.
+        It's cheaper than constructing a public key object, since the point is not decoded.
+
+        Args:
+            point_bytes (bytes): Encoded point bytes
+
+        Returns:
+            bool: True if it lies on the curve, false otherwise
+
+        Raises:
+            ValueError: If point bytes are not valid
+        """
+        return ed25519_lib.point_encoded_is_on_curve(point_bytes)
+
     @staticmethod
     def ScalarReduce(scalar: Union[bytes, int]) -> bytes:
         """
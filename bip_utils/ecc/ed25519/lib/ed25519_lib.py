@@ -58,6 +58,21 @@ def _x_recover(y: int) -> int:
     return x
 
 
+def _jacobi(a: int, n: int) -> int:
+    # Binary algorithm, it's much faster than computing the Euler criterion with pow
+    a %= n
+    res = 1
+    while a != 0:
+        tz = (a & -a).bit_length() - 1
+        a >>= tz
+        if tz & 1 and (n & 7) in (3, 5):
+            res = -res
+        if a & n & 3 == 3:
+            res = -res
+        a, n = n % a, a
+    return res if n == 1 else 0
+
+
 def int_decode(int_bytes: bytes) -> int:
     """
     Decode int from bytes.
@@ -259,6 +274,8 @@ def point_is_on_curve(point: Union[bytes, Tuple[int, int]]) -> bool:
         ValueError: If point bytes are not valid
     """
     if isinstance(point, bytes):
+        if point_is_encoded_bytes(point):
+            return point_encoded_is_on_curve(point)
         point = point_bytes_to_coord(point)
 
     x = point[0]
@@ -266,6 +283,29 @@ def point_is_on_curve(point: Union[bytes, Tuple[int, int]]) -> bool:
     return (-x * x + y * y - 1 - _D * x * x * y * y) % _Q == 0
 
 
+def point_encoded_is_on_curve(point_bytes: bytes) -> bool:
+    """
+    Get if the encoded point lies on the ed25519 curve, without decoding it.
+    The point lies on the curve if x^2 = (y^2 - 1) / (d*y^2 + 1) has a solution, i.e. if (y^2 - 1) * (d*y^2 + 1)
+    is a square modulo q (or zero), which is checked with the Jacobi symbol instead of recovering x.
+
+    Args:
+        point_bytes (bytes): Point bytes
+
+    Returns:
+        bool: True if it lies on the curve, false otherwise
+
+    Raises:
+        ValueError: If point bytes are not valid
+    """
+    if not point_is_encoded_bytes(point_bytes):
+        raise ValueError("Invalid point bytes")
+
+    y = int_decode(point_bytes) & ((1 << 255) - 1)
+    yy = y * y
+    return _jacobi((yy - 1) * (_D * yy + 1), _Q) >= 0
+
+
 def point_add(point_1: Union[bytes, Tuple[int, int]],
               point_2: Union[bytes, Tuple[int, int]]) -> bytes:
     """
@@ -0,0 +1,118 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for secp256k1 utility functions."""
+
+# Imports
+from bip_utils.ecc.conf import EccConf
+from bip_utils.ecc.secp256k1.secp256k1_const import Secp256k1Const, Secp256k1Point, Secp256k1PublicKey
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
+
+
+if EccConf.USE_COINCURVE:
+    import coincurve
+
+
+class Secp256k1UtilsConst:
+    """Class container for secp256k1 utility constants."""
+
+    # Prefix of a compressed public key with even y coordinate
+    EVEN_Y_PREFIX: bytes = b"\x02"
+
+
+class _Secp256k1UtilsCoincurve:
+    """Class container for secp256k1 utility functions implemented with coincurve."""
+
+    @staticmethod
+    def XOnlyTweakAdd(x_bytes: bytes,
+                      tweak_bytes: bytes) -> bytes:
+        """
+        Compute lift_x(x) + tweak * G and return its x coordinate.
+
+        Args:
+            x_bytes (bytes)    : X coordinate bytes
+            tweak_bytes (bytes): Tweak bytes
+
+        Returns:
+            bytes: X coordinate bytes of the tweaked point
+
+        Raises:
+            ValueError: If the x coordinate or the tweak is not valid
+        """
+        return coincurve.PublicKey(Secp256k1UtilsConst.EVEN_Y_PREFIX + x_bytes).add(tweak_bytes).format()[1:]
+
+
+class _Secp256k1UtilsGeneric:
+    """Class container for secp256k1 utility functions implemented with the generic point interface."""
+
+    @staticmethod
+    def XOnlyTweakAdd(x_bytes: bytes,
+                      tweak_bytes: bytes) -> bytes:
+        """
+        Compute lift_x(x) + tweak * G and return its x coordinate.
+
+        Args:
+            x_bytes (bytes)    : X coordinate bytes
+            tweak_bytes (bytes): Tweak bytes
+
+        Returns:
+            bytes: X coordinate bytes of the tweaked point
+
+        Raises:
+            ValueError: If the x coordinate or the tweak is not valid
+        """
+        tweak = BytesUtils.ToInteger(tweak_bytes)
+        if tweak >= Secp256k1Const.CURVE_ORDER:
+            raise ValueError("Invalid tweak")
+
+        # Decompressing the key with even y is exactly lift_x
+        point = Secp256k1PublicKey.FromBytes(Secp256k1UtilsConst.EVEN_Y_PREFIX + x_bytes).Point()
+        return IntegerUtils.ToBytes((point + (tweak * Secp256k1Const.GENERATOR)).X(),
+                                    bytes_num=Secp256k1Point.CoordinateLength())
+
+
+class Secp256k1Utils:
+    """Class container for secp256k1 utility functions."""
+
+    @staticmethod
+    def XOnlyTweakAdd(x_bytes: bytes,
+                      tweak_bytes: bytes) -> bytes:
+        """
+        Tweak a x-only public key as defined by BIP-0340/BIP-0341, i.e. compute lift_x(x) + tweak * G and return
+        its x coordinate.
+        If coincurve is used, the whole computation is performed by libsecp256k1.
+
+        Args:
+            x_bytes (bytes)    : X coordinate bytes (32-byte long)
+            tweak_bytes (bytes): Tweak bytes (32-byte long)
+
+        Returns:
+            bytes: X coordinate bytes of the tweaked point
+
+        Raises:
+            ValueError: If the x coordinate is not on the curve or the tweak is not valid
+        """
+        if len(x_bytes) != Secp256k1Point.CoordinateLength():
+            raise ValueError(f"Invalid x coordinate length ({len(x_bytes)})")
+        if len(tweak_bytes) != Secp256k1Point.CoordinateLength():
+            raise ValueError(f"Invalid tweak length ({len(tweak_bytes)})")
+        if EccConf.USE_COINCURVE:
+            return _Secp256k1UtilsCoincurve.XOnlyTweakAdd(x_bytes, tweak_bytes)
+        return _Secp256k1UtilsGeneric.XOnlyTweakAdd(x_bytes, tweak_bytes)
@@ -7,5 +7,7 @@ from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import (
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_decoder import ElectrumV1MnemonicDecoder
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_encoder import ElectrumV1MnemonicEncoder
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_generator import ElectrumV1MnemonicGenerator
-from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_validator import ElectrumV1MnemonicValidator
+from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_validator import (
+    ElectrumV1MnemonicBulkValidator, ElectrumV1MnemonicValidator
+)
 from bip_utils.electrum.mnemonic_v1.electrum_v1_seed_generator import ElectrumV1SeedGenerator
@@ -24,7 +24,7 @@ Reference: https://github.com/spesmilo/electrum
 """
 
 # Imports
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Union
 
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import (
     ElectrumV1Languages, ElectrumV1Mnemonic, ElectrumV1MnemonicConst
@@ -80,13 +80,21 @@ class ElectrumV1MnemonicDecoder(MnemonicDecoderBase):
         # Detect language if it was not specified at construction
         words_list, _ = self._FindLanguage(mnemonic_obj)
 
-        # Get words
-        words = mnemonic_obj.ToList()
+        # 3 words represent 4 bytes, all chunks are converted at once
+        return MnemonicUtils.WordsIdxToBytes(words_list.GetWordsIdx(mnemonic_obj.ToList()), words_list.Length(), "big")
 
-        # Consider 3 words at a time, 3 words represent 4 bytes
-        entropy_bytes = b""
-        for i in range(len(words) // 3):
-            word1, word2, word3 = words[i * 3:(i * 3) + 3]
-            entropy_bytes += MnemonicUtils.WordsToBytesChunk(word1, word2, word3, words_list, "big")
+    def DecodeMany(self,
+                   mnemonics: Iterable[Union[str, Mnemonic]]) -> List[bytes]:
+        """
+        Decode many mnemonic phrases to bytes.
+
+        Args:
+            mnemonics (iterable): Mnemonics (each element shall be str or Mnemonic object)
+
+        Returns:
+            list[bytes]: Decoded bytes
 
-        return entropy_bytes
+        Raises:
+            ValueError: If mnemonic is not valid
+        """
+        return [self.Decode(mnemonic) for mnemonic in mnemonics]
@@ -24,6 +24,8 @@ Reference: https://github.com/spesmilo/electrum
 """
 
 # Imports
+from typing import List, Sequence
+
 from bip_utils.electrum.mnemonic_v1.electrum_v1_entropy_generator import ElectrumV1EntropyGenerator
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import ElectrumV1Languages, ElectrumV1Mnemonic
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_utils import ElectrumV1WordsListGetter
@@ -64,15 +66,29 @@ class ElectrumV1MnemonicEncoder(MnemonicEncoderBase):
         Raises:
             ValueError: If bytes length is not valid
         """
+        return self.EncodeMany([entropy_bytes])[0]
 
-        # Check entropy length
-        entropy_byte_len = len(entropy_bytes)
-        if not ElectrumV1EntropyGenerator.IsValidEntropyByteLen(entropy_byte_len):
-            raise ValueError(f"Entropy byte length ({entropy_byte_len}) is not valid")
+    def EncodeMany(self,
+                   entropies: Sequence[bytes]) -> List[Mnemonic]:
+        """
+        Encode many bytes to mnemonic phrases.
+
+        Args:
+            entropies (sequence[bytes]): Entropy bytes (accepted lengths in bits: 128)
+
+        Returns:
+            list[Mnemonic]: Encoded mnemonics
+
+        Raises:
+            ValueError: If bytes length is not valid
+        """
 
-        # Build mnemonic
-        mnemonic = []
-        for i in range(len(entropy_bytes) // 4):
-            mnemonic += MnemonicUtils.BytesChunkToWords(entropy_bytes[i * 4:(i * 4) + 4], self.m_words_list, "big")
+        # Check entropy length
+        for entropy_bytes in entropies:
+            entropy_byte_len = len(entropy_bytes)
+            if not ElectrumV1EntropyGenerator.IsValidEntropyByteLen(entropy_byte_len):
+                raise ValueError(f"Entropy byte length ({entropy_byte_len}) is not valid")
 
-        return ElectrumV1Mnemonic.FromList(mnemonic)
+        # Build mnemonics, 4 bytes represent 3 words and all chunks are converted at once
+        return [ElectrumV1Mnemonic.FromList(self.m_words_list.GetWordsAtIdx(words_idx))
+                for words_idx in MnemonicUtils.BytesToWordsIdxMany(entropies, self.m_words_list.Length(), "big")]
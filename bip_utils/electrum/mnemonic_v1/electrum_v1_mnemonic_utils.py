@@ -22,6 +22,7 @@
 
 # Imports
 import os
+from functools import lru_cache
 from typing import Tuple
 
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import ElectrumV1Languages, ElectrumV1MnemonicConst
@@ -60,6 +61,7 @@ class ElectrumV1WordsListGetter(MnemonicWordsListGetterBase):
                                    ElectrumV1MnemonicConst.WORDS_LIST_NUM)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def __GetLanguageFile(lang: MnemonicLanguages) -> str:
         """
         Get the specified language file name.
@@ -23,9 +23,11 @@
 # Imports
 from typing import Optional
 
-from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import ElectrumV1Languages
+from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import (
+    ElectrumV1Languages, ElectrumV1Mnemonic, ElectrumV1MnemonicConst
+)
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_decoder import ElectrumV1MnemonicDecoder
-from bip_utils.utils.mnemonic import MnemonicValidator
+from bip_utils.utils.mnemonic import MnemonicBulkValidator, MnemonicValidator
 
 
 class ElectrumV1MnemonicValidator(MnemonicValidator):
@@ -47,3 +49,26 @@ class ElectrumV1MnemonicValidator(MnemonicValidator):
             lang (ElectrumV1Languages, optional): Language, None for automatic detection
         """
         super().__init__(ElectrumV1MnemonicDecoder(lang))
+
+
+class ElectrumV1MnemonicBulkValidator(MnemonicBulkValidator):
+    """
+    Electrum v1 bulk mnemonic validator class.
+    It validates a stream of mnemonic phrases.
+    """
+
+    def __init__(self,
+                 lang: Optional[ElectrumV1Languages] = ElectrumV1Languages.ENGLISH) -> None:
+        """
+        Construct class.
+
+        Args:
+            lang (ElectrumV1Languages, optional): Language, None for automatic detection
+
+        Raises:
+            TypeError: If the language is not a ElectrumV1Languages enum
+        """
+        super().__init__(ElectrumV1MnemonicValidator,
+                         (lang,),
+                         ElectrumV1Mnemonic,
+                         ElectrumV1MnemonicConst.MNEMONIC_WORD_NUM)
@@ -7,5 +7,7 @@ from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import (
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_decoder import ElectrumV2MnemonicDecoder
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_encoder import ElectrumV2MnemonicEncoder
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_generator import ElectrumV2MnemonicGenerator
-from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_validator import ElectrumV2MnemonicValidator
+from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_validator import (
+    ElectrumV2MnemonicBulkValidator, ElectrumV2MnemonicValidator
+)
 from bip_utils.electrum.mnemonic_v2.electrum_v2_seed_generator import ElectrumV2SeedGenerator
@@ -32,7 +32,7 @@ from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import (
 )
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_utils import ElectrumV2MnemonicUtils
 from bip_utils.utils.misc import IntegerUtils
-from bip_utils.utils.mnemonic import Mnemonic, MnemonicDecoderBase
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicDecoderBase, MnemonicVersionError
 
 
 class ElectrumV2MnemonicDecoder(MnemonicDecoderBase):
@@ -78,7 +78,7 @@ class ElectrumV2MnemonicDecoder(MnemonicDecoderBase):
             bytes: Decoded bytes
 
         Raises:
-            MnemonicChecksumError: If checksum is not valid
+            MnemonicVersionError: If the words are valid but the mnemonic version is not
             ValueError: If mnemonic is not valid
         """
         mnemonic_obj = ElectrumV2Mnemonic.FromString(mnemonic) if isinstance(mnemonic, str) else mnemonic
@@ -87,10 +87,6 @@ class ElectrumV2MnemonicDecoder(MnemonicDecoderBase):
         if mnemonic_obj.WordsCount() not in ElectrumV2MnemonicConst.MNEMONIC_WORD_NUM:
             raise ValueError(f"Mnemonic words count is not valid ({mnemonic_obj.WordsCount()})")
 
-        # Check mnemonic validity:
-        if not ElectrumV2MnemonicUtils.IsValidMnemonic(mnemonic_obj, self.m_mnemonic_type):
-            raise ValueError("Invalid mnemonic")
-
         # Get words
         words = mnemonic_obj.ToList()
         # Detect language if it was not specified at construction
@@ -102,4 +98,8 @@ class ElectrumV2MnemonicDecoder(MnemonicDecoderBase):
         for word in reversed(words):
             entropy_int = (entropy_int * n) + words_list.GetWordIdx(word)
 
+        # Check mnemonic validity, after the words so that invalid words are reported as such
+        if not ElectrumV2MnemonicUtils.IsValidMnemonic(mnemonic_obj, self.m_mnemonic_type):
+            raise MnemonicVersionError("Invalid mnemonic")
+
         return IntegerUtils.ToBytes(entropy_int)
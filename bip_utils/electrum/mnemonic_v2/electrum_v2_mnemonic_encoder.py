@@ -23,9 +23,10 @@ Module for Electrum v2 mnemonic encoding.
 Reference: https://github.com/spesmilo/electrum
 """
 
-from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
-
 # Imports
+from typing import List, Union
+
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
 from bip_utils.electrum.mnemonic_v2.electrum_v2_entropy_generator import ElectrumV2EntropyGenerator
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import (
     ElectrumV2Languages, ElectrumV2Mnemonic, ElectrumV2MnemonicTypes
@@ -85,17 +86,50 @@ class ElectrumV2MnemonicEncoder(MnemonicEncoderBase):
         if not ElectrumV2EntropyGenerator.AreEntropyBitsEnough(entropy_int):
             raise ValueError("Entropy bit length is not enough for generating a valid mnemonic")
 
-        # Encode to words
-        n = self.m_words_list.Length()
-        mnemonic = []
-        while entropy_int > 0:
-            word_idx = entropy_int % n
-            entropy_int //= n
-            mnemonic.append(self.m_words_list.GetWordAtIdx(word_idx))
-
-        # Check if the mnemonic is valid
-        mnemonic_obj = ElectrumV2Mnemonic.FromList(mnemonic)
+        # Encode to words and check if the mnemonic is valid
+        mnemonic_obj = ElectrumV2Mnemonic.FromList(self.__EncodeToWords(entropy_int))
         if not ElectrumV2MnemonicUtils.IsValidMnemonic(mnemonic_obj, self.m_mnemonic_type):
             raise ValueError("Entropy bytes are not suitable for generating a valid mnemonic")
 
         return mnemonic_obj
+
+    def IsValidEntropy(self,
+                       entropy: Union[bytes, int]) -> bool:
+        """
+        Get if the specified entropy can be encoded to a valid mnemonic, without raising any exception.
+        The version of the words is checked before building the mnemonic object, since it is the cheapest check
+        and it discards most of the entropies.
+
+        Args:
+            entropy (bytes or int): Entropy
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        entropy_int = BytesUtils.ToInteger(entropy) if isinstance(entropy, bytes) else entropy
+        if not ElectrumV2EntropyGenerator.AreEntropyBitsEnough(entropy_int):
+            return False
+
+        # Words of the list are already normalized
+        mnemonic = self.__EncodeToWords(entropy_int)
+        if not ElectrumV2MnemonicUtils.IsValidVersion(" ".join(mnemonic), self.m_mnemonic_type):
+            return False
+        return ElectrumV2MnemonicUtils.IsValidMnemonic(ElectrumV2Mnemonic.FromList(mnemonic), self.m_mnemonic_type)
+
+    def __EncodeToWords(self,
+                        entropy_int: int) -> List[str]:
+        """
+        Encode entropy integer to words.
+
+        Args:
+            entropy_int (int): Entropy integer
+
+        Returns:
+            list[str]: Encoded words
+        """
+        n = self.m_words_list.Length()
+        mnemonic = []
+        while entropy_int > 0:
+            entropy_int, word_idx = divmod(entropy_int, n)
+            mnemonic.append(self.m_words_list.GetWordAtIdx(word_idx))
+        return mnemonic
@@ -21,7 +21,9 @@
 """Module for Electrum v2 mnemonic generation."""
 
 # Imports
-from typing import Dict, Union
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Deque, Dict, Optional, Tuple, Union
 
 from bip_utils.electrum.mnemonic_v2.electrum_v2_entropy_generator import (
     ElectrumV2EntropyBitLen, ElectrumV2EntropyGenerator
@@ -44,6 +46,65 @@ class ElectrumV2MnemonicGeneratorConst:
     }
     # Maximum number of attempts (just to avoid infinite looping)
     MAX_ATTEMPTS: int = 10**6
+    # Default number of attempts for each chunk submitted to the executor
+    DEFAULT_CHUNK_SIZE: int = 1024
+    # Maximum number of chunks waiting to be processed by the executor
+    MAX_PENDING_CHUNKS: int = 64
+
+
+class _ElectrumV2MnemonicGeneratorUtils:
+    """
+    Class container for Electrum v2 mnemonic generator utility functions.
+    Functions are not name-mangled, so that they can be submitted to a process pool.
+    """
+
+    # Encoders constructed by the current process
+    __encoders: Dict[Tuple[ElectrumV2MnemonicTypes, ElectrumV2Languages], ElectrumV2MnemonicEncoder] = {}
+
+    @staticmethod
+    def GetEncoder(mnemonic_type: ElectrumV2MnemonicTypes,
+                   lang: ElectrumV2Languages) -> ElectrumV2MnemonicEncoder:
+        """
+        Get the encoder for the specified mnemonic type and language, constructing it only once per process.
+
+        Args:
+            mnemonic_type (ElectrumV2MnemonicTypes): Mnemonic type
+            lang (ElectrumV2Languages)             : Language
+
+        Returns:
+            ElectrumV2MnemonicEncoder object: ElectrumV2MnemonicEncoder object
+        """
+        key = (mnemonic_type, lang)
+        encoder = _ElectrumV2MnemonicGeneratorUtils.__encoders.get(key)
+        if encoder is None:
+            encoder = _ElectrumV2MnemonicGeneratorUtils.__encoders[key] = ElectrumV2MnemonicEncoder(mnemonic_type,
+                                                                                                    lang)
+        return encoder
+
+    @staticmethod
+    def SearchRange(mnemonic_type: ElectrumV2MnemonicTypes,
+                    lang: ElectrumV2Languages,
+                    entropy_int: int,
+                    start: int,
+                    end: int) -> int:
+        """
+        Search the first valid entropy in the specified range of attempts.
+
+        Args:
+            mnemonic_type (ElectrumV2MnemonicTypes): Mnemonic type
+            lang (ElectrumV2Languages)             : Language
+            entropy_int (int)                      : Starting entropy integer
+            start (int)                            : First attempt (included)
+            end (int)                              : Last attempt (excluded)
+
+        Returns:
+            int: Index of the first valid attempt, -1 if not found
+        """
+        encoder = _ElectrumV2MnemonicGeneratorUtils.GetEncoder(mnemonic_type, lang)
+        for i in range(start, end):
+            if encoder.IsValidEntropy(entropy_int + i):
+                return i
+        return -1
 
 
 class ElectrumV2MnemonicGenerator:
@@ -52,6 +113,8 @@ class ElectrumV2MnemonicGenerator:
     It generates 12 or 24-words mnemonic in according to Electrum wallets.
     """
 
+    m_mnemonic_type: ElectrumV2MnemonicTypes
+    m_lang: ElectrumV2Languages
     m_mnemonic_encoder: ElectrumV2MnemonicEncoder
 
     def __init__(self,
@@ -70,6 +133,8 @@ class ElectrumV2MnemonicGenerator:
             ValueError: If language words list is not valid
         """
         self.m_mnemonic_encoder = ElectrumV2MnemonicEncoder(mnemonic_type, lang)
+        self.m_mnemonic_type = mnemonic_type
+        self.m_lang = lang
 
     def FromWordsNumber(self,
                         words_num: Union[int, ElectrumV2WordsNum]) -> Mnemonic:
@@ -102,7 +167,9 @@ class ElectrumV2MnemonicGenerator:
         return self.FromEntropy(entropy_bytes)
 
     def FromEntropy(self,
-                    entropy_bytes: bytes) -> Mnemonic:
+                    entropy_bytes: bytes,
+                    executor: Optional[Executor] = None,
+                    chunk_size: int = ElectrumV2MnemonicGeneratorConst.DEFAULT_CHUNK_SIZE) -> Mnemonic:
         """
         Generate mnemonic from the specified entropy bytes.
         Because of the mnemonic encoding algorithm used by Electrum, the specified entropy will only be a starting
@@ -111,26 +178,91 @@ class ElectrumV2MnemonicGenerator:
         Please note that, to successfully generate a mnemonic, the bits of the big endian integer encoded entropy
         shall be at least 121 (for 12 words) or 253 (for 24 words). Otherwise, a mnemonic generation is not possible
         and a ValueError exception will be raised.
+        If an executor is specified, disjoint ranges of attempts are searched concurrently. The generated mnemonic is
+        the same of the sequential search, since the first valid entropy is always the one returned.
 
         Args:
-            entropy_bytes (bytes): Entropy bytes
+            entropy_bytes (bytes)        : Entropy bytes
+            executor (Executor, optional): Executor for searching ranges of attempts concurrently (default: None)
+                                           A process pool is advised, since the search is CPU-bound
+            chunk_size (int, optional)   : Number of attempts for each range (default: 1024)
 
         Returns:
             Mnemonic object: Generated mnemonic
 
         Raises:
-            ValueError: If entropy byte length is not valid or a mnemonic cannot be generated
+            ValueError: If entropy byte length or chunk size is not valid or a mnemonic cannot be generated
         """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
 
         # Do not waste time trying if the entropy bit are not enough
         if ElectrumV2EntropyGenerator.AreEntropyBitsEnough(entropy_bytes):
             # Same of Electrum: increase the entropy until a valid one is found
             entropy_int = BytesUtils.ToInteger(entropy_bytes)
-            for i in range(ElectrumV2MnemonicGeneratorConst.MAX_ATTEMPTS):
-                new_entropy_int = entropy_int + i
-                try:
-                    return self.m_mnemonic_encoder.Encode(IntegerUtils.ToBytes(new_entropy_int))
-                except ValueError:
-                    continue
+            if executor is None:
+                idx = self.__SearchSequential(entropy_int)
+            else:
+                idx = self.__SearchConcurrent(entropy_int, executor, chunk_size)
+            if idx >= 0:
+                return self.m_mnemonic_encoder.Encode(IntegerUtils.ToBytes(entropy_int + idx))
 
         raise ValueError("Unable to generate a valid mnemonic")
+
+    def __SearchSequential(self,
+                           entropy_int: int) -> int:
+        """
+        Search the first valid entropy sequentially.
+
+        Args:
+            entropy_int (int): Starting entropy integer
+
+        Returns:
+            int: Index of the first valid attempt, -1 if not found
+        """
+        for i in range(ElectrumV2MnemonicGeneratorConst.MAX_ATTEMPTS):
+            if self.m_mnemonic_encoder.IsValidEntropy(entropy_int + i):
+                return i
+        return -1
+
+    def __SearchConcurrent(self,
+                           entropy_int: int,
+                           executor: Executor,
+                           chunk_size: int) -> int:
+        """
+        Search the first valid entropy concurrently, in disjoint ranges of attempts.
+        Ranges are consumed in order, so the first valid entropy is returned even if a later range finishes first.
+
+        Args:
+            entropy_int (int)  : Starting entropy integer
+            executor (Executor): Executor
+            chunk_size (int)   : Number of attempts for each range
+
+        Returns:
+            int: Index of the first valid attempt, -1 if not found
+        """
+        max_attempts = ElectrumV2MnemonicGeneratorConst.MAX_ATTEMPTS
+        pending: Deque[Future] = deque()
+        try:
+            for chunk_start in range(0, max_attempts, chunk_size):
+                pending.append(executor.submit(_ElectrumV2MnemonicGeneratorUtils.SearchRange,
+                                               self.m_mnemonic_type,
+                                               self.m_lang,
+                                               entropy_int,
+                                               chunk_start,
+                                               min(chunk_start + chunk_size, max_attempts)))
+
+                # Keep a limited number of chunks in flight
+                if len(pending) >= ElectrumV2MnemonicGeneratorConst.MAX_PENDING_CHUNKS:
+                    idx = pending.popleft().result()
+                    if idx >= 0:
+                        return idx
+            while pending:
+                idx = pending.popleft().result()
+                if idx >= 0:
+                    return idx
+            return -1
+        finally:
+            # Do not waste time on ranges that are not needed anymore
+            for future in pending:
+                future.cancel()
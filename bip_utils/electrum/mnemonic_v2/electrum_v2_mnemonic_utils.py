@@ -21,13 +21,14 @@
 """Module for Electrum v2 mnemonic generation."""
 
 # Imports
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from bip_utils.bip.bip39 import Bip39MnemonicValidator
 from bip_utils.electrum.mnemonic_v1 import ElectrumV1MnemonicValidator
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import ElectrumV2MnemonicConst, ElectrumV2MnemonicTypes
 from bip_utils.utils.crypto import HmacSha512
-from bip_utils.utils.misc import BytesUtils
+from bip_utils.utils.misc import AlgoUtils, BytesUtils
+from bip_utils.utils.misc.algo import BytesLike
 from bip_utils.utils.mnemonic import Mnemonic
 
 
@@ -36,11 +37,21 @@ class ElectrumV2MnemonicUtilsConst:
 
     # HMAC key
     HMAC_KEY: bytes = b"Seed version"
+    # Mnemonic types to prefix, as (bit length, value) of the HMAC leading bits
+    TYPE_TO_PREFIX_BITS: Dict[ElectrumV2MnemonicTypes, Tuple[int, int]] = {
+        mnemonic_type: (len(prefix) * 4, int(prefix, 16))
+        for mnemonic_type, prefix in ElectrumV2MnemonicConst.TYPE_TO_PREFIX.items()
+    }
+    # Number of HMAC leading bytes needed for checking the prefix
+    PREFIX_BYTE_LEN: int = 2
 
 
 class ElectrumV2MnemonicUtils:
     """Class container for Electrum v2 mnemonic utility functions."""
 
+    # Keyed HMAC, so that the key is processed only once
+    __hmac_fct: Callable[[BytesLike], bytes] = HmacSha512.KeyedDigestFct(ElectrumV2MnemonicUtilsConst.HMAC_KEY)
+
     @staticmethod
     def IsValidMnemonic(mnemonic: Mnemonic,
                         mnemonic_type: Optional[ElectrumV2MnemonicTypes] = None) -> bool:
@@ -54,54 +65,47 @@ class ElectrumV2MnemonicUtils:
         Returns:
             bool: True if valid, false otherwise
         """
-        if ElectrumV2MnemonicUtils.__IsBip39OrV1Mnemonic(mnemonic):
+
+        # Check the version first, since it is much cheaper than the BIP39/v1 validation
+        if not ElectrumV2MnemonicUtils.IsValidVersion(mnemonic, mnemonic_type):
             return False
-        return (ElectrumV2MnemonicUtils.__IsType(mnemonic, mnemonic_type)
-                if mnemonic_type is not None
-                else ElectrumV2MnemonicUtils.__IsAnyType(mnemonic))
+        return not ElectrumV2MnemonicUtils.__IsBip39OrV1Mnemonic(mnemonic)
 
     @staticmethod
-    def __IsBip39OrV1Mnemonic(mnemonic: Mnemonic) -> bool:
+    def IsValidVersion(mnemonic: Union[str, Mnemonic],
+                       mnemonic_type: Optional[ElectrumV2MnemonicTypes] = None) -> bool:
         """
-        Get if the specified mnemonic is a valid BIP39 or v1 Electrum mnemonic.
+        Get if the version prefix of the specified mnemonic is valid.
+        Only the HMAC of the mnemonic is checked, so the mnemonic shall be already normalized and the check
+        against BIP39 and Electrum v1 mnemonics is not performed.
 
         Args:
-            mnemonic (Mnemonic): Mnemonic
+            mnemonic (str or Mnemonic)                       : Mnemonic
+            mnemonic_type (ElectrumV2MnemonicTypes, optional): Mnemonic type (default: any type)
 
         Returns:
             bool: True if valid, false otherwise
         """
-        return Bip39MnemonicValidator().IsValid(mnemonic) or ElectrumV1MnemonicValidator().IsValid(mnemonic)
+        mnemonic_str = mnemonic.ToStr() if isinstance(mnemonic, Mnemonic) else mnemonic
+        h = ElectrumV2MnemonicUtils.__hmac_fct(AlgoUtils.Encode(mnemonic_str))
+        h_int = BytesUtils.ToInteger(h[:ElectrumV2MnemonicUtilsConst.PREFIX_BYTE_LEN])
+        h_bit_len = ElectrumV2MnemonicUtilsConst.PREFIX_BYTE_LEN * 8
 
-    @staticmethod
-    def __IsAnyType(mnemonic: Mnemonic) -> bool:
-        """
-        Get if the specified mnemonic is of any valid type.
-
-        Args:
-            mnemonic (Mnemonic): Mnemonic
-
-        Returns:
-            bool: True if valid, false otherwise
-        """
-        h = HmacSha512.QuickDigest(ElectrumV2MnemonicUtilsConst.HMAC_KEY, mnemonic.ToStr())
-        for mnemonic_type in ElectrumV2MnemonicTypes:
-            if BytesUtils.ToHexString(h).startswith(ElectrumV2MnemonicConst.TYPE_TO_PREFIX[mnemonic_type]):
-                return True
-        return False
+        if mnemonic_type is not None:
+            bit_len, value = ElectrumV2MnemonicUtilsConst.TYPE_TO_PREFIX_BITS[mnemonic_type]
+            return (h_int >> (h_bit_len - bit_len)) == value
+        return any((h_int >> (h_bit_len - bit_len)) == value
+                   for bit_len, value in ElectrumV2MnemonicUtilsConst.TYPE_TO_PREFIX_BITS.values())
 
     @staticmethod
-    def __IsType(mnemonic: Mnemonic,
-                 mnemonic_type: ElectrumV2MnemonicTypes) -> bool:
+    def __IsBip39OrV1Mnemonic(mnemonic: Mnemonic) -> bool:
         """
-        Get if the specified mnemonic is of the specified type.
+        Get if the specified mnemonic is a valid BIP39 or v1 Electrum mnemonic.
 
         Args:
-            mnemonic (Mnemonic)                    : Mnemonic
-            mnemonic_type (ElectrumV2MnemonicTypes): Mnemonic type
+            mnemonic (Mnemonic): Mnemonic
 
         Returns:
             bool: True if valid, false otherwise
         """
-        h = HmacSha512.QuickDigest(ElectrumV2MnemonicUtilsConst.HMAC_KEY, mnemonic.ToStr())
-        return BytesUtils.ToHexString(h).startswith(ElectrumV2MnemonicConst.TYPE_TO_PREFIX[mnemonic_type])
+        return Bip39MnemonicValidator().IsValid(mnemonic) or ElectrumV1MnemonicValidator().IsValid(mnemonic)
@@ -23,9 +23,11 @@
 # Imports
 from typing import Optional
 
-from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import ElectrumV2Languages, ElectrumV2MnemonicTypes
+from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import (
+    ElectrumV2Languages, ElectrumV2Mnemonic, ElectrumV2MnemonicConst, ElectrumV2MnemonicTypes
+)
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_decoder import ElectrumV2MnemonicDecoder
-from bip_utils.utils.mnemonic import MnemonicValidator
+from bip_utils.utils.mnemonic import MnemonicBulkValidator, MnemonicValidator
 
 
 class ElectrumV2MnemonicValidator(MnemonicValidator):
@@ -47,3 +49,28 @@ class ElectrumV2MnemonicValidator(MnemonicValidator):
             lang (ElectrumV2Languages, optional)             : Language, None for automatic detection
         """
         super().__init__(ElectrumV2MnemonicDecoder(mnemonic_type, lang))
+
+
+class ElectrumV2MnemonicBulkValidator(MnemonicBulkValidator):
+    """
+    Electrum v2 bulk mnemonic validator class.
+    It validates a stream of mnemonic phrases.
+    """
+
+    def __init__(self,
+                 mnemonic_type: Optional[ElectrumV2MnemonicTypes] = None,
+                 lang: Optional[ElectrumV2Languages] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            mnemonic_type (ElectrumV2MnemonicTypes, optional): Mnemonic type, None for all types
+            lang (ElectrumV2Languages, optional)             : Language, None for automatic detection
+
+        Raises:
+            TypeError: If the mnemonic type or language is not of the correct enum
+        """
+        super().__init__(ElectrumV2MnemonicValidator,
+                         (mnemonic_type, lang),
+                         ElectrumV2Mnemonic,
+                         ElectrumV2MnemonicConst.MNEMONIC_WORD_NUM)
@@ -27,7 +27,7 @@ from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import ElectrumV2Langua
 from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_validator import ElectrumV2MnemonicValidator
 from bip_utils.utils.crypto import Pbkdf2HmacSha512
 from bip_utils.utils.misc import StringUtils
-from bip_utils.utils.mnemonic import Mnemonic
+from bip_utils.utils.mnemonic import Mnemonic, SeedCache
 
 
 class ElectrumV2SeedGeneratorConst:
@@ -37,6 +37,8 @@ class ElectrumV2SeedGeneratorConst:
     SEED_SALT_MOD: str = "electrum"
     # PBKDF2 round for seed generation
     SEED_PBKDF2_ROUNDS: int = 2048
+    # Domain for seed cache
+    SEED_CACHE_DOMAIN: str = "electrum_v2"
 
 
 class ElectrumV2SeedGenerator:
@@ -46,16 +48,19 @@ class ElectrumV2SeedGenerator:
     """
 
     m_entropy_bytes: bytes
+    m_seed_cache: Optional[SeedCache]
 
     def __init__(self,
                  mnemonic: Union[str, Mnemonic],
-                 lang: Optional[ElectrumV2Languages] = None) -> None:
+                 lang: Optional[ElectrumV2Languages] = None,
+                 seed_cache: Optional[SeedCache] = None) -> None:
         """
         Construct class.
 
         Args:
             mnemonic (str or Mnemonic object)   : Mnemonic
             lang (ElectrumV2Languages, optional): Language, None for automatic detection
+            seed_cache (SeedCache, optional)    : Seed cache, None for not caching seeds (default: None)
 
         Raises:
             ValueError: If the mnemonic is not valid
@@ -64,6 +69,7 @@ class ElectrumV2SeedGenerator:
         self.m_mnemonic = (ElectrumV2Mnemonic.FromString(mnemonic)
                            if isinstance(mnemonic, str)
                            else mnemonic)
+        self.m_seed_cache = seed_cache
 
     def Generate(self,
                  passphrase: str = "") -> bytes:
@@ -76,7 +82,13 @@ class ElectrumV2SeedGenerator:
         Returns:
             bytes: Generated seed
         """
+        mnemonic_str = self.m_mnemonic.ToStr()
         salt = StringUtils.NormalizeNfkd(ElectrumV2SeedGeneratorConst.SEED_SALT_MOD + passphrase)
-        return Pbkdf2HmacSha512.DeriveKey(self.m_mnemonic.ToStr(),
-                                          salt,
-                                          ElectrumV2SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+
+        def generate_fct() -> bytes:
+            return Pbkdf2HmacSha512.DeriveKey(mnemonic_str, salt, ElectrumV2SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+
+        if self.m_seed_cache is None:
+            return generate_fct()
+        return self.m_seed_cache.GetOrGenerate((ElectrumV2SeedGeneratorConst.SEED_CACHE_DOMAIN, mnemonic_str, salt),
+                                               generate_fct)
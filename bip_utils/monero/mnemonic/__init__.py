@@ -5,5 +5,5 @@ from bip_utils.monero.mnemonic.monero_mnemonic_encoder import (
     MoneroMnemonicEncoder, MoneroMnemonicNoChecksumEncoder, MoneroMnemonicWithChecksumEncoder
 )
 from bip_utils.monero.mnemonic.monero_mnemonic_generator import MoneroMnemonicGenerator
-from bip_utils.monero.mnemonic.monero_mnemonic_validator import MoneroMnemonicValidator
+from bip_utils.monero.mnemonic.monero_mnemonic_validator import MoneroMnemonicBulkValidator, MoneroMnemonicValidator
 from bip_utils.monero.mnemonic.monero_seed_generator import MoneroSeedGenerator
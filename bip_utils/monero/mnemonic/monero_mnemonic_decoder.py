@@ -21,14 +21,14 @@
 """Module for Monero mnemonic decoding."""
 
 # Imports
-from typing import List, Optional, Union
+from typing import Iterable, List, Optional, Union
 
 from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonic, MoneroMnemonicConst
 from bip_utils.monero.mnemonic.monero_mnemonic_utils import (
     MoneroMnemonicUtils, MoneroWordsListFinder, MoneroWordsListGetter
 )
 from bip_utils.utils.mnemonic import (
-    Mnemonic, MnemonicChecksumError, MnemonicDecoderBase, MnemonicLanguages, MnemonicUtils
+    Mnemonic, MnemonicChecksumError, MnemonicDecoderBase, MnemonicUtils, MnemonicWordsList
 )
 
 
@@ -81,34 +81,52 @@ class MoneroMnemonicDecoder(MnemonicDecoderBase):
         words_list, lang = self._FindLanguage(mnemonic_obj)
         assert isinstance(lang, MoneroLanguages)
 
-        # Get words
-        words = mnemonic_obj.ToList()
+        # Get word indexes
+        words_idx = words_list.GetWordsIdx(mnemonic_obj.ToList())
 
         # Validate checksum
-        self.__ValidateChecksum(words, lang)
+        if len(words_idx) in MoneroMnemonicConst.MNEMONIC_WORD_NUM_CHKSUM:
+            self.__ValidateChecksum(words_idx, words_list, lang)
+            words_idx = words_idx[:-1]
 
-        # Consider 3 words at a time, 3 words represent 4 bytes
-        entropy_bytes = b""
-        for i in range(len(words) // 3):
-            word1, word2, word3 = words[i * 3:(i * 3) + 3]
-            entropy_bytes += MnemonicUtils.WordsToBytesChunk(word1, word2, word3, words_list, "little")
+        # 3 words represent 4 bytes, all chunks are converted at once
+        return MnemonicUtils.WordsIdxToBytes(words_idx, words_list.Length(), "little")
 
-        return entropy_bytes
+    def DecodeMany(self,
+                   mnemonics: Iterable[Union[str, Mnemonic]]) -> List[bytes]:
+        """
+        Decode many mnemonic phrases to bytes.
+
+        Args:
+            mnemonics (iterable): Mnemonics (each element shall be str or Mnemonic object)
+
+        Returns:
+            list[bytes]: Decoded bytes
+
+        Raises:
+            MnemonicChecksumError: If checksum is not valid
+            ValueError: If mnemonic is not valid
+        """
+        return [self.Decode(mnemonic) for mnemonic in mnemonics]
 
     @staticmethod
-    def __ValidateChecksum(words: List[str],
-                           lang: MnemonicLanguages) -> None:
+    def __ValidateChecksum(words_idx: List[int],
+                           words_list: MnemonicWordsList,
+                           lang: MoneroLanguages) -> None:
         """
         Validate a mnemonic checksum.
 
         Args:
-            words (list[str])       : Words list
-            lang (MnemonicLanguages): Language
+            words_idx (list[int])                : Word indexes
+            words_list (MnemonicWordsList object): Words list
+            lang (MoneroLanguages)               : Language
 
         Raises:
             MnemonicChecksumError: If checksum is not valid
         """
-        if len(words) in MoneroMnemonicConst.MNEMONIC_WORD_NUM_CHKSUM:
-            chksum_word = MoneroMnemonicUtils.ComputeChecksum(words[:-1], lang)
-            if words[-1] != chksum_word:
-                raise MnemonicChecksumError(f"Invalid checksum (expected {chksum_word}, got {words[-1]})")
+        chksum_idx = MoneroMnemonicUtils.ComputeChecksumIdx(words_idx[:-1], lang)
+        if words_idx[-1] != chksum_idx:
+            raise MnemonicChecksumError(
+                f"Invalid checksum (expected {words_list.GetWordAtIdx(chksum_idx)}, "
+                f"got {words_list.GetWordAtIdx(words_idx[-1])})"
+            )
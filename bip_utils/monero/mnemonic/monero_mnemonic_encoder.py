@@ -21,8 +21,8 @@
 """Module for Monero mnemonic encoding."""
 
 # Imports
-from abc import ABC
-from typing import List
+from abc import ABC, abstractmethod
+from typing import List, Sequence
 
 from bip_utils.monero.mnemonic.monero_entropy_generator import MoneroEntropyGenerator
 from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonic
@@ -53,32 +53,45 @@ class MoneroMnemonicEncoderBase(MnemonicEncoderBase, ABC):
         super().__init__(lang, MoneroWordsListGetter)
         self.m_lang = lang
 
-    def _EncodeToList(self,
-                      entropy_bytes: bytes) -> List[str]:
+    @abstractmethod
+    def EncodeMany(self,
+                   entropies: Sequence[bytes]) -> List[Mnemonic]:
         """
-        Encode bytes to list of mnemonic words.
+        Encode many bytes to mnemonic phrases.
 
         Args:
-            entropy_bytes (bytes): Entropy bytes (accepted lengths in bits: 128, 256)
+            entropies (sequence[bytes]): Entropy bytes (accepted lengths in bits: 128, 256)
 
         Returns:
-            list[str]: List of encoded mnemonic words
+            list[Mnemonic]: Encoded mnemonics
+
+        Raises:
+            ValueError: If entropy is not valid
+        """
+
+    def _EncodeToIdxMany(self,
+                         entropies: Sequence[bytes]) -> List[List[int]]:
+        """
+        Encode many bytes to lists of mnemonic word indexes.
+
+        Args:
+            entropies (sequence[bytes]): Entropy bytes (accepted lengths in bits: 128, 256)
+
+        Returns:
+            list[list[int]]: Lists of encoded mnemonic word indexes
 
         Raises:
             ValueError: If bytes length is not valid
         """
 
         # Check entropy length
-        entropy_byte_len = len(entropy_bytes)
-        if not MoneroEntropyGenerator.IsValidEntropyByteLen(entropy_byte_len):
-            raise ValueError(f"Entropy byte length ({entropy_byte_len}) is not valid")
-
-        # Consider 4 bytes at a time, 4 bytes represent 3 words
-        mnemonic = []
-        for i in range(len(entropy_bytes) // 4):
-            mnemonic += MnemonicUtils.BytesChunkToWords(entropy_bytes[i * 4:(i * 4) + 4], self.m_words_list, "little")
+        for entropy_bytes in entropies:
+            entropy_byte_len = len(entropy_bytes)
+            if not MoneroEntropyGenerator.IsValidEntropyByteLen(entropy_byte_len):
+                raise ValueError(f"Entropy byte length ({entropy_byte_len}) is not valid")
 
-        return mnemonic
+        # 4 bytes represent 3 words, all chunks are converted at once
+        return MnemonicUtils.BytesToWordsIdxMany(entropies, self.m_words_list.Length(), "little")
 
 
 class MoneroMnemonicNoChecksumEncoder(MoneroMnemonicEncoderBase):
@@ -101,7 +114,24 @@ class MoneroMnemonicNoChecksumEncoder(MoneroMnemonicEncoderBase):
         Raises:
             ValueError: If entropy is not valid
         """
-        return MoneroMnemonic.FromList(self._EncodeToList(entropy_bytes))
+        return self.EncodeMany([entropy_bytes])[0]
+
+    def EncodeMany(self,
+                   entropies: Sequence[bytes]) -> List[Mnemonic]:
+        """
+        Encode many bytes to mnemonic phrases (no checksum).
+
+        Args:
+            entropies (sequence[bytes]): Entropy bytes (accepted lengths in bits: 128, 256)
+
+        Returns:
+            list[Mnemonic]: Encoded mnemonics (no checksum)
+
+        Raises:
+            ValueError: If entropy is not valid
+        """
+        return [MoneroMnemonic.FromList(self.m_words_list.GetWordsAtIdx(words_idx))
+                for words_idx in self._EncodeToIdxMany(entropies)]
 
 
 class MoneroMnemonicWithChecksumEncoder(MoneroMnemonicEncoderBase):
@@ -124,10 +154,27 @@ class MoneroMnemonicWithChecksumEncoder(MoneroMnemonicEncoderBase):
         Raises:
             ValueError: If entropy is not valid
         """
-        words = self._EncodeToList(entropy_bytes)
-        checksum_word = MoneroMnemonicUtils.ComputeChecksum(words, self.m_lang)
+        return self.EncodeMany([entropy_bytes])[0]
+
+    def EncodeMany(self,
+                   entropies: Sequence[bytes]) -> List[Mnemonic]:
+        """
+        Encode many bytes to mnemonic phrases (with checksum).
 
-        return MoneroMnemonic.FromList(words + [checksum_word])
+        Args:
+            entropies (sequence[bytes]): Entropy bytes (accepted lengths in bits: 128, 256)
+
+        Returns:
+            list[Mnemonic]: Encoded mnemonics (with checksum)
+
+        Raises:
+            ValueError: If entropy is not valid
+        """
+        mnemonics = []
+        for words_idx in self._EncodeToIdxMany(entropies):
+            words_idx.append(MoneroMnemonicUtils.ComputeChecksumIdx(words_idx, self.m_lang))
+            mnemonics.append(MoneroMnemonic.FromList(self.m_words_list.GetWordsAtIdx(words_idx)))
+        return mnemonics
 
 
 class MoneroMnemonicEncoder:
@@ -185,3 +232,35 @@ class MoneroMnemonicEncoder:
             ValueError: If bytes length is not valid
         """
         return self.m_with_chk_enc.Encode(entropy_bytes)
+
+    def EncodeNoChecksumMany(self,
+                             entropies: Sequence[bytes]) -> List[Mnemonic]:
+        """
+        Encode many bytes to mnemonic phrases (no checksum).
+
+        Args:
+            entropies (sequence[bytes]): Entropy bytes (accepted lengths in bits: 128, 256)
+
+        Returns:
+            list[Mnemonic]: Encoded mnemonics (no checksum)
+
+        Raises:
+            ValueError: If bytes length is not valid
+        """
+        return self.m_no_chk_enc.EncodeMany(entropies)
+
+    def EncodeWithChecksumMany(self,
+                               entropies: Sequence[bytes]) -> List[Mnemonic]:
+        """
+        Encode many bytes to mnemonic phrases (with checksum).
+
+        Args:
+            entropies (sequence[bytes]): Entropy bytes (accepted lengths in bits: 128, 256)
+
+        Returns:
+            list[Mnemonic]: Encoded mnemonics (with checksum)
+
+        Raises:
+            ValueError: If bytes length is not valid
+        """
+        return self.m_with_chk_enc.EncodeMany(entropies)
@@ -21,7 +21,7 @@
 """Module for Monero mnemonic generation."""
 
 # Imports
-from typing import Dict, Union
+from typing import Dict, Iterable, List, Union
 
 from bip_utils.monero.mnemonic.monero_entropy_generator import MoneroEntropyBitLen, MoneroEntropyGenerator
 from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonicConst, MoneroWordsNum
@@ -78,16 +78,8 @@ class MoneroMnemonicGenerator:
             ValueError: If words number is not valid
         """
 
-        # Check words number
-        if words_num not in MoneroMnemonicConst.MNEMONIC_WORD_NUM:
-            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
-
-        # Convert int to enum if necessary
-        if isinstance(words_num, int):
-            words_num = MoneroWordsNum(words_num)
-
         # Get entropy length in bit from words number
-        entropy_bit_len = MoneroMnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
         # Generate entropy
         entropy_bytes = MoneroEntropyGenerator(entropy_bit_len).Generate()
 
@@ -126,3 +118,81 @@ class MoneroMnemonicGenerator:
             ValueError: If entropy byte length is not valid
         """
         return self.m_mnemonic_encoder.EncodeWithChecksum(entropy_bytes)
+
+    def FromWordsNumberMany(self,
+                            words_num: Union[int, MoneroWordsNum],
+                            count: int) -> List[Mnemonic]:
+        """
+        Generate many mnemonics with the specified words number from random entropy.
+        Entropy is read in a single chunk for all the mnemonics.
+
+        Args:
+            words_num (int or MoneroWordsNum): Number of words (12, 13, 24, 25)
+            count (int)                      : Number of mnemonics
+
+        Returns:
+            list[Mnemonic]: Generated mnemonics
+
+        Raises:
+            ValueError: If words number or count is not valid
+        """
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
+        entropies = MoneroEntropyGenerator(entropy_bit_len).GenerateMany(count)
+
+        return (self.FromEntropyWithChecksumMany(entropies)
+                if words_num in MoneroMnemonicConst.MNEMONIC_WORD_NUM_CHKSUM
+                else self.FromEntropyNoChecksumMany(entropies))
+
+    def FromEntropyNoChecksumMany(self,
+                                  entropies: Iterable[bytes]) -> List[Mnemonic]:
+        """
+        Generate many mnemonics from the specified entropy bytes (no checksum).
+
+        Args:
+            entropies (iterable[bytes]): Entropy bytes
+
+        Returns:
+            list[Mnemonic]: Generated mnemonics (no checksum)
+
+        Raises:
+            ValueError: If entropy byte length is not valid
+        """
+        return self.m_mnemonic_encoder.EncodeNoChecksumMany(list(entropies))
+
+    def FromEntropyWithChecksumMany(self,
+                                    entropies: Iterable[bytes]) -> List[Mnemonic]:
+        """
+        Generate many mnemonics from the specified entropy bytes (with checksum).
+
+        Args:
+            entropies (iterable[bytes]): Entropy bytes
+
+        Returns:
+            list[Mnemonic]: Generated mnemonics (with checksum)
+
+        Raises:
+            ValueError: If entropy byte length is not valid
+        """
+        return self.m_mnemonic_encoder.EncodeWithChecksumMany(list(entropies))
+
+    @staticmethod
+    def __EntropyBitLenFromWordsNum(words_num: Union[int, MoneroWordsNum]) -> int:
+        """
+        Get entropy length from words number.
+
+        Args:
+            words_num (int or MoneroWordsNum): Words number
+
+        Returns:
+            int: Correspondent entropy length
+
+        Raises:
+            ValueError: If words number is not valid
+        """
+        if words_num not in MoneroMnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
+
+        # Convert int to enum if necessary
+        if isinstance(words_num, int):
+            words_num = MoneroWordsNum(words_num)
+        return MoneroMnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
@@ -22,7 +22,8 @@
 
 # Imports
 import os
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonicConst
 from bip_utils.utils.crypto import Crc32
@@ -61,6 +62,7 @@ class MoneroWordsListGetter(MnemonicWordsListGetterBase):
                                    MoneroMnemonicConst.WORDS_LIST_NUM)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def __GetLanguageFile(lang: MnemonicLanguages) -> str:
         """
         Get the specified language file name.
@@ -102,6 +104,9 @@ class MoneroWordsListFinder(MnemonicWordsListFinderBase):
 class MoneroMnemonicUtils:
     """Utility functions for Monero mnemonic."""
 
+    # Unique prefixes of the words lists, by language
+    __prefixes: Dict[MnemonicLanguages, List[str]] = {}
+
     @staticmethod
     def ComputeChecksum(mnemonic: List[str],
                         lang: MnemonicLanguages) -> str:
@@ -121,3 +126,42 @@ class MoneroMnemonicUtils:
         prefixes = "".join(word[:unique_prefix_len] for word in mnemonic)
 
         return mnemonic[Crc32.QuickIntDigest(prefixes) % len(mnemonic)]
+
+    @staticmethod
+    def ComputeChecksumIdx(words_idx: List[int],
+                           lang: MoneroLanguages) -> int:
+        """
+        Compute checksum from word indexes.
+        The unique prefixes of the words list are computed only once per language.
+
+        Args:
+            words_idx (list[int]) : Mnemonic word indexes
+            lang (MoneroLanguages): Language
+
+        Returns:
+            int: Checksum word index
+        """
+        prefixes = MoneroMnemonicUtils.__GetPrefixes(lang)
+        prefixes_str = "".join([prefixes[word_idx] for word_idx in words_idx])
+
+        return words_idx[Crc32.QuickIntDigest(prefixes_str) % len(words_idx)]
+
+    @staticmethod
+    def __GetPrefixes(lang: MoneroLanguages) -> List[str]:
+        """
+        Get the unique prefixes of the words list of the specified language.
+
+        Args:
+            lang (MoneroLanguages): Language
+
+        Returns:
+            list[str]: Unique prefixes, by word index
+        """
+        prefixes = MoneroMnemonicUtils.__prefixes.get(lang)
+        if prefixes is None:
+            unique_prefix_len = MoneroMnemonicConst.LANGUAGE_UNIQUE_PREFIX_LEN[lang]
+            words_list = MoneroWordsListGetter.Instance().GetByLanguage(lang)
+            prefixes = MoneroMnemonicUtils.__prefixes[lang] = [
+                words_list.GetWordAtIdx(i)[:unique_prefix_len] for i in range(words_list.Length())
+            ]
+        return prefixes
@@ -23,9 +23,9 @@
 # Imports
 from typing import Optional
 
-from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages
+from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonic, MoneroMnemonicConst
 from bip_utils.monero.mnemonic.monero_mnemonic_decoder import MoneroMnemonicDecoder
-from bip_utils.utils.mnemonic import MnemonicValidator
+from bip_utils.utils.mnemonic import MnemonicBulkValidator, MnemonicValidator
 
 
 class MoneroMnemonicValidator(MnemonicValidator):
@@ -43,3 +43,23 @@ class MoneroMnemonicValidator(MnemonicValidator):
             lang (MoneroLanguages, optional): Language, None for automatic detection
         """
         super().__init__(MoneroMnemonicDecoder(lang))
+
+
+class MoneroMnemonicBulkValidator(MnemonicBulkValidator):
+    """
+    Monero bulk mnemonic validator class.
+    It validates a stream of mnemonic phrases.
+    """
+
+    def __init__(self,
+                 lang: Optional[MoneroLanguages] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            lang (MoneroLanguages, optional): Language, None for automatic detection
+
+        Raises:
+            TypeError: If the language is not a MoneroLanguages enum
+        """
+        super().__init__(MoneroMnemonicValidator, (lang,), MoneroMnemonic, MoneroMnemonicConst.MNEMONIC_WORD_NUM)
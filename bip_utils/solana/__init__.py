@@ -1 +1 @@
-from bip_utils.solana.spl_token import SplToken
+from bip_utils.solana.spl_token import SplToken, SplTokenBatch
@@ -23,13 +23,14 @@
 #
 # Imports
 #
-from typing import List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from bip_utils.addr import SolAddrDecoder
 from bip_utils.base58 import Base58Encoder
-from bip_utils.ecc import Ed25519PublicKey
+from bip_utils.ecc import Ed25519PublicKey, Ed25519Utils
 from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import IntegerUtils
 
 
 #
@@ -49,6 +50,97 @@ class SplTokenConst:
     SEED_BUMP_MAX_VAL: int = 2 ** 8 - 1
     # Maximum number of seeds
     SEEDS_MAX_NUM: int = 16
+    # Maximum number of decoded program IDs and token mint addresses kept in cache
+    DECODED_ADDR_CACHE_SIZE: int = 4096
+
+
+class _SplTokenUtils:
+    """Class container for SPL token utility functions."""
+
+    @staticmethod
+    @lru_cache(maxsize=SplTokenConst.DECODED_ADDR_CACHE_SIZE)
+    def DecodeAddr(addr: str) -> bytes:
+        """
+        Decode an address.
+        The result is cached, since program IDs and token mint addresses are usually the same for many wallets.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            bytes: Decoded address bytes
+
+        Raises:
+            ValueError: If the address is not valid
+        """
+        return SolAddrDecoder.DecodeAddr(addr)
+
+    @staticmethod
+    def FindPda(seeds_hash: Sha256,
+                program_id_bytes: bytes) -> bytes:
+        """
+        Find a valid PDA (Program Derived Address) by trying all bump seeds.
+
+        Args:
+            seeds_hash (Sha256 object): SHA256 state with the seeds already absorbed, it's not modified
+            program_id_bytes (bytes)  : Program ID bytes
+
+        Returns:
+            bytes: Found PDA bytes
+
+        Raises:
+            ValueError: If the PDA cannot be found
+        """
+        suffix = program_id_bytes + SplTokenConst.PDA_MARKER
+        for bump_seed in range(SplTokenConst.SEED_BUMP_MAX_VAL, 0, -1):
+            sha256 = seeds_hash.Copy()
+            sha256.Update(bytes([bump_seed]) + suffix)
+            pda_bytes = sha256.Digest()
+            # A PDA shall NOT lie on the ed25519 curve, so it shall not be a valid public key
+            if not Ed25519Utils.PointIsOnCurve(pda_bytes):
+                return pda_bytes
+
+        # Very unlucky case
+        raise ValueError("Unable to find a valid PDA")
+
+    @staticmethod
+    def FindAssociatedTokenAddress(wallet_hash: Sha256,
+                                   token_mint_addr_bytes: bytes) -> bytes:
+        """
+        Find the associated token address bytes of the specified token mint.
+
+        Args:
+            wallet_hash (Sha256 object)  : SHA256 state with the wallet and the token program ID already absorbed,
+                                           it's not modified
+            token_mint_addr_bytes (bytes): Token mint address bytes
+
+        Returns:
+            bytes: Associated token address bytes
+
+        Raises:
+            ValueError: If the account address cannot be found
+        """
+        seeds_hash = wallet_hash.Copy()
+        seeds_hash.Update(token_mint_addr_bytes)
+        return _SplTokenUtils.FindPda(seeds_hash,
+                                      _SplTokenUtils.DecodeAddr(SplTokenConst.DEF_PROGRAM_ID))
+
+    @staticmethod
+    def WalletHash(wallet_addr_bytes: bytes,
+                   token_program_id_bytes: bytes) -> Sha256:
+        """
+        Get the SHA256 state with the wallet and the token program ID seeds absorbed.
+
+        Args:
+            wallet_addr_bytes (bytes)     : Wallet address bytes
+            token_program_id_bytes (bytes): Token program ID bytes
+
+        Returns:
+            Sha256 object: Sha256 object
+        """
+        sha256 = Sha256()
+        sha256.Update(wallet_addr_bytes + token_program_id_bytes)
+        return sha256
 
 
 class SplToken:
@@ -99,12 +191,11 @@ class SplToken:
         Raises:
             ValueError: If the account address cannot be found or the specified addresses or ID are not valid
         """
-        seeds = [
-            SolAddrDecoder.DecodeAddr(wallet_addr),
-            SolAddrDecoder.DecodeAddr(token_program_id),
-            SolAddrDecoder.DecodeAddr(token_mint_addr),
-        ]
-        return cls.FindPda(seeds, SplTokenConst.DEF_PROGRAM_ID)
+        wallet_hash = _SplTokenUtils.WalletHash(SolAddrDecoder.DecodeAddr(wallet_addr),
+                                                _SplTokenUtils.DecodeAddr(token_program_id))
+        return Base58Encoder.Encode(
+            _SplTokenUtils.FindAssociatedTokenAddress(wallet_hash, _SplTokenUtils.DecodeAddr(token_mint_addr))
+        )
 
     @classmethod
     def FindPda(cls,
@@ -131,50 +222,147 @@ class SplToken:
             if len(seed) > Ed25519PublicKey.CompressedLength() - 1:
                 raise ValueError(f"Seed length is not valid ({len(seeds)})")
 
-        program_id_bytes = SolAddrDecoder.DecodeAddr(program_id)
-        bump_seed = SplTokenConst.SEED_BUMP_MAX_VAL
-        for _ in range(SplTokenConst.SEED_BUMP_MAX_VAL):
-            # Add bump to seeds
-            seeds_with_bump = list(seeds)
-            seeds_with_bump.append(IntegerUtils.ToBytes(bump_seed))
-            # Try to create PDA
-            try:
-                return cls.__CreatePda(seeds_with_bump, program_id_bytes)
-            except ValueError:
-                # Continue with the next bump seed if PDA is not valid
-                bump_seed -= 1
+        program_id_bytes = _SplTokenUtils.DecodeAddr(program_id)
 
-        # Very unlucky case
-        raise ValueError("Unable to find a valid PDA")
+        seeds_hash = Sha256()
+        for seed in seeds:
+            seeds_hash.Update(seed)
+        return Base58Encoder.Encode(_SplTokenUtils.FindPda(seeds_hash, program_id_bytes))
 
-    @staticmethod
-    def __CreatePda(seeds_with_bump: List[bytes],
-                    program_id_bytes: bytes) -> str:
+
+class SplTokenBatch:
+    """
+    SPL token batch class.
+    It computes the associated token addresses of many wallets and token mints (e.g. a wallets x token mints grid).
+    Each wallet address is decoded and absorbed in the SHA256 state only once for all token mints, while program IDs
+    and token mint addresses are decoded once for all wallets.
+    Already computed (wallet, token mint, token program ID) addresses can be optionally kept in a LRU cache.
+    """
+
+    m_cache_size: int
+    m_cache: OrderedDict
+
+    def __init__(self,
+                 cache_size: int = 0) -> None:
+        """
+        Construct class.
+
+        Args:
+            cache_size (int, optional): Maximum number of addresses kept in cache (default: 0, i.e. no cache)
+
+        Raises:
+            ValueError: If the cache size is not valid
+        """
+        if cache_size < 0:
+            raise ValueError(f"Invalid cache size ({cache_size})")
+        self.m_cache_size = cache_size
+        self.m_cache = OrderedDict()
+
+    def CacheLength(self) -> int:
         """
-        Create a PDA (Program Derived Address) for the specified seeds and program ID.
+        Get the number of addresses currently kept in cache.
+
+        Returns:
+            int: Number of cached addresses
+        """
+        return len(self.m_cache)
+
+    def ClearCache(self) -> None:
+        """Clear the cache."""
+        self.m_cache.clear()
+
+    def GetAssociatedTokenAddress(self,
+                                  wallet_addr: str,
+                                  token_mint_addr: str,
+                                  token_program_id: str = SplTokenConst.DEF_TOKEN_PROGRAM_ID) -> str:
+        """
+        Get the account address associated to the specified SPL token and token program ID.
 
         Args:
-            seeds_with_bump (list[bytes]): List of seeds bytes with bump
-            program_id_bytes (bytes)     : Program ID bytes
+            wallet_addr (str)               : Wallet address
+            token_mint_addr (str)           : Token mint address
+            token_program_id (str, optional): Token program ID (default: SplTokenConst.DEF_TOKEN_PROGRAM_ID)
 
         Returns:
-            str: Created PDA
+            str: Associated account address
 
         Raises:
-            ValueError: If the created PDA is not valid
+            ValueError: If the account address cannot be found or the specified addresses or ID are not valid
         """
-        sha256 = Sha256()
-        # Compute SHA256 of seeds with bump
-        for seed in seeds_with_bump:
-            sha256.Update(seed)
-        # Compute SHA256 of program ID and PDA marker
-        for elem in (program_id_bytes, SplTokenConst.PDA_MARKER):
-            sha256.Update(elem)
-        # Get PDA bytes
-        pda_bytes = sha256.Digest()
-
-        # A PDA shall NOT lie on the ed25519 curve, so it shall not be a valid public key
-        if Ed25519PublicKey.IsValidBytes(pda_bytes):
-            raise ValueError("Invalid created PDA")
-
-        return Base58Encoder.Encode(pda_bytes)
+        return self.GetAssociatedTokenAddresses([wallet_addr], [token_mint_addr], token_program_id)[0][0]
+
+    def GetAssociatedTokenAddresses(self,
+                                    wallet_addrs: Iterable[str],
+                                    token_mint_addrs: Sequence[str],
+                                    token_program_id: str = SplTokenConst.DEF_TOKEN_PROGRAM_ID) -> List[List[str]]:
+        """
+        Get the account addresses associated to the specified SPL tokens for many wallets.
+
+        Args:
+            wallet_addrs (iterable[str])    : Wallet addresses
+            token_mint_addrs (sequence[str]): Token mint addresses
+            token_program_id (str, optional): Token program ID (default: SplTokenConst.DEF_TOKEN_PROGRAM_ID)
+
+        Returns:
+            list[list[str]]: Associated account addresses, one list for each wallet with one address for each token mint
+
+        Raises:
+            ValueError: If an account address cannot be found or the specified addresses or ID are not valid
+        """
+        token_program_id_bytes = _SplTokenUtils.DecodeAddr(token_program_id)
+        token_mint_addrs_bytes = [_SplTokenUtils.DecodeAddr(token_mint_addr) for token_mint_addr in token_mint_addrs]
+
+        ata_addrs = []
+        for wallet_addr in wallet_addrs:
+            cached_ata_addrs = [self.__CacheGet((wallet_addr, token_mint_addr, token_program_id))
+                                for token_mint_addr in token_mint_addrs]
+
+            # Compute the missing addresses, the wallet is decoded only if needed
+            computed_ata_addrs = {}
+            missing_idx = [i for i, ata_addr in enumerate(cached_ata_addrs) if ata_addr is None]
+            if missing_idx:
+                wallet_hash = _SplTokenUtils.WalletHash(SolAddrDecoder.DecodeAddr(wallet_addr),
+                                                        token_program_id_bytes)
+                computed_ata_addrs = dict(zip(missing_idx, Base58Encoder.EncodeMany(
+                    [_SplTokenUtils.FindAssociatedTokenAddress(wallet_hash, token_mint_addrs_bytes[i])
+                     for i in missing_idx]
+                )))
+                for i, ata_addr in computed_ata_addrs.items():
+                    self.__CachePut((wallet_addr, token_mint_addrs[i], token_program_id), ata_addr)
+
+            ata_addrs.append([ata_addr if ata_addr is not None else computed_ata_addrs[i]
+                              for i, ata_addr in enumerate(cached_ata_addrs)])
+
+        return ata_addrs
+
+    def __CacheGet(self,
+                   key: Tuple[str, str, str]) -> Optional[str]:
+        """
+        Get an address from the cache, marking it as the most recently used.
+
+        Args:
+            key (tuple[str, str, str]): Wallet address, token mint address and token program ID
+
+        Returns:
+            str: Associated account address (None if not in cache)
+        """
+        ata_addr = self.m_cache.get(key)
+        if ata_addr is not None:
+            self.m_cache.move_to_end(key)
+        return ata_addr
+
+    def __CachePut(self,
+                   key: Tuple[str, str, str],
+                   ata_addr: str) -> None:
+        """
+        Put an address in the cache, removing the least recently used one if full.
+
+        Args:
+            key (tuple[str, str, str]): Wallet address, token mint address and token program ID
+            ata_addr (str)            : Associated account address
+        """
+        if self.m_cache_size == 0:
+            return
+        self.m_cache[key] = ata_addr
+        if len(self.m_cache) > self.m_cache_size:
+            self.m_cache.popitem(last=False)
@@ -24,11 +24,12 @@ Reference: https://github.com/paritytech/substrate/wiki/External-Address-Format-
 """
 
 # Imports
-from typing import Tuple
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
 from bip_utils.base58 import Base58Decoder, Base58Encoder
 from bip_utils.ss58.ss58_ex import SS58ChecksumError
-from bip_utils.utils.crypto import Blake2b512
+from bip_utils.utils.crypto import Blake2b, Blake2b512
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
@@ -65,7 +66,54 @@ class _SS58Utils:
         Returns:
             bytes: Computed checksum
         """
-        return Blake2b512.QuickDigest(SS58Const.CHECKSUM_PREFIX + data_bytes)[:SS58Const.CHECKSUM_BYTE_LEN]
+        blake2b = _SS58Utils.__ChecksumPrefixHash().Copy()
+        blake2b.Update(data_bytes)
+        return blake2b.Digest()[:SS58Const.CHECKSUM_BYTE_LEN]
+
+    @staticmethod
+    @lru_cache()
+    def __ChecksumPrefixHash() -> Blake2b:
+        """
+        Get the Blake2b-512 state with the checksum prefix already absorbed.
+        It shall be copied before being updated.
+
+        Returns:
+            Blake2b object: Blake2b object
+        """
+        blake2b = Blake2b(Blake2b512.DigestSize())
+        blake2b.Update(SS58Const.CHECKSUM_PREFIX)
+        return blake2b
+
+    @staticmethod
+    @lru_cache()
+    def FormatToBytes(ss58_format: int) -> bytes:
+        """
+        Convert the SS58 format to bytes.
+        The result is cached, since the same formats are usually used for many addresses.
+
+        Args:
+            ss58_format (int): SS58 format
+
+        Returns:
+            bytes: SS58 format bytes
+
+        Raises:
+            ValueError: If the format is not valid
+        """
+        if ss58_format < 0 or ss58_format > SS58Const.FORMAT_MAX_VAL:
+            raise ValueError(f"Invalid SS58 format ({ss58_format})")
+        if ss58_format in SS58Const.RESERVED_FORMATS:
+            raise ValueError(f"Invalid SS58 format ({ss58_format})")
+
+        # Simple account
+        if ss58_format <= SS58Const.SIMPLE_ACCOUNT_FORMAT_MAX_VAL:
+            return IntegerUtils.ToBytes(ss58_format)
+        # Full address
+        # 0b00HHHHHH_MMLLLLLL -> (0b01LLLLLL, 0bHHHHHHMM)
+        return bytes([
+            ((ss58_format & 0x00FC) >> 2) | 0x0040,
+            (ss58_format >> 8) | ((ss58_format & 0x0003) << 6)
+        ])
 
 
 class SS58Encoder:
@@ -84,6 +132,64 @@ class SS58Encoder:
         Returns:
             str: SS58 encoded string
 
+        Raises:
+            ValueError: If parameters are not valid
+        """
+        return Base58Encoder.Encode(SS58Encoder.__Payload(data_bytes, ss58_format))
+
+    @staticmethod
+    def EncodeMany(data_bytes: Iterable[bytes],
+                   ss58_format: int) -> List[str]:
+        """
+        Encode many bytes into SS58 strings with the same format.
+
+        Args:
+            data_bytes (iterable[bytes]): Data bytes (32-byte length each)
+            ss58_format (int)           : SS58 format
+
+        Returns:
+            list[str]: SS58 encoded strings
+
+        Raises:
+            ValueError: If parameters are not valid
+        """
+        return Base58Encoder.EncodeMany(
+            [SS58Encoder.__Payload(d, ss58_format) for d in data_bytes]
+        )
+
+    @staticmethod
+    def EncodeManyFormats(data_bytes: bytes,
+                          ss58_formats: Iterable[int]) -> List[str]:
+        """
+        Encode bytes into SS58 strings with many formats (e.g. the same public key for different chains).
+
+        Args:
+            data_bytes (bytes)          : Data bytes (32-byte length)
+            ss58_formats (iterable[int]): SS58 formats
+
+        Returns:
+            list[str]: SS58 encoded strings, one for each format
+
+        Raises:
+            ValueError: If parameters are not valid
+        """
+        return Base58Encoder.EncodeMany(
+            [SS58Encoder.__Payload(data_bytes, ss58_format) for ss58_format in ss58_formats]
+        )
+
+    @staticmethod
+    def __Payload(data_bytes: bytes,
+                  ss58_format: int) -> bytes:
+        """
+        Get the payload to be encoded (format, data and checksum).
+
+        Args:
+            data_bytes (bytes): Data bytes (32-byte length)
+            ss58_format (int) : SS58 format
+
+        Returns:
+            bytes: Payload bytes
+
         Raises:
             ValueError: If parameters are not valid
         """
@@ -91,28 +197,11 @@ class SS58Encoder:
         # Check parameters
         if len(data_bytes) != SS58Const.DATA_BYTE_LEN:
             raise ValueError(f"Invalid data length ({len(data_bytes)})")
-        if ss58_format < 0 or ss58_format > SS58Const.FORMAT_MAX_VAL:
-            raise ValueError(f"Invalid SS58 format ({ss58_format})")
-        if ss58_format in SS58Const.RESERVED_FORMATS:
-            raise ValueError(f"Invalid SS58 format ({ss58_format})")
-
-        # Simple account
-        if ss58_format <= SS58Const.SIMPLE_ACCOUNT_FORMAT_MAX_VAL:
-            ss58_format_bytes = IntegerUtils.ToBytes(ss58_format)
-        # Full address
-        else:
-            # 0b00HHHHHH_MMLLLLLL -> (0b01LLLLLL, 0bHHHHHHMM)
-            ss58_format_bytes = bytes([
-                ((ss58_format & 0x00FC) >> 2) | 0x0040,
-                (ss58_format >> 8) | ((ss58_format & 0x0003) << 6)
-            ])
 
         # Get payload
-        payload = ss58_format_bytes + data_bytes
-        # Compute checksum
-        checksum = _SS58Utils.ComputeChecksum(payload)
-        # Encode
-        return Base58Encoder.Encode(payload + checksum)
+        payload = _SS58Utils.FormatToBytes(ss58_format) + data_bytes
+        # Add checksum
+        return payload + _SS58Utils.ComputeChecksum(payload)
 
 
 class SS58Decoder:
@@ -133,9 +222,41 @@ class SS58Decoder:
             SS58ChecksumError: If checksum is not valid
             ValueError: If the string is not a valid SS58 format
         """
+        return SS58Decoder.__DecodeBytes(Base58Decoder.Decode(data_str))
 
-        # Decode string
-        dec_bytes = Base58Decoder.Decode(data_str)
+    @staticmethod
+    def DecodeMany(data_str: Iterable[str]) -> List[Tuple[int, bytes]]:
+        """
+        Decode bytes from many SS58 strings.
+
+        Args:
+            data_str (iterable[str]): Data strings
+
+        Returns:
+            list[tuple[int, bytes]]: SS58 format and data bytes of each string
+
+        Raises:
+            SS58ChecksumError: If a checksum is not valid
+            ValueError: If a string is not a valid SS58 format
+        """
+        return [SS58Decoder.__DecodeBytes(dec_bytes)
+                for dec_bytes in Base58Decoder.DecodeMany(data_str)]
+
+    @staticmethod
+    def __DecodeBytes(dec_bytes: bytes) -> Tuple[int, bytes]:
+        """
+        Get SS58 format and data bytes from the Base58 decoded bytes.
+
+        Args:
+            dec_bytes (bytes): Base58 decoded bytes
+
+        Returns:
+            tuple[int, bytes]: SS58 format and data bytes
+
+        Raises:
+            SS58ChecksumError: If checksum is not valid
+            ValueError: If the string is not a valid SS58 format
+        """
 
         # Full address
         if dec_bytes[0] & 0x40:
@@ -1,7 +1,8 @@
 from bip_utils.utils.crypto.aes_ecb import AesEcbDecrypter, AesEcbEncrypter
 from bip_utils.utils.crypto.blake2 import Blake2b, Blake2b32, Blake2b40, Blake2b160, Blake2b224, Blake2b256, Blake2b512
-from bip_utils.utils.crypto.chacha20_poly1305 import ChaCha20Poly1305
+from bip_utils.utils.crypto.chacha20_poly1305 import ChaCha20Poly1305, ChaCha20Poly1305Decrypter
 from bip_utils.utils.crypto.crc import Crc32, XModemCrc
+from bip_utils.utils.crypto.digest_many import DigestManyUtils
 from bip_utils.utils.crypto.hash160 import Hash160
 from bip_utils.utils.crypto.hmac import HmacSha256, HmacSha512
 from bip_utils.utils.crypto.pbkdf2 import Pbkdf2HmacSha512
@@ -54,7 +54,7 @@ class AesEcbEncrypter:
         Args:
             key (str or bytes): AES key
         """
-        self.aes = AES.new(AlgoUtils.Encode(key), AES.MODE_ECB)
+        self.aes = AES.new(AlgoUtils.EncodeBuffer(key), AES.MODE_ECB)
         self.auto_pad = True
 
     def AutoPad(self,
@@ -111,7 +111,7 @@ class AesEcbDecrypter:
         Args:
             key (str or bytes): AES key
         """
-        self.aes = AES.new(AlgoUtils.Encode(key), AES.MODE_ECB)
+        self.aes = AES.new(AlgoUtils.EncodeBuffer(key), AES.MODE_ECB)
         self.auto_unpad = True
 
     def AutoUnPad(self,
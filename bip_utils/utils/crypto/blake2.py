@@ -21,11 +21,15 @@
 """Module for BLAKE-2 algorithms."""
 
 # Imports
+from __future__ import annotations
+
 import hashlib
 from abc import ABC, abstractmethod
-from typing import Union
+from concurrent.futures import Executor
+from typing import Any, Iterable, List, Optional, Union
 
-from bip_utils.utils.misc import AlgoUtils
+from bip_utils.utils.crypto.digest_many import DigestManyUtils
+from bip_utils.utils.misc.algo import AlgoUtils, BytesLike
 
 
 class Blake2b:
@@ -34,6 +38,54 @@ class Blake2b:
     It computes digests using BLAKE2b algorithm.
     """
 
+    handle: Any
+
+    def __init__(self,
+                 digest_size: int,
+                 key: Union[bytes, str] = b"",
+                 salt: Union[bytes, str] = b"") -> None:
+        """
+        Construct class.
+
+        Args:
+            digest_size (int)            : Digest size
+            key (str or bytes, optional) : Key (default: empty)
+            salt (str or bytes, optional): Salt (default: empty)
+        """
+        self.handle = hashlib.blake2b(digest_size=digest_size,
+                                      key=AlgoUtils.EncodeBuffer(key),
+                                      salt=AlgoUtils.EncodeBuffer(salt))
+
+    def Update(self,
+               data_bytes: bytes) -> None:
+        """
+        Update digest.
+
+        Args:
+            data_bytes (bytes): Data bytes
+        """
+        self.handle.update(data_bytes)
+
+    def Digest(self) -> bytes:
+        """
+        Get the computed digest.
+
+        Returns:
+            bytes: Computed digest
+        """
+        return self.handle.digest()
+
+    def Copy(self) -> Blake2b:
+        """
+        Get a copy of the current state, e.g. for reusing a common prefix already absorbed.
+
+        Returns:
+            Blake2b object: Blake2b object
+        """
+        blake2b = Blake2b.__new__(Blake2b)
+        blake2b.handle = self.handle.copy()
+        return blake2b
+
     @staticmethod
     def QuickDigest(data: Union[bytes, str],
                     digest_size: int,
@@ -43,18 +95,49 @@ class Blake2b:
         Compute the digest (quick version).
 
         Args:
-            data (str or bytes)           : Data
-            digest_size (int)             : Digest size
-            key ((str or bytes, optional) : Key (default: empty)
-            salt ((str or bytes, optional): Salt (default: empty)
+            data (str or bytes)          : Data
+            digest_size (int)            : Digest size
+            key (str or bytes, optional) : Key (default: empty)
+            salt (str or bytes, optional): Salt (default: empty)
 
         Returns:
             bytes: Computed digest
         """
-        return hashlib.blake2b(AlgoUtils.Encode(data),
+        return hashlib.blake2b(AlgoUtils.EncodeBuffer(data),
                                digest_size=digest_size,
-                               key=AlgoUtils.Encode(key),
-                               salt=AlgoUtils.Encode(salt)).digest()
+                               key=AlgoUtils.EncodeBuffer(key),
+                               salt=AlgoUtils.EncodeBuffer(salt)).digest()
+
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   digest_size: int,
+                   key: Union[bytes, str] = b"",
+                   salt: Union[bytes, str] = b"",
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+        Key and salt are absorbed only once, the resulting state is then copied for each element.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            digest_size (int)            : Digest size
+            key (str or bytes, optional) : Key (default: empty)
+            salt (str or bytes, optional): Salt (default: empty)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        base_hash = hashlib.blake2b(digest_size=digest_size,
+                                    key=AlgoUtils.EncodeBuffer(key),
+                                    salt=AlgoUtils.EncodeBuffer(salt))
+
+        def digest_fct(d: BytesLike) -> bytes:
+            h = base_hash.copy()
+            h.update(d)
+            return h.digest()
+
+        return DigestManyUtils.Compute(digest_fct, data, executor)
 
 
 class _Blake2bWithSpecificSize(ABC):
@@ -78,6 +161,26 @@ class _Blake2bWithSpecificSize(ABC):
         """
         return Blake2b.QuickDigest(data, cls.DigestSize(), key, salt)
 
+    @classmethod
+    def DigestMany(cls,
+                   data: Iterable[Union[bytes, str]],
+                   key: Union[bytes, str] = b"",
+                   salt: Union[bytes, str] = b"",
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            key (str or bytes, optional) : Key bytes (default: empty)
+            salt (str or bytes, optional): Salt bytes (default: empty)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        return Blake2b.DigestMany(data, cls.DigestSize(), key, salt, executor)
+
     @staticmethod
     @abstractmethod
     def DigestSize() -> int:
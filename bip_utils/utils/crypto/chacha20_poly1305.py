@@ -53,10 +53,10 @@ class ChaCha20Poly1305:
         Returns:
             bytes: Decrypted data
         """
-        cipher = ChaCha20_Poly1305.new(key=AlgoUtils.Encode(key),
-                                       nonce=AlgoUtils.Encode(nonce))
-        cipher.update(AlgoUtils.Encode(assoc_data))
-        return cipher.decrypt_and_verify(AlgoUtils.Encode(cipher_text), AlgoUtils.Encode(tag))
+        cipher = ChaCha20_Poly1305.new(key=AlgoUtils.EncodeBuffer(key),
+                                       nonce=AlgoUtils.EncodeBuffer(nonce))
+        cipher.update(AlgoUtils.EncodeBuffer(assoc_data))
+        return cipher.decrypt_and_verify(AlgoUtils.EncodeBuffer(cipher_text), AlgoUtils.EncodeBuffer(tag))
 
     @staticmethod
     def Encrypt(key: Union[bytes, str],
@@ -75,10 +75,10 @@ class ChaCha20Poly1305:
         Returns:
             tuple[bytes, bytes]: Cipher text bytes (index 0) and tag bytes (index 1)
         """
-        cipher = ChaCha20_Poly1305.new(key=AlgoUtils.Encode(key),
-                                       nonce=AlgoUtils.Encode(nonce))
-        cipher.update(AlgoUtils.Encode(assoc_data))
-        return cipher.encrypt_and_digest(AlgoUtils.Encode(plain_text))
+        cipher = ChaCha20_Poly1305.new(key=AlgoUtils.EncodeBuffer(key),
+                                       nonce=AlgoUtils.EncodeBuffer(nonce))
+        cipher.update(AlgoUtils.EncodeBuffer(assoc_data))
+        return cipher.encrypt_and_digest(AlgoUtils.EncodeBuffer(plain_text))
 
     @staticmethod
     def KeySize() -> int:
@@ -99,3 +99,48 @@ class ChaCha20Poly1305:
             int: Tag size
         """
         return 16
+
+
+class ChaCha20Poly1305Decrypter:
+    """
+    ChaCha20-Poly1305 decrypter class.
+    It decrypts many data with the same key and nonce, which are encoded only once at construction.
+    """
+
+    m_key: bytes
+    m_nonce: bytes
+
+    def __init__(self,
+                 key: Union[bytes, str],
+                 nonce: Union[bytes, str]) -> None:
+        """
+        Construct class.
+
+        Args:
+            key (str or bytes)  : Key
+            nonce (str or bytes): Nonce
+        """
+        self.m_key = AlgoUtils.Encode(key)
+        self.m_nonce = AlgoUtils.Encode(nonce)
+
+    def Decrypt(self,
+                assoc_data: Union[bytes, str],
+                cipher_text: Union[bytes, str],
+                tag: Union[bytes, str]) -> bytes:
+        """
+        Decrypt data.
+
+        Args:
+            assoc_data (str or bytes): Associated data
+            cipher_text (bytes)      : Cipher text
+            tag (bytes)              : Tag
+
+        Returns:
+            bytes: Decrypted data
+
+        Raises:
+            ValueError: If the tag is not valid
+        """
+        cipher = ChaCha20_Poly1305.new(key=self.m_key, nonce=self.m_nonce)
+        cipher.update(AlgoUtils.EncodeBuffer(assoc_data))
+        return cipher.decrypt_and_verify(AlgoUtils.EncodeBuffer(cipher_text), AlgoUtils.EncodeBuffer(tag))
@@ -22,10 +22,12 @@
 
 # Imports
 import binascii
-from typing import Union
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional, Union
 
 import crcmod.predefined
 
+from bip_utils.utils.crypto.digest_many import DigestManyUtils
 from bip_utils.utils.misc import AlgoUtils, IntegerUtils
 
 
@@ -63,7 +65,24 @@ class Crc32:
         Returns:
             bytes: Computed digest
         """
-        return binascii.crc32(AlgoUtils.Encode(data))   # Much faster than crcmod
+        return binascii.crc32(AlgoUtils.EncodeBuffer(data))   # Much faster than crcmod
+
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        crc32 = binascii.crc32
+        digest_size = Crc32.DigestSize()
+        return DigestManyUtils.Compute(lambda d: crc32(d).to_bytes(digest_size, byteorder="big"), data, executor)
 
     @staticmethod
     def DigestSize() -> int:
@@ -93,7 +112,23 @@ class XModemCrc:
         Returns:
             bytes: Computed digest
         """
-        return XMODEM_CRC.new(AlgoUtils.Encode(data)).digest()
+        return XMODEM_CRC.new(AlgoUtils.EncodeBuffer(data)).digest()
+
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        crc_new = XMODEM_CRC.new
+        return DigestManyUtils.Compute(lambda d: crc_new(d).digest(), data, executor)
 
     @staticmethod
     def DigestSize() -> int:
@@ -0,0 +1,55 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with utility functions for computing digests of many data at once."""
+
+# Imports
+from concurrent.futures import Executor
+from typing import Callable, Iterable, List, Optional, Union
+
+from bip_utils.utils.misc.algo import AlgoUtils, BytesLike
+
+
+class DigestManyUtils:
+    """Class container for batch digest utility functions."""
+
+    @staticmethod
+    def Compute(digest_fct: Callable[[BytesLike], bytes],
+                data: Iterable[Union[bytes, str]],
+                executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of each element of the specified data.
+        Elements that are already bytes are passed to the digest function without re-encoding them.
+
+        Args:
+            digest_fct (function)       : Digest function
+            data (iterable)             : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+                                           A thread pool is advised, since hashlib releases the GIL only for
+                                           large inputs and the digest function may not be picklable
+
+        Returns:
+            list[bytes]: Computed digests, in the same order of data
+        """
+        data_bytes = (d if isinstance(d, bytes) else AlgoUtils.EncodeBuffer(d)
+                      for d in data)
+        if executor is None:
+            return [digest_fct(d) for d in data_bytes]
+        return list(executor.map(digest_fct, data_bytes))
@@ -21,8 +21,13 @@
 """Module for HASH160 algorithm."""
 
 # Imports
-from typing import Union
+import hashlib
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional, Union
 
+from Crypto.Hash import RIPEMD160
+
+from bip_utils.utils.crypto.digest_many import DigestManyUtils
 from bip_utils.utils.crypto.ripemd import Ripemd160
 from bip_utils.utils.crypto.sha2 import Sha256
 
@@ -46,6 +51,23 @@ class Hash160:
         """
         return Ripemd160.QuickDigest(Sha256.QuickDigest(data))
 
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        sha256 = hashlib.sha256
+        ripemd160_new = RIPEMD160.new
+        return DigestManyUtils.Compute(lambda d: ripemd160_new(sha256(d).digest()).digest(), data, executor)
+
     @staticmethod
     def DigestSize() -> int:
         """
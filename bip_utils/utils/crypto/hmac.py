@@ -23,14 +23,63 @@
 # Imports
 import hashlib
 import hmac
-from typing import Tuple, Union
+from concurrent.futures import Executor
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
 
-from bip_utils.utils.misc import AlgoUtils
+from bip_utils.utils.crypto.digest_many import DigestManyUtils
+from bip_utils.utils.misc.algo import AlgoUtils, BytesLike
 
 
 HMAC_USE_DIGEST: bool = hasattr(hmac, "digest")
 
 
+class _HmacUtils:
+    """Class container for HMAC utility functions."""
+
+    @staticmethod
+    def KeyedDigestFct(key: Union[bytes, str],
+                       digest_mod: Any) -> Callable[[BytesLike], bytes]:
+        """
+        Get a function computing the digest of data with the specified key.
+        The key is processed only once, the resulting keyed state is then copied for each call.
+
+        Args:
+            key (str or bytes): Key
+            digest_mod (any)  : Digest module
+
+        Returns:
+            function: Digest function
+        """
+        base_hmac = hmac.new(AlgoUtils.Encode(key), digestmod=digest_mod)
+
+        def digest_fct(d: BytesLike) -> bytes:
+            h = base_hmac.copy()
+            h.update(d)
+            return h.digest()
+
+        return digest_fct
+
+    @staticmethod
+    def DigestMany(key: Union[bytes, str],
+                   data: Iterable[Union[bytes, str]],
+                   digest_mod: Any,
+                   executor: Optional[Executor]) -> List[bytes]:
+        """
+        Compute the digest of many data with the same key.
+        The key is processed only once, the resulting keyed state is then copied for each element.
+
+        Args:
+            key (str or bytes)           : Key
+            data (iterable)              : Data (each element shall be str or bytes)
+            digest_mod (any)             : Digest module
+            executor (Executor, optional): Executor for computing digests concurrently
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        return DigestManyUtils.Compute(_HmacUtils.KeyedDigestFct(key, digest_mod), data, executor)
+
+
 class HmacSha256:
     """
     HMAC-SHA256 class.
@@ -52,8 +101,39 @@ class HmacSha256:
         """
         # Use digest if available
         if HMAC_USE_DIGEST:
-            return hmac.digest(AlgoUtils.Encode(key), AlgoUtils.Encode(data), "sha256")
-        return hmac.new(AlgoUtils.Encode(key), AlgoUtils.Encode(data), hashlib.sha256).digest()
+            return hmac.digest(AlgoUtils.Encode(key), AlgoUtils.EncodeBuffer(data), "sha256")
+        return hmac.new(AlgoUtils.Encode(key), AlgoUtils.EncodeBuffer(data), hashlib.sha256).digest()
+
+    @staticmethod
+    def DigestMany(key: Union[bytes, str],
+                   data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data with the same key.
+
+        Args:
+            key (str or bytes)           : Key
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        return _HmacUtils.DigestMany(key, data, hashlib.sha256, executor)
+
+    @staticmethod
+    def KeyedDigestFct(key: Union[bytes, str]) -> Callable[[BytesLike], bytes]:
+        """
+        Get a function computing the digest of data with the specified key.
+        Useful when many digests shall be computed with the same key, since the key is processed only once.
+
+        Args:
+            key (str or bytes): Key
+
+        Returns:
+            function: Digest function (data bytes as argument)
+        """
+        return _HmacUtils.KeyedDigestFct(key, hashlib.sha256)
 
     @staticmethod
     def DigestSize() -> int:
@@ -88,8 +168,39 @@ class HmacSha512:
 
         # Use digest if available
         if HMAC_USE_DIGEST:
-            return hmac.digest(AlgoUtils.Encode(key), AlgoUtils.Encode(data), "sha512")
-        return hmac.new(AlgoUtils.Encode(key), AlgoUtils.Encode(data), hashlib.sha512).digest()
+            return hmac.digest(AlgoUtils.Encode(key), AlgoUtils.EncodeBuffer(data), "sha512")
+        return hmac.new(AlgoUtils.Encode(key), AlgoUtils.EncodeBuffer(data), hashlib.sha512).digest()
+
+    @staticmethod
+    def DigestMany(key: Union[bytes, str],
+                   data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data with the same key.
+
+        Args:
+            key (str or bytes)           : Key
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        return _HmacUtils.DigestMany(key, data, hashlib.sha512, executor)
+
+    @staticmethod
+    def KeyedDigestFct(key: Union[bytes, str]) -> Callable[[BytesLike], bytes]:
+        """
+        Get a function computing the digest of data with the specified key.
+        Useful when many digests shall be computed with the same key, since the key is processed only once.
+
+        Args:
+            key (str or bytes): Key
+
+        Returns:
+            function: Digest function (data bytes as argument)
+        """
+        return _HmacUtils.KeyedDigestFct(key, hashlib.sha512)
 
     @staticmethod
     def QuickDigestHalves(key: Union[bytes, str],
@@ -105,7 +216,8 @@ class HmacSha512:
             tuple[bytes, bytes]: Computed digest left part (index 0) and right part (index 1)
         """
         digest_bytes = HmacSha512.QuickDigest(key, data)
-        return digest_bytes[:HmacSha512.DigestSize() // 2], digest_bytes[HmacSha512.DigestSize() // 2:]
+        half_len = len(digest_bytes) // 2
+        return digest_bytes[:half_len], digest_bytes[half_len:]
 
     @staticmethod
     def DigestSize() -> int:
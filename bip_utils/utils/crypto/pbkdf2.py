@@ -22,12 +22,15 @@
 
 # Imports
 import hashlib
-from typing import Optional, Union
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional, Union
 
 from Crypto.Hash import SHA512
 from Crypto.Protocol.KDF import PBKDF2
 
+from bip_utils.utils.crypto.digest_many import DigestManyUtils
 from bip_utils.utils.misc import AlgoUtils
+from bip_utils.utils.misc.algo import BytesLike
 
 
 HASHLIB_USE_PBKDF2_SHA512: bool = hasattr(hashlib, "pbkdf2_hmac")   # For future changes
@@ -57,10 +60,41 @@ class Pbkdf2HmacSha512:
             bytes: Computed result
         """
         if HASHLIB_USE_PBKDF2_SHA512:
-            return hashlib.pbkdf2_hmac("sha512", AlgoUtils.Encode(password), AlgoUtils.Encode(salt), itr_num, dklen)
+            return hashlib.pbkdf2_hmac("sha512",
+                                       AlgoUtils.EncodeBuffer(password),
+                                       AlgoUtils.EncodeBuffer(salt),
+                                       itr_num,
+                                       dklen)
         # Use Cryptodome if not implemented in hashlib
         return PBKDF2(AlgoUtils.Encode(password),  # type: ignore [arg-type]
                       AlgoUtils.Encode(salt),
                       dklen or SHA512.digest_size,
                       count=itr_num,
                       hmac_hash_module=SHA512)
+
+    @staticmethod
+    def DeriveKeyMany(passwords: Iterable[Union[bytes, str]],
+                      salt: Union[bytes, str],
+                      itr_num: int,
+                      dklen: Optional[int] = None,
+                      executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Derive many keys with the same salt.
+
+        Args:
+            passwords (iterable)         : Passwords (each element shall be str or bytes)
+            salt (str or bytes)          : Salt
+            itr_num (int)                : Iteration number
+            dklen (int, optional)        : Length of the derived keys (default: SHA-512 output length)
+            executor (Executor, optional): Executor for deriving keys concurrently (default: None)
+                                           A thread pool is advised, since hashlib releases the GIL while deriving
+
+        Returns:
+            list[bytes]: Computed results, in the same order of passwords
+        """
+        salt_bytes = AlgoUtils.Encode(salt)
+
+        def derive_fct(password: BytesLike) -> bytes:
+            return Pbkdf2HmacSha512.DeriveKey(bytes(password), salt_bytes, itr_num, dklen)
+
+        return DigestManyUtils.Compute(derive_fct, passwords, executor)
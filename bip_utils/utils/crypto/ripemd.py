@@ -21,10 +21,12 @@
 """Module for RIPEMD algorithm."""
 
 # Imports
-from typing import Union
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional, Union
 
 from Crypto.Hash import RIPEMD160
 
+from bip_utils.utils.crypto.digest_many import DigestManyUtils
 from bip_utils.utils.misc import AlgoUtils
 
 
@@ -45,7 +47,23 @@ class Ripemd160:
         Returns:
             bytes: Computed digest
         """
-        return RIPEMD160.new(AlgoUtils.Encode(data)).digest()
+        return RIPEMD160.new(AlgoUtils.EncodeBuffer(data)).digest()
+
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        ripemd160_new = RIPEMD160.new
+        return DigestManyUtils.Compute(lambda d: ripemd160_new(d).digest(), data, executor)
 
     @staticmethod
     def DigestSize() -> int:
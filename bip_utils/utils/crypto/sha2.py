@@ -21,11 +21,15 @@
 """Module for SHA-2 algorithms."""
 
 # Imports
+from __future__ import annotations
+
 import hashlib
-from typing import Any, Union
+from concurrent.futures import Executor
+from typing import Any, Iterable, List, Optional, Union
 
 from Crypto.Hash import SHA512
 
+from bip_utils.utils.crypto.digest_many import DigestManyUtils
 from bip_utils.utils.misc import AlgoUtils
 
 
@@ -63,6 +67,17 @@ class Sha256:
         """
         return self.handle.digest()
 
+    def Copy(self) -> Sha256:
+        """
+        Get a copy of the current state, e.g. for reusing a common prefix already absorbed.
+
+        Returns:
+            Sha256 object: Sha256 object
+        """
+        sha256 = Sha256.__new__(Sha256)
+        sha256.handle = self.handle.copy()
+        return sha256
+
     @staticmethod
     def QuickDigest(data: Union[bytes, str]) -> bytes:
         """
@@ -74,7 +89,23 @@ class Sha256:
         Returns:
             bytes: Computed digest
         """
-        return hashlib.sha256(AlgoUtils.Encode(data)).digest()
+        return hashlib.sha256(AlgoUtils.EncodeBuffer(data)).digest()
+
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        sha256 = hashlib.sha256
+        return DigestManyUtils.Compute(lambda d: sha256(d).digest(), data, executor)
 
     @staticmethod
     def DigestSize() -> int:
@@ -106,6 +137,22 @@ class DoubleSha256:
         """
         return Sha256.QuickDigest(Sha256.QuickDigest(data))
 
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        sha256 = hashlib.sha256
+        return DigestManyUtils.Compute(lambda d: sha256(sha256(d).digest()).digest(), data, executor)
+
     @staticmethod
     def DigestSize() -> int:
         """
@@ -134,7 +181,23 @@ class Sha512:
         Returns:
             bytes: Computed digest
         """
-        return hashlib.sha512(AlgoUtils.Encode(data)).digest()
+        return hashlib.sha512(AlgoUtils.EncodeBuffer(data)).digest()
+
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        sha512 = hashlib.sha512
+        return DigestManyUtils.Compute(lambda d: sha512(d).digest(), data, executor)
 
     @staticmethod
     def DigestSize() -> int:
@@ -165,9 +228,29 @@ class Sha512_256:   # noqa: N801
             bytes: Computed digest
         """
         if HASHLIB_USE_SHA512_256:
-            return hashlib.new("sha512_256", AlgoUtils.Encode(data)).digest()
+            return hashlib.new("sha512_256", AlgoUtils.EncodeBuffer(data)).digest()
+        # Use Cryptodome if not implemented in hashlib
+        return SHA512.new(AlgoUtils.EncodeBuffer(data), truncate="256").digest()
+
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        if HASHLIB_USE_SHA512_256:
+            hashlib_new = hashlib.new
+            return DigestManyUtils.Compute(lambda d: hashlib_new("sha512_256", d).digest(), data, executor)
         # Use Cryptodome if not implemented in hashlib
-        return SHA512.new(AlgoUtils.Encode(data), truncate="256").digest()
+        sha512_new = SHA512.new
+        return DigestManyUtils.Compute(lambda d: sha512_new(d, truncate="256").digest(), data, executor)
 
     @staticmethod
     def DigestSize() -> int:
@@ -22,10 +22,12 @@
 
 # Imports
 import hashlib
-from typing import Union
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional, Union
 
 from Crypto.Hash import SHA3_256, keccak
 
+from bip_utils.utils.crypto.digest_many import DigestManyUtils
 from bip_utils.utils.misc import AlgoUtils
 
 
@@ -49,7 +51,23 @@ class Kekkak256:
         Returns:
             bytes: Computed digest
         """
-        return keccak.new(data=AlgoUtils.Encode(data), digest_bits=256).digest()
+        return keccak.new(data=AlgoUtils.EncodeBuffer(data), digest_bits=256).digest()
+
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        keccak_new = keccak.new
+        return DigestManyUtils.Compute(lambda d: keccak_new(data=d, digest_bits=256).digest(), data, executor)
 
     @staticmethod
     def DigestSize() -> int:
@@ -82,9 +100,29 @@ class Sha3_256:     # noqa: N801
             bytes: Computed digest
         """
         if HASHLIB_USE_SHA3_256:
-            return hashlib.new("sha3_256", AlgoUtils.Encode(data)).digest()
+            return hashlib.new("sha3_256", AlgoUtils.EncodeBuffer(data)).digest()
+        # Use Cryptodome if not implemented in hashlib
+        return SHA3_256.new(AlgoUtils.EncodeBuffer(data)).digest()
+
+    @staticmethod
+    def DigestMany(data: Iterable[Union[bytes, str]],
+                   executor: Optional[Executor] = None) -> List[bytes]:
+        """
+        Compute the digest of many data at once.
+
+        Args:
+            data (iterable)              : Data (each element shall be str or bytes)
+            executor (Executor, optional): Executor for computing digests concurrently (default: None)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        if HASHLIB_USE_SHA3_256:
+            hashlib_new = hashlib.new
+            return DigestManyUtils.Compute(lambda d: hashlib_new("sha3_256", d).digest(), data, executor)
         # Use Cryptodome if not implemented in hashlib
-        return SHA3_256.new(AlgoUtils.Encode(data)).digest()
+        sha3_256_new = SHA3_256.new
+        return DigestManyUtils.Compute(lambda d: sha3_256_new(d).digest(), data, executor)
 
     @staticmethod
     def DigestSize() -> int:
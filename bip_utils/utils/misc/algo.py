@@ -25,6 +25,10 @@ from bisect import bisect_left
 from typing import Any, List, Union
 
 
+# Bytes-like object type
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
 class AlgoUtils:
     """Class container for algorithm utility functions."""
 
@@ -57,7 +61,7 @@ class AlgoUtils:
         Decode from bytes.
 
         Args:
-            data (str or bytes): Data
+            data (str or bytes): Data (any object supporting the buffer protocol is accepted as bytes)
             encoding (str)     : Encoding type
 
         Returns:
@@ -70,13 +74,14 @@ class AlgoUtils:
             return data
         if isinstance(data, bytes):
             return data.decode(encoding)
-        raise TypeError("Invalid data type")
+        return str(AlgoUtils.EncodeBuffer(data), encoding)
 
     @staticmethod
     def Encode(data: Union[bytes, str],
                encoding: str = "utf-8") -> bytes:
         """
         Encode to bytes.
+        Objects supporting the buffer protocol (e.g. bytearray, memoryview) are converted to bytes.
 
         Args:
             data (str or bytes): Data
@@ -92,7 +97,35 @@ class AlgoUtils:
             return data.encode(encoding)
         if isinstance(data, bytes):
             return data
-        raise TypeError("Invalid data type")
+        return bytes(AlgoUtils.EncodeBuffer(data))
+
+    @staticmethod
+    def EncodeBuffer(data: Union[bytes, str],
+                     encoding: str = "utf-8") -> BytesLike:
+        """
+        Encode to a bytes-like object.
+        Differently from Encode, objects supporting the buffer protocol (e.g. bytearray, memoryview, mmap)
+        are returned as they are (or as a memoryview), without copying them.
+        It shall be used when data is only read (e.g. hashing), since the returned object could be mutable.
+
+        Args:
+            data (str or bytes): Data
+            encoding (str)     : Encoding type
+
+        Returns:
+            bytes, bytearray or memoryview: Bytes-like object
+
+        Raises:
+            TypeError: If the data is neither string nor bytes-like object
+        """
+        if isinstance(data, str):
+            return data.encode(encoding)
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return data
+        try:
+            return memoryview(data)
+        except TypeError as ex:
+            raise TypeError("Invalid data type") from ex
 
     @staticmethod
     def IsStringMixed(data_str: str) -> bool:
@@ -105,4 +138,7 @@ class AlgoUtils:
         Returns:
             bool: True if mixed case, false otherwise
         """
+        # Fast path for ASCII strings (e.g. addresses), where case conversions are equivalent to character checks
+        if data_str.isascii():
+            return data_str not in (data_str.lower(), data_str.upper())
         return any(c.islower() for c in data_str) and any(c.isupper() for c in data_str)
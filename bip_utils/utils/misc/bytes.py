@@ -30,7 +30,10 @@ from bip_utils.utils.typing import Literal
 
 
 class BytesUtils:
-    """Class container for bytes utility functions."""
+    """
+    Class container for bytes utility functions.
+    Where bytes are required, any object supporting the buffer protocol (e.g. bytearray, memoryview) is accepted.
+    """
 
     @staticmethod
     def Reverse(data_bytes: bytes) -> bytes:
@@ -43,9 +46,7 @@ class BytesUtils:
         Returns:
             bytes: Original bytes in the reverse order
         """
-        tmp = bytearray(data_bytes)
-        tmp.reverse()
-        return bytes(tmp)
+        return bytes(data_bytes[::-1])
 
     @staticmethod
     def Xor(data_bytes_1: bytes,
@@ -171,7 +172,7 @@ class BytesUtils:
         Returns
             bytes: Hex string converted to bytes
         """
-        return binascii.unhexlify(AlgoUtils.Encode(data))
+        return binascii.unhexlify(AlgoUtils.EncodeBuffer(data))
 
     @staticmethod
     def FromList(data_list: List[int]) -> bytes:
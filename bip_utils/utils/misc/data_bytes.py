@@ -39,11 +39,15 @@ class DataBytes:
                  data_bytes: bytes) -> None:
         """
         Construct class.
+        Objects supporting the buffer protocol (e.g. bytearray, memoryview) are converted to bytes,
+        while bytes are stored without being copied.
 
         Args:
             data_bytes (bytes): Data bytes
         """
-        self.m_data_bytes = data_bytes
+        self.m_data_bytes = (data_bytes
+                             if isinstance(data_bytes, bytes)
+                             else bytes(memoryview(data_bytes)))
 
     def Length(self) -> int:
         """
@@ -161,7 +165,7 @@ class DataBytes:
         Equality operator.
 
         Args:
-            other (bytes, str, int or DataBytes object): Other object to compare
+            other (bytes, bytearray, memoryview, str, int or DataBytes object): Other object to compare
 
         Returns:
             bool: True if equal false otherwise
@@ -169,13 +173,13 @@ class DataBytes:
         Raises:
             TypeError: If the other object is not of the correct type
         """
-        if not isinstance(other, (bytes, int, str, DataBytes)):
+        if not isinstance(other, (bytes, bytearray, memoryview, int, str, DataBytes)):
             raise TypeError(f"Invalid type for checking equality ({type(other)})")
 
-        if isinstance(other, bytes):
-            return other == bytes(self)
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return other == self.m_data_bytes
         if isinstance(other, int):
             return other == int(self)
         if isinstance(other, str):
             return other == str(self)
-        return bytes(other) == bytes(self)
+        return other.m_data_bytes == self.m_data_bytes
@@ -1,10 +1,15 @@
 from bip_utils.utils.mnemonic.entropy_generator import EntropyGenerator
 from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
+from bip_utils.utils.mnemonic.mnemonic_bulk_validator import (
+    MnemonicBulkValidator, MnemonicBulkValidatorConst, MnemonicValidationResults
+)
 from bip_utils.utils.mnemonic.mnemonic_decoder_base import MnemonicDecoderBase
 from bip_utils.utils.mnemonic.mnemonic_encoder_base import MnemonicEncoderBase
-from bip_utils.utils.mnemonic.mnemonic_ex import MnemonicChecksumError
+from bip_utils.utils.mnemonic.mnemonic_ex import MnemonicChecksumError, MnemonicVersionError
 from bip_utils.utils.mnemonic.mnemonic_utils import (
     MnemonicUtils, MnemonicWordsList, MnemonicWordsListFileReader, MnemonicWordsListFinderBase,
-    MnemonicWordsListGetterBase
+    MnemonicWordsListGetterBase, MnemonicWordsListLangIndex, MnemonicWordsListPackedFile,
+    MnemonicWordsListPackedFileConst
 )
 from bip_utils.utils.mnemonic.mnemonic_validator import MnemonicValidator
+from bip_utils.utils.mnemonic.seed_cache import SeedCache, SeedCacheConst, SeedCacheMetrics
@@ -24,6 +24,7 @@
 import os
 import secrets
 import math
+from typing import List
 
 from bip_utils.utils.misc import IntegerUtils
 
@@ -53,10 +54,53 @@ class EntropyGenerator:
         Returns:
             bytes: Generated entropy bytes
         """
-        bpw = int(math.log(2048, 2))
-        num_bits = int(math.ceil(self.m_bit_len / bpw) * bpw)
+        min_entropy = self.__MinEntropy()
         entropy = 1
-        while entropy < pow(2, num_bits - bpw):
+        while entropy < min_entropy:
             # try again if seed would not contain enough words
             entropy = secrets.randbits(self.m_bit_len)
         return IntegerUtils.ToBytes(entropy)
+
+    def GenerateMany(self,
+                     count: int) -> List[bytes]:
+        """
+        Generate many random entropy bytes.
+        Random bytes are read in a single chunk for all the entropies, instead of once for each one.
+        Entropies are accepted with the same rule of the Generate method.
+
+        Args:
+            count (int): Number of entropies
+
+        Returns:
+            list[bytes]: Generated entropy bytes
+
+        Raises:
+            ValueError: If the count is not valid
+        """
+        if count < 0:
+            raise ValueError(f"Invalid entropies count ({count})")
+
+        byte_len = (self.m_bit_len + 7) // 8
+        shift = (byte_len * 8) - self.m_bit_len
+        min_entropy = self.__MinEntropy()
+
+        entropies: List[bytes] = []
+        while len(entropies) < count:
+            rand_bytes = os.urandom((count - len(entropies)) * byte_len)
+            for i in range(0, len(rand_bytes), byte_len):
+                entropy = int.from_bytes(rand_bytes[i:i + byte_len], "big") >> shift
+                # Discard it if seed would not contain enough words
+                if entropy >= min_entropy:
+                    entropies.append(IntegerUtils.ToBytes(entropy))
+        return entropies
+
+    def __MinEntropy(self) -> int:
+        """
+        Get the minimum accepted entropy value.
+
+        Returns:
+            int: Minimum entropy value
+        """
+        bpw = int(math.log(2048, 2))
+        num_bits = int(math.ceil(self.m_bit_len / bpw) * bpw)
+        return pow(2, num_bits - bpw)
@@ -51,7 +51,7 @@ class Mnemonic:
         Returns:
             Mnemonic: Mnemonic object
         """
-        return cls.FromList(cls._Normalize(mnemonic_str))
+        return cls(cls._Normalize(mnemonic_str))
 
     @classmethod
     def FromList(cls,
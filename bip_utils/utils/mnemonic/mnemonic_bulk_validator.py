@@ -0,0 +1,266 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for generic bulk mnemonic validation."""
+
+# Imports
+from collections import deque
+from concurrent.futures import Executor, Future
+from enum import IntEnum, unique
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from bip_utils.utils.mnemonic.mnemonic import Mnemonic
+from bip_utils.utils.mnemonic.mnemonic_ex import MnemonicChecksumError, MnemonicVersionError
+from bip_utils.utils.mnemonic.mnemonic_validator import MnemonicValidator
+
+
+@unique
+class MnemonicValidationResults(IntEnum):
+    """Enumerative for mnemonic validation results."""
+
+    VALID = 0
+    INVALID_WORDS_NUM = 1
+    INVALID_WORDS = 2
+    INVALID_CHECKSUM = 3
+    INVALID_VERSION = 4
+
+
+class MnemonicBulkValidatorConst:
+    """Class container for bulk mnemonic validator constants."""
+
+    # Default number of mnemonics for each chunk submitted to the executor
+    DEFAULT_CHUNK_SIZE: int = 4096
+    # Maximum number of chunks waiting to be processed by the executor
+    MAX_PENDING_CHUNKS: int = 64
+
+
+class _MnemonicBulkValidatorUtils:
+    """
+    Bulk mnemonic validator utility class.
+    Methods are not name-mangled, so that they can be pickled and executed by process pools.
+    """
+
+    # Validators constructed by the current process
+    __validators: Dict[Tuple[Any, ...], MnemonicValidator] = {}
+
+    @staticmethod
+    def GetValidator(validator_cls: Type[MnemonicValidator],
+                     validator_args: Tuple[Any, ...]) -> MnemonicValidator:
+        """
+        Get the validator, constructed only once for each process.
+
+        Args:
+            validator_cls (MnemonicValidator class): Validator class
+            validator_args (tuple)                  : Validator construction arguments
+
+        Returns:
+            MnemonicValidator object: MnemonicValidator object
+        """
+        key = (validator_cls, validator_args)
+        validator = _MnemonicBulkValidatorUtils.__validators.get(key)
+        if validator is None:
+            validator = _MnemonicBulkValidatorUtils.__validators[key] = validator_cls(*validator_args)
+        return validator
+
+    @staticmethod
+    def ValidateChunk(validator_cls: Type[MnemonicValidator],
+                      validator_args: Tuple[Any, ...],
+                      mnemonic_cls: Type[Mnemonic],
+                      words_num: Tuple[int, ...],
+                      mnemonics: Sequence[Union[str, Mnemonic]]) -> bytes:
+        """
+        Validate a chunk of mnemonics.
+
+        Args:
+            validator_cls (MnemonicValidator class): Validator class
+            validator_args (tuple)                  : Validator construction arguments
+            mnemonic_cls (Mnemonic class)           : Mnemonic class
+            words_num (tuple[int])                  : Valid words numbers
+            mnemonics (Sequence)                    : Mnemonics
+
+        Returns:
+            bytes: Validation result of each mnemonic, one byte for each mnemonic
+        """
+        validator = _MnemonicBulkValidatorUtils.GetValidator(validator_cls, validator_args)
+        return bytes(
+            _MnemonicBulkValidatorUtils.ValidateOne(validator, mnemonic_cls, words_num, mnemonic)
+            for mnemonic in mnemonics
+        )
+
+    @staticmethod
+    def ValidateOne(validator: MnemonicValidator,
+                    mnemonic_cls: Type[Mnemonic],
+                    words_num: Tuple[int, ...],
+                    mnemonic: Union[str, Mnemonic]) -> MnemonicValidationResults:
+        """
+        Validate a mnemonic.
+
+        Args:
+            validator (MnemonicValidator object): MnemonicValidator object
+            mnemonic_cls (Mnemonic class)       : Mnemonic class
+            words_num (tuple[int])              : Valid words numbers
+            mnemonic (str or Mnemonic object)   : Mnemonic
+
+        Returns:
+            MnemonicValidationResults: Validation result
+        """
+
+        # Normalize only once, the validator does not normalize Mnemonic objects again
+        mnemonic_obj = mnemonic_cls.FromString(mnemonic) if isinstance(mnemonic, str) else mnemonic
+        if mnemonic_obj.WordsCount() not in words_num:
+            return MnemonicValidationResults.INVALID_WORDS_NUM
+
+        try:
+            validator.Validate(mnemonic_obj)
+        except MnemonicChecksumError:
+            return MnemonicValidationResults.INVALID_CHECKSUM
+        except MnemonicVersionError:
+            return MnemonicValidationResults.INVALID_VERSION
+        except ValueError:
+            return MnemonicValidationResults.INVALID_WORDS
+        return MnemonicValidationResults.VALID
+
+
+class MnemonicBulkValidator:
+    """
+    Bulk mnemonic validator class.
+    It validates a stream of mnemonic phrases, reporting a result code for each one instead of raising exceptions.
+    """
+
+    m_validator_cls: Type[MnemonicValidator]
+    m_validator_args: Tuple[Any, ...]
+    m_mnemonic_cls: Type[Mnemonic]
+    m_words_num: Tuple[int, ...]
+
+    def __init__(self,
+                 validator_cls: Type[MnemonicValidator],
+                 validator_args: Tuple[Any, ...],
+                 mnemonic_cls: Type[Mnemonic],
+                 words_num: Iterable[int]) -> None:
+        """
+        Construct class.
+        The validator is constructed from its class and arguments, so that the class is cheap to be pickled.
+
+        Args:
+            validator_cls (MnemonicValidator class): Validator class
+            validator_args (tuple)                  : Validator construction arguments
+            mnemonic_cls (Mnemonic class)           : Mnemonic class
+            words_num (Iterable[int])               : Valid words numbers
+
+        Raises:
+            TypeError: If the validator arguments are not valid
+        """
+        self.m_validator_cls = validator_cls
+        self.m_validator_args = validator_args
+        self.m_mnemonic_cls = mnemonic_cls
+        self.m_words_num = tuple(words_num)
+        # Construct it immediately, so that invalid arguments are reported here
+        _MnemonicBulkValidatorUtils.GetValidator(validator_cls, validator_args)
+
+    def ValidateOne(self,
+                    mnemonic: Union[str, Mnemonic]) -> MnemonicValidationResults:
+        """
+        Validate a mnemonic.
+
+        Args:
+            mnemonic (str or Mnemonic object): Mnemonic
+
+        Returns:
+            MnemonicValidationResults: Validation result
+        """
+        return _MnemonicBulkValidatorUtils.ValidateOne(
+            _MnemonicBulkValidatorUtils.GetValidator(self.m_validator_cls, self.m_validator_args),
+            self.m_mnemonic_cls,
+            self.m_words_num,
+            mnemonic
+        )
+
+    def Validate(self,
+                 mnemonics: Iterable[Union[str, Mnemonic]],
+                 executor: Optional[Executor] = None,
+                 chunk_size: int = MnemonicBulkValidatorConst.DEFAULT_CHUNK_SIZE
+                 ) -> Iterator[MnemonicValidationResults]:
+        """
+        Validate the mnemonics, yielding a result for each one in the same order.
+        The mnemonics are consumed lazily, so the iterable can be larger than the available memory.
+
+        Args:
+            mnemonics (Iterable)         : Mnemonics
+            executor (Executor, optional): Executor for validating chunks of mnemonics concurrently (default: None)
+                                           A process pool is advised, since the validation is CPU-bound
+            chunk_size (int, optional)   : Number of mnemonics for each chunk (default: 4096)
+
+        Returns:
+            Iterator[MnemonicValidationResults]: Validation results
+
+        Raises:
+            ValueError: If the chunk size is not valid
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+        return self.__Validate(mnemonics, executor, chunk_size)
+
+    def __Validate(self,
+                   mnemonics: Iterable[Union[str, Mnemonic]],
+                   executor: Optional[Executor],
+                   chunk_size: int) -> Iterator[MnemonicValidationResults]:
+        """
+        Validate the mnemonics, yielding a result for each one in the same order.
+
+        Args:
+            mnemonics (Iterable)         : Mnemonics
+            executor (Executor, optional): Executor for validating chunks of mnemonics concurrently
+            chunk_size (int)             : Number of mnemonics for each chunk
+
+        Returns:
+            Iterator[MnemonicValidationResults]: Validation results
+        """
+        mnemonics_it = iter(mnemonics)
+        pending: Deque[Union[Future, bytes]] = deque()
+        while True:
+            chunk = list(islice(mnemonics_it, chunk_size))
+            if not chunk:
+                break
+
+            args = (self.m_validator_cls, self.m_validator_args, self.m_mnemonic_cls, self.m_words_num, chunk)
+            pending.append(_MnemonicBulkValidatorUtils.ValidateChunk(*args)
+                           if executor is None
+                           else executor.submit(_MnemonicBulkValidatorUtils.ValidateChunk, *args))
+
+            # Keep a limited number of chunks in flight
+            if executor is None or len(pending) >= MnemonicBulkValidatorConst.MAX_PENDING_CHUNKS:
+                yield from self.__ChunkResults(pending.popleft())
+        while pending:
+            yield from self.__ChunkResults(pending.popleft())
+
+    @staticmethod
+    def __ChunkResults(chunk_res: Union[Future, bytes]) -> List[MnemonicValidationResults]:
+        """
+        Get the results of a chunk.
+
+        Args:
+            chunk_res (bytes or Future): Chunk results or future
+
+        Returns:
+            list[MnemonicValidationResults]: Validation results
+        """
+        res_bytes = chunk_res.result() if isinstance(chunk_res, Future) else chunk_res
+        return [MnemonicValidationResults(res) for res in res_bytes]
@@ -23,3 +23,7 @@
 
 class MnemonicChecksumError(Exception):
     """Exception in case of checksum error."""
+
+
+class MnemonicVersionError(ValueError):
+    """Exception in case of version error (i.e. valid words not encoding a mnemonic of the expected version)."""
@@ -23,8 +23,10 @@
 # Imports
 from __future__ import annotations
 
+import os
+import struct
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Dict, List, Optional, Sequence, Tuple, Type
 
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
 from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
@@ -90,6 +92,102 @@ class MnemonicUtils:
 
         return IntegerUtils.ToBytes(int_chunk, bytes_num=4, endianness=endianness)
 
+    @staticmethod
+    def BytesToWordsIdx(data_bytes: bytes,
+                        words_list_len: int,
+                        endianness: Literal["little", "big"]) -> List[int]:
+        """
+        Get word indexes from bytes, 4 bytes represent 3 words.
+        All chunks are unpacked at once, instead of converting them one by one.
+
+        Args:
+            data_bytes (bytes)            : Data bytes (length shall be a multiple of 4)
+            words_list_len (int)          : Words list length
+            endianness ("big" or "little"): Bytes endianness
+
+        Returns:
+            list[int]: Word indexes
+        """
+        n = words_list_len
+        words_idx: List[int] = []
+        for int_chunk in struct.unpack(MnemonicUtils.__ChunksFormat(len(data_bytes) // 4, endianness), data_bytes):
+            quot, word1_idx = divmod(int_chunk, n)
+            word2_idx = (quot + word1_idx) % n
+            word3_idx = (quot // n + word2_idx) % n
+            words_idx += (word1_idx, word2_idx, word3_idx)
+        return words_idx
+
+    @staticmethod
+    def BytesToWordsIdxMany(data_bytes_list: Sequence[bytes],
+                            words_list_len: int,
+                            endianness: Literal["little", "big"]) -> List[List[int]]:
+        """
+        Get word indexes from many bytes at once, 4 bytes represent 3 words.
+        All the bytes are joined and unpacked together.
+
+        Args:
+            data_bytes_list (sequence[bytes]): Data bytes (length of each element shall be a multiple of 4)
+            words_list_len (int)             : Words list length
+            endianness ("big" or "little")   : Bytes endianness
+
+        Returns:
+            list[list[int]]: Word indexes for each element
+        """
+        words_idx = MnemonicUtils.BytesToWordsIdx(b"".join(data_bytes_list), words_list_len, endianness)
+
+        words_idx_list = []
+        start = 0
+        for data_bytes in data_bytes_list:
+            end = start + (len(data_bytes) // 4) * 3
+            words_idx_list.append(words_idx[start:end])
+            start = end
+        return words_idx_list
+
+    @staticmethod
+    def WordsIdxToBytes(words_idx: List[int],
+                        words_list_len: int,
+                        endianness: Literal["little", "big"]) -> bytes:
+        """
+        Get bytes from word indexes, 3 words represent 4 bytes.
+        All chunks are packed at once, instead of converting them one by one.
+
+        Args:
+            words_idx (list[int])         : Word indexes (length shall be a multiple of 3)
+            words_list_len (int)          : Words list length
+            endianness ("big" or "little"): Bytes endianness
+
+        Returns:
+            bytes: Data bytes
+
+        Raises:
+            ValueError: If a group of 3 words does not represent a valid 4-byte chunk
+        """
+        n = words_list_len
+        n_sqr = n * n
+        int_chunks = []
+        for i in range(0, len(words_idx) - 2, 3):
+            word1_idx, word2_idx, word3_idx = words_idx[i:i + 3]
+            int_chunk = word1_idx + (n * ((word2_idx - word1_idx) % n)) + (n_sqr * ((word3_idx - word2_idx) % n))
+            if int_chunk > 0xFFFFFFFF:
+                raise ValueError(f"Invalid words chunk at index {i}")
+            int_chunks.append(int_chunk)
+        return struct.pack(MnemonicUtils.__ChunksFormat(len(int_chunks), endianness), *int_chunks)
+
+    @staticmethod
+    def __ChunksFormat(chunks_num: int,
+                       endianness: Literal["little", "big"]) -> str:
+        """
+        Get the struct format for the specified number of 4-byte chunks.
+
+        Args:
+            chunks_num (int)              : Number of chunks
+            endianness ("big" or "little"): Bytes endianness
+
+        Returns:
+            str: Struct format
+        """
+        return f"{'<' if endianness == 'little' else '>'}{chunks_num}I"
+
 
 class MnemonicWordsList:
     """Mnemonic words list class."""
@@ -150,6 +248,39 @@ class MnemonicWordsList:
         """
         return self.m_idx_to_words[word_idx]
 
+    def GetWordsIdx(self,
+                    words: List[str]) -> List[int]:
+        """
+        Get the indexes of the specified words.
+
+        Args:
+            words (list[str]): Words to be searched
+
+        Returns:
+            list[int]: Word indexes
+
+        Raises:
+            ValueError: If a word is not found
+        """
+        try:
+            return [self.m_words_to_idx[word] for word in words]
+        except KeyError as ex:
+            raise ValueError(f"Unable to find word {ex.args[0]}") from ex
+
+    def GetWordsAtIdx(self,
+                      words_idx: List[int]) -> List[str]:
+        """
+        Get the words at the specified indexes.
+
+        Args:
+            words_idx (list[int]): Word indexes
+
+        Returns:
+            list[str]: Words at the specified indexes
+        """
+        idx_to_words = self.m_idx_to_words
+        return [idx_to_words[word_idx] for word_idx in words_idx]
+
 
 class MnemonicWordsListFileReader:
     """
@@ -174,11 +305,207 @@ class MnemonicWordsListFileReader:
             ValueError: If loaded words list is not valid
         """
 
-        # Read file
+        words_list = MnemonicWordsListFileReader.ReadWords(file_path)
+
+        # Check words list count
+        if len(words_list) != words_num:
+            raise ValueError(f"Number of loaded words list ({len(words_list)}) is not valid")
+
+        return MnemonicWordsList(words_list)
+
+    @staticmethod
+    def ReadWords(file_path: str) -> List[str]:
+        """
+        Read the words of a words list file, skipping empty lines and comments.
+
+        Args:
+            file_path (str): File name
+
+        Returns:
+            list[str]: Words
+        """
         with open(file_path, "r", encoding="utf-8") as fin:
-            words_list = [word.strip()
-                          for word in fin.readlines()
-                          if word.strip() != "" and not word.startswith("#")]
+            return [word.strip()
+                    for word in fin.readlines()
+                    if word.strip() != "" and not word.startswith("#")]
+
+
+class MnemonicWordsListPackedFileConst:
+    """Class container for mnemonic packed words list file constants."""
+
+    # File name, in the same folder of the words list text files
+    FILE_NAME: str = "wordlists.bin"
+    # Extension of the words list text files
+    TEXT_FILE_EXT: str = ".txt"
+    # Magic bytes
+    MAGIC: bytes = b"BUWL"
+    # Format version
+    VERSION: int = 1
+    # Words separator
+    WORDS_SEP: str = "\n"
+
+
+class MnemonicWordsListPackedFile:
+    """
+    Mnemonic packed words list file class.
+    It packs all the words list text files of a folder in a single binary file, built in advance, so that they can
+    be loaded with a single read. Each words list is then decoded only the first time it is requested.
+
+    File format (integers are big endian):
+    - header: magic (4 bytes), version (1 byte), number of words lists (1 byte)
+    - for each words list: name length (1 byte), name (UTF-8), data length (4 bytes)
+    - data of each words list: words encoded in UTF-8 and separated by a new line
+    """
+
+    m_data: bytes
+    m_entries: Dict[str, Tuple[int, int]]
+
+    # Global cache of read files
+    __files: Dict[str, Optional[MnemonicWordsListPackedFile]] = {}
+
+    @classmethod
+    def FromDir(cls,
+                dir_path: str) -> Optional[MnemonicWordsListPackedFile]:
+        """
+        Get the packed words list file of the specified folder.
+        The file is read only the first time it is requested.
+
+        Args:
+            dir_path (str): Folder path
+
+        Returns:
+            MnemonicWordsListPackedFile object: MnemonicWordsListPackedFile object, None if there is no packed file
+
+        Raises:
+            ValueError: If the packed file is not valid
+        """
+        file_path = os.path.join(os.path.abspath(dir_path), MnemonicWordsListPackedFileConst.FILE_NAME)
+        if file_path not in cls.__files:
+            try:
+                with open(file_path, "rb") as fin:
+                    cls.__files[file_path] = cls(fin.read())
+            except FileNotFoundError:
+                cls.__files[file_path] = None
+        return cls.__files[file_path]
+
+    @staticmethod
+    def Compile(dir_path: str) -> bytes:
+        """
+        Compile all the words list text files of the specified folder to the packed format.
+        Words lists are sorted by name, so that the result is reproducible.
+
+        Args:
+            dir_path (str): Folder path
+
+        Returns:
+            bytes: Packed file data
+        """
+        file_names = sorted(file_name
+                            for file_name in os.listdir(dir_path)
+                            if file_name.endswith(MnemonicWordsListPackedFileConst.TEXT_FILE_EXT))
+
+        header = MnemonicWordsListPackedFileConst.MAGIC + bytes([MnemonicWordsListPackedFileConst.VERSION,
+                                                                len(file_names)])
+        data = b""
+        for file_name in file_names:
+            name = os.path.splitext(file_name)[0].encode("utf-8")
+            words_data = MnemonicWordsListPackedFileConst.WORDS_SEP.join(
+                MnemonicWordsListFileReader.ReadWords(os.path.join(dir_path, file_name))
+            ).encode("utf-8")
+
+            header += bytes([len(name)]) + name + IntegerUtils.ToBytes(len(words_data), bytes_num=4)
+            data += words_data
+
+        return header + data
+
+    @staticmethod
+    def CompileToFile(dir_path: str) -> None:
+        """
+        Compile all the words list text files of the specified folder to the packed format and write the packed
+        file in the same folder.
+
+        Args:
+            dir_path (str): Folder path
+        """
+        with open(os.path.join(dir_path, MnemonicWordsListPackedFileConst.FILE_NAME), "wb") as fout:
+            fout.write(MnemonicWordsListPackedFile.Compile(dir_path))
+
+    def __init__(self,
+                 data: bytes) -> None:
+        """
+        Construct class.
+
+        Args:
+            data (bytes): Packed file data
+
+        Raises:
+            ValueError: If the packed file data is not valid
+        """
+        magic_len = len(MnemonicWordsListPackedFileConst.MAGIC)
+        if (len(data) < magic_len + 2
+                or data[:magic_len] != MnemonicWordsListPackedFileConst.MAGIC
+                or data[magic_len] != MnemonicWordsListPackedFileConst.VERSION):
+            raise ValueError("Invalid packed words list file")
+
+        self.m_data = data
+        self.m_entries = {}
+
+        # Parse header
+        try:
+            entries = []
+            offset = magic_len + 2
+            for _ in range(data[magic_len + 1]):
+                name_len = data[offset]
+                name = data[offset + 1:offset + 1 + name_len].decode("utf-8")
+                offset += 1 + name_len
+                entries.append((name, BytesUtils.ToInteger(data[offset:offset + 4])))
+                offset += 4
+        except IndexError as ex:
+            raise ValueError("Invalid packed words list file") from ex
+
+        # Get data offset of each words list
+        for name, data_len in entries:
+            self.m_entries[name] = (offset, data_len)
+            offset += data_len
+        if offset != len(data):
+            raise ValueError("Invalid packed words list file")
+
+    def HasWordsList(self,
+                     name: str) -> bool:
+        """
+        Get if the file contains the words list with the specified name.
+
+        Args:
+            name (str): Words list name (i.e. the name of its text file without extension)
+
+        Returns:
+            bool: True if the words list is present, false otherwise
+        """
+        return name in self.m_entries
+
+    def GetWordsList(self,
+                     name: str,
+                     words_num: int) -> MnemonicWordsList:
+        """
+        Get the words list with the specified name.
+
+        Args:
+            name (str)     : Words list name (i.e. the name of its text file without extension)
+            words_num (int): Number of expected words
+
+        Returns:
+            MnemonicWordsList: MnemonicWordsList object
+
+        Raises:
+            ValueError: If the words list is not present or not valid
+        """
+        try:
+            offset, data_len = self.m_entries[name]
+        except KeyError as ex:
+            raise ValueError(f"Unable to find words list {name}") from ex
+
+        words_list = (self.m_data[offset:offset + data_len].decode("utf-8")
+                      .split(MnemonicWordsListPackedFileConst.WORDS_SEP))
 
         # Check words list count
         if len(words_list) != words_num:
@@ -194,6 +521,8 @@ class MnemonicWordsListGetterBase(ABC):
 
     # Global instance
     __instance: Optional[MnemonicWordsListGetterBase] = None
+    # Words lists shared among all getters, by file path
+    __shared_words_lists: Dict[str, MnemonicWordsList] = {}
 
     def __init__(self):
         """Construct class."""
@@ -240,11 +569,42 @@ class MnemonicWordsListGetterBase(ABC):
         try:
             return self.m_words_lists[lang]
         except KeyError:
-            self.m_words_lists[lang] = MnemonicWordsListFileReader.LoadFile(file_name,
-                                                                            words_num)
+            self.m_words_lists[lang] = MnemonicWordsListGetterBase.__LoadSharedWordsList(file_name,
+                                                                                         words_num)
 
             return self.m_words_lists[lang]
 
+    @staticmethod
+    def __LoadSharedWordsList(file_name: str,
+                              words_num: int) -> MnemonicWordsList:
+        """
+        Load words list, sharing it among all getters.
+        If the folder of the file contains a packed words list file, the words list is taken from it, otherwise
+        the text file is read.
+
+        Args:
+            file_name (str): File name
+            words_num (int): Number of expected words
+
+        Returns:
+            MnemonicWordsList object: MnemonicWordsList object
+
+        Raises:
+            ValueError: If loaded words list is not valid
+        """
+        shared_words_lists = MnemonicWordsListGetterBase.__shared_words_lists
+
+        file_path = os.path.abspath(file_name)
+        if file_path not in shared_words_lists:
+            packed_file = MnemonicWordsListPackedFile.FromDir(os.path.dirname(file_path))
+            words_list_name = os.path.splitext(os.path.basename(file_path))[0]
+
+            if packed_file is not None and packed_file.HasWordsList(words_list_name):
+                shared_words_lists[file_path] = packed_file.GetWordsList(words_list_name, words_num)
+            else:
+                shared_words_lists[file_path] = MnemonicWordsListFileReader.LoadFile(file_path, words_num)
+        return shared_words_lists[file_path]
+
     @classmethod
     def Instance(cls) -> MnemonicWordsListGetterBase:
         """
@@ -258,12 +618,74 @@ class MnemonicWordsListGetterBase(ABC):
         return cls.__instance
 
 
+class MnemonicWordsListLangIndex:
+    """
+    Mnemonic words list language index class.
+    It maps each word to a bitmask of the languages whose words list contains it, so that the language of a
+    mnemonic can be found with one lookup per word.
+    The bit index of a language is its position in the languages enumerative.
+    """
+
+    m_langs: List[MnemonicLanguages]
+    m_words_to_langs: Dict[str, int]
+
+    def __init__(self,
+                 langs_enum: Type[MnemonicLanguages],
+                 words_list_getter_cls: Type[MnemonicWordsListGetterBase]) -> None:
+        """
+        Construct class.
+        The words lists of all languages are loaded.
+
+        Args:
+            langs_enum (MnemonicLanguages class)               : Language class
+            words_list_getter_cls (MnemonicWordsListGetterBase): Word list getter class type
+
+        Raises:
+            ValueError: If loaded words list is not valid
+        """
+        self.m_langs = list(langs_enum)
+        self.m_words_to_langs = {}
+
+        words_list_getter = words_list_getter_cls.Instance()
+        for i, lang in enumerate(self.m_langs):
+            words_list = words_list_getter.GetByLanguage(lang)
+            for word_idx in range(words_list.Length()):
+                word = words_list.GetWordAtIdx(word_idx)
+                self.m_words_to_langs[word] = self.m_words_to_langs.get(word, 0) | (1 << i)
+
+    def FindLanguage(self,
+                     mnemonic: Mnemonic) -> Optional[MnemonicLanguages]:
+        """
+        Find the language of the specified mnemonic.
+        If the words belong to more than one language, the first one in the enumerative order is returned.
+
+        Args:
+            mnemonic (Mnemonic object): Mnemonic object
+
+        Returns:
+            MnemonicLanguages: Mnemonic language, None if not found
+        """
+        words_to_langs = self.m_words_to_langs
+
+        langs_mask = (1 << len(self.m_langs)) - 1
+        for word in mnemonic.ToList():
+            langs_mask &= words_to_langs.get(word, 0)
+            if langs_mask == 0:
+                return None
+        # Get the lowest set bit
+        return self.m_langs[(langs_mask & -langs_mask).bit_length() - 1]
+
+
 class MnemonicWordsListFinderBase(ABC):
     """
     Mnemonic words list finder base class.
     It automatically finds the correct words list from a mnemonic.
     """
 
+    # Global language indexes, built the first time a language is searched
+    __lang_indexes: Dict[Tuple[Type[MnemonicLanguages], Type[MnemonicWordsListGetterBase]],
+                         MnemonicWordsListLangIndex] = {}
+
     @classmethod
     @abstractmethod
     def FindLanguage(cls,
@@ -302,17 +724,14 @@ class MnemonicWordsListFinderBase(ABC):
         Raises:
             ValueError: If the mnemonic language cannot be found
         """
-        for lang in langs_enum:
-            # Search all the words because some languages have words in common
-            # (e.g. 'fatigue' both in English and French)
-            # It's more time consuming, but considering only the first word can detect the wrong language sometimes
-            try:
-                words_list = words_list_getter_cls.Instance().GetByLanguage(lang)
-                for word in mnemonic.ToList():
-                    words_list.GetWordIdx(word)
-                return words_list, lang
-            except ValueError:
-                continue
-
-        # Language not found
-        raise ValueError(f"Invalid language for mnemonic '{mnemonic.ToStr()}'")
+        lang_indexes = MnemonicWordsListFinderBase.__lang_indexes
+        index_key = (langs_enum, words_list_getter_cls)
+        if index_key not in lang_indexes:
+            lang_indexes[index_key] = MnemonicWordsListLangIndex(langs_enum, words_list_getter_cls)
+
+        # Search all the words because some languages have words in common
+        # (e.g. 'fatigue' both in English and French), considering only the first word can detect the wrong language
+        lang = lang_indexes[index_key].FindLanguage(mnemonic)
+        if lang is None:
+            raise ValueError(f"Invalid language for mnemonic '{mnemonic.ToStr()}'")
+        return words_list_getter_cls.Instance().GetByLanguage(lang), lang
@@ -0,0 +1,227 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for caching seeds generated from mnemonics."""
+
+# Imports
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Tuple, Union
+
+from bip_utils.utils.crypto import HmacSha256
+from bip_utils.utils.misc import AlgoUtils, IntegerUtils
+
+
+class SeedCacheConst:
+    """Class container for seed cache constants."""
+
+    # Default maximum number of cached seeds
+    DEFAULT_MAX_SIZE: int = 64
+    # Default time to live of cached seeds in seconds
+    DEFAULT_TTL: float = 60.0
+    # Byte length of the random key used for hashing the inputs
+    KEY_BYTE_LEN: int = 32
+    # Byte length of the input length prefix
+    INPUT_LEN_BYTE_LEN: int = 4
+
+
+class SeedCacheMetrics(NamedTuple):
+    """Seed cache metrics class."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class SeedCache:
+    """
+    Seed cache class.
+    It keeps the seeds of the most recently used inputs (e.g. mnemonic and passphrase), so that the expensive key
+    derivation is not repeated. It shall be explicitly passed to the seed generators (opt-in), since keeping seeds in
+    memory trades memory exposure for latency:
+    - entries are indexed by a keyed hash of the inputs (the key is random and different for each cache), never by
+      the inputs themselves
+    - seeds are stored in bytearrays that are zeroized when evicted, expired or cleared
+    - the number of entries and their lifetime are bounded
+    Returned seeds are immutable copies, so they are not zeroized by the cache.
+    The class is thread-safe.
+    """
+
+    m_max_size: int
+    m_ttl: float
+    m_hash_fct: Callable[[bytes], bytes]
+    m_cache: OrderedDict
+    m_lock: threading.Lock
+    m_hits: int
+    m_misses: int
+    m_evictions: int
+    m_expirations: int
+
+    def __init__(self,
+                 max_size: int = SeedCacheConst.DEFAULT_MAX_SIZE,
+                 ttl: float = SeedCacheConst.DEFAULT_TTL) -> None:
+        """
+        Construct class.
+
+        Args:
+            max_size (int, optional): Maximum number of cached seeds (default: 64)
+            ttl (float, optional)   : Time to live of cached seeds in seconds (default: 60)
+
+        Raises:
+            ValueError: If the maximum size or time to live is not valid
+        """
+        if max_size <= 0:
+            raise ValueError(f"Invalid maximum size ({max_size})")
+        if ttl <= 0:
+            raise ValueError(f"Invalid time to live ({ttl})")
+
+        self.m_max_size = max_size
+        self.m_ttl = ttl
+        self.m_hash_fct = HmacSha256.KeyedDigestFct(os.urandom(SeedCacheConst.KEY_BYTE_LEN))
+        self.m_cache = OrderedDict()
+        self.m_lock = threading.Lock()
+        self.m_hits = 0
+        self.m_misses = 0
+        self.m_evictions = 0
+        self.m_expirations = 0
+
+    def Length(self) -> int:
+        """
+        Get the number of cached seeds (including the expired ones not removed yet).
+
+        Returns:
+            int: Number of cached seeds
+        """
+        with self.m_lock:
+            return len(self.m_cache)
+
+    def Metrics(self) -> SeedCacheMetrics:
+        """
+        Get the cache metrics.
+
+        Returns:
+            SeedCacheMetrics object: SeedCacheMetrics object
+        """
+        with self.m_lock:
+            return SeedCacheMetrics(self.m_hits, self.m_misses, self.m_evictions, self.m_expirations)
+
+    def Clear(self) -> None:
+        """Clear the cache, zeroizing all the cached seeds."""
+        with self.m_lock:
+            for _, seed in self.m_cache.values():
+                self.__Zeroize(seed)
+            self.m_cache.clear()
+
+    def PurgeExpired(self) -> None:
+        """Remove the expired seeds, zeroizing them."""
+        with self.m_lock:
+            self.__PurgeExpired(time.monotonic())
+
+    def GetOrGenerate(self,
+                      inputs: Tuple[Union[bytes, str], ...],
+                      generate_fct: Callable[[], bytes]) -> bytes:
+        """
+        Get the seed of the specified inputs from the cache, generating and caching it if missing or expired.
+        The generate function is called outside the lock, so concurrent misses of the same inputs may generate the
+        seed more than once.
+
+        Args:
+            inputs (tuple)         : Inputs identifying the seed (each element shall be str or bytes), including
+                                     a domain separating different seed generators
+            generate_fct (function): Function generating the seed
+
+        Returns:
+            bytes: Seed bytes
+        """
+        key = self.__Key(inputs)
+
+        with self.m_lock:
+            entry = self.m_cache.get(key)
+            if entry is not None:
+                expiry, seed = entry
+                if time.monotonic() < expiry:
+                    self.m_cache.move_to_end(key)
+                    self.m_hits += 1
+                    return bytes(seed)
+                del self.m_cache[key]
+                self.__Zeroize(seed)
+                self.m_expirations += 1
+            self.m_misses += 1
+
+        seed_bytes = generate_fct()
+
+        with self.m_lock:
+            now = time.monotonic()
+            self.__PurgeExpired(now)
+            old_entry = self.m_cache.pop(key, None)
+            if old_entry is not None:
+                self.__Zeroize(old_entry[1])
+            while len(self.m_cache) >= self.m_max_size:
+                _, (_, evicted_seed) = self.m_cache.popitem(last=False)
+                self.__Zeroize(evicted_seed)
+                self.m_evictions += 1
+            self.m_cache[key] = (now + self.m_ttl, bytearray(seed_bytes))
+
+        return seed_bytes
+
+    def __Key(self,
+              inputs: Tuple[Union[bytes, str], ...]) -> bytes:
+        """
+        Get the cache key of the specified inputs.
+        Each input is prefixed by its length, so that different inputs cannot be joined to the same data.
+
+        Args:
+            inputs (tuple): Inputs (each element shall be str or bytes)
+
+        Returns:
+            bytes: Cache key
+        """
+        data = b""
+        for input_data in inputs:
+            input_bytes = AlgoUtils.Encode(input_data) if isinstance(input_data, str) else input_data
+            data += IntegerUtils.ToBytes(len(input_bytes), bytes_num=SeedCacheConst.INPUT_LEN_BYTE_LEN) + input_bytes
+        return self.m_hash_fct(data)
+
+    def __PurgeExpired(self,
+                       now: float) -> None:
+        """
+        Remove the expired seeds, zeroizing them (lock shall be already acquired).
+
+        Args:
+            now (float): Current time
+        """
+        expired_keys = [key for key, (expiry, _) in self.m_cache.items() if now >= expiry]
+        for key in expired_keys:
+            _, seed = self.m_cache.pop(key)
+            self.__Zeroize(seed)
+            self.m_expirations += 1
+
+    @staticmethod
+    def __Zeroize(seed: bytearray) -> None:
+        """
+        Zeroize a seed in place.
+
+        Args:
+            seed (bytearray): Seed
+        """
+        seed[:] = bytes(len(seed))
@@ -126,6 +126,9 @@ setuptools.setup(
             "typing_extensions",
         ],
         "develop": load_requirements("requirements-dev.txt"),
+        "numpy": [
+            "numpy>=1.17",
+        ],
     },
     packages=setuptools.find_packages(exclude=["*tests*"]),
     package_data={
@@ -140,8 +143,10 @@ setuptools.setup(
             "bip/bip39/wordlist/chinese_simplified.txt",
             "bip/bip39/wordlist/chinese_traditional.txt",
             "bip/bip39/wordlist/korean.txt",
+            "bip/bip39/wordlist/wordlists.bin",
             # Electrum
             "electrum/mnemonic_v1/wordlist/english.txt",
+            "electrum/mnemonic_v1/wordlist/wordlists.bin",
             # Monero
             "monero/mnemonic/wordlist/chinese_simplified.txt",
             "monero/mnemonic/wordlist/dutch.txt",
@@ -153,6 +158,7 @@ setuptools.setup(
             "monero/mnemonic/wordlist/portuguese.txt",
             "monero/mnemonic/wordlist/russian.txt",
             "monero/mnemonic/wordlist/spanish.txt",
+            "monero/mnemonic/wordlist/wordlists.bin",
         ]
     },
     keywords=load_keywords("keywords.txt"),
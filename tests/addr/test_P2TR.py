@@ -46,6 +46,23 @@ TEST_VECT = [
         },
         "address": "bc1psrgptjwnz4z8gqmt0fd4gkfc04cvhdyngdy4ya436v3zxhrp9dmsd05jqz",
     },
+    # From BIP-0086 test vectors (m/86'/0'/0'/0/0 and m/86'/0'/0'/0/1)
+    {
+        "pub_key": b"02cc8a4bc64d897bddc5fbc2f670f7a8ba0b386779106cf1223c6fc5d7cd6fc115",
+        "address_dec": b"a60869f0dbcf1dc659c9cecbaf8050135ea9e8cdc487053f1dc6880949dc684c",
+        "address_params": {
+            "hrp": CoinsConf.BitcoinMainNet.ParamByKey("p2tr_hrp"),
+        },
+        "address": "bc1p5cyxnuxmeuwuvkwfem96lqzszd02n6xdcjrs20cac6yqjjwudpxqkedrcr",
+    },
+    {
+        "pub_key": b"0283dfe85a3151d2517290da461fe2815591ef69f2b18a2ce63f01697a8b313145",
+        "address_dec": b"a82f29944d65b86ae6b5e5cc75e294ead6c59391a1edc5e016e3498c67fc7bbb",
+        "address_params": {
+            "hrp": CoinsConf.BitcoinMainNet.ParamByKey("p2tr_hrp"),
+        },
+        "address": "bc1p4qhjn9zdvkux4e44uhx8tc55attvtyu358kutcqkudyccelu0was9fqzwh",
+    },
     #
     # Test nets
     #
@@ -38,6 +38,13 @@ class AddrBaseTests(unittest.TestCase):
             self.assertEqual(test["address"], addr_enc_class.EncodeKey(pub_key_class.FromBytes(key_bytes),
                                                                        **test["address_params"]))
 
+            # Test batch encoding, with and without validation
+            for skip_validation in (False, True):
+                self.assertEqual([test["address"]] * 2,
+                                 addr_enc_class.EncodeKeys([key_bytes, pub_key_class.FromBytes(key_bytes)],
+                                                           skip_validation,
+                                                           **test["address_params"]))
+
     # Test decode address
     def _test_decode_addr(self, addr_dec_class, test_vector):
         for test in test_vector:
@@ -55,10 +62,12 @@ class AddrBaseTests(unittest.TestCase):
         # Invalid key types
         for key in test_vector_inv_types:
             self.assertRaises(TypeError, addr_enc_class.EncodeKey, key, **addr_params)
+            self.assertRaises(TypeError, addr_enc_class.EncodeKeys, [key], **addr_params)
 
         # Invalid public keys
         for key in test_vector_inv_keys:
             self.assertRaises(ValueError, addr_enc_class.EncodeKey, key, **addr_params)
+            self.assertRaises(ValueError, addr_enc_class.EncodeKeys, [key], **addr_params)
 
     # Test invalid parameters (decoding)
     def _test_invalid_params_dec(self, addr_dec_class, err_params, ex_type):
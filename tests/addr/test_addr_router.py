@@ -0,0 +1,167 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import binascii
+import unittest
+
+from bip_utils import (
+    AdaByronAddrDecoder, AdaShelleyAddrDecoder, AdaShelleyStakingAddrDecoder, AddrRouter, AddrRouterResult,
+    AlgoAddrDecoder, AptosAddrDecoder, AtomAddrDecoder, AvaxPChainAddrDecoder, AvaxXChainAddrDecoder,
+    BchP2PKHAddrDecoder, BchP2SHAddrDecoder, Bip44Conf, Bip84Conf, EgldAddrDecoder, EosAddrDecoder,
+    ErgoP2PKHAddrDecoder, EthAddrDecoder, FilSecp256k1AddrDecoder, IcxAddrDecoder, NanoAddrDecoder, NearAddrDecoder,
+    NeoAddrDecoder, OkexAddrDecoder, OneAddrDecoder, P2PKHAddrDecoder, P2SHAddrDecoder, P2TRAddrDecoder,
+    P2WPKHAddrDecoder, SolAddrDecoder, SubstrateEd25519AddrDecoder, SubstrateSr25519AddrDecoder, TrxAddrDecoder,
+    XlmAddrDecoder, XmrAddrDecoder, XmrIntegratedAddrDecoder, XrpAddrDecoder, XtzAddrDecoder, ZilAddrDecoder
+)
+from tests.addr import (
+    test_ada_byron_addr, test_ada_shelley_addr, test_algo_addr, test_aptos_addr, test_atom_addr, test_avax_addr,
+    test_bch_P2PKH, test_bch_P2SH, test_egld_addr, test_eos_addr, test_ergo_addr, test_eth_addr, test_fil_addr,
+    test_icx_addr, test_nano_addr, test_near_addr, test_neo_addr, test_okex_addr, test_one_addr, test_P2PKH, test_P2SH,
+    test_P2TR, test_P2WPKH, test_sol_addr, test_substrate_addr, test_trx_addr, test_xlm_addr, test_xmr_addr,
+    test_xrp_addr, test_xtz_addr, test_zil_addr
+)
+
+
+# Decoder classes and test vectors of all the address types
+TEST_VECT_ROUTES = [
+    (AdaByronAddrDecoder, test_ada_byron_addr.TEST_VECT_ICARUS_ADDRESS),
+    (AdaByronAddrDecoder, test_ada_byron_addr.TEST_VECT_LEGACY_ADDRESS),
+    (AdaShelleyAddrDecoder, test_ada_shelley_addr.TEST_VECT_ADDRESS),
+    (AdaShelleyStakingAddrDecoder, test_ada_shelley_addr.TEST_VECT_REWARD_ADDRESS),
+    (AlgoAddrDecoder, test_algo_addr.TEST_VECT),
+    (AptosAddrDecoder, test_aptos_addr.TEST_VECT),
+    (AtomAddrDecoder, test_atom_addr.TEST_VECT),
+    (AvaxPChainAddrDecoder, test_avax_addr.TEST_VECT["p_chain"]),
+    (AvaxXChainAddrDecoder, test_avax_addr.TEST_VECT["x_chain"]),
+    (BchP2PKHAddrDecoder, test_bch_P2PKH.TEST_VECT),
+    (BchP2SHAddrDecoder, test_bch_P2SH.TEST_VECT),
+    (EgldAddrDecoder, test_egld_addr.TEST_VECT),
+    (EosAddrDecoder, test_eos_addr.TEST_VECT),
+    (ErgoP2PKHAddrDecoder, test_ergo_addr.TEST_VECT),
+    (EthAddrDecoder, test_eth_addr.TEST_VECT),
+    (FilSecp256k1AddrDecoder, test_fil_addr.TEST_VECT),
+    (IcxAddrDecoder, test_icx_addr.TEST_VECT),
+    (NanoAddrDecoder, test_nano_addr.TEST_VECT),
+    (NearAddrDecoder, test_near_addr.TEST_VECT),
+    (NeoAddrDecoder, test_neo_addr.TEST_VECT),
+    (OkexAddrDecoder, test_okex_addr.TEST_VECT),
+    (OneAddrDecoder, test_one_addr.TEST_VECT),
+    (P2PKHAddrDecoder, test_P2PKH.TEST_VECT),
+    (P2SHAddrDecoder, test_P2SH.TEST_VECT),
+    (P2TRAddrDecoder, test_P2TR.TEST_VECT),
+    (P2WPKHAddrDecoder, test_P2WPKH.TEST_VECT),
+    (SolAddrDecoder, test_sol_addr.TEST_VECT),
+    (SubstrateEd25519AddrDecoder, test_substrate_addr.TEST_VECT),
+    (SubstrateSr25519AddrDecoder, test_substrate_addr.TEST_VECT),
+    (TrxAddrDecoder, test_trx_addr.TEST_VECT),
+    (XlmAddrDecoder, test_xlm_addr.TEST_VECT),
+    (XmrAddrDecoder, test_xmr_addr.TEST_VECT),
+    (XmrIntegratedAddrDecoder, test_xmr_addr.TEST_VECT_INTEGRATED),
+    (XrpAddrDecoder, test_xrp_addr.TEST_VECT),
+    (XtzAddrDecoder, test_xtz_addr.TEST_VECT),
+    (ZilAddrDecoder, test_zil_addr.TEST_VECT),
+]
+
+# Invalid addresses
+TEST_VECT_INVALID = [
+    # Unknown format
+    ("", "Unknown address format"),
+    ("invalid", "Unknown address format"),
+    ("xyz1qqqsyqcyq5rqwzqfpg9scrgwpugpzysnzs23v7q", "Unknown address format"),
+    # Known format, invalid checksum
+    ("1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN3", "Invalid base58 checksum"),
+    ("bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t5", "Invalid bech32 checksum"),
+    # Known format, invalid checksum encoding
+    ("0x52908400098527886E0F7030069857D2E4169Ee7", "Invalid checksum encoding"),
+]
+
+
+#
+# Tests
+#
+class AddrRouterTests(unittest.TestCase):
+    # Test decoding of all address types
+    def test_decode(self):
+        addr_router = AddrRouter()
+        for decoder_cls, test_vect in TEST_VECT_ROUTES:
+            for i, test in enumerate(test_vect):
+                addr_router.AddRoute(f"{decoder_cls.__name__}_{i}", decoder_cls, test["address_params"])
+
+        for decoder_cls, test_vect in TEST_VECT_ROUTES:
+            for i, test in enumerate(test_vect):
+                res = addr_router.Decode(test["address"])
+                self.assertIsNone(res.error)
+                self.assertIn(f"{decoder_cls.__name__}_{i}", res.coins)
+                self.assertEqual(binascii.unhexlify(test["address_dec"]), res.payload)
+
+    # Test routes from coin configurations
+    def test_from_coin_confs(self):
+        addr_router = AddrRouter.FromCoinConfs(
+            [Bip44Conf.BitcoinMainNet, Bip44Conf.BitcoinSvMainNet, Bip44Conf.Ethereum, Bip44Conf.Polygon,
+             Bip44Conf.Cosmos, Bip84Conf.BitcoinMainNet]
+        )
+
+        # Coins with the same address format share the route
+        self.assertEqual(
+            AddrRouterResult(("Ethereum", "Polygon"),
+                             binascii.unhexlify(b"52908400098527886e0f7030069857d2e4169ee7"),
+                             None),
+            addr_router.Decode("0x52908400098527886E0F7030069857D2E4169EE7")
+        )
+        self.assertEqual(
+            AddrRouterResult(("Bitcoin", "BitcoinSV"),
+                             binascii.unhexlify(b"77bff20c60e522dfaa3350c39b030a5d004e839a"),
+                             None),
+            addr_router.Decode("1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2")
+        )
+        # Uppercase Bech32
+        self.assertEqual(
+            AddrRouterResult(("Bitcoin",),
+                             binascii.unhexlify(b"751e76e8199196d454941c45d1b3a323f1433bd6"),
+                             None),
+            addr_router.Decode("BC1QW508D6QEJXTDG4Y5R3ZARVARY0C5XW7KV8F3T4")
+        )
+
+    # Test batch decoding
+    def test_decode_many(self):
+        addr_router = AddrRouter.FromCoinConfs([Bip44Conf.BitcoinMainNet, Bip44Conf.Ethereum])
+        addrs = ["1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2", "invalid", "0x52908400098527886E0F7030069857D2E4169EE7"]
+
+        res = list(addr_router.DecodeMany(addrs))
+        self.assertEqual([addr_router.Decode(addr) for addr in addrs], res)
+        self.assertEqual([("Bitcoin",), (), ("Ethereum",)], [r.coins for r in res])
+
+    # Test invalid addresses
+    def test_invalid(self):
+        addr_router = AddrRouter.FromCoinConfs(
+            [Bip44Conf.BitcoinMainNet, Bip44Conf.Ethereum, Bip44Conf.Cosmos, Bip84Conf.BitcoinMainNet]
+        )
+        for addr, err in TEST_VECT_INVALID:
+            self.assertEqual(AddrRouterResult((), None, err), addr_router.Decode(addr))
+
+    # Test unsupported address class
+    def test_unsupported_addr_cls(self):
+        class _CoinConf:
+            def AddrClass(self):
+                return object
+
+        self.assertRaises(ValueError, AddrRouter().AddCoinConf, _CoinConf())
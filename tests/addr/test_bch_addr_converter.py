@@ -21,7 +21,7 @@
 # Imports
 import unittest
 
-from bip_utils import BchAddrConverter
+from bip_utils import BchAddrConverter, BchAddrConverterResult, Bech32ChecksumError
 
 
 # Some random addresses
@@ -59,6 +59,50 @@ TEST_VECT = [
 ]
 
 
+# Legacy addresses (from CashAddr specification)
+TEST_VECT_LEGACY = [
+    {
+        "legacy": "1BpEi6DfDAUFd7GtittLSdBeYJvcoaVggu",
+        "hrp": "bitcoincash",
+        "cash_addr": "bitcoincash:qpm2qsznhks23z7629mms6s4cwef74vcwvy22gdx6a",
+    },
+    {
+        "legacy": "1KXrWXciRDZUpQwQmuM1DbwsKDLYAYsVLR",
+        "hrp": "bitcoincash",
+        "cash_addr": "bitcoincash:qr95sy3j9xwd2ap32xkykttr4cvcu7as4y0qverfuy",
+    },
+    {
+        "legacy": "3CWFddi6m4ndiGyKqzYvsFYagqDLPVMTzC",
+        "hrp": "bitcoincash",
+        "cash_addr": "bitcoincash:ppm2qsznhks23z7629mms6s4cwef74vcwvn0h829pq",
+    },
+    {
+        "legacy": "3LDsS579y7sruadqu11beEJoTjdFiFCdX4",
+        "hrp": "bitcoincash",
+        "cash_addr": "bitcoincash:pr95sy3j9xwd2ap32xkykttr4cvcu7as4yc93ky28e",
+    },
+]
+
+# Invalid addresses
+TEST_VECT_CONV_INVALID = [
+    # Invalid checksum
+    "bitcoincash:qp90dvzptg759efdcd93s4dkdw0vuhlkmqlch7letr",
+    # No separator
+    "qp90dvzptg759efdcd93s4dkdw0vuhlkmqlch7letq",
+    # Mixed case
+    "bitcoincash:Qp90dvzptg759efdcd93s4dkdw0vuhlkmqlch7letq",
+    # Non-zero padding bits
+    "bitcoincash:qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqp6swafeus",
+]
+
+TEST_VECT_LEGACY_INVALID = [
+    # Invalid checksum
+    "1BpEi6DfDAUFd7GtittLSdBeYJvcoaVggv",
+    # Invalid net version
+    "LVg2kJoFNg45Nbpy53h7Fe1wKyeXVRhMH9",
+]
+
+
 #
 # Tests
 #
@@ -68,3 +112,63 @@ class BchAddrConverterTests(unittest.TestCase):
         for test in TEST_VECT:
             conv_addr = BchAddrConverter.Convert(test["address"], test["new_hrp"], test["new_net_ver"])
             self.assertEqual(test["conv_address"], conv_addr)
+
+    # Test empty net version (same of not specifying it)
+    def test_empty_net_ver(self):
+        for test in TEST_VECT:
+            self.assertEqual(BchAddrConverter.Convert(test["address"], test["new_hrp"]),
+                             BchAddrConverter.Convert(test["address"], test["new_hrp"], b""))
+
+    # Test many
+    def test_many(self):
+        for test in TEST_VECT:
+            res = BchAddrConverter.ConvertMany([test["address"]], test["new_hrp"], test["new_net_ver"])
+            self.assertEqual([BchAddrConverterResult(test["conv_address"], None)], res)
+
+        res = BchAddrConverter.ConvertMany(
+            [TEST_VECT[0]["address"]] + TEST_VECT_CONV_INVALID + [TEST_VECT[0]["address"].upper()],
+            TEST_VECT[0]["new_hrp"]
+        )
+        self.assertEqual(len(TEST_VECT_CONV_INVALID) + 2, len(res))
+        self.assertEqual(TEST_VECT[0]["conv_address"], res[0].address)
+        self.assertEqual(TEST_VECT[0]["conv_address"], res[-1].address)
+        for r in res[1:-1]:
+            self.assertIsNone(r.address)
+            self.assertIsNotNone(r.error)
+
+    # Test invalid conversion
+    def test_invalid(self):
+        for addr in TEST_VECT_CONV_INVALID:
+            for net_ver in (None, b"", b"\x00", b"\x00\x00"):
+                self.assertRaises((Bech32ChecksumError, ValueError), BchAddrConverter.Convert, addr, "ecash", net_ver)
+
+    # Test legacy conversion
+    def test_legacy(self):
+        for test in TEST_VECT_LEGACY:
+            self.assertEqual(test["cash_addr"], BchAddrConverter.LegacyToCashAddr(test["legacy"], test["hrp"]))
+            self.assertEqual(test["legacy"], BchAddrConverter.CashAddrToLegacy(test["cash_addr"]))
+            self.assertEqual(test["legacy"], BchAddrConverter.CashAddrToLegacy(test["cash_addr"].upper()))
+
+        res = BchAddrConverter.LegacyToCashAddrMany([test["legacy"] for test in TEST_VECT_LEGACY], "bitcoincash")
+        self.assertEqual([BchAddrConverterResult(test["cash_addr"], None) for test in TEST_VECT_LEGACY], res)
+        res = BchAddrConverter.CashAddrToLegacyMany([test["cash_addr"] for test in TEST_VECT_LEGACY])
+        self.assertEqual([BchAddrConverterResult(test["legacy"], None) for test in TEST_VECT_LEGACY], res)
+
+        # Test net versions
+        cash_addr = BchAddrConverter.LegacyToCashAddr("mipcBbFg9gMiCh81Kj8tqqdgoZub1ZJRfn", "bchtest", b"\x6f", b"\xc4")
+        self.assertEqual("bchtest:qqjr7yu573z4faxw8ltgvjwpntwys08fysk07zmvce", cash_addr)
+        self.assertEqual("mipcBbFg9gMiCh81Kj8tqqdgoZub1ZJRfn",
+                         BchAddrConverter.CashAddrToLegacy(cash_addr, b"\x6f", b"\xc4"))
+
+    # Test invalid legacy conversion
+    def test_legacy_invalid(self):
+        for res in BchAddrConverter.LegacyToCashAddrMany(TEST_VECT_LEGACY_INVALID, "bitcoincash"):
+            self.assertIsNone(res.address)
+            self.assertIsNotNone(res.error)
+        for res in BchAddrConverter.CashAddrToLegacyMany(TEST_VECT_CONV_INVALID):
+            self.assertIsNone(res.address)
+            self.assertIsNotNone(res.error)
+
+        # Invalid net version
+        self.assertRaises(ValueError, BchAddrConverter.CashAddrToLegacy,
+                          BchAddrConverter.Convert(TEST_VECT[0]["address"], "bitcoincash", b"\x01"))
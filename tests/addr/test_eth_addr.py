@@ -74,6 +74,13 @@ TEST_VECT_DEC_INVALID = [
     "0xA2cA1D082016421489b7891091CA1CF0D2d1220e1",
 ]
 
+# Addresses with valid format but not checksum encoded
+TEST_VECT_NO_CHKSUM_ENC = [
+    "0x4d46542bda7ff01f583e8459125c91d56d2426cf",
+    "0x8C5F5279DD5A5DEE331D629620FE6F3E7C73D21E",
+    "0x8C5F5279DD5a5deE331d629620Fe6f3e7c73d21E",
+]
+
 
 #
 # Tests
@@ -91,6 +98,33 @@ class EthAddrTests(AddrBaseTests):
     def test_invalid_dec(self):
         self._test_invalid_dec(EthAddrDecoder, {}, TEST_VECT_DEC_INVALID)
 
+    # Test checksum encoding of many addresses
+    def test_checksum_encode_many(self):
+        self.assertEqual(
+            [TEST_VECT[0]["address"], TEST_VECT[1]["address"], TEST_VECT[1]["address"]],
+            EthAddrEncoder.ChecksumEncodeMany(TEST_VECT_NO_CHKSUM_ENC)
+        )
+        self.assertEqual(
+            [test["address"] for test in TEST_VECT[:3]],
+            EthAddrEncoder.ChecksumEncodeMany([test["address"] for test in TEST_VECT[:3]])
+        )
+
+        for addr in TEST_VECT_DEC_INVALID[:1] + TEST_VECT_DEC_INVALID[2:]:
+            self.assertRaises(ValueError, EthAddrEncoder.ChecksumEncodeMany, [addr])
+
+    # Test validation of many addresses
+    def test_is_valid_many(self):
+        addrs = [test["address"] for test in TEST_VECT[:3]] + TEST_VECT_DEC_INVALID + TEST_VECT_NO_CHKSUM_ENC
+
+        self.assertEqual(
+            [True] * 3 + [False] * (len(TEST_VECT_DEC_INVALID) + len(TEST_VECT_NO_CHKSUM_ENC)),
+            EthAddrDecoder.IsValidMany(addrs)
+        )
+        self.assertEqual(
+            [True] * 3 + [False, True, False, False] + [True] * len(TEST_VECT_NO_CHKSUM_ENC),
+            EthAddrDecoder.IsValidMany(addrs, skip_chksum_enc=True)
+        )
+
     # Test invalid keys
     def test_invalid_keys(self):
         self._test_invalid_keys(
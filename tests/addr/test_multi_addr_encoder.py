@@ -0,0 +1,115 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+
+from bip_utils import (
+    AtomAddrEncoder, AvaxPChainAddrEncoder, AvaxXChainAddrEncoder, BchP2PKHAddrEncoder, BchP2SHAddrEncoder, CoinsConf,
+    EgldAddrEncoder, EthAddrEncoder, MultiAddrEncoder, OkexAddrEncoder, OneAddrEncoder, P2PKHAddrEncoder,
+    P2PKHPubKeyModes, P2SHAddrEncoder, P2TRAddrEncoder, P2WPKHAddrEncoder, SubstrateEd25519AddrEncoder,
+    SubstrateSr25519AddrEncoder, TrxAddrEncoder, XrpAddrEncoder, ZilAddrEncoder
+)
+from tests.ecc.test_ecc import (
+    TEST_ED25519_COMPR_PUB_KEY_BYTES, TEST_ED25519_PUB_KEY, TEST_SECP256K1_COMPR_PUB_KEY_BYTES, TEST_SECP256K1_PUB_KEY,
+    TEST_SR25519_COMPR_PUB_KEY_BYTES, TEST_SR25519_PUB_KEY
+)
+
+
+# Secp256k1 encoders (both with and without shared encoders)
+TEST_SECP256K1_ENCODERS = [
+    (P2PKHAddrEncoder, {"net_ver": CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver")}),
+    (P2PKHAddrEncoder, {"net_ver": CoinsConf.BitcoinMainNet.ParamByKey("p2pkh_net_ver"),
+                        "pub_key_mode": P2PKHPubKeyModes.UNCOMPRESSED}),
+    (P2SHAddrEncoder, {"net_ver": CoinsConf.BitcoinMainNet.ParamByKey("p2sh_net_ver")}),
+    (P2WPKHAddrEncoder, {"hrp": CoinsConf.BitcoinMainNet.ParamByKey("p2wpkh_hrp")}),
+    (P2TRAddrEncoder, {"hrp": CoinsConf.BitcoinMainNet.ParamByKey("p2tr_hrp")}),
+    (P2TRAddrEncoder, {"hrp": CoinsConf.BitcoinTestNet.ParamByKey("p2tr_hrp")}),
+    (BchP2PKHAddrEncoder, {"hrp": CoinsConf.BitcoinCashMainNet.ParamByKey("p2pkh_std_hrp"),
+                           "net_ver": CoinsConf.BitcoinCashMainNet.ParamByKey("p2pkh_std_net_ver")}),
+    (BchP2SHAddrEncoder, {"hrp": CoinsConf.BitcoinCashMainNet.ParamByKey("p2sh_std_hrp"),
+                          "net_ver": CoinsConf.BitcoinCashMainNet.ParamByKey("p2sh_std_net_ver")}),
+    (AtomAddrEncoder, {"hrp": CoinsConf.Cosmos.ParamByKey("addr_hrp")}),
+    (AtomAddrEncoder, {"hrp": CoinsConf.Kava.ParamByKey("addr_hrp")}),
+    (AvaxPChainAddrEncoder, {}),
+    (AvaxXChainAddrEncoder, {}),
+    (EthAddrEncoder, {}),
+    (EthAddrEncoder, {"skip_chksum_enc": True}),
+    (OkexAddrEncoder, {}),
+    (OneAddrEncoder, {}),
+    (TrxAddrEncoder, {}),
+    (XrpAddrEncoder, {}),
+    (ZilAddrEncoder, {}),
+]
+
+# Substrate formats
+TEST_SUBSTRATE_FORMATS = [
+    CoinsConf.Polkadot.ParamByKey("addr_ss58_format"),
+    CoinsConf.Kusama.ParamByKey("addr_ss58_format"),
+    CoinsConf.Acala.ParamByKey("addr_ss58_format"),
+]
+
+
+#
+# Tests
+#
+class MultiAddrEncoderTests(unittest.TestCase):
+    # Test secp256k1 encoders
+    def test_secp256k1(self):
+        for pub_key in (TEST_SECP256K1_COMPR_PUB_KEY_BYTES, TEST_SECP256K1_PUB_KEY):
+            self.assertEqual(
+                [encoder_cls.EncodeKey(pub_key, **params) for encoder_cls, params in TEST_SECP256K1_ENCODERS],
+                MultiAddrEncoder.EncodeKey(pub_key, TEST_SECP256K1_ENCODERS)
+            )
+
+    # Test Substrate encoders
+    def test_substrate(self):
+        for encoder_cls, pub_keys in ((SubstrateEd25519AddrEncoder, (TEST_ED25519_COMPR_PUB_KEY_BYTES,
+                                                                     TEST_ED25519_PUB_KEY)),
+                                      (SubstrateSr25519AddrEncoder, (TEST_SR25519_COMPR_PUB_KEY_BYTES,
+                                                                     TEST_SR25519_PUB_KEY))):
+            encoders = [(encoder_cls, {"ss58_format": ss58_format}) for ss58_format in TEST_SUBSTRATE_FORMATS]
+            for pub_key in pub_keys:
+                self.assertEqual(
+                    [encoder_cls.EncodeKey(pub_key, **params) for encoder_cls, params in encoders],
+                    MultiAddrEncoder.EncodeKey(pub_key, encoders)
+                )
+
+    # Test mixed curves
+    def test_mixed_curves(self):
+        encoders = [
+            (EgldAddrEncoder, {}),
+            (SubstrateEd25519AddrEncoder, {"ss58_format": 0}),
+        ]
+        self.assertEqual(
+            [encoder_cls.EncodeKey(TEST_ED25519_PUB_KEY, **params) for encoder_cls, params in encoders],
+            MultiAddrEncoder.EncodeKey(TEST_ED25519_PUB_KEY, encoders)
+        )
+        self.assertEqual([], MultiAddrEncoder.EncodeKey(TEST_ED25519_PUB_KEY, []))
+
+    # Test invalid keys
+    def test_invalid_keys(self):
+        # Wrong key type (both for encoders with and without shared values)
+        self.assertRaises(TypeError, MultiAddrEncoder.EncodeKey, TEST_ED25519_PUB_KEY, TEST_SECP256K1_ENCODERS[:1])
+        self.assertRaises(TypeError, MultiAddrEncoder.EncodeKey, TEST_ED25519_PUB_KEY, TEST_SECP256K1_ENCODERS[-1:])
+        self.assertRaises(TypeError, MultiAddrEncoder.EncodeKey, TEST_SECP256K1_PUB_KEY,
+                          [(SubstrateSr25519AddrEncoder, {"ss58_format": 0})])
+        # Invalid key bytes
+        self.assertRaises(ValueError, MultiAddrEncoder.EncodeKey, b"\x00" * 33, TEST_SECP256K1_ENCODERS[:1])
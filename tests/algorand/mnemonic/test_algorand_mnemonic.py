@@ -24,9 +24,10 @@ import unittest
 
 from bip_utils import (
     AlgorandEntropyBitLen, AlgorandEntropyGenerator, AlgorandLanguages, AlgorandMnemonicDecoder,
-    AlgorandMnemonicGenerator, AlgorandMnemonicValidator, AlgorandSeedGenerator, AlgorandWordsNum, Bip44, Bip44Coins,
-    MnemonicChecksumError
+    AlgorandMnemonicEncoder, AlgorandMnemonicGenerator, AlgorandMnemonicValidator, AlgorandSeedGenerator,
+    AlgorandWordsNum, Bip44, Bip44Coins, MnemonicChecksumError
 )
+from bip_utils.algorand.mnemonic.algorand_mnemonic_utils import AlgorandMnemonicUtils
 
 
 # Verified with the official Algorand wallet: https://wallet.myalgo.com/
@@ -197,6 +198,38 @@ class AlgorandMnemonicTests(unittest.TestCase):
             self.assertRaises(ValueError, AlgorandMnemonicGenerator().FromWordsNumber, test_words_num - 1)
             self.assertRaises(ValueError, AlgorandMnemonicGenerator().FromWordsNumber, test_words_num + 1)
 
+    # Test mass generation
+    def test_many(self):
+        for test_words_num in AlgorandWordsNum:
+            mnemonics = AlgorandMnemonicGenerator().FromWordsNumberMany(test_words_num, 10)
+            self.assertEqual(10, len(mnemonics))
+            for mnemonic in mnemonics:
+                self.assertEqual(test_words_num, mnemonic.WordsCount())
+                self.assertTrue(AlgorandMnemonicValidator().IsValid(mnemonic))
+            self.assertRaises(ValueError, AlgorandMnemonicGenerator().FromWordsNumberMany, test_words_num + 1, 1)
+
+        entropies = [binascii.unhexlify(test["entropy"]) for test in TEST_VECT]
+        mnemonics = AlgorandMnemonicGenerator().FromEntropyMany(entropies)
+        self.assertEqual([test["mnemonic"] for test in TEST_VECT], [mnemonic.ToStr() for mnemonic in mnemonics])
+
+        # Test batch encoding/decoding
+        mnemonics = AlgorandMnemonicEncoder().EncodeMany(entropies)
+        self.assertEqual([test["mnemonic"] for test in TEST_VECT], [mnemonic.ToStr() for mnemonic in mnemonics])
+        self.assertEqual(entropies, AlgorandMnemonicDecoder().DecodeMany(mnemonics))
+        self.assertEqual(entropies, AlgorandMnemonicDecoder().DecodeMany([test["mnemonic"] for test in TEST_VECT]))
+        self.assertRaises(ValueError, AlgorandMnemonicEncoder().EncodeMany, entropies + [b"\x00" * 31])
+
+    # Test bit stream conversion (same result of the generic bit conversion)
+    def test_bit_stream(self):
+        for test in TEST_VECT:
+            entropy = binascii.unhexlify(test["entropy"])
+            word_indexes = AlgorandMnemonicUtils.ConvertBits(entropy, 8, 11)
+
+            self.assertEqual(word_indexes, AlgorandMnemonicUtils.BytesToWordIndexes(entropy))
+            self.assertEqual(entropy, AlgorandMnemonicUtils.WordIndexesToBytes(word_indexes, len(entropy)))
+            self.assertEqual(AlgorandMnemonicUtils.ConvertBits(AlgorandMnemonicUtils.ComputeChecksum(entropy), 8, 11)[0],
+                             AlgorandMnemonicUtils.ComputeChecksumWordIndex(entropy))
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
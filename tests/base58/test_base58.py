@@ -233,15 +233,32 @@ class Base58Tests(unittest.TestCase):
             self.assertEqual(test["check_encode"],
                              Base58Encoder.CheckEncode(raw_bytes, Base58Alphabets.RIPPLE))
 
+    # Test bulk encoder and decoder
+    def test_many(self):
+        for alph_idx, test_vect in ((Base58Alphabets.BITCOIN, TEST_VECT_BTC), (Base58Alphabets.RIPPLE, TEST_VECT_XRP)):
+            raw_bytes = [binascii.unhexlify(test["raw"]) for test in test_vect]
+
+            self.assertEqual([test["encode"] for test in test_vect],
+                             Base58Encoder.EncodeMany(raw_bytes, alph_idx))
+            self.assertEqual([test["check_encode"] for test in test_vect],
+                             Base58Encoder.CheckEncodeMany(iter(raw_bytes), alph_idx))
+            self.assertEqual(raw_bytes,
+                             Base58Decoder.DecodeMany((test["encode"] for test in test_vect), alph_idx))
+            self.assertEqual(raw_bytes,
+                             Base58Decoder.CheckDecodeMany([test["check_encode"] for test in test_vect], alph_idx))
+
     # Test invalid checksum
     def test_invalid_checksum(self):
         for test in TEST_VECT_CHKSUM_INVALID:
             self.assertRaises(Base58ChecksumError, Base58Decoder.CheckDecode, test)
+            self.assertRaises(Base58ChecksumError,
+                              Base58Decoder.CheckDecodeMany, [TEST_VECT_BTC[0]["check_encode"], test])
 
     # Test invalid calls to decode
     def test_invalid_decode(self):
         for test in TEST_VECT_DEC_INVALID:
             self.assertRaises(ValueError, Base58Decoder.Decode, test)
+            self.assertRaises(ValueError, Base58Decoder.DecodeMany, [test])
 
     # Test invalid alphabet
     def test_invalid_alphabet(self):
@@ -249,3 +266,7 @@ class Base58Tests(unittest.TestCase):
         self.assertRaises(TypeError, Base58Encoder.CheckEncode, "test", 0)
         self.assertRaises(TypeError, Base58Decoder.Decode, "test", 0)
         self.assertRaises(TypeError, Base58Decoder.CheckDecode, "test", 0)
+        self.assertRaises(TypeError, Base58Encoder.EncodeMany, [b"test"], 0)
+        self.assertRaises(TypeError, Base58Encoder.CheckEncodeMany, [b"test"], 0)
+        self.assertRaises(TypeError, Base58Decoder.DecodeMany, ["test"], 0)
+        self.assertRaises(TypeError, Base58Decoder.CheckDecodeMany, ["test"], 0)
@@ -0,0 +1,108 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import unittest
+
+from bip_utils import Base58Alphabets, Base58BulkValidator, Base58Encoder
+
+
+# Test vector (P2PKH/P2SH-like payloads)
+TEST_VECT_PAYLOADS = [
+    b"0077bff20c60e522dfaa3350c39b030a5d004e839a",
+    b"05b472a266d0bd89c13706a4132ccfb16f7c3b9fcb",
+    b"00000000000000000000000000000000000000000a",
+    b"6fffffffffffffffffffffffffffffffffffffffff",
+]
+
+# Test vector for invalid strings (index of the valid address to be modified, modifying function)
+TEST_VECT_INVALID = [
+    # Invalid checksum
+    (0, lambda s: s[:-1] + ("2" if s[-1] != "2" else "3")),
+    # Invalid character
+    (1, lambda s: s[:5] + "0" + s[6:]),
+    # Non-ASCII character
+    (1, lambda s: s[:5] + "é" + s[6:]),
+    # Too big value
+    (0, lambda s: "z" * len(s)),
+    # All zeros
+    (0, lambda s: "1" * len(s)),
+    # Longer decoded length
+    (1, lambda s: "1" + s[:-1]),
+    # Shorter string
+    (1, lambda s: s[:-1]),
+]
+
+
+#
+# Tests
+#
+class Base58BulkValidatorTests(unittest.TestCase):
+    # Test valid and invalid strings with both the available implementations
+    def test_check_decode(self):
+        for alph_idx in Base58Alphabets:
+            payloads = [binascii.unhexlify(p) for p in TEST_VECT_PAYLOADS]
+            addrs = Base58Encoder.CheckEncodeMany(payloads, alph_idx)
+            addrs_inv = [modify(addrs[idx]) for idx, modify in TEST_VECT_INVALID]
+
+            for use_numpy in self.__UseNumpyValues():
+                payloads_got, valid_mask = Base58BulkValidator.CheckDecode(addrs + addrs_inv,
+                                                                           len(payloads[0]),
+                                                                           alph_idx,
+                                                                           use_numpy)
+
+                self.assertEqual([True] * len(addrs) + [False] * len(addrs_inv), [bool(v) for v in valid_mask])
+                self.assertEqual(payloads, [bytes(p) for p in payloads_got[:len(addrs)]])
+                for payload in payloads_got[len(addrs):]:
+                    self.assertFalse(any(payload))
+
+    # Test empty input with both the available implementations
+    def test_empty(self):
+        for use_numpy in self.__UseNumpyValues():
+            payloads_got, valid_mask = Base58BulkValidator.CheckDecode([], 21, use_numpy=use_numpy)
+
+            self.assertEqual(0, len(payloads_got))
+            self.assertEqual(0, len(valid_mask))
+
+    # Test NumPy arrays of str and bytes
+    @unittest.skipUnless(Base58BulkValidator.IsNumpyAvailable(), "NumPy not installed")
+    def test_numpy_arrays(self):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        payloads = [binascii.unhexlify(p) for p in TEST_VECT_PAYLOADS]
+        addrs = Base58Encoder.CheckEncodeMany(payloads)
+
+        for addrs_arr in (np.array(addrs), np.array(addrs).astype("S")):
+            payloads_got, valid_mask = Base58BulkValidator.CheckDecode(addrs_arr, len(payloads[0]))
+
+            self.assertEqual((len(payloads), len(payloads[0])), payloads_got.shape)
+            self.assertTrue(valid_mask.all())
+            self.assertEqual(payloads, [p.tobytes() for p in payloads_got])
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(TypeError, Base58BulkValidator.CheckDecode, ["test"], 21, 0)
+        self.assertRaises(ValueError, Base58BulkValidator.CheckDecode, ["test"], 0)
+
+    # Get the values for the use_numpy parameter to be tested
+    @staticmethod
+    def __UseNumpyValues():
+        return (True, False) if Base58BulkValidator.IsNumpyAvailable() else (False,)
@@ -86,6 +86,16 @@ TEST_VECT = [
     }
 ]
 
+# Test vector for invalid Monero strings
+TEST_VECT_XMR_DEC_INVALID = [
+    # Invalid last block length
+    "1",
+    "111111111111111",
+    # Block overflow
+    "zzzzzzzzzzz",
+    "11111111111zzzzzzzzzz",
+]
+
 
 #
 # Tests
@@ -103,7 +113,16 @@ class Base58XmrTests(unittest.TestCase):
             self.assertEqual(test["encode"],
                              Base58XmrEncoder.Encode(binascii.unhexlify(test["raw"])))
 
+    # Test many
+    def test_many(self):
+        enc = Base58XmrEncoder.EncodeMany(binascii.unhexlify(test["raw"]) for test in TEST_VECT)
+        self.assertEqual([test["encode"] for test in TEST_VECT], enc)
+
+        dec = Base58XmrDecoder.DecodeMany(enc)
+        self.assertEqual([test["raw"] for test in TEST_VECT], [binascii.hexlify(d) for d in dec])
+
     # Test invalid calls to decode
     def test_invalid_decode(self):
-        for test in TEST_VECT_DEC_INVALID:
+        for test in TEST_VECT_DEC_INVALID + TEST_VECT_XMR_DEC_INVALID:
             self.assertRaises(ValueError, Base58XmrDecoder.Decode, test)
+        self.assertRaises(ValueError, Base58XmrDecoder.DecodeMany, TEST_VECT_XMR_DEC_INVALID)
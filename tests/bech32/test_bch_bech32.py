@@ -22,7 +22,7 @@
 import binascii
 import unittest
 
-from bip_utils import BchBech32Decoder, BchBech32Encoder, CoinsConf
+from bip_utils import BchBech32Decoder, BchBech32Encoder, Bech32ChecksumError, CoinsConf
 
 
 # Some random public keys
@@ -88,7 +88,42 @@ class BchBech32Tests(unittest.TestCase):
                                           binascii.unhexlify(test["raw"]))
             self.assertEqual(test["encode"], enc)
 
+    # Test many
+    def test_many(self):
+        net_ver = CoinsConf.BitcoinCashMainNet.ParamByKey("p2pkh_std_net_ver")
+        for hrp in ("bitcoincash", "bchtest"):
+            tests = [test for test in TEST_VECT if test["encode"].startswith(hrp + ":")]
+
+            enc = BchBech32Encoder.EncodeMany(hrp, net_ver, (binascii.unhexlify(test["raw"]) for test in tests))
+            self.assertEqual([test["encode"] for test in tests], enc)
+
+            dec = BchBech32Decoder.DecodeMany(hrp, enc)
+            self.assertEqual([(net_ver, test["raw"]) for test in tests], [(n, binascii.hexlify(d)) for n, d in dec])
+            self.assertEqual([True] * len(tests), BchBech32Decoder.IsValidMany(hrp, enc))
+
+    # Test base32 and HRP replacement
+    def test_base32(self):
+        net_ver = CoinsConf.BitcoinCashMainNet.ParamByKey("p2pkh_std_net_ver")
+        for test in TEST_VECT:
+            hrp, data = BchBech32Decoder.DecodeBase32(test["encode"])
+            self.assertEqual(test["encode"], BchBech32Encoder.EncodeBase32(hrp, data))
+
+            for new_hrp in ("ecash", "simpleledger", hrp):
+                enc = BchBech32Encoder.Encode(new_hrp, net_ver, binascii.unhexlify(test["raw"]))
+                self.assertEqual(enc, BchBech32Encoder.ReplaceHrp(test["encode"], new_hrp))
+                self.assertEqual(enc, BchBech32Encoder.ReplaceHrp(test["encode"].upper(), new_hrp))
+
+            # Invalid checksum
+            addr = test["encode"][:-1] + ("q" if test["encode"][-1] != "q" else "p")
+            self.assertRaises(Bech32ChecksumError, BchBech32Encoder.ReplaceHrp, addr, "ecash")
+
+        # Non-zero padding bits
+        addr = "bitcoincash:qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqp6swafeus"
+        self.assertRaises(ValueError, BchBech32Decoder.DecodeBase32, addr)
+        self.assertRaises(ValueError, BchBech32Encoder.ReplaceHrp, addr, "ecash")
+
     # Test invalid address
     def test_invalid_addr(self):
         for test in TEST_VECT_ADDR_INVALID:
             self.assertRaises(ValueError, BchBech32Decoder.Decode, test["hrp"], test["addr"])
+            self.assertEqual([False], BchBech32Decoder.IsValidMany(test["hrp"], [test["addr"]]))
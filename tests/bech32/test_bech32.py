@@ -23,6 +23,7 @@ import binascii
 import unittest
 
 from bip_utils import Bech32Decoder, Bech32Encoder
+from bip_utils.bech32.bech32_base import Bech32BaseUtils
 
 
 # Some random public keys
@@ -76,7 +77,37 @@ class Bech32Tests(unittest.TestCase):
             enc = Bech32Encoder.Encode(hrp, binascii.unhexlify(test["raw"]))
             self.assertEqual(test["encode"], enc)
 
+    # Test many
+    def test_many(self):
+        for hrp in ("cosmos", "band"):
+            tests = [test for test in TEST_VECT if test["encode"].startswith(hrp + "1")]
+
+            enc = Bech32Encoder.EncodeMany(hrp, (binascii.unhexlify(test["raw"]) for test in tests))
+            self.assertEqual([test["encode"] for test in tests], enc)
+
+            dec = Bech32Decoder.DecodeMany(hrp, enc)
+            self.assertEqual([test["raw"] for test in tests], [binascii.hexlify(d) for d in dec])
+            self.assertEqual([True] * len(tests), Bech32Decoder.IsValidMany(hrp, enc))
+
+    # Test bits conversion
+    def test_convert_bits(self):
+        self.assertEqual([], Bech32BaseUtils.ConvertBits(b"", 8, 5))
+        self.assertEqual([31, 28], Bech32BaseUtils.ConvertBits(b"\xff", 8, 5))
+        self.assertEqual([255], Bech32BaseUtils.ConvertBits([31, 28], 5, 8, False))
+        self.assertEqual([7, 7, 6], Bech32BaseUtils.ConvertBits(b"\xff", 8, 3))
+        self.assertEqual([255], Bech32BaseUtils.ConvertBits([7, 7, 6], 3, 8, False))
+        # Invalid values
+        self.assertIsNone(Bech32BaseUtils.ConvertBits([256], 8, 5))
+        self.assertIsNone(Bech32BaseUtils.ConvertBits([32], 5, 8, False))
+        self.assertIsNone(Bech32BaseUtils.ConvertBits([-1], 5, 8, False))
+        self.assertIsNone(Bech32BaseUtils.ConvertBits([8], 3, 8, False))
+        # Invalid padding
+        self.assertIsNone(Bech32BaseUtils.ConvertBits([31, 29], 5, 8, False))
+        self.assertIsNone(Bech32BaseUtils.ConvertBits([31, 28, 0], 5, 8, False))
+
     # Test invalid address
     def test_invalid_addr(self):
         for test in TEST_VECT_ADDR_INVALID:
             self.assertRaises(ValueError, Bech32Decoder.Decode, test["hrp"], test["addr"])
+        self.assertEqual([False] * len(TEST_VECT_ADDR_INVALID),
+                         Bech32Decoder.IsValidMany("cosmos", [test["addr"] for test in TEST_VECT_ADDR_INVALID]))
@@ -236,7 +236,20 @@ class SegwitBech32Tests(unittest.TestCase):
             enc = SegwitBech32Encoder.Encode(hrp, 0, binascii.unhexlify(test["raw"]))
             self.assertEqual(test["encode"], enc)
 
+    # Test many
+    def test_many(self):
+        for hrp in {test["encode"][:test["encode"].find("1")] for test in TEST_VECT}:
+            tests = [test for test in TEST_VECT if test["encode"].startswith(hrp + "1")]
+
+            enc = SegwitBech32Encoder.EncodeMany(hrp, 0, (binascii.unhexlify(test["raw"]) for test in tests))
+            self.assertEqual([test["encode"] for test in tests], enc)
+
+            dec = SegwitBech32Decoder.DecodeMany(hrp, enc)
+            self.assertEqual([(0, test["raw"]) for test in tests], [(v, binascii.hexlify(p)) for v, p in dec])
+            self.assertEqual([True] * len(tests), SegwitBech32Decoder.IsValidMany(hrp, enc))
+
     # Test invalid address
     def test_invalid_addr(self):
         for test in TEST_VECT_ADDR_INVALID:
             self.assertRaises(test["ex"], SegwitBech32Decoder.Decode, test["hrp"], test["addr"])
+            self.assertEqual([False], SegwitBech32Decoder.IsValidMany(test["hrp"], [test["addr"]]))
@@ -21,11 +21,14 @@
 # Imports
 import binascii
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from bip_utils import (
-    Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39MnemonicDecoder, Bip39MnemonicGenerator,
-    Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum, MnemonicChecksumError
+    Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39Mnemonic, Bip39MnemonicDecoder,
+    Bip39MnemonicEncoder, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum,
+    MnemonicChecksumError
 )
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListFinder, Bip39WordsListGetter
 
 
 # Tests from BIP39 page
@@ -417,6 +420,33 @@ class Bip39Tests(unittest.TestCase):
             self.assertRaises(ValueError, Bip39MnemonicGenerator().FromWordsNumber, test_words_num - 1)
             self.assertRaises(ValueError, Bip39MnemonicGenerator().FromWordsNumber, test_words_num + 1)
 
+    # Test mass generation
+    def test_many(self):
+        for test_words_num in Bip39WordsNum:
+            mnemonics = Bip39MnemonicGenerator().FromWordsNumberMany(test_words_num, 20)
+            self.assertEqual(20, len(mnemonics))
+            self.assertEqual(20, len({mnemonic.ToStr() for mnemonic in mnemonics}))
+            for mnemonic in mnemonics:
+                self.assertEqual(test_words_num, mnemonic.WordsCount())
+                self.assertTrue(Bip39MnemonicValidator(Bip39Languages.ENGLISH).IsValid(mnemonic))
+
+            self.assertRaises(ValueError, Bip39MnemonicGenerator().FromWordsNumberMany, test_words_num - 1, 1)
+        self.assertEqual([], Bip39MnemonicGenerator().FromWordsNumberMany(Bip39WordsNum.WORDS_NUM_12, 0))
+        self.assertRaises(ValueError, Bip39MnemonicGenerator().FromWordsNumberMany, Bip39WordsNum.WORDS_NUM_12, -1)
+
+        test_vect = [test for test in TEST_VECT if test.get("lang", Bip39Languages.ENGLISH) == Bip39Languages.ENGLISH]
+        mnemonics = Bip39MnemonicGenerator().FromEntropyMany(binascii.unhexlify(test["entropy"]) for test in test_vect)
+        self.assertEqual([test["mnemonic"] for test in test_vect], [mnemonic.ToStr() for mnemonic in mnemonics])
+
+        seeds = Bip39SeedGenerator.GenerateMany(mnemonics, TEST_PASSPHRASE)
+        self.assertEqual([test["seed"] for test in test_vect], [binascii.hexlify(seed) for seed in seeds])
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(seeds, Bip39SeedGenerator.GenerateMany(
+                [mnemonic.ToStr() for mnemonic in mnemonics], TEST_PASSPHRASE, Bip39Languages.ENGLISH, executor
+            ))
+        self.assertRaises(MnemonicChecksumError, Bip39SeedGenerator.GenerateMany, ["abandon " * 12])
+        self.assertRaises(ValueError, Bip39SeedGenerator.GenerateMany, ["abandon " * 11])
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
@@ -426,6 +456,50 @@ class Bip39Tests(unittest.TestCase):
             self.assertRaises(test["exception"], Bip39MnemonicValidator(lang).Validate, test["mnemonic"])
             self.assertRaises(test["exception"], Bip39SeedGenerator, test["mnemonic"], lang)
 
+    # Tests language detection
+    def test_find_language(self):
+        for test in TEST_VECT:
+            lang = test["lang"] if "lang" in test else Bip39Languages.ENGLISH
+            words_list, lang_got = Bip39WordsListFinder.FindLanguage(Bip39Mnemonic.FromString(test["mnemonic"]))
+            self.assertEqual(lang, lang_got)
+            self.assertIs(Bip39WordsListGetter.Instance().GetByLanguage(lang), words_list)
+
+        # Words in common are assigned to the first language
+        for words, lang in (
+            (["fatigue"], Bip39Languages.ENGLISH),
+            (["fatigue", "semaine"], Bip39Languages.FRENCH),
+            (["的", "是"], Bip39Languages.CHINESE_SIMPLIFIED),
+            (["的", "這"], Bip39Languages.CHINESE_TRADITIONAL),
+        ):
+            self.assertEqual(lang, Bip39WordsListFinder.FindLanguage(Bip39Mnemonic.FromList(words))[1])
+
+        # Words of different languages
+        self.assertRaises(ValueError, Bip39WordsListFinder.FindLanguage, Bip39Mnemonic.FromList(["zoo", "semaine"]))
+
+    # Tests checksum error message
+    def test_checksum_error(self):
+        for mnemonic, err_msg in (
+            ("abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon any",
+             "Invalid checksum (expected 0001, got 1100)"),
+            (" ".join(["zoo"] * 24),
+             "Invalid checksum (expected 11111111, got 10101111)"),
+        ):
+            with self.assertRaises(MnemonicChecksumError) as ctx:
+                Bip39MnemonicDecoder().Decode(mnemonic)
+            self.assertEqual(err_msg, str(ctx.exception))
+
+    # Tests encoding and decoding of all entropy lengths
+    def test_encode_decode(self):
+        for test_bit_len in Bip39EntropyBitLen:
+            for entropy in (b"\x00" * (test_bit_len // 8), b"\xff" * (test_bit_len // 8)):
+                mnemonic = Bip39MnemonicEncoder().Encode(entropy)
+                self.assertEqual(entropy, Bip39MnemonicDecoder().Decode(mnemonic))
+
+                entropy_chksum = Bip39MnemonicDecoder().DecodeWithChecksum(mnemonic)
+                self.assertEqual((test_bit_len + test_bit_len // 32 + 7) // 8, len(entropy_chksum))
+                self.assertEqual(int.from_bytes(entropy, "big"),
+                                 int.from_bytes(entropy_chksum, "big") >> (test_bit_len // 32))
+
     # Tests invalid parameters
     def test_invalid_params(self):
         self.assertRaises(TypeError, Bip39MnemonicGenerator, 0)
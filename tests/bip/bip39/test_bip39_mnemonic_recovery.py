@@ -0,0 +1,193 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from bip_utils import (
+    Bip39Languages, Bip39MnemonicRecovery, Bip39MnemonicRecoveryProgress, Bip39MnemonicSearchSpace,
+    Bip39MnemonicValidator, Bip44, Bip44Coins, Bip84, Bip84Coins
+)
+
+
+# Mnemonic to be recovered and its keys
+TEST_MNEMONIC = "legal winner thank year wave sausage worth useful legal winner thank yellow"
+TEST_BIP84_ADDR = "bc1q0uez0durhkezwzmhfyj5fkjcmqcm56jdhxkq6k"
+TEST_BIP84_ADDR_IDX = 1
+TEST_BIP84_XPUB = (
+    "zpub6s3Buz3fYNRSZk9BFYo9RCMkAvSiknUtRVjuYYCZmDJPrxTwYEW6fBXzYwMdT3DaKaE7TxN1QQwU2tjpNzAYS3S9G2xGEPQcMsrgxQNwh47"
+)
+TEST_BIP44_ADDR = "1EBuf21icKTE5m3HWVndKx2bTxvqrWCqV6"
+
+# Search spaces
+TEST_VECT_SEARCH_SPACE = [
+    # Unknown word
+    {
+        "mnemonic": "legal winner thank year wave sausage worth useful legal winner thank ?",
+        "swap_words": False,
+        "length": 2048,
+        "valid_num": 128,
+    },
+    # Misspelled words
+    {
+        "mnemonic": "legal winnr thank year wave sausag worth useful legal winner thank yellow",
+        "swap_words": False,
+        "length": 1,
+        "valid_num": 1,
+    },
+    # Swapped words
+    {
+        "mnemonic": "legal winner thank year wave sausage worth useful legal winner yellow thank",
+        "swap_words": True,
+        "length": 64,
+        "valid_num": 5,
+    },
+    # Missing word
+    {
+        "mnemonic": "legal winner thank year wave sausage worth useful legal winner thank",
+        "swap_words": False,
+        "length": 11 * 2047 + 2048,
+        "valid_num": None,
+    },
+]
+
+# Invalid mnemonics
+TEST_VECT_MNEMONIC_INVALID = [
+    # Wrong words count
+    "legal winner thank year wave sausage worth useful legal winner",
+    # Misspelled word without candidates
+    "legal winner thank year wave sausage worth useful legal winner thank xxxxxxxx",
+]
+
+
+# Convert results to comparable tuples
+def results_to_tuples(res):
+    return [(r.cand_index, r.mnemonic.ToStr(), r.address, r.address_index) for r in res]
+
+
+#
+# Tests
+#
+class Bip39MnemonicRecoveryTests(unittest.TestCase):
+    # Test search space
+    def test_search_space(self):
+        for test in TEST_VECT_SEARCH_SPACE:
+            search_space = Bip39MnemonicSearchSpace.FromMnemonic(test["mnemonic"], swap_words=test["swap_words"])
+            self.assertEqual(test["length"], search_space.Length())
+            self.assertEqual(Bip39Languages.ENGLISH, search_space.Language())
+
+            if test["valid_num"] is None:
+                continue
+
+            cands = list(search_space.ValidCandidates())
+            self.assertEqual(test["valid_num"], len(cands))
+            self.assertIn(TEST_MNEMONIC, [mnemonic.ToStr() for _, mnemonic in cands])
+            for _, mnemonic in cands:
+                self.assertTrue(Bip39MnemonicValidator(Bip39Languages.ENGLISH).IsValid(mnemonic))
+
+            # Test resume
+            for start_idx in range(0, test["length"], max(test["length"] // 4, 1)):
+                self.assertEqual([cand_idx for cand_idx, _ in cands if cand_idx >= start_idx],
+                                 [cand_idx for cand_idx, _ in search_space.ValidCandidates(start_idx)])
+            self.assertEqual([cand_idx for cand_idx, _ in cands if 1 <= cand_idx < test["length"] - 1],
+                             [cand_idx for cand_idx, _ in search_space.ValidCandidates(1, test["length"] - 1)])
+
+    # Test recovery from address
+    def test_recovery_addr(self):
+        search_space = Bip39MnemonicSearchSpace.FromMnemonic(TEST_VECT_SEARCH_SPACE[2]["mnemonic"], swap_words=True)
+
+        progress = []
+        res = list(Bip39MnemonicRecovery(search_space,
+                                         Bip84,
+                                         Bip84Coins.BITCOIN,
+                                         target_addrs=[TEST_BIP84_ADDR],
+                                         addr_num=2).Search(chunk_size=16, progress_fct=progress.append))
+        self.assertEqual(1, len(res))
+        self.assertEqual(TEST_MNEMONIC, res[0].mnemonic.ToStr())
+        self.assertEqual(TEST_BIP84_ADDR, res[0].address)
+        self.assertEqual(TEST_BIP84_ADDR_IDX, res[0].address_index)
+        self.assertEqual([Bip39MnemonicRecoveryProgress(idx, 64, 0) for idx in (16, 32, 48, 64)],
+                         [p._replace(valid_num=0) for p in progress])
+        self.assertEqual(5, progress[-1].valid_num)
+
+        # Address index not derived
+        res = list(Bip39MnemonicRecovery(search_space,
+                                         Bip84,
+                                         Bip84Coins.BITCOIN,
+                                         target_addrs=[TEST_BIP84_ADDR],
+                                         addr_num=1).Search())
+        self.assertEqual([], res)
+
+        # Resume after the match
+        recovery = Bip39MnemonicRecovery(search_space, Bip44, Bip44Coins.BITCOIN, target_addrs=[TEST_BIP44_ADDR])
+        res = list(recovery.Search())
+        self.assertEqual(1, len(res))
+        self.assertEqual([], list(recovery.Search(start_idx=res[0].cand_index + 1)))
+        self.assertEqual(results_to_tuples(res), results_to_tuples(recovery.Search(start_idx=res[0].cand_index)))
+
+    # Test recovery from extended public key
+    def test_recovery_xpub(self):
+        search_space = Bip39MnemonicSearchSpace.FromMnemonic(TEST_VECT_SEARCH_SPACE[1]["mnemonic"])
+
+        res = list(Bip39MnemonicRecovery(search_space,
+                                         Bip84,
+                                         Bip84Coins.BITCOIN,
+                                         target_xpub=TEST_BIP84_XPUB).Search())
+        self.assertEqual(1, len(res))
+        self.assertEqual(TEST_MNEMONIC, res[0].mnemonic.ToStr())
+        self.assertIsNone(res[0].address)
+        self.assertIsNone(res[0].address_index)
+
+    # Test recovery with executor
+    def test_recovery_executor(self):
+        search_space = Bip39MnemonicSearchSpace.FromMnemonic(TEST_VECT_SEARCH_SPACE[2]["mnemonic"], swap_words=True)
+        recovery = Bip39MnemonicRecovery(search_space, Bip84, Bip84Coins.BITCOIN, target_xpub=TEST_BIP84_XPUB)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(results_to_tuples(recovery.Search()),
+                             results_to_tuples(recovery.Search(executor=executor, chunk_size=8)))
+
+    # Test recovery with process pool (i.e. search space and matcher shall be picklable)
+    def test_recovery_process_pool(self):
+        search_space = Bip39MnemonicSearchSpace.FromMnemonic(TEST_VECT_SEARCH_SPACE[2]["mnemonic"], swap_words=True)
+        recovery = Bip39MnemonicRecovery(search_space, Bip84, Bip84Coins.BITCOIN, target_addrs=[TEST_BIP84_ADDR])
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(results_to_tuples(recovery.Search()),
+                             results_to_tuples(recovery.Search(executor=executor, chunk_size=8)))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        for mnemonic in TEST_VECT_MNEMONIC_INVALID:
+            self.assertRaises(ValueError, Bip39MnemonicSearchSpace.FromMnemonic, mnemonic)
+        self.assertRaises(TypeError, Bip39MnemonicSearchSpace.FromMnemonic, TEST_MNEMONIC, 0)
+
+        search_space = Bip39MnemonicSearchSpace.FromMnemonic(TEST_MNEMONIC)
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, search_space, Bip84, Bip84Coins.BITCOIN)
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, search_space, Bip84, Bip84Coins.BITCOIN,
+                          [TEST_BIP84_ADDR], None, "", 0, 0)
+
+        recovery = Bip39MnemonicRecovery(search_space, Bip84, Bip84Coins.BITCOIN, target_xpub=TEST_BIP84_XPUB)
+        self.assertRaises(ValueError, recovery.Search, start_idx=-1)
+        self.assertRaises(ValueError, recovery.Search, start_idx=search_space.Length() + 1)
+        self.assertRaises(ValueError, recovery.Search, chunk_size=0)
+        self.assertRaises(TypeError, Bip39MnemonicRecovery, search_space, Bip84, Bip44Coins.BITCOIN,
+                          target_xpub=TEST_BIP84_XPUB)
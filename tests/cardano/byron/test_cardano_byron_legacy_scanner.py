@@ -0,0 +1,125 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from bip_utils import (
+    AdaByronIcarusAddrEncoder, CardanoByronLegacy, CardanoByronLegacyScanner, CardanoByronLegacyScanResult,
+    CardanoIcarusBip32
+)
+from bip_utils.cardano.byron.cardano_byron_legacy_scanner import _CardanoByronLegacyScannerUtils
+from tests.cardano.byron.test_cardano_byron_legacy import TEST_SEED_1, TEST_SEED_2, TEST_VECT
+
+
+# Addresses that are not Cardano Byron legacy ones
+TEST_VECT_NOT_LEGACY = [
+    # Not base58
+    "addr1qxy3w62dupy9pzmpdfzxz4k240w5vawyagl5m9djqquyymrtm3grn7gpnjh7rwh2dy62hk8639lt6kpn32uk5yfywk2s3thhwg",
+    # Invalid CBOR
+    "DdzFFzCqrhs",
+    # Icarus address (no HD path)
+    AdaByronIcarusAddrEncoder.EncodeKey(
+        CardanoIcarusBip32.FromSeed(TEST_SEED_1).PublicKey().KeyObject(),
+        chain_code=CardanoIcarusBip32.FromSeed(TEST_SEED_1).ChainCode()
+    ),
+    # Invalid CRC (last character modified)
+    TEST_VECT[0]["addresses"][0]["address"][:-1] + "B",
+    # Legacy address of another wallet
+    CardanoByronLegacy.FromSeed(TEST_SEED_2).GetAddress(0, 0),
+]
+
+
+#
+# Tests
+#
+class CardanoByronLegacyScannerTests(unittest.TestCase):
+    # Run all tests in test vector
+    def test_vector(self):
+        for test in TEST_VECT:
+            byron_legacy = CardanoByronLegacy.FromSeed(binascii.unhexlify(test["seed"]))
+            addrs = [test_addr["address"] for test_addr in test["addresses"]]
+            exp_paths = [f"m/0'/{i}'" for i in range(len(addrs))]
+
+            scanner = CardanoByronLegacyScanner.FromWallet(byron_legacy)
+            self.assertEqual(test["hd_path_key"], scanner.HdPathKey().hex())
+
+            # Single address
+            for addr, exp_path in zip(addrs, exp_paths):
+                res = scanner.ScanAddress(addr)
+                self.assertTrue(isinstance(res, CardanoByronLegacyScanResult))
+                self.assertEqual(addr, res.address)
+                self.assertEqual(exp_path, res.hd_path.ToStr())
+                self.assertEqual(byron_legacy.HdPathFromAddress(addr).ToStr(), res.hd_path.ToStr())
+
+            # Interleave with addresses not belonging to the wallet
+            scan_addrs = [addr for addr_pair in zip(TEST_VECT_NOT_LEGACY, addrs) for addr in addr_pair]
+            self.__test_scan(scanner, scan_addrs, addrs, exp_paths)
+            self.__test_scan(CardanoByronLegacyScanner(byron_legacy.HdPathKey()), scan_addrs, addrs, exp_paths)
+
+    # Test addresses with other paths
+    def test_paths(self):
+        byron_legacy = CardanoByronLegacy.FromSeed(TEST_SEED_1)
+        scanner = CardanoByronLegacyScanner.FromWallet(byron_legacy)
+
+        indexes = [(i, j) for i in (0, 1, 2**31 - 1) for j in (0, 255, 65536)]
+        exp_paths = [f"m/{i}'/{j}'" for i, j in indexes]
+        addrs = [byron_legacy.GetAddress(i, j) for i, j in indexes]
+        self.__test_scan(scanner, addrs + TEST_VECT_NOT_LEGACY, addrs, exp_paths)
+
+    # Test addresses not belonging to the wallet
+    def test_not_owned(self):
+        scanner = CardanoByronLegacyScanner.FromWallet(CardanoByronLegacy.FromSeed(TEST_SEED_1))
+
+        for addr in TEST_VECT_NOT_LEGACY:
+            self.assertIsNone(scanner.ScanAddress(addr))
+        self.assertEqual([], list(scanner.Scan(TEST_VECT_NOT_LEGACY)))
+        self.assertEqual([], list(scanner.Scan([])))
+
+    # Test chunk scanning (i.e. the function submitted to the executor)
+    def test_scan_chunk(self):
+        byron_legacy = CardanoByronLegacy.FromSeed(TEST_SEED_1)
+        addrs = [byron_legacy.GetAddress(0, i) for i in range(3)]
+
+        res = _CardanoByronLegacyScannerUtils.ScanChunk(byron_legacy.HdPathKey(), TEST_VECT_NOT_LEGACY + addrs)
+        self.assertEqual(addrs, [r.address for r in res])
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, CardanoByronLegacyScanner, b"\x00" * 31)
+        self.assertRaises(ValueError, CardanoByronLegacyScanner, b"\x00" * 33)
+
+        scanner = CardanoByronLegacyScanner.FromWallet(CardanoByronLegacy.FromSeed(TEST_SEED_1))
+        self.assertRaises(ValueError, scanner.Scan, TEST_VECT_NOT_LEGACY, chunk_size=0)
+
+    # Test scan, with and without executor
+    def __test_scan(self, scanner, scan_addrs, exp_addrs, exp_paths):
+        for res_list in (list(scanner.Scan(scan_addrs)),
+                         list(scanner.Scan(iter(scan_addrs)))):
+            self.assertEqual(exp_addrs, [res.address for res in res_list])
+            self.assertEqual(exp_paths, [res.hd_path.ToStr() for res in res_list])
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for chunk_size in (1, 2, 1000):
+                res_list = list(scanner.Scan(scan_addrs, executor=executor, chunk_size=chunk_size))
+                self.assertEqual(exp_addrs, [res.address for res in res_list])
+                self.assertEqual(exp_paths, [res.hd_path.ToStr() for res in res_list])
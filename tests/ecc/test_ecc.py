@@ -37,8 +37,12 @@ from bip_utils import (
     Nist256p1PublicKey, Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey, Sr25519, Sr25519Point,
     Sr25519PrivateKey, Sr25519PublicKey
 )
+from bip_utils.ecc import Ed25519Utils, Secp256k1Utils
 from bip_utils.ecc.conf import EccConf
-from bip_utils.utils.misc import IntegerUtils
+from bip_utils.ecc.ed25519.lib import ed25519_lib
+from bip_utils.ecc.secp256k1.secp256k1_utils import _Secp256k1UtilsGeneric
+from bip_utils.utils.crypto import Sha256
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
 # ed25519 order and generator
@@ -653,6 +657,53 @@ class EccTests(unittest.TestCase):
         # Point
         self.__test_dummy_point(Sr25519Point)
 
+    # Test ed25519 on-curve check of encoded points
+    def test_ed25519_point_is_on_curve(self):
+        q = 2**255 - 19
+        points = [
+            TEST_ED25519_POINT_ENC_BYTES,
+            # Edge cases (y = 0, 1, -1, q, q + 1 and maximum value), with and without sign bit
+            *[IntegerUtils.ToBytes(y | sign, 32, endianness="little")
+              for y in (0, 1, q - 1, q, q + 1, 2**255 - 1) for sign in (0, 1 << 255)],
+            # Pseudo-random points, about half of them lie on the curve
+            *[Sha256.QuickDigest(IntegerUtils.ToBytes(i)) for i in range(256)],
+        ]
+        for point_bytes in points:
+            # Compare with the check on the decoded coordinates
+            x, y = ed25519_lib.point_decode_no_check(point_bytes)
+            exp_res = ed25519_lib.point_is_on_curve((x, y))
+            self.assertEqual(exp_res, Ed25519Utils.PointIsOnCurve(point_bytes))
+            self.assertEqual(exp_res, Ed25519PublicKey.IsValidBytes(point_bytes))
+
+        self.assertRaises(ValueError, Ed25519Utils.PointIsOnCurve, TEST_ED25519_POINT_ENC_BYTES[:-1])
+        self.assertRaises(ValueError, Ed25519Utils.PointIsOnCurve, TEST_ED25519_POINT_DEC_BYTES)
+
+    # Test secp256k1 x-only tweak
+    def test_secp256k1_x_only_tweak_add(self):
+        for i in range(16):
+            pub_key = Secp256k1PrivateKey.FromBytes(Sha256.QuickDigest(IntegerUtils.ToBytes(i))).PublicKey()
+            x_bytes = pub_key.RawCompressed().ToBytes()[1:]
+            tweak_bytes = Sha256.QuickDigest(x_bytes)
+
+            # Compare with the generic point arithmetic
+            lift_x_point = Secp256k1PublicKey.FromBytes(b"\x02" + x_bytes).Point()
+            exp_point = lift_x_point + (BytesUtils.ToInteger(tweak_bytes) * Secp256k1.Generator())
+            exp_x_bytes = exp_point.RawEncoded().ToBytes()[1:]
+
+            self.assertEqual(exp_x_bytes, Secp256k1Utils.XOnlyTweakAdd(x_bytes, tweak_bytes))
+            self.assertEqual(exp_x_bytes, _Secp256k1UtilsGeneric.XOnlyTweakAdd(x_bytes, tweak_bytes))
+
+        # x coordinate not on the curve
+        self.assertRaises(ValueError, Secp256k1Utils.XOnlyTweakAdd, b"\x00" * 32, b"\x01" * 32)
+        self.assertRaises(ValueError, _Secp256k1UtilsGeneric.XOnlyTweakAdd, b"\x00" * 32, b"\x01" * 32)
+        # Tweak not lower than the curve order
+        x_bytes = Secp256k1.Generator().RawEncoded().ToBytes()[1:]
+        self.assertRaises(ValueError, Secp256k1Utils.XOnlyTweakAdd, x_bytes, b"\xff" * 32)
+        self.assertRaises(ValueError, _Secp256k1UtilsGeneric.XOnlyTweakAdd, x_bytes, b"\xff" * 32)
+        # Invalid lengths
+        self.assertRaises(ValueError, Secp256k1Utils.XOnlyTweakAdd, x_bytes[:-1], b"\x01" * 32)
+        self.assertRaises(ValueError, Secp256k1Utils.XOnlyTweakAdd, x_bytes, b"\x01" * 31)
+
     # Test invalid public keys
     def test_invalid_pub_keys(self):
         for test in TEST_VECT_ED25519_PUB_KEY_INVALID:
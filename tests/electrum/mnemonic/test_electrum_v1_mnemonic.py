@@ -24,7 +24,8 @@ import unittest
 
 from bip_utils import (
     ElectrumV1, ElectrumV1EntropyBitLen, ElectrumV1EntropyGenerator, ElectrumV1Languages, ElectrumV1MnemonicDecoder,
-    ElectrumV1MnemonicGenerator, ElectrumV1MnemonicValidator, ElectrumV1SeedGenerator, ElectrumV1WordsNum
+    ElectrumV1MnemonicEncoder, ElectrumV1MnemonicGenerator, ElectrumV1MnemonicValidator, ElectrumV1SeedGenerator,
+    ElectrumV1WordsNum
 )
 
 
@@ -203,6 +204,28 @@ class ElectrumV1MnemonicTests(unittest.TestCase):
             self.assertRaises(ValueError, ElectrumV1MnemonicGenerator().FromWordsNumber, test_words_num - 1)
             self.assertRaises(ValueError, ElectrumV1MnemonicGenerator().FromWordsNumber, test_words_num + 1)
 
+    # Test mass generation
+    def test_many(self):
+        for test_words_num in ElectrumV1WordsNum:
+            mnemonics = ElectrumV1MnemonicGenerator().FromWordsNumberMany(test_words_num, 10)
+            self.assertEqual(10, len(mnemonics))
+            for mnemonic in mnemonics:
+                self.assertEqual(test_words_num, mnemonic.WordsCount())
+                self.assertTrue(ElectrumV1MnemonicValidator().IsValid(mnemonic))
+            self.assertRaises(ValueError, ElectrumV1MnemonicGenerator().FromWordsNumberMany, test_words_num + 1, 1)
+
+        entropies = [binascii.unhexlify(test["entropy"]) for test in TEST_VECT]
+        mnemonics = ElectrumV1MnemonicGenerator().FromEntropyMany(entropies)
+        self.assertEqual([test["mnemonic"] for test in TEST_VECT], [mnemonic.ToStr() for mnemonic in mnemonics])
+
+        # Test batch encoding/decoding
+        mnemonics = ElectrumV1MnemonicEncoder().EncodeMany(entropies)
+        self.assertEqual([test["mnemonic"] for test in TEST_VECT], [mnemonic.ToStr() for mnemonic in mnemonics])
+        self.assertEqual(entropies, ElectrumV1MnemonicDecoder().DecodeMany(mnemonics))
+        self.assertRaises(ValueError, ElectrumV1MnemonicEncoder().EncodeMany, entropies + [b"\x00" * 15])
+        # Words not representing a 4-byte chunk
+        self.assertRaises(ValueError, ElectrumV1MnemonicDecoder().Decode, " ".join(["weary weapon unseen"] * 4))
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
@@ -22,6 +22,7 @@
 import binascii
 import math
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from bip_utils import (
     BytesUtils, ElectrumV2EntropyBitLen, ElectrumV2EntropyGenerator, ElectrumV2Languages, ElectrumV2MnemonicDecoder,
@@ -197,6 +198,26 @@ class ElectrumV2MnemonicTests(unittest.TestCase):
             elif test["mnemonic_type"] == ElectrumV2MnemonicTypes.SEGWIT:
                 self.assertEqual(test["address"], ElectrumV2Segwit.FromSeed(seed).GetAddress(0, 0))
 
+    # Test concurrent search (same result of the sequential one)
+    def test_concurrent_search(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for test in TEST_VECT:
+                mnemonic_gen = ElectrumV2MnemonicGenerator(test["mnemonic_type"], test["lang"])
+                entropy = binascii.unhexlify(test["entropy"])
+                for chunk_size in (1, 7, 4096):
+                    mnemonic = mnemonic_gen.FromEntropy(entropy, executor=executor, chunk_size=chunk_size)
+                    self.assertEqual(test["mnemonic"], mnemonic.ToStr())
+
+            for mnemonic_type in ElectrumV2MnemonicTypes:
+                mnemonic_gen = ElectrumV2MnemonicGenerator(mnemonic_type)
+                entropy = ElectrumV2EntropyGenerator(ElectrumV2EntropyBitLen.BIT_LEN_132).Generate()
+                self.assertEqual(mnemonic_gen.FromEntropy(entropy).ToStr(),
+                                 mnemonic_gen.FromEntropy(entropy, executor=executor, chunk_size=64).ToStr())
+
+            self.assertRaises(ValueError, ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.STANDARD).FromEntropy, binascii.unhexlify(b"00000000000000000000000000000000"), executor)
+
+        self.assertRaises(ValueError, ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.STANDARD).FromEntropy, binascii.unhexlify(test["entropy"]), None, 0)
+
     # Test entropy generator and construction from valid entropy bit lengths
     def test_entropy_valid_bitlen(self):
         for test_bit_len in ElectrumV2EntropyBitLen:
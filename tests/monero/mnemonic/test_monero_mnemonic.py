@@ -24,7 +24,7 @@ import unittest
 
 from bip_utils import (
     MnemonicChecksumError, Monero, MoneroEntropyBitLen, MoneroEntropyGenerator, MoneroLanguages, MoneroMnemonicDecoder,
-    MoneroMnemonicGenerator, MoneroMnemonicValidator, MoneroSeedGenerator, MoneroWordsNum
+    MoneroMnemonicEncoder, MoneroMnemonicGenerator, MoneroMnemonicValidator, MoneroSeedGenerator, MoneroWordsNum
 )
 
 
@@ -344,6 +344,34 @@ class MoneroMnemonicTests(unittest.TestCase):
             if test_words_num + 1 not in monero_int_words_num:
                 self.assertRaises(ValueError, MoneroMnemonicGenerator().FromWordsNumber, test_words_num + 1)
 
+    # Test mass generation
+    def test_many(self):
+        for test_words_num in MoneroWordsNum:
+            mnemonics = MoneroMnemonicGenerator().FromWordsNumberMany(test_words_num, 10)
+            self.assertEqual(10, len(mnemonics))
+            for mnemonic in mnemonics:
+                self.assertEqual(test_words_num, mnemonic.WordsCount())
+                self.assertTrue(MoneroMnemonicValidator().IsValid(mnemonic))
+        self.assertRaises(ValueError, MoneroMnemonicGenerator().FromWordsNumberMany, 11, 1)
+
+        test_vect = [test for test in TEST_VECT if test["lang"] == MoneroLanguages.ENGLISH]
+        entropies = [binascii.unhexlify(test["entropy"]) for test in test_vect]
+        mnemonics = MoneroMnemonicGenerator().FromEntropyWithChecksumMany(entropies)
+        self.assertEqual([test["mnemonic"] for test in test_vect], [mnemonic.ToStr() for mnemonic in mnemonics])
+        mnemonics = MoneroMnemonicGenerator().FromEntropyNoChecksumMany(entropies)
+        self.assertEqual([test["mnemonic"].split(" ")[:-1] for test in test_vect],
+                         [mnemonic.ToList() for mnemonic in mnemonics])
+
+        # Test batch encoding/decoding
+        mnemonics = MoneroMnemonicEncoder().EncodeWithChecksumMany(entropies)
+        self.assertEqual([test["mnemonic"] for test in test_vect], [mnemonic.ToStr() for mnemonic in mnemonics])
+        self.assertEqual(entropies, MoneroMnemonicDecoder().DecodeMany(mnemonics))
+        self.assertEqual(entropies, MoneroMnemonicDecoder().DecodeMany(MoneroMnemonicEncoder().EncodeNoChecksumMany(entropies)))
+        self.assertEqual([], MoneroMnemonicEncoder().EncodeWithChecksumMany([]))
+        self.assertRaises(ValueError, MoneroMnemonicEncoder().EncodeNoChecksumMany, entropies + [b"\x00" * 15])
+        # Words not representing a 4-byte chunk
+        self.assertRaises(ValueError, MoneroMnemonicDecoder().Decode, " ".join(["zoom zones zombie"] * 4))
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
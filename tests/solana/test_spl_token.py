@@ -21,7 +21,7 @@
 # Imports
 import unittest
 
-from bip_utils import SplToken
+from bip_utils import SolAddrDecoder, SplToken, SplTokenBatch
 from bip_utils.solana.spl_token import SplTokenConst
 
 
@@ -65,6 +65,51 @@ class SplTokenTests(unittest.TestCase):
             pda = SplToken.GetAssociatedTokenAddress(test["wallet_address"], test["token_mint_address"])
             self.assertEqual(test["pda"], pda)
 
+            pda = SplToken.GetAssociatedTokenAddressWithProgramId(test["wallet_address"],
+                                                                  test["token_mint_address"],
+                                                                  SplTokenConst.DEF_TOKEN_PROGRAM_ID)
+            self.assertEqual(test["pda"], pda)
+
+    # Test batch associated token addresses
+    def test_batch(self):
+        wallet_addrs = list(dict.fromkeys(test["wallet_address"] for test in TEST_VECT))
+        token_mint_addrs = [test["token_mint_address"] for test in TEST_VECT]
+        exp_pdas = [[SplToken.GetAssociatedTokenAddress(wallet_addr, token_mint_addr)
+                     for token_mint_addr in token_mint_addrs]
+                    for wallet_addr in wallet_addrs]
+
+        for cache_size in (0, 3, 100):
+            spl_token_batch = SplTokenBatch(cache_size)
+            # Computed twice to test the cache
+            for _ in range(2):
+                self.assertEqual(exp_pdas, spl_token_batch.GetAssociatedTokenAddresses(wallet_addrs, token_mint_addrs))
+                self.assertEqual(exp_pdas,
+                                 spl_token_batch.GetAssociatedTokenAddresses(iter(wallet_addrs),
+                                                                             token_mint_addrs,
+                                                                             SplTokenConst.DEF_TOKEN_PROGRAM_ID))
+                self.assertEqual(min(cache_size, len(wallet_addrs) * len(token_mint_addrs)),
+                                 spl_token_batch.CacheLength())
+
+            for test in TEST_VECT:
+                pda = spl_token_batch.GetAssociatedTokenAddress(test["wallet_address"], test["token_mint_address"])
+                self.assertEqual(test["pda"], pda)
+
+            spl_token_batch.ClearCache()
+            self.assertEqual(0, spl_token_batch.CacheLength())
+
+        self.assertEqual([], SplTokenBatch().GetAssociatedTokenAddresses([], token_mint_addrs))
+        self.assertEqual([[]], SplTokenBatch().GetAssociatedTokenAddresses(wallet_addrs[:1], []))
+
+    # Test FindPda
+    def test_find_pda(self):
+        for test in TEST_VECT:
+            seeds = [
+                SolAddrDecoder.DecodeAddr(test["wallet_address"]),
+                SolAddrDecoder.DecodeAddr(SplTokenConst.DEF_TOKEN_PROGRAM_ID),
+                SolAddrDecoder.DecodeAddr(test["token_mint_address"]),
+            ]
+            self.assertEqual(test["pda"], SplToken.FindPda(seeds, SplTokenConst.DEF_PROGRAM_ID))
+
     # Test invalid parameters
     def test_invalid_params(self):
         # GetAssociatedTokenAddress
@@ -92,6 +137,21 @@ class SplTokenTests(unittest.TestCase):
                           "7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh",
                           "7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh",
                           "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb")
+        # SplTokenBatch
+        self.assertRaises(ValueError, SplTokenBatch, -1)
+        self.assertRaises(ValueError,
+                          SplTokenBatch().GetAssociatedTokenAddresses,
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"],
+                          ["kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb"])
+        self.assertRaises(ValueError,
+                          SplTokenBatch(10).GetAssociatedTokenAddresses,
+                          ["kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb"],
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"])
+        self.assertRaises(ValueError,
+                          SplTokenBatch().GetAssociatedTokenAddress,
+                          "7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh",
+                          "7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh",
+                          "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb")
         # FindPda
         self.assertRaises(ValueError, SplToken.FindPda, ["\x00" for _ in range(SplTokenConst.SEEDS_MAX_NUM + 1)], "")
         self.assertRaises(ValueError, SplToken.FindPda, ["\x00", "\x00" * 33, "\x00"], "")
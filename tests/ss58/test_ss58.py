@@ -106,6 +106,26 @@ class SS58Tests(unittest.TestCase):
             # Test encoder
             self.assertEqual(test["encode"], SS58Encoder.Encode(binascii.unhexlify(test["raw"]), test["ss58_format"]))
 
+    # Test many
+    def test_many(self):
+        data = [binascii.unhexlify(test["raw"]) for test in TEST_VECT]
+        ss58_formats = [test["ss58_format"] for test in TEST_VECT]
+
+        # Test vector
+        self.assertEqual([(test["ss58_format"], test["raw"]) for test in TEST_VECT],
+                         [(ss58_format, binascii.hexlify(dec))
+                          for ss58_format, dec in SS58Decoder.DecodeMany(test["encode"] for test in TEST_VECT)])
+
+        # Many data with the same format
+        enc = SS58Encoder.EncodeMany(data, ss58_formats[-1])
+        self.assertEqual([SS58Encoder.Encode(d, ss58_formats[-1]) for d in data], enc)
+        self.assertEqual([(ss58_formats[-1], d) for d in data], SS58Decoder.DecodeMany(enc))
+
+        # Same data with many formats
+        enc = SS58Encoder.EncodeManyFormats(data[0], ss58_formats)
+        self.assertEqual([SS58Encoder.Encode(data[0], ss58_format) for ss58_format in ss58_formats], enc)
+        self.assertEqual([(ss58_format, data[0]) for ss58_format in ss58_formats], SS58Decoder.DecodeMany(enc))
+
     #  Test invalid calls to encode
     def test_invalid_encode(self):
         data_len = SS58Const.DATA_BYTE_LEN
@@ -116,6 +136,8 @@ class SS58Tests(unittest.TestCase):
         self.assertRaises(ValueError, SS58Encoder.Encode, data_len * b"\x00", -1)
         for reserved_format in SS58Const.RESERVED_FORMATS:
             self.assertRaises(ValueError, SS58Encoder.Encode, data_len * b"\x00", reserved_format)
+        self.assertRaises(ValueError, SS58Encoder.EncodeMany, [data_len * b"\x00", (data_len - 1) * b"\x00"], 0)
+        self.assertRaises(ValueError, SS58Encoder.EncodeManyFormats, data_len * b"\x00", [0, -1])
 
     #  Test invalid calls to decode
     def test_invalid_decode(self):
@@ -0,0 +1,65 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import unittest
+
+from bip_utils.utils.crypto import ChaCha20Poly1305, ChaCha20Poly1305Decrypter
+
+
+# Data lengths to be tested
+TEST_DATA_LENS = [0, 1, 15, 16, 17, 31, 32, 33, 64, 255, 256, 257, 1000]
+
+
+#
+# Tests
+#
+class ChaCha20Poly1305Tests(unittest.TestCase):
+    # Test decrypter against the standard decryption
+    def test_decrypter(self):
+        for data_len in TEST_DATA_LENS:
+            key = os.urandom(ChaCha20Poly1305.KeySize())
+            nonce = os.urandom(12)
+            assoc_data = os.urandom(data_len % 20)
+            plain_text = os.urandom(data_len)
+
+            cipher_text, tag = ChaCha20Poly1305.Encrypt(key, nonce, assoc_data, plain_text)
+            decrypter = ChaCha20Poly1305Decrypter(key, nonce)
+
+            self.assertEqual(plain_text, ChaCha20Poly1305.Decrypt(key, nonce, assoc_data, cipher_text, tag))
+            self.assertEqual(plain_text, decrypter.Decrypt(assoc_data, cipher_text, tag))
+            # Decrypter shall be reusable
+            self.assertEqual(plain_text, decrypter.Decrypt(assoc_data, cipher_text, tag))
+
+    # Test invalid tag
+    def test_invalid_tag(self):
+        for data_len in TEST_DATA_LENS:
+            key = os.urandom(ChaCha20Poly1305.KeySize())
+            nonce = os.urandom(12)
+
+            cipher_text, tag = ChaCha20Poly1305.Encrypt(key, nonce, b"", os.urandom(data_len))
+            decrypter = ChaCha20Poly1305Decrypter(key, nonce)
+
+            self.assertRaises(ValueError, decrypter.Decrypt, b"", cipher_text, bytes([tag[0] ^ 1]) + tag[1:])
+            self.assertRaises(ValueError, decrypter.Decrypt, b"\x00", cipher_text, tag)
+            if data_len > 0:
+                cipher_text_err = bytes([cipher_text[0] ^ 1]) + cipher_text[1:]
+                self.assertRaises(ValueError, decrypter.Decrypt, b"", cipher_text_err, tag)
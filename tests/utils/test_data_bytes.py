@@ -85,6 +85,22 @@ class DataBytesTests(unittest.TestCase):
             self.assertEqual(test["int_big"], data_bytes_obj)
             self.assertEqual(DataBytes(test_bytes), data_bytes_obj)
 
+    # Test construction from bytes-like objects
+    def test_bytes_like(self):
+        for test in TEST_VECT:
+            test_bytes = binascii.unhexlify(test["bytes"])
+
+            for data in (bytearray(test_bytes), memoryview(test_bytes)):
+                data_bytes_obj = DataBytes(data)
+
+                self.assertTrue(isinstance(data_bytes_obj.ToBytes(), bytes))
+                self.assertEqual(test_bytes, data_bytes_obj.ToBytes())
+                self.assertEqual(data, data_bytes_obj)
+            # Bytes shall not be copied
+            self.assertIs(test_bytes, DataBytes(test_bytes).ToBytes())
+
     # Test invalid parameters
     def test_invalid_parameters(self):
         self.assertRaises(TypeError, DataBytes(b"").__eq__, [])
+        self.assertRaises(TypeError, DataBytes, "test")
+        self.assertRaises(TypeError, DataBytes, 0)
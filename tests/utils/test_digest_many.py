@@ -0,0 +1,125 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from bip_utils import (
+    Blake2b, Blake2b160, Blake2b224, Blake2b256, Crc32, DoubleSha256, Hash160, HmacSha256, HmacSha512, Kekkak256,
+    Ripemd160, Sha3_256, Sha256, Sha512, Sha512_256, XModemCrc
+)
+
+
+# Test data (mixed bytes and strings, the last one is large enough to let hashlib release the GIL)
+TEST_DATA = [
+    b"",
+    b"\x00\x01\x02\x03",
+    "test string",
+    bytes(range(256)) * 16,
+]
+
+# Digest classes to be tested
+TEST_DIGEST_CLASSES = [
+    Blake2b160,
+    Blake2b224,
+    Blake2b256,
+    Crc32,
+    DoubleSha256,
+    Hash160,
+    Kekkak256,
+    Ripemd160,
+    Sha3_256,
+    Sha256,
+    Sha512,
+    Sha512_256,
+    XModemCrc,
+]
+
+
+#
+# Tests
+#
+class DigestManyTests(unittest.TestCase):
+    # Test digest classes
+    def test_digest_classes(self):
+        for digest_cls in TEST_DIGEST_CLASSES:
+            exp_digests = [digest_cls.QuickDigest(data) for data in TEST_DATA]
+
+            self.assertEqual(exp_digests, digest_cls.DigestMany(TEST_DATA))
+            self.assertEqual(exp_digests, digest_cls.DigestMany(iter(TEST_DATA)))
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                self.assertEqual(exp_digests, digest_cls.DigestMany(TEST_DATA, executor=executor))
+
+    # Test bytes-like objects
+    def test_bytes_like(self):
+        for digest_cls in TEST_DIGEST_CLASSES:
+            exp_digests = [digest_cls.QuickDigest(b"test bytes")] * 2
+            data = [bytearray(b"test bytes"), memoryview(b"test bytes")]
+
+            self.assertEqual(exp_digests, [digest_cls.QuickDigest(d) for d in data])
+            self.assertEqual(exp_digests, digest_cls.DigestMany(data))
+
+    # Test Blake2b with key and salt
+    def test_blake2b(self):
+        self.assertEqual(
+            [Blake2b.QuickDigest(data, 32, b"key", b"salt") for data in TEST_DATA],
+            Blake2b.DigestMany(TEST_DATA, 32, b"key", b"salt")
+        )
+        self.assertEqual(
+            [Blake2b160.QuickDigest(data, "key") for data in TEST_DATA],
+            Blake2b160.DigestMany(TEST_DATA, "key")
+        )
+
+    # Test Blake2b state copy (common prefix absorbed only once)
+    def test_blake2b_copy(self):
+        prefix_hash = Blake2b(32, b"key", b"salt")
+        prefix_hash.Update(b"prefix")
+        for data in TEST_DATA[:2] + TEST_DATA[3:]:
+            blake2b = prefix_hash.Copy()
+            blake2b.Update(data)
+            self.assertEqual(Blake2b.QuickDigest(b"prefix" + data, 32, b"key", b"salt"), blake2b.Digest())
+        self.assertEqual(Blake2b.QuickDigest(b"prefix", 32, b"key", b"salt"), prefix_hash.Digest())
+
+    # Test HMAC
+    def test_hmac(self):
+        for hmac_cls in (HmacSha256, HmacSha512):
+            self.assertEqual(
+                [hmac_cls.QuickDigest(b"key", data) for data in TEST_DATA],
+                hmac_cls.DigestMany(b"key", TEST_DATA)
+            )
+
+    # Test HMAC keyed digest function (including keys longer than the block size)
+    def test_hmac_keyed(self):
+        for hmac_cls in (HmacSha256, HmacSha512):
+            for key in (b"", "key", b"\xaa" * 200):
+                digest_fct = hmac_cls.KeyedDigestFct(key)
+                for data in (b"", b"\x00\x01\x02\x03", TEST_DATA[3]):
+                    self.assertEqual(hmac_cls.QuickDigest(key, data), digest_fct(data))
+
+    # Test empty input
+    def test_empty(self):
+        for digest_cls in TEST_DIGEST_CLASSES:
+            self.assertEqual([], digest_cls.DigestMany([]))
+
+    # Test invalid data
+    def test_invalid_data(self):
+        for digest_cls in TEST_DIGEST_CLASSES:
+            self.assertRaises(TypeError, digest_cls.DigestMany, [b"", 0])
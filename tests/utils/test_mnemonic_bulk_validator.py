@@ -0,0 +1,147 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from bip_utils import (
+    AlgorandMnemonicBulkValidator, Bip39Languages, Bip39MnemonicBulkValidator, ElectrumV1MnemonicBulkValidator,
+    ElectrumV2MnemonicBulkValidator, ElectrumV2MnemonicTypes, MnemonicValidationResults, MoneroLanguages,
+    MoneroMnemonicBulkValidator
+)
+from bip_utils.bip.bip39 import Bip39Mnemonic
+
+
+# Tests vector (validator, mnemonics, expected results)
+TEST_VECT = [
+    (
+        Bip39MnemonicBulkValidator(),
+        [
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+            "ábaco ábaco ábaco ábaco ábaco ábaco ábaco ábaco ábaco ábaco ábaco abierto",
+            Bip39Mnemonic.FromString("legal winner thank year wave sausage worth useful legal winner thank yellow"),
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon",
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon notaword",
+            "",
+        ],
+        [
+            MnemonicValidationResults.VALID,
+            MnemonicValidationResults.VALID,
+            MnemonicValidationResults.VALID,
+            MnemonicValidationResults.INVALID_CHECKSUM,
+            MnemonicValidationResults.INVALID_WORDS_NUM,
+            MnemonicValidationResults.INVALID_WORDS,
+            MnemonicValidationResults.INVALID_WORDS_NUM,
+        ],
+    ),
+    (
+        Bip39MnemonicBulkValidator(Bip39Languages.ENGLISH),
+        [
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+            "ábaco ábaco ábaco ábaco ábaco ábaco ábaco ábaco ábaco ábaco ábaco abierto",
+        ],
+        [
+            MnemonicValidationResults.VALID,
+            MnemonicValidationResults.INVALID_WORDS,
+        ],
+    ),
+    (
+        MoneroMnemonicBulkValidator(MoneroLanguages.ENGLISH),
+        [
+            "aces gasp lymph jeers cent sipped older sneeze tender balding pawnshop vulture wetsuit ivory hounded "
+            "begun mouth safety puck tilt kiosk zapped pierce obnoxious jeers",
+            "aces gasp lymph jeers cent sipped older sneeze tender balding pawnshop vulture wetsuit ivory hounded "
+            "begun mouth safety puck tilt kiosk zapped pierce obnoxious aces",
+            "aces gasp lymph jeers cent sipped older sneeze tender balding pawnshop vulture wetsuit ivory hounded "
+            "begun mouth safety puck tilt kiosk zapped pierce obnoxious",
+        ],
+        [
+            MnemonicValidationResults.VALID,
+            MnemonicValidationResults.INVALID_CHECKSUM,
+            MnemonicValidationResults.VALID,
+        ],
+    ),
+    (
+        ElectrumV1MnemonicBulkValidator(),
+        [
+            "perhaps look boom real reveal draw pile eat blank fully bird knowledge",
+            "perhaps look boom real reveal draw pile eat blank fully bird",
+        ],
+        [
+            MnemonicValidationResults.VALID,
+            MnemonicValidationResults.INVALID_WORDS_NUM,
+        ],
+    ),
+    (
+        ElectrumV2MnemonicBulkValidator(ElectrumV2MnemonicTypes.STANDARD),
+        [
+            "tide borrow field spike ensure lunch rack blur tenant bonus soft pudding",
+            "tide borrow field spike ensure lunch rack blur tenant bonus soft tide",
+            "tide borrow field spike ensure lunch rack blur tenant bonus soft notaword",
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+        ],
+        [
+            MnemonicValidationResults.VALID,
+            MnemonicValidationResults.INVALID_VERSION,
+            MnemonicValidationResults.INVALID_WORDS,
+            MnemonicValidationResults.INVALID_VERSION,
+        ],
+    ),
+    (
+        AlgorandMnemonicBulkValidator(),
+        [
+            "any safe success run east term plunge income daring mention unit pony banner exhibit rib predict "
+            "bitter struggle laundry office gun pet potato about oyster",
+            "any safe success run east term plunge income daring mention unit pony banner exhibit rib predict "
+            "bitter struggle laundry office gun pet potato about any",
+        ],
+        [
+            MnemonicValidationResults.VALID,
+            MnemonicValidationResults.INVALID_CHECKSUM,
+        ],
+    ),
+]
+
+
+#
+# Tests
+#
+class MnemonicBulkValidatorTests(unittest.TestCase):
+    # Test validation
+    def test_validate(self):
+        for validator, mnemonics, exp_res in TEST_VECT:
+            self.assertEqual(exp_res, list(validator.Validate(mnemonics)))
+            self.assertEqual(exp_res, list(validator.Validate(iter(mnemonics), chunk_size=1)))
+            self.assertEqual(exp_res, [validator.ValidateOne(mnemonic) for mnemonic in mnemonics])
+
+    # Test validation with executor
+    def test_validate_executor(self):
+        validator, mnemonics, exp_res = TEST_VECT[0]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(exp_res * 10, list(validator.Validate(mnemonics * 10, executor=executor, chunk_size=3)))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertEqual([], list(Bip39MnemonicBulkValidator().Validate([])))
+        self.assertRaises(ValueError, Bip39MnemonicBulkValidator().Validate, [], chunk_size=0)
+        self.assertRaises(TypeError, Bip39MnemonicBulkValidator, MoneroLanguages.ENGLISH)
+        self.assertRaises(TypeError, ElectrumV2MnemonicBulkValidator, 0)
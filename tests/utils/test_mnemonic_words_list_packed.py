@@ -0,0 +1,91 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import unittest
+
+import bip_utils
+from bip_utils.utils.mnemonic import (
+    MnemonicWordsListFileReader, MnemonicWordsListPackedFile, MnemonicWordsListPackedFileConst
+)
+
+
+# Folders containing words lists
+TEST_WORDS_LIST_DIRS = [
+    os.path.join(os.path.dirname(bip_utils.__file__), "bip", "bip39", "wordlist"),
+    os.path.join(os.path.dirname(bip_utils.__file__), "electrum", "mnemonic_v1", "wordlist"),
+    os.path.join(os.path.dirname(bip_utils.__file__), "monero", "mnemonic", "wordlist"),
+]
+
+# Invalid packed files
+TEST_VECT_PACKED_INVALID = [
+    # Empty
+    b"",
+    # Wrong magic
+    b"XXXX\x01\x00",
+    # Wrong version
+    MnemonicWordsListPackedFileConst.MAGIC + b"\x02\x00",
+    # Truncated header
+    MnemonicWordsListPackedFileConst.MAGIC + b"\x01\x01\x03ab",
+    # Wrong data length
+    MnemonicWordsListPackedFileConst.MAGIC + b"\x01\x01\x01a\x00\x00\x00\x05word",
+]
+
+
+#
+# Tests
+#
+class MnemonicWordsListPackedFileTests(unittest.TestCase):
+    # Test that packed files are up to date with text files
+    def test_up_to_date(self):
+        for dir_path in TEST_WORDS_LIST_DIRS:
+            with open(os.path.join(dir_path, MnemonicWordsListPackedFileConst.FILE_NAME), "rb") as fin:
+                self.assertEqual(MnemonicWordsListPackedFile.Compile(dir_path), fin.read())
+
+    # Test words lists
+    def test_words_lists(self):
+        for dir_path in TEST_WORDS_LIST_DIRS:
+            packed_file = MnemonicWordsListPackedFile.FromDir(dir_path)
+            self.assertIs(packed_file, MnemonicWordsListPackedFile.FromDir(dir_path))
+
+            for file_name in os.listdir(dir_path):
+                if not file_name.endswith(MnemonicWordsListPackedFileConst.TEXT_FILE_EXT):
+                    continue
+
+                words = MnemonicWordsListFileReader.ReadWords(os.path.join(dir_path, file_name))
+                name = os.path.splitext(file_name)[0]
+                self.assertTrue(packed_file.HasWordsList(name))
+
+                words_list = packed_file.GetWordsList(name, len(words))
+                self.assertEqual(words, [words_list.GetWordAtIdx(i) for i in range(words_list.Length())])
+                self.assertRaises(ValueError, packed_file.GetWordsList, name, len(words) + 1)
+
+            self.assertFalse(packed_file.HasWordsList("invalid"))
+            self.assertRaises(ValueError, packed_file.GetWordsList, "invalid", 2048)
+
+    # Test folder without packed file
+    def test_no_packed_file(self):
+        self.assertIsNone(MnemonicWordsListPackedFile.FromDir(os.path.dirname(__file__)))
+
+    # Test invalid packed files
+    def test_invalid(self):
+        for data in TEST_VECT_PACKED_INVALID:
+            self.assertRaises(ValueError, MnemonicWordsListPackedFile, data)
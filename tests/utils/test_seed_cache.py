@@ -0,0 +1,122 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import time
+import unittest
+
+from bip_utils import Bip39SeedGenerator, CardanoIcarusBip32, ElectrumV2SeedGenerator, SeedCache, SeedCacheMetrics
+from bip_utils.cardano.bip32.cardano_icarus_mst_key_generator import CardanoIcarusMstKeyGenerator
+
+
+# Test mnemonics
+TEST_BIP39_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+TEST_ELECTRUM_V2_MNEMONIC = "buddy immune recycle material point hotel easily order diesel globe differ awkward"
+# Test Cardano seed
+TEST_CARDANO_SEED = binascii.unhexlify(b"00000000000000000000000000000000")
+
+
+#
+# Tests
+#
+class SeedCacheTests(unittest.TestCase):
+    # Test cached seeds are the same of the generated ones
+    def test_same_seed(self):
+        seed_cache = SeedCache()
+
+        for passphrase in ("", "my_passphrase"):
+            exp_seed = Bip39SeedGenerator(TEST_BIP39_MNEMONIC).Generate(passphrase)
+            for _ in range(2):
+                seed_gen = Bip39SeedGenerator(TEST_BIP39_MNEMONIC, seed_cache=seed_cache)
+                self.assertEqual(exp_seed, seed_gen.Generate(passphrase))
+
+            exp_seed = ElectrumV2SeedGenerator(TEST_ELECTRUM_V2_MNEMONIC).Generate(passphrase)
+            for _ in range(2):
+                seed_gen = ElectrumV2SeedGenerator(TEST_ELECTRUM_V2_MNEMONIC, seed_cache=seed_cache)
+                self.assertEqual(exp_seed, seed_gen.Generate(passphrase))
+
+        exp_key = CardanoIcarusBip32.FromSeed(TEST_CARDANO_SEED).PrivateKey().Raw().ToBytes()
+        CardanoIcarusMstKeyGenerator.SetSeedCache(seed_cache)
+        try:
+            for _ in range(2):
+                self.assertEqual(exp_key, CardanoIcarusBip32.FromSeed(TEST_CARDANO_SEED).PrivateKey().Raw().ToBytes())
+        finally:
+            CardanoIcarusMstKeyGenerator.SetSeedCache(None)
+
+        self.assertEqual(5, seed_cache.Length())
+        self.assertEqual(SeedCacheMetrics(hits=5, misses=5, evictions=0, expirations=0), seed_cache.Metrics())
+
+    # Test keys are not the plaintext inputs
+    def test_keys(self):
+        seed_cache = SeedCache()
+        Bip39SeedGenerator(TEST_BIP39_MNEMONIC, seed_cache=seed_cache).Generate()
+
+        for key in seed_cache.m_cache:
+            self.assertEqual(32, len(key))
+            self.assertNotIn(key, TEST_BIP39_MNEMONIC.encode())
+        # Different caches use different keys
+        other_seed_cache = SeedCache()
+        Bip39SeedGenerator(TEST_BIP39_MNEMONIC, seed_cache=other_seed_cache).Generate()
+        self.assertNotEqual(list(seed_cache.m_cache), list(other_seed_cache.m_cache))
+
+        # Length-prefixed inputs cannot collide when joined differently
+        seed_cache.GetOrGenerate(("ab", "c"), lambda: b"\x01")
+        self.assertEqual(b"\x02", seed_cache.GetOrGenerate(("a", "bc"), lambda: b"\x02"))
+
+    # Test eviction
+    def test_eviction(self):
+        seed_cache = SeedCache(max_size=2)
+        seed_cache.GetOrGenerate(("a",), lambda: b"\xaa" * 4)
+        seed_cache.GetOrGenerate(("b",), lambda: b"\xbb" * 4)
+        # Make "a" the most recently used, so that "b" is evicted
+        self.assertEqual(b"\xaa" * 4, seed_cache.GetOrGenerate(("a",), lambda: b""))
+        evicted_seed = list(seed_cache.m_cache.values())[0][1]
+        seed_cache.GetOrGenerate(("c",), lambda: b"\xcc" * 4)
+
+        self.assertEqual(bytearray(4), evicted_seed)
+        self.assertEqual(2, seed_cache.Length())
+        self.assertEqual(SeedCacheMetrics(hits=1, misses=3, evictions=1, expirations=0), seed_cache.Metrics())
+        self.assertEqual(b"\xaa" * 4, seed_cache.GetOrGenerate(("a",), lambda: b""))
+
+        # Clear zeroizes all seeds
+        seeds = [seed for _, seed in seed_cache.m_cache.values()]
+        seed_cache.Clear()
+        self.assertEqual(0, seed_cache.Length())
+        self.assertEqual([bytearray(4)] * 2, seeds)
+
+    # Test expiration
+    def test_expiration(self):
+        seed_cache = SeedCache(ttl=0.05)
+        seed_cache.GetOrGenerate(("a",), lambda: b"\xaa" * 4)
+        seed_cache.GetOrGenerate(("b",), lambda: b"\xbb" * 4)
+        seeds = [seed for _, seed in seed_cache.m_cache.values()]
+        time.sleep(0.1)
+
+        self.assertEqual(b"\x01", seed_cache.GetOrGenerate(("a",), lambda: b"\x01"))
+        seed_cache.PurgeExpired()
+        self.assertEqual(1, seed_cache.Length())
+        self.assertEqual([bytearray(4)] * 2, seeds)
+        self.assertEqual(SeedCacheMetrics(hits=0, misses=3, evictions=0, expirations=2), seed_cache.Metrics())
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, SeedCache, 0)
+        self.assertRaises(ValueError, SeedCache, 1, 0)